@@ -144,6 +144,15 @@ user once the component is constructed, with the one exception of `prefs <Compon
   corresponding methods of its Log, used to identify, configure and track items for logging.
 ..
 
+.. _Component_Random_State:
+
+* **random_state** - the `random_state <Component.random_state>` attribute contains the random number generator used
+  by the Component for any random values it draws (e.g., the samples of a `DistributionFunction`, or the noise of a
+  `DriftDiffusionIntegrator`).  By default, this is the global generator of numpy (``np.random``), so that Components
+  draw from a single sequence of values;  it can be assigned a seeded ``np.random.RandomState``, so that the values
+  drawn by the Component are independent of those drawn by any other Component (see `System_Random_States`).
+..
+
 .. _Component_Name:
 
 * **name** - the `name <Component.name>` attribute contains the name assigned to the Component when it was created.
@@ -369,9 +378,10 @@ import typecheck as tc
 from psyneulink.globals.keywords import COMMAND_LINE, COMPONENT_INIT, CONTEXT, CONTROL, CONTROL_PROJECTION, DEFERRED_DEFAULT_NAME, DEFERRED_INITIALIZATION, FUNCTION, FUNCTION_CHECK_ARGS, FUNCTION_PARAMS, INITIALIZING, INIT_FULL_EXECUTE_METHOD, INPUT_STATES, LEARNING, LEARNING_PROJECTION, LOG_ENTRIES, MAPPING_PROJECTION, MODULATORY_SPEC_KEYWORDS, NAME, OUTPUT_STATES, PARAMS, PARAMS_CURRENT, PARAM_CLASS_DEFAULTS, PARAM_INSTANCE_DEFAULTS, PREFS_ARG, SEPARATOR_BAR, SET_ATTRIBUTE, SIZE, USER_PARAMS, VALUE, VARIABLE, kwComponentCategory
 from psyneulink.globals.registry import register_category
 # from psyneulink.globals.log import Log, LogCondition
+from psyneulink.globals.log import _tracks_execution_context
 from psyneulink.globals.preferences.componentpreferenceset import ComponentPreferenceSet, kpVerbosePref
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel, PreferenceSet
-from psyneulink.globals.utilities import ContentAddressableList, ReadOnlyOrderedDict, convert_all_elements_to_np_array, convert_to_np_array, is_matrix, is_same_function_spec, iscompatible, kwCompatibilityLength, object_has_single_value
+from psyneulink.globals.utilities import ContentAddressableList, ReadOnlyOrderedDict, convert_all_elements_to_np_array, convert_to_np_array, is_matrix, is_same_function_spec, is_sparse_matrix, iscompatible, kwCompatibilityLength, object_has_single_value
 
 __all__ = [
     'Component', 'COMPONENT_BASE_CLASS', 'component_keywords', 'ComponentError', 'ComponentLog', 'ExecutionStatus',
@@ -680,6 +690,9 @@ class Component(object):
     log : Log
         see `log <Component_Log>`
 
+    random_state : np.random.RandomState or np.random
+        see `random_state <Component_Random_State>`
+
     name : str
         see `name <Component_Name>`
 
@@ -778,6 +791,10 @@ class Component(object):
 
     initMethod = INIT_FULL_EXECUTE_METHOD
 
+    # Determines whether the Component draws random values, and so is assigned its own random_state by
+    #    System.seed_random_states
+    _draws_random_numbers = False
+
     classPreferenceLevel = PreferenceLevel.SYSTEM
     # Any preferences specified below will override those specified in SystemDefaultPreferences
     # Note: only need to specify setting;  level will be assigned to SYSTEM automatically
@@ -1459,7 +1476,7 @@ class Component(object):
         self.user_params_for_instantiation = OrderedDict()
         for param_name in sorted(list(self.user_params.keys())):
             param_value = self.user_params[param_name]
-            if isinstance(param_value, (str, np.ndarray, tuple)):
+            if isinstance(param_value, (str, np.ndarray, tuple)) or is_sparse_matrix(param_value):
                 self.user_params_for_instantiation[param_name] = param_value
             elif isinstance(param_value, Iterable):
                 self.user_params_for_instantiation[param_name] = type(self.user_params[param_name])()
@@ -2057,7 +2074,7 @@ class Component(object):
             -------
             The transformed **input**
         """
-        if variable is None:
+        if variable is None or is_sparse_matrix(variable):
             return variable
 
         variable = np.atleast_1d(variable)
@@ -2737,6 +2754,7 @@ class Component(object):
     def initialize(self):
         raise ComponentError("{} class does not support initialize() method".format(self.__class__.__name__))
 
+    @_tracks_execution_context
     def execute(self, variable=None, runtime_params=None, context=None):
         return self._execute(variable=variable, runtime_params=runtime_params, context=context)
 
@@ -2956,18 +2974,20 @@ class Component(object):
         return self.log.loggable_items
 
     from psyneulink.globals.log import LogCondition
-    def set_log_conditions(self, items, log_condition=LogCondition.EXECUTION):
+    def set_log_conditions(self, items, log_condition=LogCondition.EXECUTION, capacity=None, sink=None):
         """
         set_log_conditions(          \
             items                    \
             log_condition=EXECUTION  \
+            capacity=None            \
+            sink=None                \
         )
 
         Specifies items to be logged; these must be be `loggable_items <Component.loggable_items>` of the Component's
         `log <Component.log>`. This is a convenience method that calls the `set_log_conditions <Log.set_log_conditions>` method
         of the Component's `log <Component.log>`.
         """
-        self.log.set_log_conditions(items=items, log_condition=log_condition)
+        self.log.set_log_conditions(items=items, log_condition=log_condition, capacity=capacity, sink=sink)
 
     def log_values(self, entries):
         """
@@ -2990,6 +3010,17 @@ class Component(object):
         """
         return self.log.logged_items
 
+    @property
+    def random_state(self):
+        try:
+            return self._random_state
+        except AttributeError:
+            return np.random
+
+    @random_state.setter
+    def random_state(self, random_state):
+        self._random_state = random_state
+
     @property
     def auto_dependent(self):
         return self._auto_dependent
@@ -178,12 +178,14 @@ Class Reference
 
 """
 
+import inspect
 import numbers
 import numpy as np
 import typecheck as tc
 import warnings
+import weakref
 
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from enum import Enum, IntEnum
 from random import randint
 
@@ -193,7 +195,7 @@ from psyneulink.globals.keywords import ACCUMULATOR_INTEGRATOR_FUNCTION, ADAPTIV
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set, kpReportOutputPref, kpRuntimeParamStickyAssignmentPref
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
 from psyneulink.globals.registry import register_category
-from psyneulink.globals.utilities import AutoNumber, is_distance_metric, is_iterable, is_matrix, is_numeric, iscompatible, np_array_less_than_2d, parameter_spec
+from psyneulink.globals.utilities import AutoNumber, is_distance_metric, is_iterable, is_matrix, is_numeric, is_sparse_matrix, iscompatible, np_array_less_than_2d, parameter_spec, sparse_or_dense
 from psyneulink.scheduling.time import TimeScale
 
 __all__ = [
@@ -689,7 +691,9 @@ class Function_Base(Function):
                                 format(self.functionOutputType, self.__class__.__name__))
 
         # Can't convert from arrays of length > 1 to number
-        if (len(self.instance_defaults.variable) > 1 and (self.functionOutputType is FunctionOutputType.RAW_NUMBER)):
+        #    (np.shape is used since the variable can be a sparse matrix, which has no len)
+        if (np.shape(self.instance_defaults.variable)[0] > 1
+                and (self.functionOutputType is FunctionOutputType.RAW_NUMBER)):
             raise FunctionError(
                 "{0} can't be set to return a single number since its variable has more than one number".
                 format(self.__class__.__name__))
@@ -2623,6 +2627,8 @@ class SoftMax(NormalizingFunction):
 
     componentName = SOFTMAX_FUNCTION
 
+    _draws_random_numbers = True
+
     bounds = (0,1)
     multiplicative_param = GAIN
     additive_param = None
@@ -2713,7 +2719,7 @@ class SoftMax(NormalizingFunction):
         #    leave that element's value intact, set others to zero
         elif output_type is PROB:
             cum_sum = np.cumsum(sm)
-            random_value = np.random.uniform()
+            random_value = self.random_state.uniform()
             chosen_item = next(element for element in cum_sum if element > random_value)
             chosen_in_cum_sum = np.where(cum_sum == chosen_item, 1, 0)
             sm = variable * chosen_in_cum_sum
@@ -3420,7 +3426,7 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
         specifies a template for the value to be transformed; length must equal the number of rows of `matrix
         <LinearMatrix.matrix>`.
 
-    matrix : number, list, 1d or 2d np.ndarray, np.matrix, function, or matrix keyword : default IDENTITY_MATRIX
+    matrix : number, list, 1d or 2d np.ndarray, np.matrix, sparse matrix, function, or matrix keyword : default IDENTITY_MATRIX
         specifies matrix used to transform `variable <LinearMatrix.variable>`
         (see `matrix <LinearMatrix.matrix>` for specification details).
 
@@ -3462,11 +3468,14 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
     variable : 1d np.array
         contains value to be transformed.
 
-    matrix : 2d np.array
+    matrix : 2d np.array or scipy.sparse.csr_matrix
         matrix used to transform `variable <LinearMatrix.variable>`.
         Can be specified as any of the following:
             * number - used as the filler value for all elements of the :keyword:`matrix` (call to np.fill);
             * list of arrays, 2d np.array or np.matrix - assigned as the value of :keyword:`matrix`;
+            * sparse matrix - assigned in CSR format if its density is no greater than `SPARSE_DENSITY_THRESHOLD
+              <Utilities.SPARSE_DENSITY_THRESHOLD>`, and as a 2d np.array otherwise (see `sparse_or_dense
+              <Utilities.sparse_or_dense>`);
             * matrix keyword - see `MatrixKeywords` for list of options.
         Rows correspond to elements of the input array (outer index), and
         columns correspond to elements of the output array (inner index).
@@ -3622,6 +3631,17 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
                     if isinstance(param_value, numbers.Number):
                         continue
 
+                    # sparse matrix provided, so check that its number of rows equals length of sender vector
+                    elif is_sparse_matrix(param_value):
+                        if param_value.shape[0] != sender_len:
+                            raise FunctionError("The number of rows ({}) of the sparse matrix provided for {} "
+                                                "function of {} does not equal the length ({}) of the sender vector "
+                                                "(variable)".format(param_value.shape[0],
+                                                                    self.name,
+                                                                    self.owner_name,
+                                                                    sender_len))
+                        continue
+
                     # np.matrix or np.ndarray provided, so validate that it is numeric and check dimensions
                     elif isinstance(param_value, (list, np.ndarray, np.matrix)):
                         # get dimensions specified by:
@@ -3733,8 +3753,17 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
             if MATRIX in param_set:
                 param_value = param_set[MATRIX]
 
+                # sparse matrix specified; verify that it is compatible with variable
+                if is_sparse_matrix(param_value):
+                    if param_value.shape[0] != np.size(np.atleast_2d(self.instance_defaults.variable),1):
+                        raise FunctionError("Specification of matrix and/or default_variable for {} is not valid. "
+                                            "The shapes of variable {} and matrix {} are not compatible for "
+                                            "multiplication".format(self.name,
+                                                                    np.shape(np.atleast_2d(self.instance_defaults.variable)),
+                                                                    param_value.shape))
+
                 # numeric value specified; verify that it is compatible with variable
-                if isinstance(param_value, (float, list, np.ndarray, np.matrix)):
+                elif isinstance(param_value, (float, list, np.ndarray, np.matrix)):
                     if np.size(np.atleast_2d(param_value), 0) != np.size(np.atleast_2d(self.instance_defaults.variable),1):
                         raise FunctionError("Specification of matrix and/or default_variable for {} is not valid. "
                                             "The shapes of variable {} and matrix {} are not compatible for "
@@ -3776,9 +3805,13 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
             + single number (used to fill self.matrix)
             + matrix keyword (see get_matrix)
             + 2D list or np.ndarray of numbers
+            + sparse matrix (see get_matrix)
 
         :return matrix: (2D list)
         """
+        if is_sparse_matrix(specification):
+            return sparse_or_dense(specification)
+
         from psyneulink.components.projections.projection import Projection
         if isinstance(self.owner, Projection):
             # Matrix provided (and validated in _validate_params); convert to np.array
@@ -3837,7 +3870,7 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
         # Note: this calls _validate_variable and _validate_params which are overridden above;
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
         matrix = self.get_current_function_param(MATRIX)
-        return np.dot(variable, matrix)
+        return _dot(variable, matrix)
 
     def keyword(self, keyword):
 
@@ -3887,9 +3920,15 @@ def get_matrix(specification, rows=1, cols=1, context=None):
             + RANDOM_CONNECTIVITY_MATRIX (random floats uniformly distributed between 0 and 1)
         + 2D list or np.ndarray of numbers
 
+        + sparse matrix: returned in CSR format, or as a 2D np.array if its density is greater than
+          SPARSE_DENSITY_THRESHOLD (see `sparse_or_dense`)
+
      Returns 2D np.array with length=rows in dim 0 and length=cols in dim 1, or none if specification is not recognized
     """
 
+    if is_sparse_matrix(specification):
+        return sparse_or_dense(specification)
+
     # Matrix provided (and validated in _validate_params); convert to np.array
     if isinstance(specification, (list, np.matrix)):
         specification = np.array(specification)
@@ -3946,6 +3985,81 @@ def get_matrix(specification, rows=1, cols=1, context=None):
     return None
 
 
+def _dot(variable, matrix):
+    """Return the dot product of **variable** and **matrix**, which can be a sparse matrix"""
+    if is_sparse_matrix(matrix):
+        # a sparse matrix must be the left operand; the result is transposed back to the orientation of variable
+        return np.asarray(matrix.T.dot(np.transpose(variable))).T
+    return np.dot(variable, matrix)
+
+
+# functions that have been checked for a size argument (see _call_param), keyed by the underlying function of a method
+_size_argument_functions = weakref.WeakKeyDictionary()
+
+
+def _accepts_size(function):
+    """Return True if **function** has a size argument, and so can return an array of samples in one call"""
+    key = getattr(function, '__func__', function)
+    try:
+        return _size_argument_functions[key]
+    except (KeyError, TypeError):
+        pass
+    try:
+        accepts_size = 'size' in inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        accepts_size = False
+    try:
+        _size_argument_functions[key] = accepts_size
+    except TypeError:
+        pass
+    return accepts_size
+
+
+def _call_param(function, shape):
+    """Return an array of **shape** of the values of **function**, calling it once if it has a size argument (e.g.,
+    the function of a `DistributionFunction`), and otherwise once for each element
+    """
+    if _accepts_size(function):
+        return np.asarray(function(size=shape))
+    values = np.array([function() for i in range(int(np.prod(shape)))])
+    return values.reshape(tuple(shape) + values.shape[1:])
+
+
+def _execute_param(param, var):
+    """Return **param** with any function it contains replaced by its value for each element of **var**
+
+    A param that is a single function is called for every element of **var**;  in a list or array, each function is
+    called for the elements to which it is assigned.  A numeric array is returned as it is, without being searched.
+    """
+    if isinstance(param, (np.ndarray, list)):
+        # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
+        param = np.atleast_2d(param)
+        if param.dtype != object:
+            return param
+        indices_of_functions = OrderedDict()
+        for index, item in enumerate(param.flat):
+            if callable(item):
+                indices_of_functions.setdefault(id(item), (item, []))[1].append(index)
+        if not indices_of_functions:
+            return param
+        # param is copied, so that the functions it contains are executed again on the next call
+        param = param.copy()
+        for function, indices in indices_of_functions.values():
+            values = _call_param(function, (len(indices),))
+            for index, value in zip(indices, values):
+                param.flat[index] = value
+        return param
+
+    if callable(param):
+        var = np.atleast_2d(var)
+        if var.dtype == object:
+            # rows of different lengths
+            return [_call_param(param, (len(row),)) for row in var]
+        return _call_param(param, var.shape[:2])
+
+    return param
+
+
 # region ***********************************  INTEGRATOR FUNCTIONS *****************************************************
 
 #  Integrator
@@ -4032,7 +4146,8 @@ class Integrator(IntegratorFunction):  # ---------------------------------------
         If noise is a list or array, it must be the same length as `variable <Integrator.default_variable>`. If noise is
         specified as a single float or function, while `variable <Integrator.variable>` is a list or array,
         noise will be applied to each variable element. In the case of a noise function, this means that the function
-        will be executed separately for each variable element.
+        will be executed separately for each variable element;  the function of a `DistributionFunction` (or any other
+        function that has a **size** argument) is called only once, and returns the values for all of the elements.
 
         Note that in the case of DIFFUSION, noise must be specified as a float (or list or array of floats) because this
         value will be used to construct the standard DDM probability distribution. For all other types of integration,
@@ -4208,27 +4323,7 @@ class Integrator(IntegratorFunction):  # ---------------------------------------
 
 
     def _try_execute_param(self, param, var):
-
-        # param is a list; if any element is callable, execute it
-        if isinstance(param, (np.ndarray, list)):
-            # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
-            param = np.atleast_2d(param)
-            for i in range(len(param)):
-                for j in range(len(param[i])):
-                    if callable(param[i][j]):
-                        param[i][j] = param[i][j]()
-        # param is one function
-        elif callable(param):
-            # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
-            new_param = []
-            for row in np.atleast_2d(var):
-                new_row = []
-                for item in row:
-                    new_row.append(param())
-                new_param.append(new_row)
-            param = new_param
-
-        return param
+        return _execute_param(param, var)
 
     def _euler(self, previous_value, previous_time, slope, time_step_size):
 
@@ -5314,6 +5409,8 @@ class DriftDiffusionIntegrator(
 
     componentName = DRIFT_DIFFUSION_INTEGRATOR_FUNCTION
 
+    _draws_random_numbers = True
+
     multiplicative_param = RATE
     additive_param = OFFSET
 
@@ -5409,12 +5506,12 @@ class DriftDiffusionIntegrator(
         previous_value = np.atleast_2d(self.previous_value)
 
         value = previous_value + rate * variable * time_step_size  \
-                + np.sqrt(time_step_size * noise) * np.random.normal()
+                + np.sqrt(time_step_size * noise) * self.random_state.normal()
 
         if np.all(abs(value) < threshold):
             adjusted_value = value + offset
         else:
-            adjusted_value = np.atleast_2d(threshold)
+            adjusted_value = np.atleast_2d(np.where(value < 0, -threshold, threshold))
 
         # If this NOT an initialization run, update the old value and time
         # If it IS an initialization run, leave as is
@@ -5427,6 +5524,85 @@ class DriftDiffusionIntegrator(
         # Current output format is [[[decision_variable]], time]
         return adjusted_value
 
+    def run_to_threshold(self, variable=None, num_paths=1, max_time_steps=None):
+        """
+        run_to_threshold(variable=None, num_paths=1, max_time_steps=None)
+
+        Return the value of the decision variable and the time at which each of **num_paths** independent paths of the
+        drift diffusion process reaches `threshold <DriftDiffusionIntegrator.threshold>`.
+
+        Each path starts from `previous_value <DriftDiffusionIntegrator.previous_value>` and `previous_time
+        <DriftDiffusionIntegrator.previous_time>`, and is integrated in the same way (and with noise from the same
+        distribution) as by successive calls to `function <DriftDiffusionIntegrator.function>`, until its magnitude
+        reaches the threshold;  the paths are integrated together, each time step being taken for all of those that
+        have not yet reached it.  The samples for each time step are drawn together from the Function's `random_state
+        <Component.random_state>` (the global numpy random number generator, unless it has been assigned its own), so
+        that a single path is identical to the one generated by calling `function <DriftDiffusionIntegrator.function>`
+        until it reaches the threshold.  Neither `previous_value <DriftDiffusionIntegrator.previous_value>` nor
+        `previous_time <DriftDiffusionIntegrator.previous_time>` is changed.
+
+        Arguments
+        ---------
+
+        variable : number, list or np.array : default ClassDefaults.variable
+            the stimulus component of drift rate;  it must have a single element.
+
+        num_paths : int : default 1
+            the number of paths to integrate.
+
+        max_time_steps : int : default None
+            if specified, integration stops after this number of time steps, whether or not each path has reached
+            the threshold.
+
+        Returns
+        -------
+
+        decision variables, times : (1d np.array, 1d np.array)
+            each has an element for each path;  the decision variable of a path that has reached the threshold is
+            the threshold, with the sign of the boundary reached.
+
+        """
+        if variable is None:
+            variable = self.instance_defaults.variable
+        if np.size(variable) != 1 or np.size(self.previous_value) != 1:
+            raise FunctionError("{} can only run a single decision variable to threshold".format(self.name))
+
+        rate = np.array(self.get_current_function_param(RATE)).astype(float)
+        offset = float(self.get_current_function_param(OFFSET))
+        noise = self.get_current_function_param(NOISE)
+        threshold = float(self.get_current_function_param(THRESHOLD))
+        time_step_size = float(self.get_current_function_param(TIME_STEP_SIZE))
+
+        drift = float(rate * np.asarray(variable, dtype=float) * time_step_size)
+        # a single noise value (or function) applies to all of the paths
+        if not callable(noise) and np.size(noise) == 1:
+            noise = np.ravel(noise)[0]
+        if not callable(noise) and np.size(noise) != 1:
+            raise FunctionError("{} can only run a single decision variable to threshold".format(self.name))
+        # a noise function is executed on each time step, for each path (as for the other Integrator Functions)
+        noise_is_function = callable(noise)
+        if not noise_is_function:
+            noise_scale = np.sqrt(time_step_size * noise)
+
+        value = np.full(num_paths, float(np.squeeze(self.previous_value)))
+        time = np.full(num_paths, float(self.previous_time))
+
+        # indices of the paths that have not yet reached threshold
+        active = np.flatnonzero(np.abs(value) < threshold)
+        num_time_steps = 0
+        while active.size and (max_time_steps is None or num_time_steps < max_time_steps):
+            if noise_is_function:
+                noise_scale = np.sqrt(time_step_size * np.ravel(self._try_execute_param(noise, np.zeros(active.size))))
+            step_value = value[active] + drift + noise_scale * self.random_state.normal(size=active.size)
+            crossed = ~(np.abs(step_value) < threshold)
+            step_value = np.where(crossed, np.where(step_value < 0, -threshold, threshold), step_value + offset)
+            value[active] = step_value
+            time[active] += time_step_size
+            active = active[np.abs(step_value) < threshold]
+            num_time_steps += 1
+
+        return value, time
+
     def reinitialize(self, new_previous_value=None, new_previous_time=None):
         """
         In effect, begins accumulation over again at the original starting point and time, or new ones.
@@ -5570,6 +5746,8 @@ class OrnsteinUhlenbeckIntegrator(
 
     componentName = ORNSTEIN_UHLENBECK_INTEGRATOR_FUNCTION
 
+    _draws_random_numbers = True
+
     multiplicative_param = RATE
     additive_param = OFFSET
 
@@ -5668,7 +5846,7 @@ class OrnsteinUhlenbeckIntegrator(
 
         # dx = (lambda*x + A)dt + c*dW
         value = previous_value + (decay * previous_value - rate * variable) * time_step_size + np.sqrt(
-            time_step_size * noise) * np.random.normal()
+            time_step_size * noise) * self.random_state.normal()
 
         # If this NOT an initialization run, update the old value and time
         # If it IS an initialization run, leave as is
@@ -6778,7 +6956,9 @@ class AccumulatorIntegrator(Integrator):  # ------------------------------------
         if increment is None:
             increment = 0.0
 
-        previous_value = np.atleast_2d(self.previous_value)
+        previous_value = self.previous_value
+        if not is_sparse_matrix(previous_value):
+            previous_value = np.atleast_2d(previous_value)
 
         value = previous_value * rate + noise + increment
 
@@ -7216,6 +7396,77 @@ kwNavarrosAndFuss = "NavarroAndFuss"
 
 
 # QUESTION: IF VARIABLE IS AN ARRAY, DOES IT RETURN AN ARRAY FOR EACH RETURN VALUE (RT, ER, ETC.)
+
+# drift rates with a smaller magnitude are treated as 0 by BogaczEtAl
+BOGACZ_ZERO_DRIFT = 1e-8
+# if 2 * threshold * |drift_rate| / noise**2 exceeds this, exp(-x) underflows, and BogaczEtAl treats the process as
+# deterministic
+BOGACZ_MAX_EXPONENT = -np.log(np.finfo(float).tiny)
+
+
+def _bogacz_et_al(drift_rate, threshold, starting_point, noise, t0):
+    """Return the mean response time and error rate of the drift diffusion process computed by `BogaczEtAl`, for
+    arrays of parameters (which are broadcast against each other).
+    """
+    drift_rate, threshold, starting_point, noise, t0 = np.broadcast_arrays(
+        *[np.asarray(p, dtype=float) for p in (drift_rate, threshold, starting_point, noise, t0)])
+
+    # prevents div by 0 issue below
+    bias = np.clip((starting_point + threshold) / (2 * threshold), 1e-8, 1 - 1e-8)
+
+    rt = np.empty(drift_rate.shape)
+    er = np.empty(drift_rate.shape)
+
+    # drift_rate close to or at 0 (avoid float comparison):
+    #    use expression for limit a->0 from Srivastava et al. 2016, with bias back in absolute terms
+    zero_drift = np.abs(drift_rate) < BOGACZ_ZERO_DRIFT
+    z = threshold[zero_drift]
+    bias_abs = bias[zero_drift] * 2 * z - z
+    rt[zero_drift] = t0[zero_drift] + (z ** 2 - bias_abs ** 2) / (noise[zero_drift] ** 2)
+    er[zero_drift] = (z - bias_abs) / (2 * z)
+
+    drift = ~zero_drift
+    drift_rate = drift_rate[drift]
+    threshold = threshold[drift]
+    noise = noise[drift]
+    is_neg_drift = drift_rate < 0
+
+    drift_rate_normed = np.abs(drift_rate)
+    ztilde = threshold / drift_rate_normed
+    atilde = (drift_rate_normed / noise) ** 2
+
+    bias_adj = np.where(is_neg_drift, 1 - bias[drift], bias[drift])
+    y0tilde = ((noise ** 2) / 2) * np.log(bias_adj / (1 - bias_adj))
+    y0tilde = np.where(np.abs(y0tilde) > threshold, np.where(is_neg_drift, -threshold, threshold), y0tilde)
+    x0tilde = y0tilde / drift_rate_normed
+
+    # exp(2 * ztilde * atilde) - exp(-2 * ztilde * atilde) and 1 - exp(-2 * x0tilde * atilde) are computed as 2 * sinh
+    #    and -expm1, which are accurate where both exponents are close to 0 (i.e., for drift rates close to 0)
+    exponent = 2 * ztilde * atilde
+    # (these overflow, giving inf / inf for drift_er, only where the process is near-deterministic, and so are replaced)
+    with np.errstate(over='ignore', under='ignore', invalid='ignore'):
+        sinh = np.sinh(exponent)
+        start = -np.expm1(-2 * x0tilde * atilde)
+        drift_rt = ztilde * np.tanh(exponent / 2) + (ztilde * start / sinh - x0tilde)
+        drift_er = 1 / (1 + np.exp(exponent)) - start / (2 * sinh)
+
+    # Per Mike Shvartsman:
+    # If ±2*ztilde*atilde (~ 2*z*a/(c^2) gets very large, the diffusion vanishes relative to drift
+    # and the problem is near-deterministic. Without diffusion, error rate goes to 0 or 1
+    # depending on the sign of the drift, and so decision time goes to a point mass on z/a – x0
+    deterministic = exponent > BOGACZ_MAX_EXPONENT
+    drift_rt[deterministic] = ztilde[deterministic] / atilde[deterministic] - x0tilde[deterministic]
+    drift_er[deterministic] = 0
+
+    # This last line makes it report back in terms of a fixed reference point
+    #    (i.e., closer to 1 always means higher p(upper boundary))
+    # If you comment this out it will report errors in the reference frame of the drift rate
+    #    (i.e., reports p(upper) if drift is positive, and p(lower if drift is negative)
+    rt[drift] = drift_rt + t0[drift]
+    er[drift] = np.where(is_neg_drift, 1 - drift_er, drift_er)
+
+    return rt, er
+
 class BogaczEtAl(
     IntegratorFunction):  # --------------------------------------------------------------------------------
     """
@@ -7236,6 +7487,13 @@ class BogaczEtAl(
     Return terminal value of decision variable, mean accuracy, and mean response time computed analytically for the
     drift diffusion process as described in `Bogacz et al (2006) <https://www.ncbi.nlm.nih.gov/pubmed/17014301>`_.
 
+    If the variable or any of the parameters is an array, the solutions for all of its elements are computed together,
+    and `function <BogaczEtAl.function>` returns arrays of response times and error rates (the variable and parameters
+    are broadcast against each other, so that, for example, an array of drift rates can be combined with an array of
+    thresholds with an additional axis, to compute the solutions for every combination of the two).  A `drift_rate
+    <BogaczEtAl.drift_rate>` with a magnitude of less than 1e-8 is treated as 0, for which the limit of the solution is
+    used.
+
     Arguments
     ---------
 
@@ -7357,14 +7615,14 @@ class BogaczEtAl(
                  params=None,
                  context=None):
         """
-        Return: terminal value of decision variable (equal to threshold), mean accuracy (error rate; ER) and mean
-        response time (RT)
+        Return: mean response time (RT) and mean accuracy (error rate; ER)
 
         Arguments
         ---------
 
-        variable : 2d np.array
-            ignored.
+        variable : number or np.array
+            multiplies `drift_rate <BogaczEtAl.drift_rate>` (e.g., the strength of the stimulus);  if it is an
+            array, a solution is computed for each element.
 
         params : Dict[param keyword: param value] : default None
             a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
@@ -7374,76 +7632,28 @@ class BogaczEtAl(
 
         Returns
         -------
-        Decision variable, mean ER, mean RT : (float, float, float)
+        mean RT, mean ER : (float, float), or (np.array, np.array) if the variable or any of the parameters is an array
 
         """
 
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
-        attentional_drift_rate = float(self.get_current_function_param(DRIFT_RATE))
-        stimulus_drift_rate = float(variable)
+        attentional_drift_rate = np.asarray(self.get_current_function_param(DRIFT_RATE), dtype=float)
+        stimulus_drift_rate = np.asarray(variable, dtype=float)
         drift_rate = attentional_drift_rate * stimulus_drift_rate
-        threshold = float(self.get_current_function_param(THRESHOLD))
-        starting_point = float(self.get_current_function_param(STARTING_POINT))
-        noise = float(self.get_current_function_param(NOISE))
-        t0 = float(self.get_current_function_param(NON_DECISION_TIME))
-
-        # drift_rate = float(self.drift_rate) * float(variable)
-        # threshold = float(self.threshold)
-        # starting_point = float(self.starting_point)
-        # noise = float(self.noise)
-        # t0 = float(self.t0)
-
-        self.bias = bias = (starting_point + threshold) / (2 * threshold)
-
-        # Prevents div by 0 issue below:
-        if bias <= 0:
-            bias = 1e-8
-        if bias >= 1:
-            bias = 1 - 1e-8
-
-        # drift_rate close to or at 0 (avoid float comparison)
-        if np.abs(drift_rate) < 1e-8:
-            # back to absolute bias in order to apply limit
-            bias_abs = bias * 2 * threshold - threshold
-            # use expression for limit a->0 from Srivastava et al. 2016
-            rt = t0 + (threshold ** 2 - bias_abs ** 2) / (noise ** 2)
-            er = (threshold - bias_abs) / (2 * threshold)
-        else:
-            drift_rate_normed = np.abs(drift_rate)
-            ztilde = threshold / drift_rate_normed
-            atilde = (drift_rate_normed / noise) ** 2
-
-            is_neg_drift = drift_rate < 0
-            bias_adj = (is_neg_drift == 1) * (1 - bias) + (is_neg_drift == 0) * bias
-            y0tilde = ((noise ** 2) / 2) * np.log(bias_adj / (1 - bias_adj))
-            if np.abs(y0tilde) > threshold:
-                y0tilde = -1 * (is_neg_drift == 1) * threshold + (is_neg_drift == 0) * threshold
-            x0tilde = y0tilde / drift_rate_normed
-
-            with np.errstate(over='raise', under='raise'):
-                try:
-                    rt = ztilde * np.tanh(ztilde * atilde) + \
-                         ((2 * ztilde * (1 - np.exp(-2 * x0tilde * atilde))) / (
-                         np.exp(2 * ztilde * atilde) - np.exp(-2 * ztilde * atilde)) - x0tilde) + t0
-                    er = 1 / (1 + np.exp(2 * ztilde * atilde)) - \
-                         ((1 - np.exp(-2 * x0tilde * atilde)) / (np.exp(2 * ztilde * atilde) - np.exp(-2 * ztilde * atilde)))
-
-                except FloatingPointError:
-                    # Per Mike Shvartsman:
-                    # If ±2*ztilde*atilde (~ 2*z*a/(c^2) gets very large, the diffusion vanishes relative to drift
-                    # and the problem is near-deterministic. Without diffusion, error rate goes to 0 or 1
-                    # depending on the sign of the drift, and so decision time goes to a point mass on z/a – x0, and
-                    # generates a "RuntimeWarning: overflow encountered in exp"
-                    er = 0
-                    rt = ztilde / atilde - x0tilde + t0
-
-            # This last line makes it report back in terms of a fixed reference point
-            #    (i.e., closer to 1 always means higher p(upper boundary))
-            # If you comment this out it will report errors in the reference frame of the drift rate
-            #    (i.e., reports p(upper) if drift is positive, and p(lower if drift is negative)
-            er = (is_neg_drift == 1) * (1 - er) + (is_neg_drift == 0) * (er)
+        threshold = np.asarray(self.get_current_function_param(THRESHOLD), dtype=float)
+        starting_point = np.asarray(self.get_current_function_param(STARTING_POINT), dtype=float)
+        noise = np.asarray(self.get_current_function_param(NOISE), dtype=float)
+        t0 = np.asarray(self.get_current_function_param(NON_DECISION_TIME), dtype=float)
+
+        self.bias = (starting_point + threshold) / (2 * threshold)
 
+        rt, er = _bogacz_et_al(drift_rate, threshold, starting_point, noise, t0)
+
+        # a single solution is returned as a pair of floats
+        if rt.size == 1:
+            self.bias = float(self.bias)
+            return float(rt), float(er)
         return rt, er
 
     def derivative(self, output=None, input=None):
@@ -7512,6 +7722,140 @@ class NF_Results(IntEnum):
     COND_SKEW_RTS = 5
 
 
+def _navarro_and_fuss_start(drift_rate, threshold, starting_point, noise):
+    """Return the parameters, broadcast against each other, and the starting point (from the top of the range of
+    starting points at the threshold to the bottom at -threshold) used by `NavarroAndFuss` for the conditional moments
+    and the first passage time density
+    """
+    drift_rate, threshold, starting_point, noise = np.broadcast_arrays(
+        *[np.asarray(p, dtype=float) for p in (drift_rate, threshold, starting_point, noise)])
+    # starting_point is the probability of the upper threshold, bounded to avoid starting at a threshold
+    probability = np.clip(starting_point, 1e-12, 1 - 1e-12)
+    return drift_rate, threshold, starting_point, probability, noise, (probability - 0.5) * 2 * threshold
+
+
+def _navarro_and_fuss(drift_rate, threshold, starting_point, noise, t0):
+    """Return the solution of the drift diffusion process computed by `NavarroAndFuss`, for arrays of parameters
+    (which are broadcast against each other), in the order of `NF_Results`;  the conditional moments have an additional
+    first axis, with the solution for the upper threshold at index 0 and the lower at index 1.
+    """
+    drift_rate, threshold, starting_point, noise, t0 = np.broadcast_arrays(
+        *[np.asarray(p, dtype=float) for p in (drift_rate, threshold, starting_point, noise, t0)])
+    drift_rate, threshold, starting_point, probability, noise, start = \
+        _navarro_and_fuss_start(drift_rate, threshold, starting_point, noise)
+
+    # mean error rate and decision time, as computed by BogaczEtAl (but with its starting point as a probability)
+    is_neg_drift = drift_rate < 0
+    drift_rate_normed = np.maximum(1e-5, np.abs(drift_rate))
+    bias_adj = np.where(is_neg_drift, 1 - starting_point, probability)
+    with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+        y0tilde = ((noise ** 2) / 2) * np.log(bias_adj / (1 - bias_adj))
+        y0tilde = np.where(np.abs(y0tilde) > threshold, np.sign(y0tilde) * threshold, y0tilde)
+        x0tilde = y0tilde / drift_rate_normed
+        atilde = (drift_rate_normed / noise) ** 2
+        ztilde = threshold / drift_rate_normed
+
+        exp_z = np.minimum(1e12, np.exp(2 * ztilde * atilde))
+        exp_minus_z = np.maximum(1e-12, np.exp(-2 * ztilde * atilde))
+        exp_minus_x0 = np.maximum(1e-12, np.exp(-2 * x0tilde * atilde))
+        er = 1 / (1 + exp_z) - (1 - exp_minus_x0) / (exp_z - exp_minus_z)
+        dt = ztilde * np.tanh(ztilde * atilde) + (2 * ztilde * (1 - exp_minus_x0) / (exp_z - exp_minus_z) - x0tilde)
+
+    # if the drift is too small relative to the noise, the error rate is the probability of the lower threshold at the
+    #    start, and the decision time is effectively infinite
+    no_drift = atilde < 1e-6
+    er = np.where(no_drift & ~np.isfinite(er), 1 - probability, er)
+    dt = np.where(no_drift & ~np.isfinite(dt), 1e12, dt)
+    er = np.where(is_neg_drift, 1 - er, er)
+    dt = np.maximum(dt, 0)
+
+    er = np.where(drift_rate == 0, np.nan, er)
+    dt = np.where(drift_rate == 0, np.nan, dt)
+
+    mean, variance, third_moment = _navarro_and_fuss_moments(drift_rate, noise, threshold, start)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        skew = third_moment / variance ** 1.5
+
+    return er, dt + t0, dt, mean + t0, variance, skew
+
+
+def _navarro_and_fuss_moments(drift_rate, noise, threshold, start):
+    """Return the mean, variance and third central moment of the decision time of the drift diffusion process
+    conditional on each threshold (with the upper threshold at index 0 of the first axis, and the lower at index 1)
+    """
+    drift_rate = np.where(np.abs(drift_rate) < 0.01, 0.01, drift_rate)
+
+    X = np.clip(drift_rate * start / noise ** 2, -100, 100)
+    Z = np.clip(drift_rate * threshold / noise ** 2, -100, 100)
+    Z = np.where(np.abs(Z) < 0.0001, 0.0001, Z)
+
+    # the distance from the starting point to the other threshold, for each threshold
+    ZX = np.stack([Z + X, Z - X])
+    scale = (noise / drift_rate) ** 2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        coth_2Z = 1 / np.tanh(2 * Z)
+        csch_2Z_sq = 1 / np.sinh(2 * Z) ** 2
+        coth_ZX = 1 / np.tanh(ZX)
+        csch_ZX_sq = 1 / np.sinh(ZX) ** 2
+
+        mean = scale * (2 * Z * coth_2Z - ZX * coth_ZX)
+        variance = scale ** 2 * (4 * Z ** 2 * csch_2Z_sq + 2 * Z * coth_2Z - ZX ** 2 * csch_ZX_sq - ZX * coth_ZX)
+        third_moment = scale ** 3 * (12 * Z ** 2 * csch_2Z_sq + 16 * Z ** 3 * coth_2Z * csch_2Z_sq + 6 * Z * coth_2Z
+                                     - 3 * ZX ** 2 * csch_ZX_sq - 2 * ZX ** 3 * coth_ZX * csch_ZX_sq - 3 * ZX * coth_ZX)
+
+    return mean, variance, third_moment
+
+
+def _navarro_and_fuss_density(time, drift_rate, boundary_separation, start, upper, error=1e-4):
+    """Return the first passage time density of the drift diffusion process with unit noise, between thresholds at 0
+    and **boundary_separation**, starting at **start** (as a proportion of boundary_separation), at the upper (or
+    lower) threshold, using the series of `Navarro and Fuss (2009)
+    <http://www.sciencedirect.com/science/article/pii/S0022249609000200>`_.  The number of terms of the series is
+    chosen for each element, to bound its error by **error**.
+    """
+    time, drift_rate, boundary_separation, start, upper = np.broadcast_arrays(
+        *[np.asarray(p, dtype=float) for p in (time, drift_rate, boundary_separation, start, upper)])
+    upper = upper.astype(bool)
+    drift_rate = np.where(upper, -drift_rate, drift_rate)
+    start = np.where(upper, 1 - start, start)
+
+    positive = time > 0
+    normed_time = np.where(positive, time, 1) / boundary_separation ** 2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # number of terms needed for large times
+        num_large = 1 / (np.pi * np.sqrt(normed_time))
+        bound = np.pi * normed_time * error
+        num_large = np.where(bound < 1,
+                             np.maximum(np.sqrt(-2 * np.log(bound) / (np.pi ** 2 * normed_time)), num_large),
+                             num_large)
+        # number of terms needed for small times
+        bound = 2 * np.sqrt(2 * np.pi * normed_time) * error
+        num_small = np.where(bound < 1,
+                             np.maximum(2 + np.sqrt(-2 * normed_time * np.log(bound)), np.sqrt(normed_time) + 1),
+                             2)
+    use_small = num_small < num_large
+    num_terms = np.ceil(np.where(use_small, num_small, num_large))
+
+    # terms beyond those needed for an element are masked, so that the series for all elements are summed together
+    max_terms = int(num_terms.max()) if num_terms.size else 1
+    t = normed_time[..., np.newaxis]
+    w = start[..., np.newaxis]
+    k = np.arange(-((max_terms - 1) // 2), (max_terms - 1) - (max_terms - 1) // 2 + 1)
+    half_terms = (num_terms[..., np.newaxis] - 1) / 2
+    in_series = (k >= -np.floor(half_terms)) & (k <= np.ceil(half_terms))
+    small = np.sum(in_series * (w + 2 * k) * np.exp(-((w + 2 * k) ** 2) / 2 / t), axis=-1) / \
+            np.sqrt(2 * np.pi * normed_time ** 3)
+    k = np.arange(1, max_terms + 1)
+    in_series = k <= num_terms[..., np.newaxis]
+    large = np.pi * np.sum(in_series * k * np.exp(-(k ** 2) * (np.pi ** 2) * t / 2) * np.sin(k * np.pi * w), axis=-1)
+
+    density = np.where(use_small, small, large) * \
+              np.exp(-drift_rate * boundary_separation * start - (drift_rate ** 2) * time / 2) / boundary_separation ** 2
+    return np.where(positive, density, 0)
+
+
 # ----------------------------------------------------------------------------
 class NavarroAndFuss(IntegratorFunction):
     """
@@ -7533,8 +7877,12 @@ class NavarroAndFuss(IntegratorFunction):
     variance and correct RT skew computed analytically for the drift diffusion process (Wiener diffusion model)
     as described in `Navarro and Fuss (2009) <http://www.sciencedirect.com/science/article/pii/S0022249609000200>`_.
 
-    .. note::
-       Use of this Function requires that the MatLab engine is installed.
+    The solution is computed in the same way as by the MATLAB function ``ddmSimFRG`` (included with PsyNeuLink in the
+    Matlab/DDMFunctions directory), with `starting_point <NavarroAndFuss.starting_point>` interpreted as the
+    probability of reaching the upper threshold from the starting point.  Any of the parameters can be an array, in
+    which case the solutions for all of its elements are computed together (the parameters are broadcast against
+    each other, as for `BogaczEtAl`).  The probability density of response times at each threshold can be computed
+    using the Function's `density <NavarroAndFuss.density>` method.
 
     Arguments
     ---------
@@ -7651,33 +7999,13 @@ class NavarroAndFuss(IntegratorFunction):
                          prefs=prefs,
                          context=context)
 
-    def _instantiate_function(self, context=None):
-        import os
-        import sys
-        try:
-            import matlab.engine
-        except ImportError as e:
-            raise ImportError(
-                'python failed to import matlab. Ensure that MATLAB and the python API is installed. See'
-                ' https://www.mathworks.com/help/matlab/matlab_external/install-the-matlab-engine-for-python.html'
-                ' for more info'
-            )
-
-        ddm_functions_path = os.path.abspath(sys.modules['psyneulink'].__path__[0] + '/../Matlab/DDMFunctions')
-
-        # must add the package-included MATLAB files to the engine path to run when not running from the path
-        # MATLAB is very finnicky about the formatting here to actually add the path so be careful if you modify
-        self.eng1 = matlab.engine.start_matlab("-r 'addpath(char(\"{0}\"))' -nojvm".format(ddm_functions_path))
-
-        super()._instantiate_function(context=context)
-
     def function(self,
                  variable=None,
                  params=None,
                  context=None):
         """
-        Return: terminal value of decision variable, mean accuracy (error rate; ER), mean response time (RT),
-        correct RT mean, correct RT variance and correct RT skew.  **Requires that the MatLab engine is installed.**
+        Return: mean accuracy (error rate; ER), mean response time (RT), mean decision time (DT), and the mean,
+        variance and skew of the response times conditional on reaching each threshold.
 
         Arguments
         ---------
@@ -7693,36 +8021,86 @@ class NavarroAndFuss(IntegratorFunction):
 
         Returns
         -------
-        Decision variable, mean ER, mean RT, correct RT mean, correct RT variance, correct RT skew : \
-        (float, float, float, float, float, float)
+        mean ER, mean RT, mean DT, conditional RT means, conditional RT variances, conditional RT skews : \
+        (float, float, float, 1d np.array, 1d np.array, 1d np.array)
+            each of the conditional values has two elements, for the upper threshold and the lower threshold;
+            if any of the parameters is an array, each value has its shape (the conditional values with an
+            additional first axis), and indexed by `NF_Results`.
 
         """
 
         self._check_args(variable=variable, params=params, context=context)
 
-        drift_rate = float(self.get_current_function_param(DRIFT_RATE))
-        threshold = float(self.get_current_function_param(THRESHOLD))
-        starting_point = float(self.get_current_function_param(STARTING_POINT))
-        noise = float(self.get_current_function_param(NOISE))
-        t0 = float(self.get_current_function_param(NON_DECISION_TIME))
+        results = _navarro_and_fuss(self.get_current_function_param(DRIFT_RATE),
+                                    self.get_current_function_param(THRESHOLD),
+                                    self.get_current_function_param(STARTING_POINT),
+                                    self.get_current_function_param(NOISE),
+                                    self.get_current_function_param(NON_DECISION_TIME))
 
-        # used to pass values in a way that the matlab script can handle
-        ddm_struct = {
-            'z': threshold,
-            'c': noise,
-            'T0': t0
-        }
+        # a single solution is returned as floats, and pairs of conditional values
+        if results[NF_Results.MEAN_ER].size == 1:
+            results = [float(r) for r in results[:NF_Results.COND_RTS]] + \
+                      [r.reshape(2) for r in results[NF_Results.COND_RTS:]]
+        return tuple(results)
 
-        results = self.eng1.ddmSimFRG(drift_rate, starting_point, ddm_struct, 1, nargout=6)
+    def density(self, time, upper=True, error=1e-4):
+        """
+        density(time, upper=True, error=1e-4)
 
-        return results
+        Return the probability density of responses at each of **time** at the upper (or lower) threshold, computed
+        using the series of `Navarro and Fuss (2009)
+        <http://www.sciencedirect.com/science/article/pii/S0022249609000200>`_ from the current values of the
+        Function's parameters, and with the same starting point as used for the conditional response times returned
+        by `function <NavarroAndFuss.function>`.
+
+        Arguments
+        ---------
+
+        time : float or np.array
+            the response times (including `t0 <NavarroAndFuss.t0>`);  it is broadcast against the parameters.
+
+        upper : bool or np.array : default True
+            specifies whether the density is for responses at the upper threshold or the lower threshold.
+
+        error : float : default 1e-4
+            the maximum error of the density;  the number of terms of the series is chosen for each time to meet it.
+
+        Returns
+        -------
+        probability density : float or np.array
+            the density, summed over time and both thresholds, integrates to 1.
+
+        """
+        drift_rate, threshold, starting_point, probability, noise, start = \
+            _navarro_and_fuss_start(self.get_current_function_param(DRIFT_RATE),
+                                    self.get_current_function_param(THRESHOLD),
+                                    self.get_current_function_param(STARTING_POINT),
+                                    self.get_current_function_param(NOISE))
+        density = _navarro_and_fuss_density(time - np.asarray(self.get_current_function_param(NON_DECISION_TIME)),
+                                            drift_rate / noise,
+                                            2 * threshold / noise,
+                                            (start + threshold) / (2 * threshold),
+                                            upper,
+                                            error)
+        if density.size == 1:
+            return float(density)
+        return density
 
 
 # region ************************************   DISTRIBUTION FUNCTIONS   ***********************************************
 
 class DistributionFunction(Function_Base):
+    """Base class for Functions that return a random sample from a distribution.
+
+    The `function <Function_Base.function>` of a DistributionFunction returns a single sample;  if it is called with
+    a **size** argument, it returns an array of that shape, of independent samples.  This is used when it is assigned
+    as the `noise <Integrator.noise>` of an `Integrator` or `TransferMechanism`, to draw the noise for all of the
+    elements of their `variable <Function_Base.variable>` in a single call.
+    """
     componentType = DIST_FUNCTION_TYPE
 
+    _draws_random_numbers = True
+
 
 class NormalDist(DistributionFunction):
     """
@@ -7824,14 +8202,15 @@ class NormalDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
         mean = self.get_current_function_param(DIST_MEAN)
         standard_deviation = self.get_current_function_param(STANDARD_DEVIATION)
 
-        result = np.random.normal(mean, standard_deviation)
+        result = self.random_state.normal(mean, standard_deviation, size)
 
         return result
 
@@ -7943,7 +8322,8 @@ class UniformToNormalDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
 
         try:
             from scipy.special import erfinv
@@ -7956,7 +8336,7 @@ class UniformToNormalDist(DistributionFunction):
         mean = self.get_current_function_param(DIST_MEAN)
         standard_deviation = self.get_current_function_param(STANDARD_DEVIATION)
 
-        sample = np.random.rand(1)[0]
+        sample = self.random_state.random_sample(size)
         return ((np.sqrt(2) * erfinv(2 * sample - 1)) * standard_deviation) + mean
 
 class ExponentialDist(DistributionFunction):
@@ -8040,12 +8420,13 @@ class ExponentialDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
         beta = self.get_current_function_param(BETA)
-        result = np.random.exponential(beta)
+        result = self.random_state.exponential(beta, size)
 
         return result
 
@@ -8140,13 +8521,14 @@ class UniformDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
         low = self.get_current_function_param(LOW)
         high = self.get_current_function_param(HIGH)
-        result = np.random.uniform(low, high)
+        result = self.random_state.uniform(low, high, size)
 
         return result
 
@@ -8242,14 +8624,15 @@ class GammaDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
         scale = self.get_current_function_param(SCALE)
         dist_shape = self.get_current_function_param(DIST_SHAPE)
 
-        result = np.random.gamma(dist_shape, scale)
+        result = self.random_state.gamma(dist_shape, scale, size)
 
         return result
 
@@ -8343,14 +8726,15 @@ class WaldDist(DistributionFunction):
     def function(self,
                  variable=None,
                  params=None,
-                 context=None):
+                 context=None,
+                 size=None):
         # Validate variable and validate params
         variable = self._update_variable(self._check_args(variable=variable, params=params, context=context))
 
         scale = self.get_current_function_param(SCALE)
         mean = self.get_current_function_param(DIST_MEAN)
 
-        result = np.random.wald(mean, scale)
+        result = self.random_state.wald(mean, scale, size)
 
         return result
 
@@ -8561,7 +8945,8 @@ COMMENT
             else:
                 param_type_string = "array or matrix"
 
-            matrix = np.array(matrix)
+            if not is_sparse_matrix(matrix):
+                matrix = np.array(matrix)
             if matrix.ndim != 2:
                 raise FunctionError("The value of the {} specified for the {} arg of {} ({}) "
                                     "must be a 2d array or matrix".
@@ -8650,12 +9035,16 @@ COMMENT
         else:
             matrix = self.matrix
 
-        current = variable
-        if self.transfer_fct is not None:
-            transformed = self.transfer_fct(np.dot(matrix * self._hollow_matrix, variable))
+        # the matrix can be a sparse matrix (e.g., of a MappingProjection), which must be multiplied by its methods
+        if is_sparse_matrix(matrix):
+            transformed = matrix.multiply(self._hollow_matrix).tocsr().dot(variable)
         else:
             transformed = np.dot(matrix * self._hollow_matrix, variable)
 
+        current = variable
+        if self.transfer_fct is not None:
+            transformed = self.transfer_fct(transformed)
+
         # # MODIFIED 11/12/15 OLD:
         # if self.metric is ENERGY:
         #     result = -np.sum(current * transformed)/2
@@ -9689,8 +10078,9 @@ class BackPropagation(LearningFunction):
 
             from psyneulink.components.states.parameterstate import ParameterState
             from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
-            if not isinstance(error_matrix, (list, np.ndarray, np.matrix, ParameterState, MappingProjection)):
-                raise FunctionError("The {} arg for {} ({}) must be a list, 2d np.array, ParamaterState or "
+            if not (isinstance(error_matrix, (list, np.ndarray, np.matrix, ParameterState, MappingProjection))
+                    or is_sparse_matrix(error_matrix)):
+                raise FunctionError("The {} arg for {} ({}) must be a list, 2d np.array, sparse matrix, ParamaterState or "
                                     "MappingProjection".format(ERROR_MATRIX, self.__class__.__name__, error_matrix))
 
             if isinstance(error_matrix, MappingProjection):
@@ -9714,7 +10104,8 @@ class BackPropagation(LearningFunction):
             else:
                 param_type_string = "array or matrix"
 
-            error_matrix = np.array(error_matrix)
+            if not is_sparse_matrix(error_matrix):
+                error_matrix = np.array(error_matrix)
             rows = error_matrix.shape[WT_MATRIX_SENDERS_DIM]
             cols = error_matrix.shape[WT_MATRIX_RECEIVERS_DIM]
             activity_output_len = len(self.activation_output)
@@ -9823,7 +10214,10 @@ class BackPropagation(LearningFunction):
         activation_input = np.array(self.activation_input).reshape(len(self.activation_input), 1)
 
         # Derivative of error with respect to output activity (contribution of each output unit to the error above)
-        dE_dA = np.dot(self.error_matrix, self.error_signal)
+        if is_sparse_matrix(self.error_matrix):
+            dE_dA = self.error_matrix.dot(np.asarray(self.error_signal))
+        else:
+            dE_dA = np.dot(self.error_matrix, self.error_signal)
 
         # Derivative of the output activity
         dA_dW = self.activation_derivative_fct(input=self.activation_input, output=self.activation_output)
@@ -762,6 +762,35 @@ State keyword: dict for State's params
                  along with any in the PROJECTION_PARAMS and MappingProjection or ControlProjection dicts
 COMMENT
 
+.. _Mechanism_Memoization:
+
+Memoized Execution
+~~~~~~~~~~~~~~~~~~
+
+.. note::
+   This is an advanced feature, and is generally not required for most applications.
+
+A Mechanism whose `value <Mechanism_Base.value>` depends only on its `variable <Mechanism_Base.variable>` and the
+values of its `ParameterStates <Mechanism_ParameterStates>` (for example, a `TransferMechanism` that is not in
+`integrator_mode <TransferMechanism.integrator_mode>` and does not use a function for its `noise
+<TransferMechanism.noise>`) returns the same `value <Mechanism_Base.value>` each time it is executed with the same
+input and parameters.  In a System in which such a Mechanism executes repeatedly with unchanging input (e.g.,
+while waiting for a `DDM` to reach threshold), the calls to its `function <Mechanism_Base.function>` can be avoided
+by specifying `True` for the **memoize_execution** argument of its constructor (or setting its `memoize_execution
+<Mechanism_Base.memoize_execution>` attribute to `True`).  When the Mechanism is then executed, and its `variable
+<Mechanism_Base.variable>` and the `value <ParameterState.value>` of each of its ParameterStates are the same
+(bit-for-bit) as in its previous execution, it does not call its `function <Mechanism_Base.function>` or update its
+`OutputStates <Mechanism_OutputStates>`, but retains the `value <Mechanism_Base.value>` and OutputState values from
+that execution.  The number of executions that did and did not reuse the previous values are recorded in the
+Mechanism's `execution_cache_hits <Mechanism_Base.execution_cache_hits>` and `execution_cache_misses
+<Mechanism_Base.execution_cache_misses>` attributes, respectively.
+
+An execution is never memoized if it is given `runtime parameters <Mechanism_Runtime_Parameters>`, if any of the
+Mechanism's OutputStates receives a `GatingProjection`, or if the Mechanism or any of its OutputStates is being
+`logged <Log>`.  Setting `memoize_execution <Mechanism_Base.memoize_execution>` to `True` for a Mechanism that does not
+meet the requirements above (including one, such as a `DDM`, that draws random values when it executes) raises an
+error.
+
 .. _Mechanism_Class_Reference:
 
 Class Reference
@@ -786,7 +815,9 @@ from psyneulink.components.states.modulatorysignals.modulatorysignal import _is_
 from psyneulink.components.states.outputstate import OutputState
 from psyneulink.components.states.parameterstate import ParameterState
 from psyneulink.components.states.state import ADD_STATES, REMOVE_STATES, _parse_state_spec
+from psyneulink.globals.context import ExecutionContext
 from psyneulink.globals.keywords import CHANGED, COMMAND_LINE, EVC_SIMULATION, EXECUTING, FUNCTION_PARAMS, INITIALIZING, INIT_FUNCTION_METHOD_ONLY, INIT__EXECUTE__METHOD_ONLY, INPUT_STATES, INPUT_STATE_PARAMS, LEARNING, MONITOR_FOR_CONTROL, MONITOR_FOR_LEARNING, NO_CONTEXT, OUTPUT_STATES, OUTPUT_STATE_PARAMS, PARAMETER_STATES, PARAMETER_STATE_PARAMS, PROCESS_INIT, REFERENCE_VALUE, SEPARATOR_BAR, SET_ATTRIBUTE, SYSTEM_INIT, UNCHANGED, VALIDATE, VALUE, VARIABLE, kwMechanismComponentCategory, kwMechanismExecuteFunction
+from psyneulink.globals.log import LogCondition, _set_execution_context, _tracks_execution_context
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.registry import register_category, remove_instance_from_registry
 from psyneulink.globals.utilities import ContentAddressableList, append_type_to_name, convert_to_np_array, iscompatible, kwCompatibilityNumeric
@@ -1001,6 +1032,20 @@ class Mechanism_Base(Mechanism):
         Conditions <Conditions_Component_Based>` to predicate the execution of one or more other Components on the
         Mechanism.
 
+    memoize_execution : bool : default False
+        determines whether an execution of the Mechanism with the same `variable <Mechanism_Base.variable>` and
+        ParameterState values as its previous execution reuses the `value <Mechanism_Base.value>` and OutputState
+        values of that execution, rather than calling its `function <Mechanism_Base.function>` (see
+        `Mechanism_Memoization`).
+
+    execution_cache_hits : int
+        the number of executions of the Mechanism that reused the values of its previous execution (see
+        `Mechanism_Memoization`).
+
+    execution_cache_misses : int
+        the number of executions of the Mechanism, while `memoize_execution <Mechanism_Base.memoize_execution>` was
+        `True`, that called its `function <Mechanism_Base.function>` (see `Mechanism_Memoization`).
+
     COMMENT:
         phaseSpec : int or float :  default 0
             determines the `TIME_STEP` (s) at which the Mechanism is executed as part of a System
@@ -1121,6 +1166,12 @@ class Mechanism_Base(Mechanism):
     #    (such as OutputStates)
     initMethod = INIT__EXECUTE__METHOD_ONLY
 
+    # Memoized execution (see Mechanism_Memoization)
+    _memoize_execution = False
+    _execution_cache_key = None
+    execution_cache_hits = 0
+    execution_cache_misses = 0
+
     # Note:  the following enforce encoding as 2D np.ndarrays,
     #        to accomodate multiple States:  one 1D np.ndarray per state
     variableEncodingDim = 2
@@ -1159,6 +1210,7 @@ class Mechanism_Base(Mechanism):
                  params=None,
                  name=None,
                  prefs=None,
+                 memoize_execution=False,
                  context=None):
         """Assign name, category-level preferences, and variable; register Mechanism; and enforce category methods
 
@@ -1292,6 +1344,9 @@ class Mechanism_Base(Mechanism):
         self.processes = {}
         self.systems = {}
 
+        if memoize_execution:
+            self.memoize_execution = memoize_execution
+
     # ------------------------------------------------------------------------------------------------------------------
     # Parsing methods
     # ------------------------------------------------------------------------------------------------------------------
@@ -1868,6 +1923,7 @@ class Mechanism_Base(Mechanism):
         except (AttributeError, TypeError):
             return getattr(self, param_name)
 
+    @_tracks_execution_context
     def execute(self,
                 input=None,
                 runtime_params=None,
@@ -1928,6 +1984,10 @@ class Mechanism_Base(Mechanism):
         """
         self.ignore_execution_id = ignore_execution_id
         context = context or NO_CONTEXT
+        if isinstance(context, str) and context is not NO_CONTEXT:
+            # so that the methods to which context is passed test its keywords as flags (see Context)
+            context = ExecutionContext(context)
+            _set_execution_context(context)
 
         # IMPLEMENTATION NOTE: Re-write by calling execute methods according to their order in functionDict:
         #         for func in self.functionDict:
@@ -2030,8 +2090,9 @@ class Mechanism_Base(Mechanism):
         # Direct call to execute Mechanism with specified input, so assign input to Mechanism's input_states
         else:
             if context is NO_CONTEXT:
-                context = EXECUTING + ' ' + append_type_to_name(self)
+                context = ExecutionContext(EXECUTING + ' ' + append_type_to_name(self))
                 self.execution_status = ExecutionStatus.EXECUTING
+                _set_execution_context(context)
             if input is None:
                 input = self.instance_defaults.variable
             variable = self._update_variable(self._get_variable_from_input(input))
@@ -2042,6 +2103,19 @@ class Mechanism_Base(Mechanism):
         self._update_parameter_states(runtime_params=runtime_params, context=context)
         #endregion
 
+        #region REUSE VALUES OF PREVIOUS EXECUTION IF variable AND PARAMETER STATES ARE UNCHANGED
+        # (see Mechanism_Memoization)
+        execution_cache_key = None
+        if self._memoize_execution and not runtime_params and not INITIALIZING in context and self._can_memoize():
+            execution_cache_key = self._get_execution_cache_key(variable)
+            if execution_cache_key is not None and execution_cache_key == self._execution_cache_key:
+                self.execution_cache_hits += 1
+                if self.prefs.reportOutputPref and context and (c in context for c in {EXECUTING, LEARNING}):
+                    self._report_mechanism_execution(self.input_values, self.user_params, self.output_state.value)
+                return self.value
+            self.execution_cache_misses += 1
+        #endregion
+
         #region CALL SUBCLASS _execute method AND ASSIGN RESULT TO self.value
 
         # IMPLEMENTATION NOTE: use value as buffer variable until it has been fully processed
@@ -2052,26 +2126,7 @@ class Mechanism_Base(Mechanism):
             context=context,
         )
 
-        # IMPLEMENTATION NOTE:  THIS IS HERE BECAUSE IF return_value IS A LIST, AND THE LENGTH OF ALL OF ITS
-        #                       ELEMENTS ALONG ALL DIMENSIONS ARE EQUAL (E.G., A 2X2 MATRIX PAIRED WITH AN
-        #                       ARRAY OF LENGTH 2), np.array (AS WELL AS np.atleast_2d) GENERATES A ValueError
-        if (isinstance(value, list) and
-            (all(isinstance(item, np.ndarray) for item in value) and
-                all(
-                        all(item.shape[i]==value[0].shape[0]
-                            for i in range(len(item.shape)))
-                        for item in value))):
-                pass
-        else:
-            converted_to_2d = np.atleast_2d(value)
-            # If return_value is a list of heterogenous elements, return as is
-            #     (satisfies requirement that return_value be an array of possibly multidimensional values)
-            if converted_to_2d.dtype == object:
-                pass
-            # Otherwise, return value converted to 2d np.array
-            else:
-                # return converted_to_2d
-                value = converted_to_2d
+        value = _convert_value_to_2d(value)
 
         # Set status based on whether self.value has changed
         self.status = value
@@ -2101,10 +2156,13 @@ class Mechanism_Base(Mechanism):
                 #    don't want any non-zero values as a residuum of initialization runs to be
                 #    transmittted back via recurrent Projections as initial inputs
                 self.output_states[state].value = self.output_states[state].value * 0.0
+            execution_cache_key = None
         #endregion
 
         #endregion
 
+        self._execution_cache_key = execution_cache_key
+
         return self.value
 
     def run(
@@ -2216,6 +2274,77 @@ class Mechanism_Base(Mechanism):
         for state in self.output_states:
             state.update(params=runtime_params, context=context)
 
+    def _can_execute_batch(self):
+        """Return `True` if the Mechanism can be executed for a batch of variables by `_execute_batch`
+
+        This requires that the Mechanism's `value <Mechanism_Base.value>` depend only on its `variable
+        <Mechanism_Base.variable>` and the values of its ParameterStates, and not on any previous executions;
+        subclasses that meet this requirement override this method (see `EVCControlMechanism_Batch_Simulation`).
+        """
+        return False
+
+    def _execute_batch(self, variable, param_values, context=None):
+        """Return the value of the Mechanism for each item of a batch of variables and parameter values
+
+        The first axis of **variable** is the batch, each item of which is used as the variable for one execution.
+        **param_values** is a dict, each entry of which is the name of a ParameterState and an array of its values,
+        the first axis of which is also the batch;  other ParameterStates have their current value in every execution.
+
+        Returns a list of values, one for each item in the batch.  The executions are carried out one at a time, by
+        calling _execute;  subclasses can override this to carry them out in a single vectorized call.  The value of
+        the Mechanism and of its States are not changed.
+        """
+        parameter_state_values = {name: self._parameter_states[name].value for name in param_values}
+        values = []
+        try:
+            for i in range(len(variable)):
+                # assign to _value, so that the assignments are not logged
+                for name, batch in param_values.items():
+                    self._parameter_states[name]._value = batch[i]
+                values.append(_convert_value_to_2d(self._execute(variable=variable[i], context=context)))
+        finally:
+            for name, value in parameter_state_values.items():
+                self._parameter_states[name]._value = value
+        return values
+
+    def _get_output_values_batch(self, values, context=None):
+        """Return the value of each OutputState for each item in **values** (as returned by `_execute_batch`)
+
+        Returns a list with an array for each OutputState, the first axis of which is the batch.
+        """
+        return [np.array([state._get_value_for_owner_value(value, context=context) for value in values])
+                for state in self.output_states]
+
+    def _is_stateless(self):
+        """Return `True` if the Mechanism's value depends only on its variable and the values of its ParameterStates
+
+        This is the requirement of `_can_execute_batch`, and additionally that neither the Mechanism nor its function
+        draw random values.
+        """
+        return (self._can_execute_batch()
+                and not self._draws_random_numbers
+                and not getattr(self.function_object, '_draws_random_numbers', False))
+
+    def _can_memoize(self):
+        """Return `True` if the current execution can reuse the values of the previous one (see Mechanism_Memoization)
+        """
+        if self.logPref != LogCondition.OFF:
+            return False
+        for state in self.output_states:
+            if state.mod_afferents or state.logPref != LogCondition.OFF:
+                return False
+        return self._is_stateless()
+
+    def _get_execution_cache_key(self, variable):
+        """Return the bytes of **variable** and of the value of each ParameterState, or None if they are not numeric
+        """
+        key = [_get_value_bytes(variable)]
+        for state in self._parameter_states:
+            key.append(_get_value_bytes(state.value))
+        if any(item is None for item in key):
+            return None
+        return tuple(key)
+
     def initialize(self, value):
         """Assign an initial value to the Mechanism's `value <Mechanism_Base.value>` attribute and update its
         `OutputStates <Mechanism_OutputStates>`.
@@ -2492,6 +2621,18 @@ class Mechanism_Base(Mechanism):
     def is_finished(self, value):
         self._is_finished = value
 
+    @property
+    def memoize_execution(self):
+        return self._memoize_execution
+
+    @memoize_execution.setter
+    def memoize_execution(self, value):
+        if value and not self._is_stateless():
+            raise MechanismError("memoize_execution can't be set for {} since its value does not depend only on its "
+                                 "variable and the values of its ParameterStates".format(self.name))
+        self._memoize_execution = bool(value)
+        self._execution_cache_key = None
+
     @property
     def input_state(self):
         return self.input_states[0]
@@ -2635,6 +2776,49 @@ def _is_mechanism_spec(spec):
 # MechanismTuple = namedtuple('MechanismTuple', 'mechanism')
 
 from collections import UserList
+def _convert_value_to_2d(value):
+    """Return the value returned by a Mechanism's _execute method as a 2d np.array, if possible"""
+    # IMPLEMENTATION NOTE:  THIS IS HERE BECAUSE IF return_value IS A LIST, AND THE LENGTH OF ALL OF ITS
+    #                       ELEMENTS ALONG ALL DIMENSIONS ARE EQUAL (E.G., A 2X2 MATRIX PAIRED WITH AN
+    #                       ARRAY OF LENGTH 2), np.array (AS WELL AS np.atleast_2d) GENERATES A ValueError
+    if (isinstance(value, list) and
+        (all(isinstance(item, np.ndarray) for item in value) and
+            all(
+                    all(item.shape[i]==value[0].shape[0]
+                        for i in range(len(item.shape)))
+                    for item in value))):
+            return value
+
+    converted_to_2d = np.atleast_2d(value)
+    # If return_value is a list of heterogenous elements, return as is
+    #     (satisfies requirement that return_value be an array of possibly multidimensional values)
+    if converted_to_2d.dtype == object:
+        return value
+    # Otherwise, return value converted to 2d np.array
+    return converted_to_2d
+
+
+def _get_value_bytes(value):
+    """Return a hashable representation of the bytes of a (possibly ragged) numeric value, or None if it is not numeric
+
+    Used to determine whether the variable and ParameterState values of a Mechanism are the same as in its previous
+    execution (see Mechanism_Memoization).
+    """
+    if isinstance(value, (list, tuple)):
+        items = value
+    else:
+        value = np.asarray(value)
+        if value.dtype != object:
+            return (value.dtype.str, value.shape, value.tobytes())
+        if value.ndim == 0:
+            return None
+        items = value
+    item_bytes = tuple(_get_value_bytes(item) for item in items)
+    if any(item is None for item in item_bytes):
+        return None
+    return item_bytes
+
+
 class MechanismList(UserList):
     """Provides access to items and their attributes in a list of :class:`MechanismTuples` for an owner.
 
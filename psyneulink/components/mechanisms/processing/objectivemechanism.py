@@ -327,7 +327,7 @@ from collections import Iterable
 import typecheck as tc
 
 from psyneulink.components.component import InitStatus
-from psyneulink.components.functions.function import LinearCombination
+from psyneulink.components.functions.function import CombinationFunction, LinearCombination
 from psyneulink.components.mechanisms.mechanism import Mechanism_Base
 from psyneulink.components.mechanisms.processing.processingmechanism import ProcessingMechanism_Base
 from psyneulink.components.states.outputstate import OutputState, PRIMARY, standard_output_states
@@ -768,6 +768,10 @@ class ObjectiveMechanism(ProcessingMechanism_Base):
                 self.function_object.exponents = [exponent or DEFAULT_EXPONENT for exponent in exponents]
         assert True
 
+    def _can_execute_batch(self):
+        # a CombinationFunction computes its result from its variable alone
+        return isinstance(self.function_object, CombinationFunction)
+
     @property
     def monitored_output_states(self):
         if not isinstance(self.input_states, ContentAddressableList):
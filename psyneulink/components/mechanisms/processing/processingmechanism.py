@@ -141,6 +141,7 @@ class ProcessingMechanism_Base(Mechanism_Base):
                  params=None,
                  name=None,
                  prefs=None,
+                 memoize_execution=False,
                  context=None):
         """Abstract class for processing mechanisms
 
@@ -149,6 +150,7 @@ class ProcessingMechanism_Base(Mechanism_Base):
         :param params: (dict)
         :param name: (str)
         :param prefs: (PreferenceSet)
+        :param memoize_execution: (bool)
         :param context: (str)
         """
 
@@ -161,6 +163,7 @@ class ProcessingMechanism_Base(Mechanism_Base):
                          params=params,
                          name=name,
                          prefs=prefs,
+                         memoize_execution=memoize_execution,
                          context=context)
 
     def _validate_inputs(self, inputs=None):
@@ -305,7 +305,8 @@ import numpy as np
 import typecheck as tc
 
 from psyneulink.components.component import Component, function_type, method_type
-from psyneulink.components.functions.function import AdaptiveIntegrator, Linear, TransferFunction
+from psyneulink.components.functions.function import AdaptiveIntegrator, Exponential, Linear, Logistic, TransferFunction, \
+    _execute_param
 from psyneulink.components.mechanisms.adaptive.control.controlmechanism import _is_control_spec
 from psyneulink.components.mechanisms.mechanism import Mechanism, MechanismError
 from psyneulink.components.mechanisms.processing.processingmechanism import ProcessingMechanism_Base
@@ -417,7 +418,8 @@ class TransferMechanism(ProcessingMechanism_Base):
     output_states=RESULTS        \
     params=None,                 \
     name=None,                   \
-    prefs=None)
+    prefs=None,                  \
+    memoize_execution=False)
 
     Subclass of `ProcessingMechanism <ProcessingMechanism>` that performs a simple transform of its input.
 
@@ -514,6 +516,12 @@ class TransferMechanism(ProcessingMechanism_Base):
     prefs : PreferenceSet or specification dict : default Mechanism.classPreferences
         specifies the `PreferenceSet` for the TransferMechanism; see `prefs <TransferMechanism.prefs>` for details.
 
+    memoize_execution : bool : default False
+        specifies whether an execution of the TransferMechanism with the same input and parameter values as its
+        previous one reuses the values of that execution;  it can be `True` only if the TransferMechanism is not in
+        `integrator_mode <TransferMechanism.integrator_mode>` and its `noise <TransferMechanism.noise>` is not a
+        function (see `memoize_execution <Mechanism_Base.memoize_execution>`).
+
     context : str : default componentType+INITIALIZING
         string used for contextualization of instantiation, hierarchical calls, executions, etc.
 
@@ -557,7 +565,9 @@ class TransferMechanism(ProcessingMechanism_Base):
 
         If noise is specified as a single float or function, while `variable <TransferMechanism.variable>` is a
         list or array, noise will be applied to each variable element. In the case of a noise function, this means that
-        the function will be executed separately for each variable element.
+        the function will be executed separately for each variable element;  the function of a `DistributionFunction`
+        (or any other function that has a **size** argument) is called only once, and returns the values for all of
+        the elements.
 
         .. note::
             In order to generate random noise, we recommend selecting a probability distribution function
@@ -664,6 +674,7 @@ class TransferMechanism(ProcessingMechanism_Base):
                  params=None,
                  name=None,
                  prefs:is_pref_set=None,
+                 memoize_execution:bool=False,
                  context=componentType+INITIALIZING):
         """Assign type-level preferences and call super.__init__
         """
@@ -699,6 +710,7 @@ class TransferMechanism(ProcessingMechanism_Base):
             params=params,
             name=name,
             prefs=prefs,
+            memoize_execution=memoize_execution,
             context=self,
             input_states=input_states,
         )
@@ -822,28 +834,7 @@ class TransferMechanism(ProcessingMechanism_Base):
                                                                             self.name))
 
     def _try_execute_param(self, param, var):
-
-        # param is a list; if any element is callable, execute it
-        if isinstance(param, (np.ndarray, list)):
-            # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
-            param = np.atleast_2d(param)
-            for i in range(len(param)):
-                for j in range(len(param[i])):
-                    if callable(param[i][j]):
-                        param[i][j] = param[i][j]()
-
-        # param is one function
-        elif callable(param):
-            # NOTE: np.atleast_2d will cause problems if the param has "rows" of different lengths
-            new_param = []
-            for row in np.atleast_2d(var):
-                new_row = []
-                for item in row:
-                    new_row.append(param())
-                new_param.append(new_row)
-            param = new_param
-
-        return param
+        return _execute_param(param, var)
 
     def _instantiate_parameter_states(self, context=None):
 
@@ -999,6 +990,41 @@ class TransferMechanism(ProcessingMechanism_Base):
         return outputs
         #endregion
 
+    def _can_execute_batch(self):
+        # in integrator_mode, or with noise that is drawn at random, value depends on previous executions
+        return (not self.integrator_mode
+                and isinstance(self.function_object, TransferFunction)
+                and not any(callable(item) for item in np.ravel(np.array(self.noise, dtype=object))))
+
+    def _execute_batch(self, variable, param_values, context=None):
+        """Execute function once for the entire batch, if it is computed elementwise
+
+        Each array of values in **param_values** is assigned to its ParameterState with its shape extended to
+        broadcast against the batch of variables, so that the function computes each item of the batch with its own
+        parameter values.
+        """
+        if not isinstance(self.function_object, (Linear, Exponential, Logistic)):
+            return super()._execute_batch(variable, param_values, context=context)
+
+        function_variable = self.function_object.variable
+        parameter_state_values = {}
+        try:
+            for name, batch in param_values.items():
+                state = self._parameter_states[name]
+                parameter_state_values[name] = state.value
+                batch = np.asarray(batch)
+                state._value = batch.reshape(batch.shape[:1] + (1,) * (variable.ndim - batch.ndim) + batch.shape[1:])
+
+            noise = self._try_execute_param(self.noise, variable)
+            if (np.array(noise) != 0).any():
+                variable = variable + noise
+
+            return self.function(variable=variable)
+        finally:
+            self.function_object._update_variable(function_variable)
+            for name, value in parameter_state_values.items():
+                self._parameter_states[name]._value = value
+
     def _report_mechanism_execution(self, input, params, output):
         """Override super to report previous_input rather than input, and selected params
         """
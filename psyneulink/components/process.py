@@ -462,7 +462,9 @@ from psyneulink.components.shellclasses import Mechanism, Process_Base, Projecti
 from psyneulink.components.states.modulatorysignals.learningsignal import LearningSignal
 from psyneulink.components.states.parameterstate import ParameterState
 from psyneulink.components.states.state import _instantiate_state, _instantiate_state_list
+from psyneulink.globals.context import ExecutionContext
 from psyneulink.globals.keywords import AUTO_ASSIGN_MATRIX, COMPONENT_INIT, ENABLED, EXECUTING, FUNCTION, FUNCTION_PARAMS, INITIALIZING, INITIAL_VALUES, INTERNAL, LEARNING, LEARNING_PROJECTION, MAPPING_PROJECTION, MATRIX, NAME, OBJECTIVE_MECHANISM, ORIGIN, PARAMETER_STATE, PATHWAY, PROCESS, PROCESS_INIT, SENDER, SEPARATOR_BAR, SINGLETON, TARGET, TERMINAL, kwProcessComponentCategory, kwReceiverArg, kwSeparator
+from psyneulink.globals.log import _set_execution_context, _tracks_execution_context
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.registry import register_category
@@ -2042,6 +2044,7 @@ class Process(Process_Base):
         for mech, value in self.initial_values.items():
             mech.initialize(value)
 
+    @_tracks_execution_context
     def execute(
         self,
         input=None,
@@ -2111,8 +2114,13 @@ class Process(Process_Base):
         from psyneulink.components.mechanisms.adaptive.learning.learningmechanism import LearningMechanism
 
         if not context:
-            context = EXECUTING + " " + PROCESS + " " + self.name
+            context = ExecutionContext(EXECUTING + " " + PROCESS + " " + self.name)
             self.execution_status = ExecutionStatus.EXECUTING
+            _set_execution_context(context)
+        elif isinstance(context, str):
+            # so that the methods to which context is passed test its keywords as flags (see Context)
+            context = ExecutionContext(context)
+            _set_execution_context(context)
         from psyneulink.globals.environment import _get_unique_id
         self._execution_id = execution_id or _get_unique_id()
         for mech in self.mechanisms:
@@ -2163,6 +2171,7 @@ class Process(Process_Base):
         return self.output_state.value
         # return self.output
 
+    @_tracks_execution_context
     def _execute_learning(self, target=None, context=None):
 
         """ Update each LearningProjection for mechanisms in _mechs of process
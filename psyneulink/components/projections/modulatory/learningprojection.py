@@ -178,7 +178,7 @@ from psyneulink.components.states.parameterstate import ParameterState
 from psyneulink.globals.keywords import CONTEXT, ENABLED, FUNCTION, FUNCTION_PARAMS, INITIALIZING, INTERCEPT, LEARNING, LEARNING_PROJECTION, LEARNING_SIGNAL, MATRIX, NAME, PARAMETER_STATE, PARAMETER_STATES, PROJECTION_SENDER, SLOPE
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
-from psyneulink.globals.utilities import iscompatible, parameter_spec
+from psyneulink.globals.utilities import is_sparse_matrix, iscompatible, parameter_spec, sparse_like
 
 __all__ = [
     'DefaultTrainingMechanism', 'LearningProjection', 'LearningProjectionError', 'WT_MATRIX_RECEIVERS_DIM', 'WT_MATRIX_SENDER_DIM',
@@ -625,8 +625,8 @@ class LearningProjection(ModulatoryProjection_Base):
         # NOTE: The current version is only guaranteed to work learning_signal.ndim =1 and matrix.ndim = 2
         if (
                 (learning_signal.ndim < matrix.ndim) and
-                np.allclose(matrix,np.diag(np.diag(matrix))) and
-                len(learning_signal)==len(np.diag(matrix))):
+                _is_diagonal(matrix) and
+                len(learning_signal)==min(matrix.shape)):
             learning_signal = np.diag(learning_signal)
         elif learning_signal.shape != matrix.shape:
             # Convert 1d array into 2d array to match format of a Projection.matrix
@@ -646,8 +646,15 @@ class LearningProjection(ModulatoryProjection_Base):
         if self.learning_rate is not None:
             self.weight_change_matrix *= self.learning_rate
 
+        # Restrict the weight changes to the stored entries of a sparse matrix, so that it remains sparse
+        if is_sparse_matrix(matrix):
+            self.weight_change_matrix = sparse_like(matrix, self.weight_change_matrix)
+
         if not INITIALIZING in context and self.reportOutputPref:
-            print("\n{} weight change matrix: \n{}\n".format(self.name, np.diag(self.weight_change_matrix)))
+            weight_change_matrix = self.weight_change_matrix
+            if is_sparse_matrix(weight_change_matrix):
+                weight_change_matrix = weight_change_matrix.toarray()
+            print("\n{} weight change matrix: \n{}\n".format(self.name, np.diag(weight_change_matrix)))
 
         return self.value
 
@@ -662,3 +669,11 @@ class LearningProjection(ModulatoryProjection_Base):
     @weight_change_matrix.setter
     def weight_change_matrix(self,assignment):
         self.value = assignment
+
+
+def _is_diagonal(matrix):
+    """Return True if **matrix** (a 2d array or sparse matrix) has values only along its main diagonal"""
+    if is_sparse_matrix(matrix):
+        rows, cols = matrix.nonzero()
+        return np.array_equal(rows, cols)
+    return np.allclose(matrix,np.diag(np.diag(matrix)))
@@ -70,6 +70,17 @@ following ways:
     given `sender <MappingProjection.sender>` makes to the `receiver <MappingProjection.receiver>` (the number of which
     must match the length of the receiver's `variable <InputState.variable>`).
 
+  .. _Mapping_Sparse_Matrix:
+
+  * **Sparse matrix** -- a `scipy.sparse <https://docs.scipy.org/doc/scipy/reference/sparse.html>`_ matrix (in any
+    format), with the same orientation as a 2d np.array.  If the proportion of its entries that are stored is no
+    greater than `SPARSE_DENSITY_THRESHOLD <Utilities.SPARSE_DENSITY_THRESHOLD>`, it is converted to CSR format and
+    kept in that form by the MappingProjection's `function <MappingProjection.function>` and *MATRIX*
+    `ParameterState <Mapping_Matrix_ParameterState>`, so that executing the MappingProjection takes time proportional
+    to the number of stored entries rather than the size of the matrix;  otherwise, it is converted to a 2d np.array.
+    When a sparse matrix is `learned <MappingProjection_Learning>`, only its stored entries are modified, so that
+    its pattern of connectivity is preserved.  Using a sparse matrix requires that scipy is installed.
+
   .. _Matrix_Keywords:
 
   * **Matrix keyword** -- used to specify a standard type of matrix without having to specify its individual
@@ -268,6 +279,7 @@ from psyneulink.globals.keywords import AUTO_ASSIGN_MATRIX, CHANGED, DEFAULT_MAT
 from psyneulink.globals.log import LogCondition, LogEntry
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
+from psyneulink.globals.utilities import is_sparse_matrix, sparse_or_dense
 
 __all__ = [
     'MappingError', 'MappingProjection',
@@ -355,7 +367,7 @@ class MappingProjection(PathwayProjection_Base):
        specifies the value by which to exponentiate the MappingProjection's `value <MappingProjection.value>`
        before combining it with others (see `exponent <MappingProjection.exponent>` for additional details).
 
-    matrix : list, np.ndarray, np.matrix, function or keyword : default DEFAULT_MATRIX
+    matrix : list, np.ndarray, np.matrix, sparse matrix, function or keyword : default DEFAULT_MATRIX
         the matrix used by `function <MappingProjection.function>` (default: `LinearCombination`) to transform the
         value of the `sender <MappingProjection.sender>` into a form suitable for the `variable <InputState.variable>`
         of its `receiver <MappingProjection.receiver>`.
@@ -383,9 +395,10 @@ class MappingProjection(PathwayProjection_Base):
     receiver: InputState
         the `InputState` of the `Mechanism <Mechanism>` that is the destination of the Projection's output.
 
-    matrix : 2d np.array
+    matrix : 2d np.array or scipy.sparse.csr_matrix
         the matrix used by `function <MappingProjection.function>` to transform the input from the MappingProjection's
-        `sender <MappingProjection.sender>` into the value provided to its `receiver <MappingProjection.receiver>`.
+        `sender <MappingProjection.sender>` into the value provided to its `receiver <MappingProjection.receiver>`
+        (a CSR matrix if it was specified as a `sparse matrix <Mapping_Sparse_Matrix>`).
 
     has_learning_projection : bool : False
         identifies whether the MappingProjection's `MATRIX` `ParameterState <ParameterState>` has been assigned a
@@ -438,6 +451,10 @@ class MappingProjection(PathwayProjection_Base):
 
     classPreferenceLevel = PreferenceLevel.TYPE
 
+    # (_FusedMappingProjections, index) if the value was last computed together with those of other MappingProjections
+    #    to the same InputState, and has not yet been read (see InputState_Fused_Projections)
+    _fused_value = None
+
     @property
     def _loggable_items(self):
         # States and afferent Projections are loggable for a Mechanism
@@ -474,6 +491,9 @@ class MappingProjection(PathwayProjection_Base):
         # it wasn't working.
         if isinstance(matrix, (np.matrix, list)):
             matrix = np.array(matrix)
+        # a sparse matrix is kept (in CSR format) only if it is sufficiently sparse
+        elif is_sparse_matrix(matrix):
+            matrix = sparse_or_dense(matrix)
 
         params = self._assign_args_to_param_dicts(function_params={MATRIX: matrix},
                                                   params=params)
@@ -632,6 +652,24 @@ class MappingProjection(PathwayProjection_Base):
 
         return self.function(self.sender.value, params=runtime_params, context=context)
 
+    @property
+    def value(self):
+        if self._fused_value is not None:
+            self._assign_fused_value()
+        return self._value
+
+    @value.setter
+    def value(self, assignment):
+        self._fused_value = None
+        self._value = assignment
+        self.log._log_value(assignment)
+
+    def _assign_fused_value(self):
+        """Assign the value computed together with those of other MappingProjections to the same InputState"""
+        fused_projections, index = self._fused_value
+        self._fused_value = None
+        self._value = fused_projections._get_value(index)
+
     @property
     def matrix(self):
         return self.function_object.matrix
@@ -640,12 +678,16 @@ class MappingProjection(PathwayProjection_Base):
     def matrix(self, matrix):
         if not (isinstance(matrix, np.matrix) or
                     (isinstance(matrix,np.ndarray) and matrix.ndim == 2) or
-                    (isinstance(matrix,list) and np.array(matrix).ndim == 2)):
+                    (isinstance(matrix,list) and np.array(matrix).ndim == 2) or
+                    is_sparse_matrix(matrix)):
             raise MappingError("Matrix parameter for {} ({}) MappingProjection must be "
-                               "an np.matrix, a 2d np.array, or a correspondingly configured list".
+                               "an np.matrix, a 2d np.array, a sparse matrix, or a correspondingly configured list".
                                format(self.name, matrix))
 
-        matrix = np.array(matrix)
+        if is_sparse_matrix(matrix):
+            matrix = matrix.tocsr(copy=True)
+        else:
+            matrix = np.array(matrix)
 
         # FIX: Hack to prevent recursion in calls to setter and assign_params
         self.function.__self__.paramValidationPref = PreferenceEntry(False, PreferenceLevel.INSTANCE)
@@ -447,6 +447,21 @@ the item of the Mechanism's `variable <Mechanism_Base.variable>` and `input_valu
 attributes  corresponding to that InputState (see `Mechanism Variable and InputStates
 <Mechanism_Variable_and_InputStates>` for additional details).
 
+.. _InputState_Fused_Projections:
+
+When an InputState receives more than one `MappingProjection`, each of which uses the standard `LinearMatrix` function,
+and its `function <InputState.function>` is a `LinearCombination` that sums their values (i.e., with *SUM* as its
+`operation <LinearCombination.operation>`, and no `weights <LinearCombination.weights>` or `exponents
+<LinearCombination.exponents>`), the values of the MappingProjections are computed together, in a single multiplication
+of the values of their senders by a matrix in which the `matrix <MappingProjection.matrix>` of each Projection is
+stacked along its rows.  The `value <MappingProjection.value>` of each MappingProjection is then computed on its own
+only when it is read, or when the MappingProjection is being `logged <Log>`.  The `value <ParameterState.value>` of
+the *MATRIX* `ParameterState` of each MappingProjection is then a view into that stacked matrix, and any new value assigned to it (e.g., by `learning <LearningProjection>`)
+is copied into the stacked matrix before the InputState is next updated.  The *MATRIX* ParameterState of a
+MappingProjection that does not receive a `LearningProjection` is not updated again unless its `matrix
+<MappingProjection.matrix>` is assigned a new value.  The values of the MappingProjections are computed one at a
+time if any `runtime parameters <Mechanism_Runtime_Parameters>` are specified for the InputState.
+
 .. _InputState_Class_Reference:
 
 Class Reference
@@ -461,11 +476,12 @@ import numpy as np
 import typecheck as tc
 
 from psyneulink.components.component import InitStatus
-from psyneulink.components.functions.function import Linear, LinearCombination, Reduce
+from psyneulink.components.functions.function import AccumulatorIntegrator, Linear, LinearCombination, Reduce
 from psyneulink.components.mechanisms.mechanism import Mechanism
 from psyneulink.components.states.outputstate import OutputState
 from psyneulink.components.states.state import ADD_STATES, StateError, State_Base, _instantiate_state_list, state_type_keywords
 from psyneulink.globals.keywords import COMMAND_LINE, EXPONENT, FUNCTION, GATING_SIGNAL, INPUT_STATE, INPUT_STATES, INPUT_STATE_PARAMS, LEARNING_SIGNAL, MAPPING_PROJECTION, MATRIX, MECHANISM, OUTPUT_STATE, OUTPUT_STATES, PROCESS_INPUT_STATE, PROJECTIONS, PROJECTION_TYPE, REFERENCE_VALUE, SENDER, SUM, SYSTEM_INPUT_STATE, VARIABLE, WEIGHT
+from psyneulink.globals.log import LogCondition
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.utilities import append_type_to_name, is_numeric, iscompatible
@@ -694,6 +710,10 @@ class InputState(State_Base):
                                MECHANISM: None,     # These are used to specifiy InputStates by projections to them
                                OUTPUT_STATES: None  # from the OutputStates of a particular Mechanism (see docs)
                                })
+    # the object used to compute the values of the InputState's MappingProjections together, and the routing of its
+    #    afferents for which that was created (see InputState._get_fused_projections)
+    _fused_projections = None
+    _fused_projections_routing = None
     #endregion
 
     @tc.typecheck
@@ -1105,6 +1125,35 @@ class InputState(State_Base):
 
         return False
 
+    def _get_fused_projections(self):
+        """Return a _FusedMappingProjections for the InputState's MappingProjections, or None if their values can't be
+        computed together (see InputState_Fused_Projections)
+
+        The _FusedMappingProjections is cached with the routing of the InputState's afferents (see
+        State._get_afferent_routing), and so is rebuilt when a Projection is added to the InputState.
+        """
+        routing = self._get_afferent_routing()
+        if routing is not self._afferent_routing:
+            # routing can't be cached, since a Projection has deferred initialization
+            return None
+        if self._fused_projections_routing is not routing:
+            self._fused_projections = _FusedMappingProjections._create(self.path_afferents)
+            self._fused_projections_routing = routing
+        if self._fused_projections is None:
+            return None
+
+        # the values of the Projections are summed only if the function is LinearCombination with operation SUM,
+        #    and without weights or exponents (scale and offset are applied to the sum by the function)
+        function = self.function_object
+        if not (isinstance(function, LinearCombination)
+                and function.operation == SUM
+                and function.weights is None
+                and function.exponents is None):
+            return None
+
+        self._fused_projections._begin()
+        return self._fused_projections
+
     @property
     def pathway_projections(self):
         return self.path_afferents
@@ -1142,6 +1191,178 @@ class InputState(State_Base):
         return function.execute(variable)
 
 
+def _is_unchanged_matrix(parameter_state, view):
+    """Return True if updating the MATRIX ParameterState of a MappingProjection would leave its value the same as
+    **view**
+
+    This is the case if its value and the previous_value of its AccumulatorIntegrator are both **view**, and nothing
+    is added to the previous_value (i.e., it receives no LearningProjections, and its rate is 1 and increment and noise
+    are 0).  An update is also not skipped if the ParameterState is being logged.
+    """
+    function = parameter_state.function_object
+    return (parameter_state.value is view
+            and type(function) is AccumulatorIntegrator
+            and function.previous_value is view
+            and not parameter_state.mod_afferents
+            and _is_number_equal_to(function.rate, 1, None)
+            and _is_number_equal_to(function.increment, 0, None)
+            and _is_number_equal_to(function.noise, 0)
+            and parameter_state.logPref == LogCondition.OFF)
+
+
+def _is_number_equal_to(value, number, default=NotImplemented):
+    if value is default:
+        return True
+    return isinstance(value, numbers.Number) and value == number
+
+
+class _FusedMappingProjections:
+    """Compute the sum of the values of the MappingProjections to an InputState in a single matrix multiplication
+
+    The matrices of the MappingProjections are stacked (along their rows) in **matrix**, and the values of their
+    senders are placed in the corresponding items of **variable**, so that their dot product is the sum of the values
+    of the Projections.  The value of the MATRIX ParameterState of each Projection is assigned a view into **matrix**,
+    so that changes to it (e.g., by learning) are made directly in the stacked matrix;  if the ParameterState is
+    assigned a new value, that is copied into the stacked matrix the next time the Projection is added.
+
+    The value of each Projection is computed from its items of **variable** and its view only if it is read (see
+    MappingProjection.value), or if the Projection is being logged;  the items of a Projection are therefore not
+    changed until it is added again, unless its value is first computed.
+    """
+
+    def __init__(self, matrix, entries):
+        self.matrix = matrix
+        self.variable = np.zeros(len(matrix))
+        # (projection, matrix ParameterState, slice of rows, view of matrix, sender,
+        #    whether to update ParameterStates (which depends on the sender))
+        self.entries = entries
+        self.indices = {projection: i for i, (projection, *_) in enumerate(entries)}
+        self.added = [False] * len(entries)
+        # assigned to each Projection added, for its value to be computed when it is read
+        self.pending_values = [(self, i) for i in range(len(entries))]
+        self.unfused_values = []
+
+    @classmethod
+    def _create(cls, projections):
+        """Return a _FusedMappingProjections for **projections**, or None if they can't be computed together
+
+        This requires that there be at least two Projections, each of which is a MappingProjection that uses the
+        standard LinearMatrix function with a 2d float matrix, and all of which have the same number of columns.
+        """
+        from psyneulink.components.functions.function import LinearMatrix
+        from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
+
+        if len(projections) < 2:
+            return None
+        matrices = []
+        for projection in projections:
+            if (not isinstance(projection, MappingProjection)
+                    or type(projection)._execute is not MappingProjection._execute
+                    or type(projection.function_object).function is not LinearMatrix.function
+                    or MATRIX not in projection._parameter_states):
+                return None
+            matrix = projection._parameter_states[MATRIX].value
+            if not (isinstance(matrix, np.ndarray) and matrix.ndim == 2 and matrix.dtype == np.float64):
+                return None
+            matrices.append(matrix)
+        if len({matrix.shape[1] for matrix in matrices}) != 1:
+            return None
+
+        stacked_matrix = np.concatenate(matrices)
+        entries = []
+        start = 0
+        for projection, matrix in zip(projections, matrices):
+            rows = slice(start, start + len(matrix))
+            view = stacked_matrix[rows]
+            parameter_state = projection._parameter_states[MATRIX]
+            parameter_state._value = view
+            # assigned to the instance, so that it is saved and restored with the state of a System
+            projection._fused_value = None
+            entries.append(cls._entry(projection, parameter_state, rows, view))
+            start = rows.stop
+        return cls(stacked_matrix, entries)
+
+    @staticmethod
+    def _entry(projection, parameter_state, rows, view):
+        sender = projection.sender
+        # as in MappingProjection._execute, Projections from System inputs don't update their ParameterStates
+        return (projection, parameter_state, rows, view, sender, "System" not in str(sender.owner))
+
+    def _begin(self):
+        """Prepare for the Projections executed in an update of the InputState to be added"""
+        for i in range(len(self.added)):
+            self.added[i] = False
+        self.unfused_values = []
+
+    def add(self, projection, context=None):
+        """Update the ParameterStates of **projection** and place its matrix and the value of its sender
+        in **matrix** and **variable**
+
+        If these are not of the shape and type used when the stacked matrix was created, the Projection's value is
+        computed by its function, and added to the sum in execute.
+        """
+        i = self.indices[projection]
+        projection, parameter_state, rows, view, sender, updates_parameter_states = self.entries[i]
+        if projection.sender is not sender:
+            # the sender has been reassigned since the Projections were fused
+            self.entries[i] = self._entry(projection, parameter_state, rows, view)
+            projection, parameter_state, rows, view, sender, updates_parameter_states = self.entries[i]
+        if updates_parameter_states:
+            if _is_unchanged_matrix(parameter_state, view):
+                parameter_state.num_updates_skipped += 1
+            else:
+                projection._update_parameter_states(context=context)
+
+        matrix = parameter_state.value
+        if matrix is not view:
+            if not (isinstance(matrix, np.ndarray) and matrix.shape == view.shape and matrix.dtype == view.dtype):
+                self._add_unfused_value(projection, projection.function(sender.value, context=context))
+                return
+            view[...] = matrix
+            parameter_state._value = view
+            if isinstance(parameter_state.function_object, AccumulatorIntegrator):
+                parameter_state.function_object.previous_value = view
+
+        sender_value = sender.value
+        if np.shape(sender_value) != (view.shape[0],):
+            self._add_unfused_value(projection, projection.function(sender_value, context=context))
+            return
+        self.variable[rows] = sender_value
+        self.added[i] = True
+
+    def _add_unfused_value(self, projection, value):
+        if projection.logPref != LogCondition.OFF:
+            projection.value = value
+        else:
+            projection._fused_value = None
+        self.unfused_values.append(value)
+
+    def execute(self, context=None):
+        """Return a list with the sum of the values of the Projections added, followed by the value of any that could
+        not be included in it (an empty list if no Projections were added)
+        """
+        if not any(self.added):
+            return self.unfused_values
+        for i, (projection, parameter_state, rows, view, *_) in enumerate(self.entries):
+            if self.added[i]:
+                if projection.logPref != LogCondition.OFF:
+                    projection.value = np.dot(self.variable[rows], view)
+                else:
+                    projection._fused_value = self.pending_values[i]
+            else:
+                # the items of a Projection not added are zeroed, so its value is computed first if it is pending
+                if projection._fused_value is self.pending_values[i]:
+                    projection._assign_fused_value()
+                self.variable[rows] = 0
+        return [np.dot(self.variable, self.matrix)] + self.unfused_values
+
+    def _get_value(self, i):
+        """Return the value of the Projection at index **i** of entries, as of the last execution in which it was added
+        """
+        projection, parameter_state, rows, view, *_ = self.entries[i]
+        return np.dot(self.variable[rows], view)
+
+
 def _instantiate_input_states(owner, input_states=None, reference_value=None, context=None):
     """Call State._instantiate_state_list() to instantiate ContentAddressableList of InputState(s)
 
@@ -1041,27 +1041,32 @@ class OutputState(State_Base):
 
         # otherwise, OutputState used specified item(s) of owner's value
         else:
-            # Most common case is OutputState has index, so assume that for efficiency
-            try:
-                # Get indexed item of owner's value
-                owner_val = self.owner.value[self.index]
-            except IndexError:
-                # Index is ALL, so use owner's entire value
-                if self.index is ALL:
-                    owner_val = self.owner.value
-                else:
-                    raise IndexError
+            return self._get_value_for_owner_value(self.owner.value, runtime_params=runtime_params, context=context)
 
-            # IMPLEMENTATION NOTE: OutputStates don't currently receive PathwayProjections,
-            #                      so there is no need to use their value (as do InputStates)
-            value = self.function(variable=owner_val,
-                                    params=runtime_params,
-                                    context=context)
-
-            if self.assign is None:
-                return value
+    def _get_value_for_owner_value(self, owner_value, runtime_params=None, context=None):
+        """Return the value of the OutputState for the specified value of its owner
+        """
+        # Most common case is OutputState has index, so assume that for efficiency
+        try:
+            # Get indexed item of owner's value
+            owner_val = owner_value[self.index]
+        except IndexError:
+            # Index is ALL, so use owner's entire value
+            if self.index is ALL:
+                owner_val = owner_value
             else:
-                return type_match(self.assign(owner_val), type(value))
+                raise IndexError
+
+        # IMPLEMENTATION NOTE: OutputStates don't currently receive PathwayProjections,
+        #                      so there is no need to use their value (as do InputStates)
+        value = self.function(variable=owner_val,
+                                params=runtime_params,
+                                context=context)
+
+        if self.assign is None:
+            return value
+        else:
+            return type_match(self.assign(owner_val), type(value))
 
     def _get_primary_state(self, mechanism):
         return mechanism.output_state
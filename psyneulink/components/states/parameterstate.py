@@ -337,6 +337,17 @@ its `function <ParameterState.function>` and the result is assigned as its `valu
 ParameterState's `value <ParameterState.value>` is used as the value of the corresponding parameter by the Component,
 or by its own `function <Component.function>`.
 
+.. _ParameterState_Static:
+
+A ParameterState that does not receive any ModulatoryProjections, is not assigned any runtime params, and does not have
+an `IntegratorFunction` as its `function <ParameterState.function>`, is not updated unless the value of its parameter
+has been reassigned since it was last updated:  its `value <ParameterState.value>` is then the same as when it was last
+updated, and so is left as it is.  The number of executions of its owner for which its update was skipped in this way is
+recorded in its `num_updates_skipped <ParameterState.num_updates_skipped>` attribute.  An update is not skipped if the
+ParameterState is being `logged <Log>`, so that each of its values is recorded.  Since a reassignment is identified by
+the parameter having been assigned a new object, a parameter that is a numpy array and is modified in place should be
+reassigned (e.g., ``my_mech.function_object.my_param = new_value``) for the change to take effect.
+
 .. note::
    It is important to note the distinction between the `function <ParameterState.function>` of a ParameterState,
    and the `function <Component.function>` of the Component to which it belongs. The former is used to determine the
@@ -358,15 +369,17 @@ import numpy as np
 import typecheck as tc
 
 from psyneulink.components.component import Component, InitStatus, function_type, method_type, parameter_keywords
-from psyneulink.components.functions.function import Linear, get_param_value_for_keyword
+from psyneulink.components.functions.function import IntegratorFunction, Linear, get_param_value_for_keyword
 from psyneulink.components.shellclasses import Mechanism, Projection
 from psyneulink.components.states.modulatorysignals.modulatorysignal import ModulatorySignal
 from psyneulink.components.states.state import StateError, State_Base, _instantiate_state, state_type_keywords
 from psyneulink.globals.keywords import CONTROL_PROJECTION, CONTROL_SIGNAL, CONTROL_SIGNALS, FUNCTION, FUNCTION_PARAMS, LEARNING_SIGNAL, LEARNING_SIGNALS, MECHANISM, NAME, PARAMETER_STATE, PARAMETER_STATES, PARAMETER_STATE_PARAMS, PATHWAY_PROJECTION, PROJECTION, PROJECTIONS, PROJECTION_TYPE, REFERENCE_VALUE, SENDER, VALUE
+from psyneulink.globals.log import LogCondition
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.utilities \
-    import ContentAddressableList, ReadOnlyOrderedDict, is_iterable, is_numeric, is_value_spec, iscompatible
+    import ContentAddressableList, ReadOnlyOrderedDict, is_iterable, is_numeric, is_sparse_matrix, is_value_spec, \
+    iscompatible
 
 __all__ = [
     'ParameterState', 'ParameterStateError', 'state_type_keywords',
@@ -374,6 +387,9 @@ __all__ = [
 
 state_type_keywords = state_type_keywords.update({PARAMETER_STATE})
 
+# marks a ParameterState that must be updated, since it has not been, or its value may change from one update to the next
+_NOT_STATIC = object()
+
 
 class ParameterStateError(Exception):
     def __init__(self, error_value):
@@ -503,6 +519,10 @@ class ParameterState(State_Base):
         `function <ParameterState.function>` may modify the latter under the influence of its
         `mod_afferents <ParameterState.mod_afferents>`.
 
+    num_updates_skipped : int
+        the number of executions of the ParameterState's owner for which its update was skipped, since its `value
+        <ParameterState.value>` could not have changed (see `ParameterState_Static`).
+
     name : str
         the name of the ParameterState; same as the name of the attribute for the Parameter to which the
         ParameterState corresponds.
@@ -539,6 +559,11 @@ class ParameterState(State_Base):
 
     paramClassDefaults = State_Base.paramClassDefaults.copy()
     paramClassDefaults.update({PROJECTION_TYPE: CONTROL_PROJECTION})
+
+    num_updates_skipped = 0
+    # the base value of the parameter when the ParameterState was last updated, if it could not have changed since
+    #    (see ParameterState_Static)
+    _static_base_value = _NOT_STATIC
     #endregion
 
     tc.typecheck
@@ -836,6 +861,37 @@ class ParameterState(State_Base):
 
         return state_spec, params_dict
 
+    def update(self, params=None, context=None):
+        """Update the ParameterState's value, unless it could not have changed since it was last updated (see
+        `ParameterState_Static`)
+        """
+        # an IntegratorFunction (such as the AccumulatorIntegrator of a MappingProjection's MATRIX ParameterState)
+        #    has a previous_value that can change its value, and so is always updated
+        static = (not self.mod_afferents
+                  and not (params and self.paramsType in params)
+                  and not isinstance(self.function_object, IntegratorFunction))
+        if static:
+            base_value = self._get_base_value()
+            if base_value is self._static_base_value and self.logPref == LogCondition.OFF:
+                self.num_updates_skipped += 1
+                return
+
+        super().update(params=params, context=context)
+
+        self._static_base_value = base_value if static else _NOT_STATIC
+
+    def _get_base_value(self):
+        """Return the backingfield ("base") value of the param for which the ParameterState is responsible"""
+        # Most commonly, ParameterState is for the parameter of a function
+        try:
+            return getattr(self.owner.function_object, '_'+ self.name)
+            # param_value = self.owner.function_object.params[self.name]
+
+        # Otherwise, should be for an attribute of the ParameterState's owner:
+        except AttributeError:
+            # param_value = self.owner.params[self.name]
+            return getattr(self.owner, '_'+ self.name)
+
     def _execute(self, variable=None, runtime_params=None, context=None):
         """Call self.function with current parameter value as the variable
 
@@ -846,17 +902,7 @@ class ParameterState(State_Base):
         if variable is not None:
             return self.function(variable, runtime_params, context)
         else:
-            # Most commonly, ParameterState is for the parameter of a function
-            try:
-                param_value = getattr(self.owner.function_object, '_'+ self.name)
-                # param_value = self.owner.function_object.params[self.name]
-
-           # Otherwise, should be for an attribute of the ParameterState's owner:
-            except AttributeError:
-                # param_value = self.owner.params[self.name]
-                param_value = getattr(self.owner, '_'+ self.name)
-
-            value = self.function(variable=param_value,
+            value = self.function(variable=self._get_base_value(),
                                   params=runtime_params,
                                   context=context)
             return value
@@ -1055,6 +1101,7 @@ def _instantiate_parameter_state(owner, param_name, param_value, context):
             from psyneulink.components.mechanisms.adaptive.adaptivemechanism import AdaptiveMechanism_Base
             if (
                 is_iterable(function_param_value)
+                and not is_sparse_matrix(function_param_value)
                 and any(isinstance(item, (ModulatorySignal, ModulatoryProjection_Base, AdaptiveMechanism_Base)) for item in function_param_value)
             ):
                 reference_value = function_param_value
@@ -1096,6 +1143,14 @@ def _is_legal_param_value(owner, value):
 
     # # lists, arrays or numeric values
     if is_value_spec(value):
+        # an array that contains functions (e.g., the noise of an Integrator) is executed by its owner, and so (like
+        #    a function; see below) is not assigned a ParameterState
+        if isinstance(value, np.ndarray) and value.dtype == object and any(callable(item) for item in value.flat):
+            return False
+        return True
+
+    # sparse matrix (e.g., the matrix of a MappingProjection)
+    if is_sparse_matrix(value):
         return True
 
     # tuple, first item of which is a legal parameter value
@@ -733,10 +733,11 @@ from psyneulink.components.component import Component, ComponentError, InitStatu
 from psyneulink.components.functions.function import Function, LinearCombination, ModulationParam, _get_modulated_param, get_param_value_for_keyword
 from psyneulink.components.shellclasses import Mechanism, Process_Base, Projection, State
 from psyneulink.globals.keywords import AUTO_ASSIGN_MATRIX, COMMAND_LINE, CONTEXT, CONTROL_PROJECTION_PARAMS, CONTROL_SIGNAL_SPECS, DEFERRED_INITIALIZATION, EXECUTING, EXPONENT, FUNCTION, FUNCTION_PARAMS, GATING_PROJECTION_PARAMS, GATING_SIGNAL_SPECS, INITIALIZING, INPUT_STATES, LEARNING, LEARNING_PROJECTION_PARAMS, LEARNING_SIGNAL_SPECS, MAPPING_PROJECTION_PARAMS, MATRIX, MECHANISM, MODULATORY_PROJECTIONS, MODULATORY_SIGNAL, NAME, OUTPUT_STATES, OWNER, PARAMETER_STATES, PARAMS, PATHWAY_PROJECTIONS, PREFS_ARG, PROJECTIONS, PROJECTION_PARAMS, PROJECTION_TYPE, RECEIVER, REFERENCE_VALUE, REFERENCE_VALUE_NAME, SENDER, SIZE, STANDARD_OUTPUT_STATES, STATE, STATE_PARAMS, STATE_TYPE, STATE_VALUE, VALUE, VARIABLE, WEIGHT, kwAssign, kwStateComponentCategory, kwStateContext, kwStateName, kwStatePrefs
+from psyneulink.globals.log import LogCondition, _tracks_execution_context
 from psyneulink.globals.preferences.componentpreferenceset import kpVerbosePref
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.registry import register_category
-from psyneulink.globals.utilities import ContentAddressableList, MODULATION_OVERRIDE, Modulation, convert_to_np_array, get_args, get_class_attributes, is_numeric, is_value_spec, iscompatible, merge_param_dicts, type_match
+from psyneulink.globals.utilities import ContentAddressableList, MODULATION_OVERRIDE, Modulation, convert_to_np_array, get_args, get_class_attributes, is_numeric, is_sparse_matrix, is_value_spec, iscompatible, merge_param_dicts, type_match
 from psyneulink.scheduling.time import TimeScale
 
 __all__ = [
@@ -1105,6 +1106,7 @@ class State_Base(State):
         self.path_afferents = []
         self.mod_afferents = []
         self.efferents = []
+        self._afferent_routing = None
         self._stateful = False
 
         self._path_proj_values = []
@@ -1165,7 +1167,7 @@ class State_Base(State):
             if size is not None:
                 size = checkAndCastInt(size)
             try:
-                if variable is not None:
+                if variable is not None and not is_sparse_matrix(variable):
                     variable = self._update_variable(np.atleast_1d(variable))
             except:
                 raise StateError("Failed to convert variable (of type {}) to a 1D array.".format(type(variable)))
@@ -1508,8 +1510,10 @@ class State_Base(State):
             #    and assigned Projection to self.path_afferents or mod_afferents lists
             if isinstance(projection, PathwayProjection_Base) and not projection in self.path_afferents:
                 self.path_afferents.append(projection)
+                self._afferent_routing = None
             elif isinstance(projection, ModulatoryProjection_Base) and not projection in self.mod_afferents:
                 self.mod_afferents.append(projection)
+                self._afferent_routing = None
 
 
     def _instantiate_projection_from_state(self, projection_spec, receiver=None, context=None):
@@ -1821,6 +1825,7 @@ class State_Base(State):
         raise StateError("PROGRAM ERROR: {} does not implement _parse_state_specific_specs method".
                          format(self.__class__.__name__))
 
+    @_tracks_execution_context
     def update(self, params=None, context=None):
         """Update each projection, combine them, and assign return result
 
@@ -1851,30 +1856,24 @@ class State_Base(State):
 
         # AGGREGATE INPUT FROM PROJECTIONS -----------------------------------------------------------------------
 
-        # Get type-specific params from PROJECTION_PARAMS
-        mapping_params = merge_param_dicts(self.stateParams, MAPPING_PROJECTION_PARAMS, PROJECTION_PARAMS)
-        learning_projection_params = merge_param_dicts(self.stateParams, LEARNING_PROJECTION_PARAMS, PROJECTION_PARAMS)
-        control_projection_params = merge_param_dicts(self.stateParams, CONTROL_PROJECTION_PARAMS, PROJECTION_PARAMS)
-        gating_projection_params = merge_param_dicts(self.stateParams, GATING_PROJECTION_PARAMS, PROJECTION_PARAMS)
+        # Get type-specific params from PROJECTION_PARAMS (only if any params were specified)
+        if self.stateParams:
+            type_specific_params = {
+                params_keyword: merge_param_dicts(self.stateParams, params_keyword, PROJECTION_PARAMS)
+                for params_keyword in (MAPPING_PROJECTION_PARAMS, LEARNING_PROJECTION_PARAMS,
+                                       CONTROL_PROJECTION_PARAMS, GATING_PROJECTION_PARAMS)
+            }
 
         #For each projection: get its params, pass them to it, get the projection's value, and append to relevant list
         self._path_proj_values = []
         for value in self._mod_proj_values:
             self._mod_proj_values[value] = []
 
-        from psyneulink.components.process import ProcessInputState
-        from psyneulink.components.projections.pathway.pathwayprojection import PathwayProjection_Base
-        from psyneulink.components.projections.modulatory.modulatoryprojection import ModulatoryProjection_Base
-        from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
-        from psyneulink.components.projections.modulatory.learningprojection import LearningProjection
-        from psyneulink.components.projections.modulatory.controlprojection import ControlProjection
-        from psyneulink.components.projections.modulatory.gatingprojection import GatingProjection
-
         # If owner is a Mechanism, get its execution_id
         if isinstance(self.owner, (Mechanism, Process_Base)):
             self_id = self.owner._execution_id
         # If owner is a MappingProjection, get it's sender's execution_id
-        elif isinstance(self.owner, MappingProjection):
+        elif isinstance(self.owner, Projection):
             self_id = self.owner.sender.owner._execution_id
         else:
             raise StateError("PROGRAM ERROR: Object ({}) of type {} has a {}, but this is only allowed for "
@@ -1883,15 +1882,17 @@ class State_Base(State):
 
         modulatory_override = False
 
+        routing = self._get_afferent_routing()
+
+        # If the values of the PathwayProjections can be computed in a single operation, get the object that does so
+        #    (see InputState_Fused_Projections);  it is not used if any runtime params were specified for the State
+        fused_projections = None if self.stateParams else self._get_fused_projections()
+
         # Get values of all Projections
-        for projection in self.all_afferents:
+        for projection, params_keyword, is_pathway, is_modulatory, is_learning in routing:
 
-            # Only update if sender has also executed in this round
-            #     (i.e., has same execution_id as owner)
-            # Get sender's execution id
-            if hasattr(projection, 'sender'):
-                sender = projection.sender
-            else:
+            sender = getattr(projection, 'sender', None)
+            if sender is None:
                 if self.verbosePref:
                     warnings.warn("{} to {} {} of {} ignored [has no sender]".format(projection.__class__.__name__,
                                                                                      self.name,
@@ -1899,34 +1900,32 @@ class State_Base(State):
                                                                                      self.owner.name))
                 continue
 
-            sender_id = sender.owner._execution_id
-            if isinstance(sender.owner, Mechanism):
-                if (not sender.owner.ignore_execution_id) and (sender_id != self_id):
-                    continue
-            else:
-                if sender_id != self_id:
+            # Only update if sender has also executed in this round
+            #     (i.e., has same execution_id as owner)
+            sender_owner = sender.owner
+            if sender_owner._execution_id != self_id:
+                if not (isinstance(sender_owner, Mechanism) and sender_owner.ignore_execution_id):
                     continue
 
-            # Only accept projections from a Process to which the owner Mechanism belongs
-            if isinstance(sender, ProcessInputState):
-                if not sender.owner in self.owner.processes.keys():
-                    continue
+            # Only accept projections from a Process (i.e., its ProcessInputState) to which the owner Mechanism belongs
+            if isinstance(sender_owner, Process_Base) and not sender_owner in self.owner.processes:
+                continue
 
             # Merge with relevant projection type-specific params
-            if isinstance(projection, MappingProjection):
-                projection_params = merge_param_dicts(self.stateParams, projection.name, mapping_params, )
-            elif isinstance(projection, LearningProjection):
-                projection_params = merge_param_dicts(self.stateParams, projection.name, learning_projection_params)
-            elif isinstance(projection, ControlProjection):
-                projection_params = merge_param_dicts(self.stateParams, projection.name, control_projection_params)
-            elif isinstance(projection, GatingProjection):
-                projection_params = merge_param_dicts(self.stateParams, projection.name, gating_projection_params)
-            if not projection_params:
+            if self.stateParams and params_keyword is not None:
+                projection_params = merge_param_dicts(self.stateParams, projection.name,
+                                                      type_specific_params[params_keyword]) or None
+            else:
                 projection_params = None
 
+            # Add PathwayProjection to those to be computed together below
+            if is_pathway and fused_projections is not None:
+                fused_projections.add(projection, context=context)
+                continue
+
             # Update LearningSignals only if context == LEARNING;  otherwise, assign zero for projection_value
             # Note: done here rather than in its own method in order to exploit parsing of params above
-            if isinstance(projection, LearningProjection) and not LEARNING in context:
+            if is_learning and not LEARNING in context:
                 projection_value = projection.value * 0.0
             else:
                 projection_value = projection.execute(runtime_params=projection_params,
@@ -1936,14 +1935,18 @@ class State_Base(State):
             if INITIALIZING in context and projection.init_status is InitStatus.DEFERRED_INITIALIZATION:
                 continue
 
-            if isinstance(projection, PathwayProjection_Base):
+            if is_pathway:
+                # Assign the value of a PathwayProjection that is being logged (as is done by _FusedMappingProjections)
+                if projection.logPref != LogCondition.OFF:
+                    projection.value = projection_value
                 # Add projection_value to list of PathwayProjection values (for aggregation below)
                 self._path_proj_values.append(projection_value)
 
             # If it is a ModulatoryProjection, add its value to the list in the dict entry for the relevant mod_param
-            elif isinstance(projection, ModulatoryProjection_Base):
+            elif is_modulatory:
                 # Get the meta_param to be modulated from modulation attribute of the  projection's ModulatorySignal
                 #    and get the function parameter to be modulated to type_match the projection value below
+                #    (this is not cached with the routing, since the modulation of a ModulatorySignal can be changed)
                 mod_meta_param, mod_param_name, mod_param_value = _get_modulated_param(self, projection)
                 # If meta_param is DISABLE, ignore the ModulatoryProjection
                 if mod_meta_param is Modulation.DISABLE:
@@ -1962,10 +1965,16 @@ class State_Base(State):
                     else:
                         self.value = type_match(projection_value, type(self.value))
                         return
+                # a sparse weight change (see LearningProjection) is kept sparse, so that it preserves the matrix
+                elif is_sparse_matrix(projection_value):
+                    mod_value = projection_value
                 else:
                     mod_value = type_match(projection_value, type(mod_param_value))
                 self._mod_proj_values[mod_meta_param].append(mod_value)
 
+        if fused_projections is not None:
+            self._path_proj_values = fused_projections.execute(context=context)
+
         # Handle ModulatoryProjection OVERRIDE
         #    if there is one and it wasn't been handled above (i.e., if paramValidation is set)
         if modulatory_override:
@@ -2010,10 +2019,78 @@ class State_Base(State):
     def projections(self, assignment):
         self._projections = assignment
 
+    @property
+    def path_afferents(self):
+        return self._path_afferents
+
+    @path_afferents.setter
+    def path_afferents(self, assignment):
+        self._path_afferents = assignment
+        self._afferent_routing = None
+
+    @property
+    def mod_afferents(self):
+        return self._mod_afferents
+
+    @mod_afferents.setter
+    def mod_afferents(self, assignment):
+        self._mod_afferents = assignment
+        self._afferent_routing = None
+
     @property
     def all_afferents(self):
         return self.path_afferents + self.mod_afferents
 
+    def _get_afferent_routing(self):
+        """Return, for each Projection in all_afferents, a tuple used by update to route its value:  the Projection,
+        the keyword for the params of its type, and whether it is a PathwayProjection, a ModulatoryProjection, and a
+        LearningProjection
+
+        The tuples are cached until a Projection is added to the State, or either list of its afferents is assigned;
+        they are not cached while any of the Projections has deferred initialization.  They don't include the sender
+        of each Projection, which update gets from the Projection, since that can be reassigned after the Projection
+        has been constructed (e.g., to a LearningProjection when learning is instantiated for a System).
+        """
+        if self._afferent_routing is not None:
+            return self._afferent_routing
+
+        from psyneulink.components.projections.pathway.pathwayprojection import PathwayProjection_Base
+        from psyneulink.components.projections.modulatory.modulatoryprojection import ModulatoryProjection_Base
+        from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
+        from psyneulink.components.projections.modulatory.learningprojection import LearningProjection
+        from psyneulink.components.projections.modulatory.controlprojection import ControlProjection
+        from psyneulink.components.projections.modulatory.gatingprojection import GatingProjection
+
+        params_keywords = ((MappingProjection, MAPPING_PROJECTION_PARAMS),
+                           (LearningProjection, LEARNING_PROJECTION_PARAMS),
+                           (ControlProjection, CONTROL_PROJECTION_PARAMS),
+                           (GatingProjection, GATING_PROJECTION_PARAMS))
+
+        routing = []
+        cacheable = True
+        for projection in self.all_afferents:
+            if projection.init_status is InitStatus.DEFERRED_INITIALIZATION:
+                cacheable = False
+            params_keyword = next((keyword for projection_type, keyword in params_keywords
+                                   if isinstance(projection, projection_type)), None)
+            routing.append((projection,
+                            params_keyword,
+                            isinstance(projection, PathwayProjection_Base),
+                            isinstance(projection, ModulatoryProjection_Base),
+                            isinstance(projection, LearningProjection)))
+
+        if cacheable:
+            self._afferent_routing = routing
+        return routing
+
+    def _get_fused_projections(self):
+        """Return an object used by update to compute the values of all of the State's PathwayProjections together,
+        or None if they are computed one at a time
+
+        This is a stub, that a State subclass can override (see InputState._get_fused_projections).
+        """
+        return None
+
     def _assign_default_state_name(self, context=None):
         return False
 
@@ -2661,6 +2738,10 @@ def _parse_state_spec(state_type=None,
     elif is_value_spec(state_specification):
         state_dict[REFERENCE_VALUE] = np.atleast_1d(state_specification)
 
+    # sparse matrix (e.g., for the MATRIX ParameterState of a MappingProjection), so also use as variable of State
+    elif is_sparse_matrix(state_specification):
+        state_dict[REFERENCE_VALUE] = state_specification
+
     elif isinstance(state_specification, Iterable) or state_specification is None:
 
         # Standard state specification dict
@@ -23,6 +23,7 @@
          * `System_Execution_Input_And_Initialization`
          * `System_Execution_Learning`
          * `System_Execution_Control`
+         * `System_Execution_State`
       * `System_Class_Reference`
 
 
@@ -341,6 +342,67 @@ for control <ControlMechanism_Control_Signals>`, which then take effect in the n
 additional information about control). The control Components of a System can be displayed using the System's
 `show_graph`method with its **show_control** argument assigned `True`.
 
+.. _System_Execution_State:
+
+Saving and Restoring State
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+The state of a System -- the numerical values that are changed by its execution, and that determine the outcome of
+subsequent executions -- can be saved using its `save_state <System.save_state>` method, and restored (any number of
+times) using its `restore_state <System.restore_state>` method.  This includes:
+
+  * the `value <Component.value>` of each of its `Processes <Process>` and `Mechanisms <Mechanism>`, their `States
+    <State>`, the `Projections <Projection>` to and from those, and the `Functions <Function>` of all of these;
+  ..
+  * the state of those Functions that carry information from one execution to the next, such as the `previous_value
+    <Integrator.previous_value>` of an `Integrator` Function, and of any random number generators they use;
+  ..
+  * the `cost <ControlSignal.cost>` of each `ControlSignal`, and the values used to compute it;
+  ..
+  * the `Clock` and execution counts of its `Schedulers <Scheduler>`, and the `Conditions <Condition>` that count
+    the times they have been satisfied.
+
+The System's `results <System.results>`, the `Logs <Log>` of its Components, and the values of their parameters
+are not saved, nor are the values assigned to their parameters (as distinct from the values of their `ParameterStates
+<ParameterState>`), or the global random number generator used by Functions that do not have their own.  The random
+number generators of the System's `controller <System.controller>` and its `function <ControlMechanism.function>`
+(e.g., one used to sample allocation policies) are not saved either, since they are not used to execute the System,
+and restoring them would make the controller repeat the same samples each time the state is restored.  The state is
+returned as a `SystemState`, which stores the values that are numpy arrays of numbers in a single buffer, so that
+restoring them requires only one copy of that buffer;  the history kept by a `Clock` is only added to, and so is
+restored by discarding anything added since it was saved.  An `EVCControlMechanism` can use this to run each of its
+simulations from the state that the System was in when the EVCControlMechanism was executed, and to restore that state
+after them (see `EVCControlMechanism_Simulation_State`).
+
+Independent runs of the same System can be interleaved by saving the state of each when it is left, and restoring it
+before it is continued.  For example, the following runs two sequences of inputs in alternation, each of which picks
+up from the state in which it was last left::
+
+    >>> states = {'a': my_system.save_state(), 'b': my_system.save_state()}  # doctest: +SKIP
+    >>> for input_a, input_b in zip(inputs_a, inputs_b):  # doctest: +SKIP
+    ...     for key, inputs in [('a', input_a), ('b', input_b)]:
+    ...         my_system.restore_state(states[key])
+    ...         my_system.run(inputs=inputs)
+    ...         states[key] = my_system.save_state()
+
+The state of the System is held by its Components themselves, and not stored separately for each run, so only one run
+of a System can be executed at a time;  a System cannot be executed concurrently (e.g., from more than one thread).
+
+.. _System_Random_States:
+
+*Random States*
+
+By default, the Components of a System that draw random values (such as a `DDM`, or the `DistributionFunction`
+assigned as the `noise <TransferMechanism.noise>` of a `TransferMechanism`) draw them from the global random number
+generator of numpy, so that the values each draws depend on those drawn by all of the others, and by any other code
+that uses that generator.  Calling the System's `seed_random_states <System.seed_random_states>` method with a seed
+assigns each of them its own ``np.random.RandomState`` as its `random_state <Component.random_state>`, seeded from an
+``np.random.SeedSequence`` created from that seed.  The values each Component draws are then determined only by the
+seed and the number of values it has drawn.  Since these are saved and restored with the rest of the `state of the
+System <System_Execution_State>`, simulations run by an `EVCControlMechanism` with `restore_system_state
+<EVCControlMechanism.restore_system_state>` are then the same whether they are run serially or `divided among processes
+<EVCControlMechanism_Parallel_Simulation>`.
+
 
 .. _System_Examples:
 
@@ -423,6 +485,8 @@ Class Reference
 
 """
 
+import copy
+import functools
 import inspect
 import logging
 import math
@@ -430,7 +494,7 @@ import numbers
 import re
 import warnings
 
-from collections import OrderedDict, namedtuple
+from collections import OrderedDict, deque, namedtuple
 
 import numpy as np
 import typecheck as tc
@@ -443,15 +507,17 @@ from psyneulink.components.mechanisms.adaptive.learning.learningauxilliary impor
 from psyneulink.components.mechanisms.mechanism import MechanismList
 from psyneulink.components.mechanisms.processing.objectivemechanism import DEFAULT_MONITORED_STATE_EXPONENT, DEFAULT_MONITORED_STATE_MATRIX, DEFAULT_MONITORED_STATE_WEIGHT, ObjectiveMechanism
 from psyneulink.components.process import Process, ProcessList, ProcessTuple
-from psyneulink.components.shellclasses import Mechanism, Process_Base, System_Base
+from psyneulink.components.shellclasses import Function, Mechanism, Process_Base, System_Base
 from psyneulink.components.states.inputstate import InputState
 from psyneulink.components.states.state import _parse_state_spec
+from psyneulink.globals.context import ExecutionContext
 from psyneulink.globals.keywords import ALL, COMPONENT_INIT, CONROLLER_PHASE_SPEC, CONTROL, CONTROLLER, CYCLE, EVC_SIMULATION, EXECUTING, EXPONENT, FUNCTION, IDENTITY_MATRIX, INITIALIZED, INITIALIZE_CYCLE, INITIALIZING, INITIAL_VALUES, INTERNAL, LEARNING, LEARNING_SIGNAL, MATRIX, MONITOR_FOR_CONTROL, ORIGIN, PARAMS, PROJECTIONS, SAMPLE, SEPARATOR_BAR, SINGLETON, SYSTEM, SYSTEM_INIT, TARGET, TERMINAL, WEIGHT, kwSeparator, kwSystemComponentCategory
-from psyneulink.globals.log import Log
+from psyneulink.globals.log import Log, _set_execution_context, _tracks_execution_context
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.registry import register_category
 from psyneulink.globals.utilities import AutoNumber, ContentAddressableList, append_type_to_name, convert_to_np_array, insert_list, iscompatible
+from psyneulink.scheduling.condition import Condition
 from psyneulink.scheduling.scheduler import Scheduler
 from psyneulink.scheduling.time import TimeScale
 
@@ -460,7 +526,7 @@ __all__ = [
     'LEARNING_MECHANISMS', 'LEARNING_PROJECTION_RECEIVERS', 'MECHANISMS', 'MonitoredOutputStateTuple',
     'NUM_PHASES_PER_TRIAL', 'ORIGIN_MECHANISMS',
     'OUTPUT_STATE_NAMES', 'OUTPUT_VALUE_ARRAY', 'PROCESSES', 'RECURRENT_INIT_ARRAY', 'RECURRENT_MECHANISMS', 'SCHEDULER',
-    'System', 'SYSTEM_TARGET_INPUT_STATE', 'SystemError', 'SystemInputState', 'SystemRegistry',
+    'System', 'SYSTEM_TARGET_INPUT_STATE', 'SystemError', 'SystemInputState', 'SystemRegistry', 'SystemState',
     'SystemWarning', 'TARGET_MECHANISMS', 'TERMINAL_MECHANISMS',
 ]
 
@@ -2436,6 +2502,7 @@ class System(System_Base):
         for mech, value in self.initial_values.items():
             mech.initialize(value)
 
+    @_tracks_execution_context
     def execute(self,
                 input=None,
                 target=None,
@@ -2491,8 +2558,13 @@ class System(System_Base):
             self.scheduler_learning = Scheduler(graph=self.learning_execution_graph)
 
         if not context:
-            context = EXECUTING + " " + SYSTEM + " " + self.name
+            context = ExecutionContext(EXECUTING + " " + SYSTEM + " " + self.name)
             self.execution_status = ExecutionStatus.EXECUTING
+            _set_execution_context(context)
+        elif isinstance(context, str):
+            # so that the methods to which context is passed test its keywords as flags (see Context)
+            context = ExecutionContext(context)
+            _set_execution_context(context)
 
         # Update execution_id for self and all mechanisms in graph (including learning) and controller
         from psyneulink.globals.environment import _get_unique_id
@@ -2628,25 +2700,28 @@ class System(System_Base):
         if self.scheduler_processing is None:
             raise SystemError('System.py:_execute_processing - {0}\'s scheduler is None, '
                               'must be initialized before execution'.format(self.name))
-        logger.debug('{0}.scheduler processing termination conditions: {1}'.format(self, self.termination_processing))
+        # checked once per call, so that no debug messages are formatted per Mechanism unless DEBUG is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug('{0}.scheduler processing termination conditions: {1}'.
+                         format(self, self.termination_processing))
         for next_execution_set in self.scheduler_processing.run(termination_conds=self.termination_processing):
-            logger.debug('Running next_execution_set {0}'.format(next_execution_set))
+            if debug:
+                logger.debug('Running next_execution_set {0}'.format(next_execution_set))
             i = 0
             for mechanism in next_execution_set:
-                logger.debug('\tRunning Mechanism {0}'.format(mechanism))
+                if debug:
+                    logger.debug('\tRunning Mechanism {0}'.format(mechanism))
                 for p in self.processes:
                     try:
                         rt_params = p.runtime_params_dict[mechanism]
                     except:
                         rt_params = None
 
-                processes = list(mechanism.processes.keys())
-                process_keys_sorted = sorted(processes, key=lambda i : processes[processes.index(i)].name)
-                process_names = list(p.name for p in process_keys_sorted)
-
+                # the description of the Mechanism is only formatted if the string form of the context is used
                 mechanism.execute(
                     runtime_params=rt_params,
-                    context=context + "| Mechanism: " + mechanism.name + " [in processes: " + str(process_names) + "]"
+                    context=context + functools.partial(self._get_mechanism_context_string, mechanism)
                 )
 
 
@@ -2679,6 +2754,13 @@ class System(System_Base):
                 pass
             i += 1
 
+    def _get_mechanism_context_string(self, mechanism):
+        processes = list(mechanism.processes.keys())
+        process_keys_sorted = sorted(processes, key=lambda i : processes[processes.index(i)].name)
+        process_names = list(p.name for p in process_keys_sorted)
+        return "| Mechanism: " + mechanism.name + " [in processes: " + str(process_names) + "]"
+
+    @_tracks_execution_context
     def _execute_learning(self, context=None):
         # Execute each LearningMechanism as well as LearningProjections in self.learning_execution_list
 
@@ -2710,11 +2792,16 @@ class System(System_Base):
         if self.scheduler_learning is None:
             raise SystemError('System.py:_execute_learning - {0}\'s scheduler is None, '
                               'must be initialized before execution'.format(self.name))
-        logger.debug('{0}.scheduler learning termination conditions: {1}'.format(self, self.termination_learning))
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug('{0}.scheduler learning termination conditions: {1}'.
+                         format(self, self.termination_learning))
         for next_execution_set in self.scheduler_learning.run(termination_conds=self.termination_learning):
-            logger.debug('Running next_execution_set {0}'.format(next_execution_set))
+            if debug:
+                logger.debug('Running next_execution_set {0}'.format(next_execution_set))
             for component in next_execution_set:
-                logger.debug('\tRunning component {0}'.format(component))
+                if debug:
+                    logger.debug('\tRunning component {0}'.format(component))
 
                 from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
                 if isinstance(component, MappingProjection):
@@ -2743,9 +2830,11 @@ class System(System_Base):
 
         # THEN update all MappingProjections
         for next_execution_set in self.scheduler_learning.run(termination_conds=self.termination_learning):
-            logger.debug('Running next_execution_set {0}'.format(next_execution_set))
+            if debug:
+                logger.debug('Running next_execution_set {0}'.format(next_execution_set))
             for component in next_execution_set:
-                logger.debug('\tRunning component {0}'.format(component))
+                if debug:
+                    logger.debug('\tRunning component {0}'.format(component))
 
                 if isinstance(component, (LearningMechanism, ObjectiveMechanism)):
                     continue
@@ -3127,42 +3216,57 @@ class System(System_Base):
             result.extend(sorted(dependency_set, key=lambda item : next(d_iter).name))
         return result
 
-    def _cache_state(self):
+    def save_state(self):
+        """Save the current state of the System (see `System_Execution_State`).
+
+        Returns
+        -------
+
+        the state of the System : SystemState
+
+        """
+        return SystemState(self)
+
+    def restore_state(self, state):
+        """Restore a state of the System saved by `save_state <System.save_state>` (see `System_Execution_State`).
+
+        Arguments
+        ---------
 
-        # http://stackoverflow.com/questions/11218477/how-can-i-use-pickle-to-save-a-dict
-        # import pickle
-        #
-        # a = {'hello': 'world'}
-        #
-        # with open('filename.pickle', 'wb') as handle:
-        #     pickle.dump(a, handle, protocol=pickle.HIGHEST_PROTOCOL)
-        #
-        # with open('filename.pickle', 'rb') as handle:
-        #     b = pickle.load(handle)
-        #
-        # print a == b
-
-        # >>> import dill
-        # >>> pik = dill.dumps(d)
-
-        # import pickle
-        # with open('cached_PNL_sys.pickle', 'wb') as handle:
-        #     pickle.dump(self, handle, protocol=pickle.HIGHEST_PROTOCOL)
-
-        # import dill
-        # self.cached_system = dill.dumps(self, recurse=True)
-
-        # def mechanisms_cache:
-        #     self.input_value = []
-        #     self.value= []
-        #     self.output_value = []
-        #
-        # for mech in self.mechanisms:
-        #     for
-        pass
+        state : SystemState
+            the state to be restored;  it must have been saved for the System, and can be restored any number of
+            times.
+
+        """
+        if state.system is not self:
+            raise SystemError("{} cannot be restored to a state saved for {}".format(self.name, state.system.name))
+        state._restore()
+
+    def seed_random_states(self, seed):
+        """Assign each Component of the System that draws random values its own seeded random number generator (see
+        `System_Random_States`).
+
+        Arguments
+        ---------
+
+        seed : int or None
+            the seed from which the random number generator of each Component is seeded;  if it is `None`, the
+            generators are seeded from fresh entropy.
+
+        """
+        # the Components are found in the same order each time the System is constructed, so that each is assigned
+        #    the same child of the SeedSequence for a given seed
+        components = [component for component in _get_stateful_objects(self)
+                      if getattr(component, '_draws_random_numbers', False)]
+        seed_sequence = np.random.SeedSequence(seed)
+        for component, child_seed_sequence in zip(components, seed_sequence.spawn(len(components))):
+            component.random_state = np.random.RandomState(np.random.MT19937(child_seed_sequence))
+
+    def _cache_state(self):
+        self._cached_state = self.save_state()
 
     def _restore_state(self):
-        pass
+        self.restore_state(self._cached_state)
 
     @property
     def mechanisms(self):
@@ -3574,6 +3678,236 @@ class System(System_Base):
             return G
 
 
+# Attributes of Components, Schedulers and Conditions that are changed by execution (see System_Execution_State);
+#    each is saved if it is in the instance's __dict__ (so that properties are not, and no Log entries are made)
+_STATE_ATTRIBUTES = (
+    '_value', '_old_value', '_is_finished', '_execution_cache_key', '_fused_value',
+    # stateful Functions
+    'previous_value', 'previous_time', 'previous_v', 'previous_w',
+    'previous_short_term_utility', 'previous_long_term_utility',
+    # ControlSignals
+    'last_intensity', 'cost', 'last_cost', 'intensity_cost', 'adjustment_cost', 'duration_cost', 'last_duration_cost',
+    # Schedulers and Conditions
+    'counts_total', 'counts_useable', 'last_time_step_run', 'satisfactions',
+)
+
+# the values saved in the buffer of a SystemState are aligned to multiples of this number of bytes
+_STATE_BUFFER_ALIGNMENT = 16
+
+
+class SystemState:
+    """
+    SystemState(system)
+
+    The state of a `System`, returned by its `save_state <System.save_state>` method, that can be restored by its
+    `restore_state <System.restore_state>` method (see `System_Execution_State` for the values it includes).
+
+    The values that are numpy arrays of numbers are stored in a single buffer;  when the state is restored, the
+    buffer is copied once, and each value is assigned a view of the copy, so that the values can be modified by
+    execution without affecting the SystemState.  Values that are the same array are restored as the same array.
+    Other values are copied (using `copy.deepcopy`) when they are saved and each time they are restored.
+
+    Arguments
+    ---------
+
+    system : System
+        the System for which the state is saved.
+
+    Attributes
+    ----------
+
+    system : System
+        the System for which the state was saved.
+
+    nbytes : int
+        the size of the buffer in which the values that are numpy arrays are stored.
+
+    """
+
+    def __init__(self, system):
+        self.system = system
+
+        array_specs = []
+        arrays = []
+        array_indices = {}
+        buffer_size = 0
+        self._array_entries = []
+        self._immutable_entries = []
+        self._object_entries = []
+        objects = []
+        self._random_states = []
+
+        controller_objects = _get_controller_objects(system)
+
+        for owner in _get_stateful_objects(system):
+            owner_dict = owner.__dict__
+            # the value of a MappingProjection computed by an InputState is otherwise assigned only when it is read
+            #    (see InputState_Fused_Projections)
+            if owner_dict.get('_fused_value') is not None:
+                owner._assign_fused_value()
+            for attribute in _STATE_ATTRIBUTES:
+                if attribute not in owner_dict:
+                    continue
+                value = owner_dict[attribute]
+                if isinstance(value, np.ndarray) and value.dtype.kind in 'biufc':
+                    try:
+                        index = array_indices[id(value)]
+                    except KeyError:
+                        index = array_indices[id(value)] = len(arrays)
+                        array_specs.append((buffer_size, value.nbytes, value.dtype, value.shape))
+                        arrays.append(value)
+                        buffer_size += -(-value.nbytes // _STATE_BUFFER_ALIGNMENT) * _STATE_BUFFER_ALIGNMENT
+                    self._array_entries.append((owner_dict, attribute, index))
+                elif value is None or isinstance(value, (numbers.Number, str, np.generic)):
+                    self._immutable_entries.append((owner_dict, attribute, value))
+                else:
+                    self._object_entries.append((owner_dict, attribute))
+                    objects.append(value)
+            if id(owner) in controller_objects:
+                continue
+            for value in owner_dict.values():
+                if isinstance(value, np.random.RandomState):
+                    self._random_states.append((value, value.get_state()))
+
+        self._buffer = np.empty(buffer_size, dtype=np.uint8)
+        for (start, nbytes, dtype, shape), array in zip(array_specs, arrays):
+            self._buffer[start:start + nbytes] = np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+        self._array_specs = array_specs
+        # copied together, so that values that refer to the same object continue to do so
+        self._objects = copy.deepcopy(objects)
+
+        self._schedulers = [(scheduler, _get_execution_list_state(scheduler.execution_list),
+                             _get_clock_state(scheduler.clock))
+                            for scheduler in (system.scheduler_processing, system.scheduler_learning)
+                            if scheduler is not None]
+
+    @property
+    def nbytes(self):
+        return self._buffer.nbytes
+
+    def _restore(self):
+        buffer = self._buffer.copy()
+        arrays = [buffer[start:start + nbytes].view(dtype).reshape(shape)
+                  for start, nbytes, dtype, shape in self._array_specs]
+        for owner_dict, attribute, index in self._array_entries:
+            owner_dict[attribute] = arrays[index]
+        for owner_dict, attribute, value in self._immutable_entries:
+            owner_dict[attribute] = value
+        for (owner_dict, attribute), value in zip(self._object_entries, copy.deepcopy(self._objects)):
+            owner_dict[attribute] = value
+        for random_state, state in self._random_states:
+            random_state.set_state(state)
+
+        for scheduler, execution_list_state, clock_state in self._schedulers:
+            scheduler.execution_list = _restore_execution_list(scheduler.execution_list, execution_list_state)
+            _restore_clock(scheduler.clock, clock_state)
+
+
+def _get_controller_objects(system):
+    """Return the ids of the controller of **system** and of the Functions assigned to it and its function_object
+    (e.g., the search function of an EVCControlMechanism), the random number generators of which are not saved in a
+    SystemState
+    """
+    controller_objects = set()
+    if system.controller is None:
+        return controller_objects
+
+    def add(obj):
+        if id(obj) not in controller_objects:
+            controller_objects.add(id(obj))
+            for value in list(obj.__dict__.values()):
+                if isinstance(value, Function):
+                    add(value)
+
+    controller_objects.add(id(system.controller))
+    if system.controller.function_object is not None:
+        add(system.controller.function_object)
+    return controller_objects
+
+
+def _get_stateful_objects(system):
+    """Return the Components of **system** (including their Functions), and its Schedulers and their Conditions,
+    that may have attributes in _STATE_ATTRIBUTES
+    """
+    components = OrderedDict()
+
+    def add(component):
+        if id(component) not in components:
+            components[id(component)] = component
+            # Functions assigned to a Component (e.g., its function_object, or the cost functions of a ControlSignal)
+            for value in list(component.__dict__.values()):
+                if isinstance(value, Function):
+                    add(value)
+                # the function of a Function, assigned (e.g.) as the noise of a Mechanism or Integrator
+                elif isinstance(getattr(value, '__self__', None), Function):
+                    add(value.__self__)
+
+    mechanisms = list(system.mechanisms)
+    if system.controller is not None:
+        mechanisms.append(system.controller)
+    for process in system.processes:
+        add(process)
+    for state in list(system.stimulusInputStates) + list(system.target_input_states):
+        add(state)
+    for mechanism in mechanisms:
+        add(mechanism)
+        for state in list(mechanism.input_states) + list(mechanism._parameter_states) + list(mechanism.output_states):
+            add(state)
+            for projection in state.path_afferents + state.mod_afferents + state.efferents:
+                add(projection)
+                for parameter_state in getattr(projection, '_parameter_states', None) or []:
+                    add(parameter_state)
+
+    stateful_objects = list(components.values())
+    for scheduler in (system.scheduler_processing, system.scheduler_learning):
+        if scheduler is None:
+            continue
+        stateful_objects.append(scheduler)
+        conditions = list(scheduler.condition_set.conditions.values()) + list(scheduler.termination_conds.values())
+        while conditions:
+            condition = conditions.pop()
+            if condition is None:
+                continue
+            stateful_objects.append(condition)
+            conditions.extend(arg for arg in condition.args if isinstance(arg, Condition))
+
+    return stateful_objects
+
+
+def _get_execution_list_state(execution_list):
+    # a list is only added to, and so is restored by discarding anything added to it;  a deque (see
+    #    Scheduler.execution_list_maxlen) discards items as it is added to, and so is copied
+    if isinstance(execution_list, list):
+        return len(execution_list)
+    return list(execution_list)
+
+
+def _restore_execution_list(execution_list, state):
+    if isinstance(state, int):
+        del execution_list[state:]
+        return execution_list
+    return deque(state, maxlen=execution_list.maxlen)
+
+
+def _get_clock_state(clock):
+    # the history of a Clock is only added to (by appending a child to the last node at each level of its tree),
+    #    so only the number of children and the totals of the last node at each level are saved
+    last_nodes = []
+    node = clock.history
+    while node is not None:
+        last_nodes.append((node, len(node.children), dict(node.total_times)))
+        node = node.children[-1] if node.children else None
+    return dict(vars(clock.history.current_time)), last_nodes
+
+
+def _restore_clock(clock, state):
+    current_time, last_nodes = state
+    vars(clock.history.current_time).update(current_time)
+    for node, num_children, total_times in last_nodes:
+        del node.children[num_children:]
+        node.total_times = dict(total_times)
+
+
 SYSTEM_TARGET_INPUT_STATE = 'SystemInputState'
 
 from psyneulink.components.states.outputstate import OutputState
@@ -1,3 +1,4 @@
+from . import context
 from . import defaults
 from . import environment
 from . import keywords
@@ -7,6 +8,7 @@ from . import preferences
 from . import registry
 from . import utilities
 
+from .context import *
 from .defaults import *
 from .environment import *
 from .keywords import *
@@ -16,7 +18,8 @@ from .preferences import *
 from .registry import *
 from .utilities import *
 
-__all__ = list(defaults.__all__)
+__all__ = list(context.__all__)
+__all__.extend(defaults.__all__)
 __all__.extend(keywords.__all__)
 __all__.extend(kvo.__all__)
 __all__.extend(log.__all__)
@@ -0,0 +1,254 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+#
+#
+# ***********************************************  Context *************************************************************
+
+"""
+
+Overview
+--------
+
+Most methods of a `Component` are passed a **context** argument that identifies the circumstances under which they
+are called (for example, during `initialization <Component>`, `execution <System_Execution>`, `learning
+<System_Execution_Learning>`, or a simulation run by an `EVCControlMechanism`).  Originally, the context was a string,
+that was extended by each method that passed it on, and that was searched for keywords (such as `INITIALIZING` or
+`EXECUTING`) by any method that needed that information.
+
+When a `System`, `Process` or `Mechanism` is executed, the context it passes on is instead an `ExecutionContext`.  This
+records the keywords it contains as a set of `ContextFlags`, so that a test such as ``INITIALIZING in context`` is a
+check of a single bit, and extending it (e.g., ``context + SEPARATOR_BAR + FUNCTION_CHECK_ARGS``) records the new
+fragment without building a new string.  The string form of an ExecutionContext is assembled only when it is needed
+(e.g., when an entry is made in a `Log`, or it is used in an error message), by calling `str` on it.
+
+An ExecutionContext can be used wherever a context string is expected:  a test for any keyword that does not have a
+corresponding `ContextFlags` value, a comparison with a string, or any other `str` method, is carried out on its string
+form.
+
+.. _Context_Class_Reference:
+
+Class Reference
+---------------
+
+"""
+
+from enum import IntEnum
+
+from psyneulink.globals.keywords import COMMAND_LINE, COMPONENT_INIT, CONTROL, EVC_SIMULATION, EXECUTING, \
+    FUNCTION_CHECK_ARGS, INITIALIZING, LEARNING, PROCESS_INIT, SYSTEM_INIT, VALIDATE
+
+__all__ = [
+    'ContextFlags', 'ExecutionContext',
+]
+
+
+# FIX: REPLACE WITH Flags and auto IF/WHEN MOVE TO Python 3.6
+class ContextFlags(IntEnum):
+    """Specifies the keywords recorded by an `ExecutionContext`, each of which is a single bit."""
+    NONE = 0
+    """No keywords."""
+    INITIALIZING =      1<<0        # 1
+    """Contains `INITIALIZING`."""
+    VALIDATING =        1<<1        # 2
+    """Contains `VALIDATE`."""
+    EXECUTING =         1<<2        # 4
+    """Contains `EXECUTING`."""
+    LEARNING =          1<<3        # 8
+    """Contains `LEARNING`."""
+    CONTROL =           1<<4        # 16
+    """Contains `CONTROL` (including as part of `EVC_SIMULATION`)."""
+    SIMULATION =        1<<5        # 32
+    """Contains `EVC_SIMULATION`."""
+    COMMAND_LINE =      1<<6        # 64
+    """Contains `COMMAND_LINE`."""
+    COMPONENT_INIT =    1<<7        # 128
+    """Contains `COMPONENT_INIT`."""
+    PROCESS_INIT =      1<<8        # 256
+    """Contains `PROCESS_INIT`."""
+    SYSTEM_INIT =       1<<9        # 512
+    """Contains `SYSTEM_INIT`."""
+    CHECKING_ARGS =     1<<10       # 1024
+    """Contains `FUNCTION_CHECK_ARGS`."""
+    INIT_METHOD =       1<<11       # 2048
+    """Contains ``'_init_'`` (e.g., as part of `COMPONENT_INIT`), used to identify an initialization run."""
+
+
+# keywords for which ExecutionContext.__contains__ tests a flag rather than searching its string
+_keyword_flags = {
+    INITIALIZING: ContextFlags.INITIALIZING,
+    VALIDATE: ContextFlags.VALIDATING,
+    EXECUTING: ContextFlags.EXECUTING,
+    LEARNING: ContextFlags.LEARNING,
+    CONTROL: ContextFlags.CONTROL,
+    EVC_SIMULATION: ContextFlags.SIMULATION,
+    COMMAND_LINE: ContextFlags.COMMAND_LINE,
+    COMPONENT_INIT: ContextFlags.COMPONENT_INIT,
+    PROCESS_INIT: ContextFlags.PROCESS_INIT,
+    SYSTEM_INIT: ContextFlags.SYSTEM_INIT,
+    FUNCTION_CHECK_ARGS: ContextFlags.CHECKING_ARGS,
+    '_init_': ContextFlags.INIT_METHOD,
+}
+
+# the same fragments (e.g., SEPARATOR_BAR, or the name of a Component) are added to contexts on every execution,
+# so the flags for each are cached;  the cache is bounded, in case contexts are built from arbitrary strings
+_fragment_flags = {}
+_MAX_CACHED_FRAGMENTS = 10000
+
+
+def _get_context_flags(string):
+    """Return the `ContextFlags` for the keywords in **string**"""
+    try:
+        return _fragment_flags[string]
+    except KeyError:
+        flags = ContextFlags.NONE
+        for keyword, flag in _keyword_flags.items():
+            if keyword in string:
+                flags |= flag
+        if len(_fragment_flags) < _MAX_CACHED_FRAGMENTS:
+            _fragment_flags[string] = flags
+        return flags
+
+
+class ExecutionContext:
+    """
+    ExecutionContext(context='')
+
+    The context passed through the methods of Components during execution (see `overview <Context>`).
+
+    Arguments
+    ---------
+
+    context : str or ExecutionContext : default ''
+        the string form of the context.
+
+    Attributes
+    ----------
+
+    flags : int
+        the `ContextFlags` for the keywords contained in the context.
+
+    """
+    __slots__ = ('flags', '_parts', '_string')
+
+    def __init__(self, context=''):
+        if isinstance(context, ExecutionContext):
+            self.flags = context.flags
+            self._parts = context._parts
+            self._string = context._string
+        else:
+            self.flags = _get_context_flags(context)
+            self._parts = (context,)
+            self._string = context
+
+    @classmethod
+    def _from_parts(cls, parts, flags):
+        context = cls.__new__(cls)
+        context.flags = flags
+        context._parts = parts
+        context._string = None
+        return context
+
+    def __add__(self, other):
+        """Return a new ExecutionContext with **other** appended
+
+        **other** can be a str, another ExecutionContext or, for a fragment that is expensive to format, a callable
+        that takes no arguments and returns its string.  A callable fragment is not called until the string form of
+        the ExecutionContext is needed, and so is not searched for keywords:  it must therefore not return any of the
+        keywords recorded as `ContextFlags` (it is intended for descriptive text, such as the name of a Component).
+        """
+        if isinstance(other, str):
+            flags = self.flags | _get_context_flags(other)
+        elif isinstance(other, ExecutionContext):
+            flags = self.flags | other.flags
+        elif callable(other):
+            flags = self.flags
+        else:
+            return NotImplemented
+        return ExecutionContext._from_parts(self._parts + (other,), flags)
+
+    def __radd__(self, other):
+        # a string with a context appended is (e.g.) an error message, so it is returned as a string
+        if isinstance(other, str):
+            return other + str(self)
+        return NotImplemented
+
+    def __contains__(self, item):
+        try:
+            return bool(self.flags & _keyword_flags[item])
+        except (KeyError, TypeError):
+            return item in str(self)
+
+    def __bool__(self):
+        return any(self._parts)
+
+    def __str__(self):
+        if self._string is None:
+            self._string = ''.join(p if isinstance(p, str) else str(p) if isinstance(p, ExecutionContext) else p()
+                                   for p in self._parts)
+        return self._string
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        if isinstance(other, (str, ExecutionContext)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __len__(self):
+        return len(str(self))
+
+    def __getitem__(self, item):
+        return str(self)[item]
+
+    def __getattr__(self, name):
+        # any other str method (e.g., startswith) is applied to the string form;  private and special names are not
+        # (e.g., so that copy and pickle do not look them up before the slots are assigned)
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(str(self), name)
+
+    def replace(self, old, new):
+        """Return a new ExecutionContext in which **old** is replaced by **new**, and flags are updated accordingly
+
+        The replacement is made in each of the fragments of the ExecutionContext, without assembling its string form;
+        as for the keywords recorded in its flags, an occurrence of **old** that spans two fragments is not replaced.
+        """
+        parts = []
+        flags = ContextFlags.NONE
+        for part in self._parts:
+            if isinstance(part, str):
+                part = part.replace(old, new)
+                flags |= _get_context_flags(part)
+            elif isinstance(part, ExecutionContext):
+                part = part.replace(old, new)
+                flags |= part.flags
+            else:
+                part = _ReplacedFragment(part, old, new)
+            parts.append(part)
+        return ExecutionContext._from_parts(tuple(parts), flags)
+
+
+class _ReplacedFragment:
+    """A callable fragment of an ExecutionContext with **old** replaced by **new** in its string"""
+    __slots__ = ('fragment', 'old', 'new')
+
+    def __init__(self, fragment, old, new):
+        self.fragment = fragment
+        self.old = old
+        self.new = new
+
+    def __call__(self):
+        return self.fragment().replace(self.old, self.new)
@@ -43,12 +43,23 @@ Structure
 ---------
 
 A Log is composed of `entries <Log.entries>`, each of which is a dictionary that maintains a record of the logged
-values of a Component.  The key for each entry is a string that is the name of the Component, and its value is a list
-of `LogEntry` tuples recording its values.  Each `LogEntry` tuple has three items:
+values of a Component.  The key for each entry is a string that is the name of the Component, and its value is a
+`LogEntryBuffer` -- a sequence of `LogEntry` tuples recording its values.  Each `LogEntry` tuple has three items:
     * *time* -- the `RUN`, `TRIAL`, `PASS`, and `TIME_STEP` in which the value of the item was recorded;
     * *context* -- a string indicating the context in which the value was recorded;
     * *value* -- the value of the item.
 The time is recorded only if the Component is executed within a `System`;  otherwise, the time field is `None`.
+The items of the LogEntries are stored in separate, preallocated numpy arrays (one for each of time, context and
+value) that are read directly by the `nparray <Log.nparray>`, `nparray_dictionary <Log.nparray_dictionary>` and `csv
+<Log.csv>` methods.  By default, all of the LogEntries for an item are retained;  the number retained can be limited
+using the **capacity** argument of `set_log_conditions <Log.set_log_conditions>` (or the Log's `capacity
+<Log.capacity>` attribute), in which case only the most recent ones are kept.  Alternatively, the **sink** argument
+of `set_log_conditions <Log.set_log_conditions>` (or the Log's `sink <Log.sink>` attribute) can be used to specify a
+directory to which the LogEntries are written in chunks as they are made (see `LogEntryFile`), so that the memory used
+by the Log remains bounded however long the run;  in that case, `nparray_dictionary <Log.nparray_dictionary>` returns
+memory-mapped views of the files, and the files can be reopened (read-only) after the process has exited using
+`read_log_entries`.  A sink can't be shared across processes:  only LogEntries made in the process that created its
+files are written to them (see `LogEntryFile`).
 
 A Log has several attributes and methods that make it easy to manage how and when it values are recorded, and
 to access its `entries <Log.entries>`:
@@ -382,23 +393,32 @@ Class Reference
 ---------------
 
 """
-import warnings
+import atexit
+import functools
 import inspect
+import json
+import os
+import threading
+import warnings
+import weakref
+
 import typecheck as tc
-from collections import namedtuple, OrderedDict
+from collections import namedtuple, OrderedDict, Sequence
 # from enum import IntEnum, unique, auto
 from enum import IntEnum, unique
 
 import numpy as np
 
 from psyneulink.scheduling.time import TimeScale
+from psyneulink.globals.context import ContextFlags, ExecutionContext
 from psyneulink.globals.utilities import ContentAddressableList, AutoNumber, is_component
 from psyneulink.globals.keywords \
     import INITIALIZING, EXECUTING, VALIDATE, CONTROL, LEARNING, TRIAL, RUN, COMMAND_LINE, CONTEXT, VALUE, TIME, ALL
 
 
 __all__ = [
-    'EntriesDict', 'Log', 'LogEntry', 'LogError', 'LogCondition',
+    'EntriesDict', 'Log', 'LogEntry', 'LogEntryBuffer', 'LogEntryFile', 'LogError', 'LogCondition',
+    'read_log_entries',
 ]
 
 
@@ -462,12 +482,29 @@ class LogCondition(IntEnum):
 LogEntry = namedtuple('LogEntry', 'time, context, value')
 
 TIME_NOT_SPECIFIED = 'Time Not Specified'
+NO_TIME = (None, None, None)
+
+# LogConditions corresponding to the flags of an ExecutionContext
+_context_flag_log_conditions = (
+    (ContextFlags.INITIALIZING, LogCondition.INITIALIZATION),
+    (ContextFlags.VALIDATING, LogCondition.VALIDATION),
+    (ContextFlags.EXECUTING, LogCondition.EXECUTION),
+    (ContextFlags.CONTROL, LogCondition.CONTROL),
+    (ContextFlags.LEARNING, LogCondition.LEARNING),
+)
+
 
 def _get_log_context(context):
 
     if isinstance(context, LogCondition):
         return context
     context_flag = LogCondition.OFF
+    # Use the flags of an ExecutionContext, so that its string is not assembled unless an entry is made
+    if isinstance(context, ExecutionContext):
+        for flag, condition in _context_flag_log_conditions:
+            if context.flags & flag:
+                context_flag |= condition
+        return context_flag
     if INITIALIZING in context:
         context_flag |= LogCondition.INITIALIZATION
     if VALIDATE in context:
@@ -487,6 +524,69 @@ def _get_log_context(context):
     return context_flag
 
 
+class _ExecutionContextStack(threading.local):
+    """Per-thread stack of the executions currently in progress.
+
+    Each item is a (context, component) tuple pushed by a method decorated with `_tracks_execution_context`;
+    `Log._log_value` and `Log._get_time` use the innermost item to determine the context (and System) of a `value
+    <Component.value>` assignment, rather than searching the frames of the call stack for a **context** argument.
+    """
+    def __init__(self):
+        self.items = []
+
+_execution_context_stack = _ExecutionContextStack()
+
+
+def _tracks_execution_context(method):
+    """Decorator that makes the **context** argument of **method** the current execution context while it executes
+
+    Methods decorated in this way (e.g., `System.execute`, `Mechanism.execute`, `State.update`) should assign the
+    `value <Component.value>` of any Component they update using the context they were passed; if a method assigns
+    a different context (e.g., a default when none was passed), it should call `_set_execution_context`.
+    """
+    context_index = list(inspect.signature(method).parameters).index(CONTEXT) - 1
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            context = kwargs[CONTEXT]
+        except KeyError:
+            context = args[context_index] if len(args) > context_index else None
+        items = _execution_context_stack.items
+        items.append((context, self))
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            items.pop()
+
+    return wrapper
+
+
+def _set_execution_context(context):
+    """Replace the context of the innermost execution in progress (used when a method reassigns its context)"""
+    items = _execution_context_stack.items
+    if items:
+        items[-1] = (context, items[-1][1])
+
+
+def _get_execution_context():
+    """Return the context of the innermost execution in progress, or None if nothing is being executed"""
+    items = _execution_context_stack.items
+    return items[-1][0] if items else None
+
+
+def _get_executing_system(mechanism):
+    """Return the innermost System currently executing to which **mechanism** belongs, or None if there is none"""
+    try:
+        systems = mechanism.systems
+    except AttributeError:
+        return None
+    for context, component in reversed(_execution_context_stack.items):
+        if component in systems:
+            return component
+    return None
+
+
 class LogTimeScaleIndices(AutoNumber):
     RUN = ()
     TRIAL = ()
@@ -512,20 +612,506 @@ def _time_string(time):
     return time_str
 
 
+#region Columnar Entries Storage
+# Interned context strings, shared by all LogEntryBuffers;  each buffer stores only the code for a context
+_log_contexts = []
+_log_context_codes = {}
+
+
+def _intern_log_context(context):
+    try:
+        return _log_context_codes[context]
+    except KeyError:
+        code = _log_context_codes[context] = len(_log_contexts)
+        _log_contexts.append(context)
+        return code
+
+
+class LogEntryBuffer(Sequence):
+    """Columnar storage for the `LogEntries <LogEntry>` of a single logged item.
+
+    Rather than keeping a list of LogEntry tuples, the time, context and value of each entry are stored in separate
+    preallocated numpy arrays that grow geometrically as entries are added:
+
+        * *time* -- an integer array with a row of `RUN`, `TRIAL`, `PASS` and `TIME_STEP` for each entry (-1 if the
+          entry has no time);
+        * *context* -- an integer array with a code for each entry's context (context strings are interned and
+          shared by all buffers);
+        * *value* -- an array with a row for each entry's value, that has the dtype and shape of the values if
+          these are numeric and all have the same shape;  otherwise, it is an object array.
+
+    If **capacity** is specified, the buffer grows to at most that many entries, after which each new entry replaces
+    the oldest one (i.e., it acts as a ring buffer that retains the **capacity** most recent entries).
+
+    A LogEntryBuffer is a Sequence of LogEntry tuples (so it can be indexed and iterated like the list it replaces),
+    and its `times <LogEntryBuffer.times>`, `contexts <LogEntryBuffer.contexts>` and `values <LogEntryBuffer.values>`
+    attributes return its columns as arrays in the order in which the entries were made.
+    """
+
+    _initial_size = 16
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity < 1:
+            raise LogError("capacity of a {} must be a positive integer or None".format(self.__class__.__name__))
+        self._capacity = capacity
+        size = self._initial_size if capacity is None else min(capacity, self._initial_size)
+        self._time = np.empty((size, NUM_TIME_SCALES), dtype=np.int64)
+        self._context = np.empty(size, dtype=np.int32)
+        # Value column is allocated on first entry, when the shape and dtype of values are known
+        self._value = None
+        self._start = 0
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("{} index out of range".format(self.__class__.__name__))
+        i = (self._start + index) % len(self._time)
+        time = self._time[i]
+        time = NO_TIME if time[0] < 0 else tuple(time.tolist())
+        value = self._value[i]
+        if isinstance(value, np.ndarray) and self._value.dtype != object:
+            value = value.copy()
+        return LogEntry(time, _log_contexts[self._context[i]], value)
+
+    def __delitem__(self, index):
+        keep = np.ones(self._len, dtype=bool)
+        keep[index] = False
+        times, contexts, values = self._time_column, self._context_column, self._value_column
+        self._start = 0
+        self._len = int(np.count_nonzero(keep))
+        self._time[:self._len] = times[keep]
+        self._context[:self._len] = contexts[keep]
+        if values is not None:
+            self._value[:self._len] = values[keep]
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, entry):
+        """Add a LogEntry to the buffer (replacing the oldest one if the buffer is at its capacity)"""
+        time, context, value = entry
+
+        if time is None or all(t is None for t in time):
+            time = -1
+        elif len(time) != NUM_TIME_SCALES or any(t is None for t in time):
+            raise LogError("PROGRAM ERROR: time of {} ({}) must specify {}".
+                           format(LogEntry.__name__, time, ", ".join(TIME_SCALE_NAMES)))
+
+        try:
+            value = None if value is None else np.array(value)
+        except ValueError:
+            # Ragged value that numpy can't convert to an array, so store as is
+            pass
+        self._prepare_value_column(value)
+
+        size = len(self._time)
+        if self._len < size:
+            i = (self._start + self._len) % size
+            self._len += 1
+        elif self._capacity is not None and size == self._capacity:
+            # Full, so overwrite oldest entry
+            i = self._start
+            self._start = (self._start + 1) % size
+        else:
+            self._grow(min(2 * size, self._capacity) if self._capacity is not None else 2 * size)
+            i = self._len
+            self._len += 1
+
+        self._time[i] = time
+        self._context[i] = _intern_log_context(context)
+        self._value[i] = value
+
+    def clear(self):
+        """Remove all entries from the buffer (its storage is retained)"""
+        self._start = 0
+        self._len = 0
+
+    def _prepare_value_column(self, value):
+        """Allocate value column on first entry, or convert it as needed to accomodate **value**"""
+        numeric = isinstance(value, np.ndarray) and value.dtype.kind in 'biufc'
+        if self._value is None:
+            if numeric:
+                self._value = np.empty((len(self._time),) + value.shape, dtype=value.dtype)
+            else:
+                self._value = np.empty(len(self._time), dtype=object)
+            return
+        if self._value.dtype == object:
+            return
+        if numeric and value.shape == self._value.shape[1:]:
+            if not np.can_cast(value.dtype, self._value.dtype):
+                self._value = self._value.astype(np.result_type(self._value, value))
+            return
+        # Value has a different shape or is not numeric, so revert to storing each value as an object
+        values = np.empty(len(self._value), dtype=object)
+        for i in range(len(self._value)):
+            values[i] = self._value[i].copy()
+        self._value = values
+
+    def _grow(self, size):
+        """Reallocate columns with **size** rows, with the current entries in order starting at row 0"""
+        times, contexts, values = self._time_column, self._context_column, self._value_column
+        self._time = np.empty((size, NUM_TIME_SCALES), dtype=np.int64)
+        self._context = np.empty(size, dtype=np.int32)
+        self._time[:self._len] = times
+        self._context[:self._len] = contexts
+        if values is not None:
+            self._value = np.empty((size,) + self._value.shape[1:], dtype=self._value.dtype)
+            self._value[:self._len] = values
+        self._start = 0
+
+    def _ordered(self, column):
+        if column is None:
+            return None
+        if self._start == 0:
+            return column[:self._len]
+        return np.concatenate((column[self._start:], column[:self._start]))
+
+    @property
+    def _time_column(self):
+        return self._ordered(self._time)
+
+    @property
+    def _context_column(self):
+        return self._ordered(self._context)
+
+    @property
+    def _value_column(self):
+        return self._ordered(self._value)
+
+    @property
+    def capacity(self):
+        """Maximum number of entries retained (None if unbounded)"""
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity):
+        if capacity is not None and capacity < 1:
+            raise LogError("capacity of a {} must be a positive integer or None".format(self.__class__.__name__))
+        if capacity is not None and self._len > capacity:
+            # Retain only the most recent entries
+            del self[:self._len - capacity]
+        if capacity is not None and len(self._time) > capacity:
+            self._grow(capacity)
+        self._capacity = capacity
+
+    @property
+    def times(self):
+        """2d int array with the `RUN`, `TRIAL`, `PASS` and `TIME_STEP` of each entry (-1 for entries with no time)"""
+        return self._time_column
+
+    @property
+    def contexts(self):
+        """list with the context of each entry"""
+        return [_log_contexts[c] for c in self._context_column]
+
+    @property
+    def values(self):
+        """array with the value of each entry (along axis 0)"""
+        if self._value is None:
+            return np.empty(0, dtype=object)
+        return self._value_column
+
+
+# Total size of the header written to .npy files by LogEntryFile;  it is fixed so that the header
+#    can be rewritten in place (with the updated shape) each time entries are appended to the file
+_NPY_HEADER_SIZE = 128
+_NPY_MAGIC = np.lib.format.magic(1, 0)
+
+# LogEntryFiles open for writing, that must be flushed when the interpreter exits
+_open_log_entry_files = weakref.WeakSet()
+
+
+def _write_npy_header(file, dtype, shape):
+    header = "{{'descr': {!r}, 'fortran_order': False, 'shape': {!r}, }}".format(
+        np.lib.format.dtype_to_descr(dtype), tuple(shape))
+    header_len = _NPY_HEADER_SIZE - len(_NPY_MAGIC) - 2
+    if len(header) >= header_len:
+        raise LogError("PROGRAM ERROR: shape {} is too large for header of log file {}".format(shape, file.name))
+    file.seek(0)
+    file.write(_NPY_MAGIC + header_len.to_bytes(2, 'little') + (header.ljust(header_len - 1) + '\n').encode('latin1'))
+
+
+@atexit.register
+def _flush_log_entry_files():
+    # Failure to write one LogEntryFile shouldn't prevent the others from being written
+    for entries in list(_open_log_entry_files):
+        try:
+            entries.flush()
+        except (LogError, OSError) as error:
+            warnings.warn("Entries logged to disk for {} could not be written: {}".format(entries.name, error))
+
+
+class LogEntryFile(Sequence):
+    """Disk-backed storage for the `LogEntries <LogEntry>` of a single logged item.
+
+    Entries are accumulated in a `LogEntryBuffer` of **chunk_size** entries that, when full, is appended to three
+    `.npy` files in **directory** -- *<name>.time.npy*, *<name>.context.npy* and *<name>.value.npy* -- that hold the
+    time, context code and value columns, respectively (the context strings are saved in *<name>.json*).  The memory
+    used is therefore bounded by **chunk_size**, irrespective of the number of entries.  Any entries still in memory
+    are written when the `times <LogEntryFile.times>`, `contexts <LogEntryFile.contexts>` or `values
+    <LogEntryFile.values>` attributes are accessed, when `flush <LogEntryFile.flush>` is called, and when the
+    interpreter exits.
+
+    The values logged to a LogEntryFile must be numeric and all have the same shape.  The columns are returned as
+    read-only memory-mapped arrays, and can be reopened after the process that wrote them has exited, either by
+    constructing a LogEntryFile with the same **directory** and **name** and **mode** = 'r', or using
+    `read_log_entries`.  If **mode** is 'w', any existing files for the item are overwritten.  The memory-mapped
+    columns are kept open until entries are next written to disk, so that accessing the entries one at a time (e.g.,
+    iterating over them) does not reopen the files for each one.
+
+    .. note::
+       A LogEntryFile open for writing can't be shared across processes.  Entries are written only by the process
+       that created it:  entries logged to it in another process (e.g., one forked to run the simulations of an
+       `EVCControlMechanism`) are discarded, rather than being written to the same files.
+    """
+
+    def __init__(self, directory, name, mode='w', chunk_size=1024):
+        if mode not in {'r', 'w'}:
+            raise LogError("mode of a {} must be 'r' or 'w'".format(self.__class__.__name__))
+        self.directory = directory
+        self.name = name
+        self.mode = mode
+        self.chunk_size = chunk_size
+        self._chunk = LogEntryBuffer()
+        self._contexts = []
+        self._context_codes = {}
+        self._dtype = None
+        self._shape = None
+        self._len_on_disk = 0
+        # memory-mapped columns, kept open until entries are next written to disk
+        self._columns = {}
+        # the process that writes the files
+        self._pid = os.getpid()
+
+        base = os.path.join(directory, name.replace(os.sep, '_').replace(os.altsep or os.sep, '_'))
+        self._paths = {column: '{}.{}.npy'.format(base, column) for column in ('time', 'context', 'value')}
+        self._metadata_path = base + '.json'
+
+        if mode == 'r':
+            with open(self._metadata_path) as file:
+                metadata = json.load(file)
+            self.name = metadata['name']
+            self._contexts = metadata['contexts']
+            self._len_on_disk = metadata['length']
+            if metadata['dtype'] is not None:
+                self._dtype = np.dtype(metadata['dtype'])
+                self._shape = tuple(metadata['shape'])
+        else:
+            os.makedirs(directory, exist_ok=True)
+            for path in self._paths.values():
+                if os.path.exists(path):
+                    os.remove(path)
+            self._write_metadata()
+            _open_log_entry_files.add(self)
+
+    def __len__(self):
+        return self._len_on_disk + len(self._chunk)
+
+    def __getitem__(self, index):
+        self.flush()
+        if isinstance(index, slice):
+            return [self._get_entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("{} index out of range".format(self.__class__.__name__))
+        return self._get_entry(index)
+
+    def __iter__(self):
+        # flushed once, rather than for each entry (as by Sequence.__iter__, which calls __getitem__)
+        self.flush()
+        for i in range(len(self)):
+            yield self._get_entry(i)
+
+    def _get_entry(self, index):
+        """Return the LogEntry at **index** (which must be on disk)"""
+        time = self._load('time')[index]
+        time = NO_TIME if time[0] < 0 else tuple(time.tolist())
+        return LogEntry(time, self._contexts[self._load('context')[index]], np.array(self._load('value')[index]))
+
+    def __delitem__(self, index):
+        if not (isinstance(index, slice) and range(*index.indices(len(self))) == range(len(self))):
+            raise LogError("Only all of the entries of a {} can be deleted".format(self.__class__.__name__))
+        self.clear()
+
+    def __repr__(self):
+        return "{}({!r}, {!r}, mode={!r})".format(self.__class__.__name__, self.directory, self.name, self.mode)
+
+    def __del__(self):
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def append(self, entry):
+        """Add a LogEntry, writing the buffered entries to disk if **chunk_size** has been reached"""
+        if self.mode == 'r':
+            raise LogError("Entries cannot be added to {} for {}, as it is read-only".
+                           format(self.__class__.__name__, self.name))
+        self._check_value(entry[2])
+        self._chunk.append(entry)
+        if len(self._chunk) >= self.chunk_size:
+            self.flush()
+
+    def clear(self):
+        """Remove all entries (from memory and disk)"""
+        if self.mode == 'r':
+            raise LogError("Entries cannot be deleted from {} for {}, as it is read-only".
+                           format(self.__class__.__name__, self.name))
+        self._chunk.clear()
+        self._columns = {}
+        for path in self._paths.values():
+            if os.path.exists(path):
+                os.remove(path)
+        self._len_on_disk = 0
+        self._write_metadata()
+
+    def flush(self):
+        """Append any entries held in memory to the files on disk (only in the process that created the LogEntryFile)
+        """
+        if self.mode == 'r' or not len(self._chunk):
+            return
+        if os.getpid() != self._pid:
+            # another process (e.g., a forked one) can't write to the files (see note above)
+            self._chunk.clear()
+            return
+
+        # The values were checked as they were appended (see _check_value), so they can all be cast to self._dtype
+        values = self._chunk.values
+        contexts = np.array([self._intern_context(c) for c in self._chunk.contexts], dtype=np.int32)
+        for column, data in (('time', self._chunk.times), ('context', contexts), ('value', values)):
+            self._append_to_file(self._paths[column], np.ascontiguousarray(data, dtype=self._column_dtype(column)))
+
+        self._len_on_disk += len(self._chunk)
+        self._chunk.clear()
+        self._columns = {}
+        self._write_metadata()
+
+    def _check_value(self, value):
+        """Raise LogError if **value** can't be written to disk with the values already logged
+
+        Until values have been written to disk, their dtype is the one to which those logged so far can all be cast.
+        """
+        try:
+            value = np.asarray(value)
+        except ValueError:
+            # Ragged value that numpy can't convert to an array
+            value = None
+        if value is None or value.dtype == object or (self._shape is not None and value.shape != self._shape):
+            raise LogError("Values logged to disk for {} must be numeric and all have the same shape".
+                           format(self.name))
+        if self._dtype is None or not self._len_on_disk:
+            self._dtype = value.dtype if self._dtype is None else np.promote_types(self._dtype, value.dtype)
+            self._shape = value.shape
+        elif not np.can_cast(value.dtype, self._dtype):
+            raise LogError("Values logged to disk for {} must all be of type {}".format(self.name, self._dtype))
+
+    def _intern_context(self, context):
+        try:
+            return self._context_codes[context]
+        except KeyError:
+            code = self._context_codes[context] = len(self._contexts)
+            self._contexts.append(context)
+            return code
+
+    def _column_dtype(self, column):
+        return {'time': np.int64, 'context': np.int32, 'value': self._dtype}[column]
+
+    def _append_to_file(self, path, data):
+        mode = 'r+b' if os.path.exists(path) else 'w+b'
+        with open(path, mode) as file:
+            file.seek(0, os.SEEK_END)
+            if file.tell() < _NPY_HEADER_SIZE:
+                file.seek(_NPY_HEADER_SIZE)
+            file.write(data.tobytes())
+            _write_npy_header(file, data.dtype, (self._len_on_disk + len(data),) + data.shape[1:])
+
+    def _write_metadata(self):
+        metadata = {'name': self.name,
+                    'contexts': [str(c) for c in self._contexts],
+                    'length': self._len_on_disk,
+                    'dtype': None if self._dtype is None else self._dtype.str,
+                    'shape': None if self._shape is None else list(self._shape)}
+        with open(self._metadata_path, 'w') as file:
+            json.dump(metadata, file)
+
+    def _load(self, column):
+        if self._len_on_disk:
+            try:
+                return self._columns[column]
+            except KeyError:
+                data = self._columns[column] = np.load(self._paths[column], mmap_mode='r')[:self._len_on_disk]
+                return data
+        if column == 'time':
+            return np.empty((0, NUM_TIME_SCALES), dtype=np.int64)
+        if column == 'context':
+            return np.empty(0, dtype=np.int32)
+        return np.empty((0,) + (self._shape or ()), dtype=self._dtype or object)
+
+    @property
+    def capacity(self):
+        """Always None:  all entries are retained on disk"""
+        return None
+
+    @capacity.setter
+    def capacity(self, capacity):
+        if capacity is not None:
+            raise LogError("The capacity of {} for {} can't be limited".format(self.__class__.__name__, self.name))
+
+    @property
+    def times(self):
+        """memory-mapped 2d int array with the `RUN`, `TRIAL`, `PASS` and `TIME_STEP` of each entry (-1 if none)"""
+        self.flush()
+        return self._load('time')
+
+    @property
+    def contexts(self):
+        """list with the context of each entry"""
+        self.flush()
+        return [self._contexts[c] for c in self._load('context')]
+
+    @property
+    def values(self):
+        """memory-mapped array with the value of each entry (along axis 0)"""
+        self.flush()
+        return self._load('value')
+
+
+def read_log_entries(directory):
+    """Return an OrderedDict with a read-only `LogEntryFile` for each item logged to **directory**, keyed by its name
+    """
+    entries = OrderedDict()
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.endswith('.json'):
+            log_entry_file = LogEntryFile(directory, file_name[:-len('.json')], mode='r')
+            entries[log_entry_file.name] = log_entry_file
+    return entries
+
+#endregion
+
 #region Custom Entries Dict
 # Modified from: http://stackoverflow.com/questions/7760916/correct-useage-of-getter-setter-for-dictionary-values
 from collections import MutableMapping
 class EntriesDict(MutableMapping,dict):
-    """Maintains a Dict of Log entries; assignment of a LogEntry to an entry appends it to the list for that entry.
+    """Maintains a Dict of Log entries; assignment of a LogEntry to an entry appends it to the buffer for that entry.
 
     The key for each entry is the name of an attribute being logged (usually the `value <Component.value>` of
     the Log's `owner <Log.owner>`.
 
-    The value of each entry is a list, each item of which is a LogEntry.
+    The value of each entry is a `LogEntryBuffer`, each item of which is a LogEntry.
 
     When a LogEntry is assigned to an entry:
-       - if the entry does not already exist, it is created and assigned a list with the LogEntry as its first item;
-       - if it exists, the LogEntry is appended to the list;
+       - if the entry does not already exist, it is created and assigned a LogEntryBuffer with the LogEntry as its
+         first item (and the `capacity <Log.capacity>` of the Log) or, if the Log has a `sink <Log.sink>`,
+         a LogEntryFile in that directory;
+       - if it exists, the LogEntry is appended to the buffer;
        - assigning anything other than a LogEntry raises and LogError exception.
 
     """
@@ -552,16 +1138,15 @@ class EntriesDict(MutableMapping,dict):
     def __setitem__(self, key, value):
 
         if not isinstance(value, LogEntry):
-            raise LogError("Object other than a {} assigned to Log for {}".format(LogEntry.__name__, self.owner.name))
+            raise LogError("Object other than a {} assigned to Log for {}".format(LogEntry.__name__, self._owner.name))
         try:
-        # If the entry already exists, use its value and append current value to it
-            self._ownerLog.entries[key].append(value)
-            value = self._ownerLog.entries[key]
+        # If the entry already exists, append current value to it
+            dict.__getitem__(self, key).append(value)
         except KeyError:
-        # Otherwise, initialize list with value as first item
-            dict.__setitem__(self,key,[value])
-        else:
-            dict.__setitem__(self,key,value)
+        # Otherwise, initialize buffer (or file, if the Log has a sink) with value as first item
+            entry = self._ownerLog._create_entry_storage(key)
+            entry.append(value)
+            dict.__setitem__(self, key, entry)
 
     def __delitem__(self, key):
         dict.__delitem__(self,key)
@@ -687,6 +1272,14 @@ class Log:
         identifies Components that currently have entries in the Log; the key for each entry is the name
         of a Component, and the value is its currently assigned `LogCondition`.
 
+    capacity : int or None : default None
+        the maximum number of `LogEntries <LogEntry>` retained for each entry of the Log;  once it is reached, each
+        new LogEntry replaces the oldest one.  If it is `None`, all LogEntries are retained.
+
+    sink : str or None : default None
+        path of a directory to which the `LogEntries <LogEntry>` for each entry of the Log are written, in chunks,
+        as they are made (see `LogEntryFile`);  if it is `None`, LogEntries are kept in memory.
+
     """
 
     def __init__(self, owner, entries=None):
@@ -699,13 +1292,15 @@ class Log:
         """
 
         self.owner = owner
+        self._capacity = None
+        self._sink = None
         # self.entries = EntriesDict({})
         self.entries = EntriesDict(self)
 
         if entries is None:
             return
 
-    def set_log_conditions(self, items, log_condition=LogCondition.EXECUTION):
+    def set_log_conditions(self, items, log_condition=LogCondition.EXECUTION, capacity=None, sink=None):
         """Specifies items to be logged at the specified `LogCondition`\\(s).
 
         Arguments
@@ -727,11 +1322,29 @@ class Log:
             list of parameters to include as loggable items;  these must be attributes of the `owner <Log.owner>`
             (for example, Mechanism
 
+        capacity : int : default None
+            specifies the maximum number of `LogEntries <LogEntry>` to retain for each of the items (see `capacity
+            <Log.capacity>`);  if it is not specified, the capacity of the items is left unchanged.
+
+        sink : str : default None
+            specifies the path of a directory to which the `LogEntries <LogEntry>` of the items are written (see
+            `sink <Log.sink>`);  if it is not specified, the sink of the items is left unchanged.
+
         """
         from psyneulink.components.component import Component
         from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
         from psyneulink.globals.keywords import ALL
 
+        if capacity is not None and sink is not None:
+            raise LogError("capacity and sink can't both be specified for items in the Log of {}".
+                           format(self.owner.name))
+
+        def assign_storage(component):
+            if capacity is not None:
+                component.log.capacity = capacity
+            if sink is not None:
+                component.log.sink = sink
+
         def assign_log_level(item, level):
 
             # Handle multiple level assignments (as LogConditions or strings in a list)
@@ -753,12 +1366,14 @@ class Log:
             try:
                 component = next(c for c in self.loggable_components if self._alias_owner_name(c.name) == item)
                 component.logPref=PreferenceEntry(level, PreferenceLevel.INSTANCE)
+                assign_storage(component)
             except AttributeError:
                 raise LogError("PROGRAM ERROR: Unable to set LogCondition for {} of {}".format(item, self.owner.name))
 
         if items is ALL:
             for component in self.loggable_components:
                 component.logPref = PreferenceEntry(log_condition, PreferenceLevel.INSTANCE)
+                assign_storage(component)
             # self.logPref = PreferenceEntry(log_condition, PreferenceLevel.INSTANCE)
             return
 
@@ -779,15 +1394,16 @@ class Log:
         If **value** is a LogEntry, it is assigned to the entry
         If **context** is a LogCondition, it is used to determine whether the entry should be made;
            **time** must be passed;  the name of the LogCondition(s) specified are assigned to the context of LogEntry
-        Otherwise, uses string (or Component) passed in **context**, or searches stack (see note) to determine the
-        context, and uses that to determine the scheduler and, from that, the time;
+        Otherwise, uses string (or Component) passed in **context**, or the current execution context (see note) to
+        determine the context, and uses that to determine the scheduler and, from that, the time;
         If value is None, uses owner's `value <Component.value>` attribute.
 
         .. note::
             Since _log_value is usually called by the setter for the `value <Component.value>` property of a Component
             (which doesn't/can't receive a context argument), it does not pass a **context** argument to _log_value;
-            in that case, _log_value searches the stack for the most recent frame with a context specification, and
-            uses that.
+            in that case, _log_value uses the context of the innermost execution in progress (see
+            `_tracks_execution_context`) or, if nothing is being executed (e.g., during construction of the Component),
+            searches the stack for the most recent frame with a context specification, and uses that.
 
         """
         from psyneulink.components.component import Component
@@ -813,7 +1429,11 @@ class Log:
                     programmatic = True
                     context = None
 
-                # Get context from the stack
+                # Get context from the innermost execution in progress
+                if context is None:
+                    context = _get_execution_context()
+
+                # Otherwise, get context from the stack
                 if context is None:
                     curr_frame = inspect.currentframe()
                     prev_frame = inspect.getouterframes(curr_frame, 2)
@@ -839,7 +1459,7 @@ class Log:
                 if context is None:
                     raise LogError("PROGRAM ERROR: No context specification found in any frame")
 
-                if not isinstance(context, str):
+                if not isinstance(context, (str, ExecutionContext)):
                     raise LogError("PROGRAM ERROR: Unrecognized context specification ({})".format(context))
 
                 # Context is an empty string, but called programatically
@@ -855,7 +1475,7 @@ class Log:
             # Get time and log value if logging condition is satisfied or called for programmatically
             if (log_pref and log_pref & context_flags) or context_flags & LogCondition.COMMAND_LINE:
                 time = time or self._get_time(context, context_flags)
-                self.entries[self.owner.name] = LogEntry(time, context, value)
+                self.entries[self.owner.name] = LogEntry(time, str(context), value)
 
         if context is not COMMAND_LINE:
             self.owner.prev_context = context
@@ -872,8 +1492,6 @@ class Log:
         from psyneulink.components.states.state import State
         from psyneulink.components.projections.projection import Projection
 
-        no_time = (None, None, None)
-
         # Get mechanism to which Component being logged belongs
         if isinstance(self.owner, Mechanism):
             ref_mech = self.owner
@@ -913,18 +1531,22 @@ class Log:
         if context_flags & (LogCondition.COMMAND_LINE | LogCondition.RUN | LogCondition.TRIAL):
             execution_context = self.owner.prev_context
             context_flags = _get_log_context(execution_context)
+            system = None
         else:
             execution_context = context
-        try:
-            systems = list(ref_mech.systems.keys())
-            system = next(s for s in systems if s.name in execution_context)
-        except AttributeError:
-            # ref_mech has not been assigned to a System
-            systems = None
-            system = None
-        except StopIteration:
-            # ref_mech is assigned to one or more Systems, but not currently being executed within one of them
-            system = None
+            # Use System currently executing, if there is one (avoids search of context string below)
+            system = _get_executing_system(ref_mech)
+        if system is None:
+            try:
+                systems = list(ref_mech.systems.keys())
+                system = next(s for s in systems if s.name in execution_context)
+            except AttributeError:
+                # ref_mech has not been assigned to a System
+                systems = None
+                system = None
+            except StopIteration:
+                # ref_mech is assigned to one or more Systems, but not currently being executed within one of them
+                system = None
         # MODIFIED 12/11/17 END
 
         if system:
@@ -961,7 +1583,7 @@ class Log:
                               "when running Components within a System".format(offender))
             time = None
 
-        return time or no_time
+        return time or NO_TIME
 
     @tc.typecheck
     def log_values(self, entries):
@@ -1293,9 +1915,9 @@ class Log:
         npa = []
 
         # Create time rows (one for each time scale)
-        if time_values:
+        if len(time_values):
             for i in range(NUM_TIME_SCALES):
-                row = [[t[i]] for t in time_values]
+                row = time_values[:, i:i+1].tolist()
                 if header:
                     time_header = [TIME_SCALE_NAMES[i].capitalize()]
                     row = [time_header] + row
@@ -1317,7 +1939,11 @@ class Log:
                 npa = [npa]
 
         for entry in entries:
-            row = self._assemble_entry_data(entry, time_values)
+            data = self._assemble_entry_data(entry, time_values)
+            if data.dtype == object:
+                row = [None if datum is None else np.array(datum).tolist() for datum in data]
+            else:
+                row = data.tolist()
 
             if header:
                 entry_header = "{}{}{}{}".format(owner_name_str, lb, self._alias_owner_name(entry), rb)
@@ -1398,11 +2024,10 @@ class Log:
         log_dict = OrderedDict()
 
         # If all time values are recorded - - - log_dict = {"Run": array, "Trial": array, "Time_step": array}
-        if time_values:
+        if len(time_values):
             for i in range(NUM_TIME_SCALES):
-                row = [[t[i]] for t in time_values]
                 time_header = TIME_SCALE_NAMES[i].capitalize()
-                log_dict[time_header] = row
+                log_dict[time_header] = time_values[:, i:i+1]
 
         # If ANY time values are empty (components were run outside of a System) - - - log_dict = {"Index": array}
         else:
@@ -1413,10 +2038,10 @@ class Log:
             if not all(len(self.logged_entries[self._dealias_owner_name(e)]) == num_indicies for e in entries):
                 raise LogError("nparray output requires that all entries have time values or are of equal length")
 
-            log_dict["Index"] = np.arange(num_indicies).reshape(num_indicies, 1).tolist()
+            log_dict["Index"] = np.arange(num_indicies).reshape(num_indicies, 1)
 
         for entry in entries:
-            log_dict[self._alias_owner_name(entry)] = np.array(self._assemble_entry_data(entry, time_values))
+            log_dict[self._alias_owner_name(entry)] = self._assemble_entry_data(entry, time_values)
 
         return log_dict
 
@@ -1554,62 +2179,47 @@ class Log:
         return mod_time_values
 
     def _parse_entries_for_time_values(self, entries):
-        # Returns sorted list of SimpleTime tuples for all time points at which these entries logged values
+        # Returns 2d array with the sorted, unique (RUN, TRIAL, PASS, TIME_STEP) time points
+        #    at which these entries logged values (entries without a time are ignored)
 
-        time_values = []
-        for entry in entries:
-            entry = self._dealias_owner_name(entry)
-            # OLD: finds duplicate time points within any one entry and modifies their values to be unique
-            #
-            # # collect all time values for this entry
-            # entry_time_values = []
-            # entry_time_values.extend([item.time for item in self.logged_entries[entry] if all(i is not None for i in item.time)])
-
-            # # increment any time stamp duplicates (on the actual data item)
-            # if len(set(entry_time_values)) != len(entry_time_values):
-            #     adjusted_time = self._scan_for_duplicates(entry_time_values)
-            #     for i in range(len(self.logged_entries[entry])):
-            #         temp_list = list(self.logged_entries[entry][i])
-            #         temp_list[0] = adjusted_time[i]
-            #         self.logged_entries[entry][i] = LogEntry(temp_list[0], temp_list[1], temp_list[2])
-
-            time_values.extend([item.time
-                                for item in self.logged_entries[entry]
-                                if all(i is not None for i in item.time)])
-
-        # Insure that all time values are assigned, get rid of duplicates, and sort
-        if all(all(i is not None for i in t) for t in time_values):
-            time_values = sorted(list(set(time_values)))
-
-        return time_values
+        times = [self.logged_entries[self._dealias_owner_name(entry)].times for entry in entries]
+        times = np.concatenate(times) if times else np.empty((0, NUM_TIME_SCALES), dtype=np.int64)
+        times = times[np.all(times >= 0, axis=1)]
+        if not len(times):
+            return times
+        return np.unique(times, axis=0)
 
     def _assemble_entry_data(self, entry, time_values):
-        # Assembles list of entry's (component's) value at each of the time points specified in time_values
-        # If data was not recorded for this entry (component) for a given time point, it will be stored as None
+        # Assembles array of entry's (component's) value at each of the time points specified in time_values
+        # If data was not recorded for this entry (component) for a given time point, it is stored as None
+        # (if data was recorded more than once for a time point, the first is used)
 
         entry = self._dealias_owner_name(entry)
-        row = []
-        time_col = iter(time_values)
-        for datum in self.logged_entries[entry]:
-            # iterate through log entry tuples:
-            # check whether tuple's time value matches the time for which data is currently being recorded
-            # if so, enter tuple's Component value in the entry's list
-            # if not, enter `None` in the entry's list
-
-            if time_values:
-                for i in range(len(time_values)):
-                    time = next(time_col, None)
-                    if time is None:
-                        break
-                    if datum.time != time:
-                        row.append(None)
-                        continue
-                    value = None if datum.value is None else np.array(datum.value).tolist()
-                    row.append(value)
-                    break
-            else:
-                value = None if datum.value is None else datum.value.tolist()
-                row.append(value)
+        data = self.logged_entries[entry]
+        values = data.values
+
+        if not len(time_values):
+            return values
+
+        times = data.times
+        timed = np.all(times >= 0, axis=1)
+        # Get index into time_values of each of the entry's (timed) data;
+        #    since time_values includes all of the entry's times, these are the inverse of their union
+        _, indices = np.unique(np.concatenate((time_values, times[timed])), axis=0, return_inverse=True)
+        indices, first = np.unique(indices[len(time_values):], return_index=True)
+
+        # Data were recorded once at every time point, in order, so return as is (e.g., as a memory-mapped view)
+        if (len(indices) == len(time_values) and len(first) == len(values)
+                and np.array_equal(first, np.arange(len(values)))):
+            return values
+
+        values = values[timed][first]
+        if len(indices) == len(time_values):
+            return values
+
+        row = np.empty(len(time_values), dtype=object)
+        for i, value in zip(indices, values):
+            row[i] = value
         return row
 
     @property
@@ -1663,6 +2273,50 @@ class Log:
 
         return logged_items
 
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity):
+        if capacity is not None and capacity < 1:
+            raise LogError("capacity of the Log for {} must be a positive integer or None".format(self.owner.name))
+        if capacity is not None and self._sink is not None:
+            raise LogError("The Log for {} can't have both a capacity and a sink".format(self.owner.name))
+        self._capacity = capacity
+        for entry in self.entries.values():
+            entry.capacity = capacity
+
+    @property
+    def sink(self):
+        return self._sink
+
+    @sink.setter
+    def sink(self, sink):
+        if sink is not None and self._capacity is not None:
+            raise LogError("The Log for {} can't have both a capacity and a sink".format(self.owner.name))
+        self._sink = sink
+        # Move any existing entries to the new storage
+        for key in list(self.entries):
+            current = dict.__getitem__(self.entries, key)
+            if isinstance(current, LogEntryFile) and current.directory == sink:
+                continue
+            entry = self._create_entry_storage(key)
+            for log_entry in current:
+                entry.append(log_entry)
+            dict.__setitem__(self.entries, key, entry)
+
+    def _create_entry_storage(self, key):
+        if self._sink is None:
+            return LogEntryBuffer(capacity=self._capacity)
+        # Qualify name of entry with that of the owner's owner (e.g., the Mechanism to which a State belongs),
+        #    since entries of different Components written to the same sink may otherwise have the same name
+        try:
+            key = "{}[{}]".format(self.owner.owner.name, key)
+        except AttributeError:
+            pass
+        return LogEntryFile(self._sink, key)
+
     @property
     def logged_entries(self):
         entries = {}
@@ -30,6 +30,7 @@ TYPE CHECKING VALUE COMPARISON
 * `optional_parameter_spec`
 * `is_matrix
 * `is_matrix_spec`
+* `is_sparse_matrix`
 * `is_numeric`
 * `is_numeric_or_none`
 * `iscompatible`
@@ -65,6 +66,8 @@ OTHER
 * `type_match`
 * `get_value_from_array`
 * `is_matrix`
+* `sparse_or_dense`
+* `sparse_like`
 * `underscore_to_camelCase`
 * `append_type_to_name`
 * `ReadOnlyOrderedDict`
@@ -84,17 +87,24 @@ from enum import Enum, EnumMeta, IntEnum
 
 import numpy as np
 
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
 from psyneulink.globals.keywords import DISTANCE_METRICS, MATRIX_KEYWORD_VALUES, NAME, VALUE
 
 __all__ = [
     'append_type_to_name', 'AutoNumber', 'ContentAddressableList', 'convert_to_np_array', 'convert_all_elements_to_np_array', 'get_class_attributes',
     'get_modulationOperation_name', 'get_value_from_array', 'is_component', 'is_distance_metric', 'is_matrix',
     'insert_list', 'is_matrix_spec',
-    'is_modulation_operation', 'is_numeric', 'is_numeric_or_none', 'is_same_function_spec', 'is_unit_interval',
+    'is_modulation_operation', 'is_numeric', 'is_numeric_or_none', 'is_same_function_spec', 'is_sparse_matrix',
+    'is_unit_interval',
     'is_value_spec', 'iscompatible', 'kwCompatibilityLength', 'kwCompatibilityNumeric', 'kwCompatibilityType',
     'make_readonly_property', 'merge_param_dicts', 'Modulation', 'MODULATION_ADD', 'MODULATION_MULTIPLY',
     'MODULATION_OVERRIDE', 'multi_getattr', 'np_array_less_than_2d', 'object_has_single_value', 'optional_parameter_spec', 'parameter_spec',
-    'random_matrix', 'ReadOnlyOrderedDict', 'safe_len', 'TEST_CONDTION', 'type_match', 'underscore_to_camelCase', 'UtilitiesError',
+    'random_matrix', 'ReadOnlyOrderedDict', 'safe_len', 'sparse_like', 'sparse_or_dense', 'SPARSE_DENSITY_THRESHOLD',
+    'TEST_CONDTION', 'type_match', 'underscore_to_camelCase', 'UtilitiesError',
 ]
 
 
@@ -251,6 +261,8 @@ def is_matrix(m):
 
     if is_matrix_spec(m):
         return True
+    if is_sparse_matrix(m):
+        return m.ndim == 2
     if isinstance(m, (list, np.ndarray, np.matrix)):
         return True
     if m is None or isinstance(m, (Component, dict, set)) or (inspect.isclass(m) and issubclass(m, Component)):
@@ -268,6 +280,39 @@ def is_matrix(m):
     return False
 
 
+def is_sparse_matrix(m):
+    """Return True if **m** is a `scipy.sparse <https://docs.scipy.org/doc/scipy/reference/sparse.html>`_ matrix
+    (always False if SciPy is not installed)
+    """
+    return sparse is not None and sparse.issparse(m)
+
+
+# the density (proportion of entries that are non-zero) above which sparse_or_dense converts a sparse matrix to dense
+SPARSE_DENSITY_THRESHOLD = 0.1
+
+
+def sparse_or_dense(m, density_threshold=SPARSE_DENSITY_THRESHOLD):
+    """Return a sparse matrix **m** in CSR format if its density is no greater than **density_threshold**, and
+    otherwise as a 2d np.array;  **m** is returned as is if it is not a sparse matrix.
+    """
+    if not is_sparse_matrix(m):
+        return m
+    rows, cols = m.shape
+    if rows * cols and m.nnz / (rows * cols) > density_threshold:
+        return m.toarray()
+    return m.tocsr(copy=True)
+
+
+def sparse_like(m, values):
+    """Return a CSR matrix with the same pattern of stored entries as the sparse matrix **m**, with values taken from
+    the corresponding entries of the 2d array **values** (e.g., a dense matrix of changes to the weights in **m**).
+    """
+    m = m.tocsr()
+    values = values.toarray() if is_sparse_matrix(values) else np.asarray(values)
+    rows = np.repeat(np.arange(m.shape[0]), np.diff(m.indptr))
+    return sparse.csr_matrix((values[rows, m.indices], m.indices.copy(), m.indptr.copy()), shape=m.shape)
+
+
 def is_distance_metric(s):
     if s in DISTANCE_METRICS:
         return True
@@ -344,12 +389,20 @@ def iscompatible(candidate, reference=None, **kargs):
             warnings.simplefilter(action='ignore', category=FutureWarning)
             if reference is not None and (candidate == reference):
                 return True
-    except ValueError:
+    except (ValueError, TypeError):
         # raise UtilitiesError("Could not compare {0} and {1}".format(candidate, reference))
         # IMPLEMENTATION NOTE: np.array generates the following error:
         # ValueError: The truth value of an array with more than one element is ambiguous. Use a.any() or a.all()
+        #                     and a scipy.sparse matrix can generate a TypeError when compared with a non-numeric value
         pass
 
+    # A sparse matrix is compatible with any 2d value of the same shape
+    if is_sparse_matrix(candidate) or is_sparse_matrix(reference):
+        if reference is None:
+            return True
+        shapes = [m.shape if is_sparse_matrix(m) else np.shape(m) for m in (candidate, reference)]
+        return shapes[0] == shapes[1]
+
     # If args not provided, assign to default values
     # if not specified in args, use these:
     #     args[kwCompatibilityType] = list
@@ -634,6 +687,10 @@ def convert_to_np_array(value, dimension):
     if value is None:
         return None
 
+    # a sparse matrix is already (and can only be) 2d
+    if is_sparse_matrix(value):
+        return value
+
     if dimension is 1:
         value = np.atleast_1d(value)
     elif dimension is 2:
@@ -680,7 +737,11 @@ def type_match(value, value_type):
     if value_type in {float, np.float, np.float64, np.float32}:
         return float(value)
     if value_type is np.ndarray:
+        if is_sparse_matrix(value):
+            return value.toarray()
         return np.array(value)
+    if sparse is not None and isinstance(value_type, type) and issubclass(value_type, sparse.spmatrix):
+        return value_type(value)
     if value_type is list:
         return list(value)
     if value_type is None:
@@ -1108,6 +1169,9 @@ def convert_all_elements_to_np_array(arr, cast_from=None, cast_to=None):
     if cast_from is not None and isinstance(arr, cast_from):
         return np.asarray(arr, dtype=cast_to)
 
+    if is_sparse_matrix(arr):
+        return arr
+
     if not isinstance(arr, collections.Iterable) or isinstance(arr, str):
         return np.array(arr)
 
@@ -136,7 +136,7 @@ Examples for each, that illustrate all of their parameters, are shown below:
     ...     name='my_DDM_BogaczEtAl'
     ... )
 
-`NavarroAndFuss <NavarroAndFuss>` Function (requires MATLAB engine)::
+`NavarroAndFuss <NavarroAndFuss>` Function::
 
     >>> my_DDM_NavarroAndFuss = pnl.DDM(
     ...     function=pnl.NavarroAndFuss(
@@ -147,7 +147,7 @@ Examples for each, that illustrate all of their parameters, are shown below:
     ...         t0=0.15
     ...     ),
     ...     name='my_DDM_NavarroAndFuss'
-    ... )                                   #doctest: +SKIP
+    ... )
 
 .. _DDM_Integration_Mode:
 
@@ -275,6 +275,21 @@ The analytic functions return a final positon and time of the model, along with
 integration function returns intermediate position and time values. The two types of functions can be thought of as
 happening on different time scales: trial (analytic) and time step (path integration).
 
+.. _DDM_Run_To_Threshold:
+
+If the **run_to_threshold** argument of the DDM's constructor is `True`, then each execution using the `path integration
+<DDM_Integration_Mode>` function instead integrates the decision process until it reaches threshold, and returns the
+final position (the threshold, with the sign of the boundary reached) and time, so that a `Scheduler` does not have to
+execute the DDM once for each time step (e.g., using a `WhenFinished` `Condition`).  The path is the same, and uses
+samples from the same random number generator, as if the DDM had been executed once for each time step.  Since a path
+may never reach threshold (e.g., if there is no drift or noise), integration stops after the number of time steps
+specified in the **max_time_steps** argument of the DDM's constructor;  if the path has not then reached threshold, a
+warning is issued, and the DDM returns the position and time at which integration stopped.  The
+`run_to_threshold <DriftDiffusionIntegrator.run_to_threshold>` method of the DDM's `function <DDM.function>` can also
+be used to simulate many independent decisions together, for example to generate a distribution of response times::
+
+    >>> my_DDM_path_integrator.function_object.run_to_threshold(1.0, num_paths=1000)  # doctest: +SKIP
+
 .. _DDM_Class_Reference:
 
 Class Reference
@@ -283,6 +298,7 @@ Class Reference
 import logging
 import numbers
 import random
+import warnings
 
 import numpy as np
 import typecheck as tc
@@ -470,6 +486,8 @@ class DDM(ProcessingMechanism_Base):
     default_variable=None,  \
     size=None,                 \
     function=BogaczEtAl,       \
+    run_to_threshold=False,    \
+    max_time_steps=10000,      \
     params=None,               \
     name=None,                 \
     prefs=None)
@@ -537,6 +555,14 @@ class DDM(ProcessingMechanism_Base):
         specifies the function to use to `execute <DDM_Execution>` the decision process; determines the mode of
         execution (see `function <DDM.function>` and `DDM_Modes` for additional information).
 
+    run_to_threshold : bool : default False
+        specifies whether, if `function <DDM.function>` is a `DriftDiffusionIntegrator`, each execution integrates the
+        decision process until it reaches threshold, rather than for a single time step (see `DDM_Run_To_Threshold`).
+
+    max_time_steps : int : default 10000
+        specifies the maximum number of time steps for which each execution integrates the decision process if
+        **run_to_threshold** is `True` (see `DDM_Run_To_Threshold`).
+
     params : Dict[param keyword: param value] : default None
         a dictionary that can be used to specify parameters of the Mechanism, parameters of its `function
         <DDM.function>`, and/or  a custom function and its parameters (see `Mechanism <Mechanism>` for specification of
@@ -563,7 +589,7 @@ class DDM(ProcessingMechanism_Base):
     function :  IntegratorFunction : default BogaczEtAl
         the function used to `execute <DDM_Execution>` the decision process; determines the mode of execution.
         If it is `BogaczEtAl <BogaczEtAl>` or `NavarroAndFuss <NavarroAndFuss>`, an `analytic solution
-        <DDM_Analytic_Mode>` is calculated (note:  the latter requires that the MatLab engine is installed); if it is
+        <DDM_Analytic_Mode>` is calculated; if it is
         an `Integrator` Function with an `integration_type <Integrator.integration_type>` of *DIFFUSION*,
         then `numerical step-wise integration <DDM_Integration_Mode>` is carried out.  See `DDM_Modes` and
         `DDM_Execution` for additional information.
@@ -573,6 +599,14 @@ class DDM(ProcessingMechanism_Base):
                is carried out.
         COMMENT
 
+    run_to_threshold : bool
+        determines whether, if `function <DDM.function>` is a `DriftDiffusionIntegrator`, each execution integrates the
+        decision process until it reaches threshold, rather than for a single time step (see `DDM_Run_To_Threshold`).
+
+    max_time_steps : int
+        the maximum number of time steps for which each execution integrates the decision process if `run_to_threshold
+        <DDM.run_to_threshold>` is `True`.
+
     value : 2d np.array[array(float64),array(float64),array(float64),array(float64)]
         result of executing DDM `function <DDM.function>`;  has six items, that are assigned based on the `function
         <DDM.function>` attribute.  The first two items are always assigned the values of `DECISION_VARIABLE
@@ -631,6 +665,8 @@ class DDM(ProcessingMechanism_Base):
 
     componentType = "DDM"
 
+    _draws_random_numbers = True
+
     classPreferenceLevel = PreferenceLevel.SUBTYPE
     # These will override those specified in SubtypeDefaultPreferences
     classPreferences = {
@@ -654,6 +690,8 @@ class DDM(ProcessingMechanism_Base):
                                      noise=0.5,
                                      t0=.200),
                  output_states:tc.optional(tc.any(str, Iterable))=(DECISION_VARIABLE, RESPONSE_TIME),
+                 run_to_threshold:bool=False,
+                 max_time_steps:int=10000,
                  params=None,
                  name=None,
                  # prefs:tc.optional(ComponentPreferenceSet)=None,
@@ -693,6 +731,8 @@ class DDM(ProcessingMechanism_Base):
                                                   # input_format=input_format,
                                                   input_states=input_states,
                                                   output_states=output_states,
+                                                  run_to_threshold=run_to_threshold,
+                                                  max_time_steps=max_time_steps,
                                                   params=params)
 
         # IMPLEMENTATION NOTE: this manner of setting default_variable works but is idiosyncratic
@@ -874,6 +914,10 @@ class DDM(ProcessingMechanism_Base):
                                                           context='plot').function
 
 
+    def _can_execute_batch(self):
+        # the analytic solutions are computed from the current input and parameter values alone
+        return isinstance(self.function_object, (BogaczEtAl, NavarroAndFuss))
+
     def _execute(self,
                  variable=None,
                  runtime_params=None,
@@ -923,7 +967,17 @@ class DDM(ProcessingMechanism_Base):
         # EXECUTE INTEGRATOR SOLUTION (TIME_STEP TIME SCALE) -----------------------------------------------------
         if isinstance(self.function.__self__, Integrator):
 
-            result = self.function(variable, context=context)
+            if self.run_to_threshold and INITIALIZING not in context:
+                # integrate the whole path to threshold, and leave the function where it ended
+                values, times = self.function_object.run_to_threshold(variable, max_time_steps=self.max_time_steps)
+                if np.abs(values[0]) < self.function_object.get_current_function_param(THRESHOLD):
+                    warnings.warn("{} did not reach threshold within {} time steps (max_time_steps); its decision "
+                                  "variable is {}".format(self.name, self.max_time_steps, values[0]))
+                result = np.atleast_2d(values[0])
+                self.function_object.previous_value = result
+                self.function_object.previous_time = np.atleast_1d(times[0])
+            else:
+                result = self.function(variable, context=context)
 
             if INITIALIZING not in context:
                 logger.info('{0} {1} is at {2}'.format(type(self).__name__, self.name, result))
@@ -960,7 +1014,12 @@ class DDM(ProcessingMechanism_Base):
 
             # Convert ER to decision variable:
             threshold = float(self.function_object.get_current_function_param(THRESHOLD))
-            if random.random() < return_value[self.PROBABILITY_LOWER_THRESHOLD_INDEX]:
+            # the global generator of Python is used unless the DDM has been assigned its own random_state
+            if self.random_state is np.random:
+                random_value = random.random()
+            else:
+                random_value = self.random_state.random_sample()
+            if random_value < return_value[self.PROBABILITY_LOWER_THRESHOLD_INDEX]:
                 return_value[self.DECISION_VARIABLE_INDEX] = np.atleast_1d(-1 * threshold)
             else:
                 return_value[self.DECISION_VARIABLE_INDEX] = threshold
@@ -13,28 +13,31 @@ Auxiliary functions for `EVCControlMechanism`.
 
 """
 
+import multiprocessing
+import warnings
+
+from collections import OrderedDict
+
 import numpy as np
 import typecheck as tc
 
 from psyneulink.components.functions.function import Function_Base
 from psyneulink.globals.defaults import MPI_IMPLEMENTATION, defaultControlAllocation
-from psyneulink.globals.keywords import COMBINE_OUTCOME_AND_COST_FUNCTION, COST_FUNCTION, EVC_SIMULATION, EXECUTING, FUNCTION_OUTPUT_TYPE_CONVERSION, INITIALIZING, PARAMETER_STATE_PARAMS, SAVE_ALL_VALUES_AND_POLICIES, VALUE_FUNCTION, kwPreferenceSetName, kwProgressBarChar
+from psyneulink.globals.keywords import BATCH_SIMULATIONS, COMBINE_OUTCOME_AND_COST_FUNCTION, COST_FUNCTION, EVC_SIMULATION, EXECUTING, FUNCTION_OUTPUT_TYPE_CONVERSION, INITIALIZING, NUM_SAVED_POLICIES, NUM_SIMULATION_PROCESSES, PARAMETER_STATE_PARAMS, RESTORE_SYSTEM_STATE, SAVE_ALL_VALUES_AND_POLICIES, SAVE_EVC_HISTORY, VALUE_FUNCTION, kwPreferenceSetName, kwProgressBarChar
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set, kpReportOutputPref, kpRuntimeParamStickyAssignmentPref
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
 from psyneulink.scheduling.time import TimeScale
 
 __all__ = [
-    'CONTROL_SIGNAL_GRID_SEARCH_FUNCTION', 'CONTROLLER', 'ControlSignalGridSearch', 'EVCAuxiliaryError',
-    'EVCAuxiliaryFunction', 'kwEVCAuxFunction', 'kwEVCAuxFunctionType', 'kwValueFunction', 'OUTCOME', 'PY_MULTIPROCESSING',
-    'ValueFunction',
+    'CONTROL_SIGNAL_COORDINATE_ASCENT_FUNCTION', 'CONTROL_SIGNAL_GRID_SEARCH_FUNCTION',
+    'CONTROL_SIGNAL_RANDOM_SEARCH_FUNCTION', 'CONTROL_SIGNAL_SEARCH_FUNCTION',
+    'CONTROL_SIGNAL_SUCCESSIVE_HALVING_FUNCTION', 'CONTROLLER', 'ControlSignalCoordinateAscent',
+    'ControlSignalGridSearch', 'ControlSignalRandomSearch', 'ControlSignalSearch', 'ControlSignalSuccessiveHalving',
+    'EVCAuxiliaryError', 'EVCAuxiliaryFunction', 'EVCHistory', 'kwEVCAuxFunction', 'kwEVCAuxFunctionType', 'kwValueFunction',
+    'LATIN_HYPERCUBE_SAMPLING', 'MAX_ITERATIONS', 'NUM_CANDIDATES', 'NUM_INITIAL_SIMULATIONS', 'NUM_SAMPLES',
+    'OUTCOME', 'RANDOM_SAMPLING', 'REDUCTION_FACTOR', 'SAMPLING', 'SEED', 'ValueFunction',
 ]
 
-PY_MULTIPROCESSING = False
-
-if PY_MULTIPROCESSING:
-    from multiprocessing import Pool
-
-
 if MPI_IMPLEMENTATION:
     from mpi4py import MPI
 
@@ -42,6 +45,19 @@ kwEVCAuxFunction = "EVC AUXILIARY FUNCTION"
 kwEVCAuxFunctionType = "EVC AUXILIARY FUNCTION TYPE"
 kwValueFunction = "EVC VALUE FUNCTION"
 CONTROL_SIGNAL_GRID_SEARCH_FUNCTION = "EVC CONTROL SIGNAL GRID SEARCH FUNCTION"
+CONTROL_SIGNAL_SEARCH_FUNCTION = "EVC CONTROL SIGNAL SEARCH FUNCTION"
+CONTROL_SIGNAL_COORDINATE_ASCENT_FUNCTION = "EVC CONTROL SIGNAL COORDINATE ASCENT FUNCTION"
+CONTROL_SIGNAL_SUCCESSIVE_HALVING_FUNCTION = "EVC CONTROL SIGNAL SUCCESSIVE HALVING FUNCTION"
+CONTROL_SIGNAL_RANDOM_SEARCH_FUNCTION = "EVC CONTROL SIGNAL RANDOM SEARCH FUNCTION"
+RANDOM_SAMPLING = 'random'
+LATIN_HYPERCUBE_SAMPLING = 'latin_hypercube'
+MAX_ITERATIONS = 'max_iterations'
+NUM_CANDIDATES = 'num_candidates'
+NUM_INITIAL_SIMULATIONS = 'num_initial_simulations'
+NUM_SAMPLES = 'num_samples'
+REDUCTION_FACTOR = 'reduction_factor'
+SAMPLING = 'sampling'
+SEED = 'seed'
 CONTROLLER = 'controller'
 OUTCOME = 'outcome'
 
@@ -212,7 +228,11 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
     calculate the EVC for each of those policies, and return the policy with the greatest EVC. By default, only the
     maximum EVC is saved and returned.  However, setting the `save_all_values_and_policies` attribute to `True` saves
     each policy and its EVC for each simulation run (in the EVCControlMechanism's `EVC_policies` and `EVC_values` attributes,
-    respectively). The EVC is calculated for each policy by iterating over the following steps:
+    respectively).  The simulations can also be divided among several processes, using the EVCControlMechanism's
+    `num_simulation_processes <EVCControlMechanism.num_simulation_processes>` attribute (see
+    `EVCControlMechanism_Parallel_Simulation`), or carried out in a single batch, using its `batch_simulations
+    <EVCControlMechanism.batch_simulations>` attribute (see `EVCControlMechanism_Batch_Simulation`). The EVC is calculated for each policy by iterating over the following
+    steps:
 
     * Select an allocation_policy:
         draw a successive item from `control_signal_search_space` in each iteration, and assign each of its values as
@@ -242,12 +262,18 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
 
     * Save the values:
         if the `save_all_values_and_policies` attribute is `True`, save allocation policy in the EVCControlMechanism's
-        `EVC_policies` attribute, and its value is saved in the `EVC_values` attribute; otherwise, retain only
+        `EVC_policies` attribute, and its value is saved in the `EVC_values` attribute (if its `num_saved_policies
+        <EVCControlMechanism.num_saved_policies>` attribute is specified, only that many of the allocation policies
+        with the greatest EVC are retained;  see `EVCControlMechanism_Saving_EVC_Values`); otherwise, retain only
         maximum EVC value.
 
-    The ControlSignalGridSearch function returns the `allocation_policy` that yielded the maximum EVC.
-    Its operation can be modified by customizing or replacing any or all of the functions referred to above
-    (also see `EVCControlMechanism_Functions`).
+    The ControlSignalGridSearch function returns the `allocation_policy` that yielded the maximum EVC, and records
+    the number of allocation policies it evaluated in its `num_simulations` attribute.  Its operation can be modified
+    by customizing or replacing any or all of the functions referred to above (also see
+    `EVCControlMechanism_Functions`).
+    Since the size of `control_signal_search_space` is the product of the number of `allocation_samples` for each
+    ControlSignal, `ControlSignalCoordinateAscent`, `ControlSignalSuccessiveHalving` or `ControlSignalRandomSearch` can
+    be used instead, to evaluate only some of the allocation policies.
 
     """
 
@@ -260,6 +286,7 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
                  owner=None,
                  context=None):
         function = function or self.function
+        self.num_simulations = 0
         super().__init__(function=function,
                          owner=owner,
                          context=self.componentName+INITIALIZING)
@@ -322,17 +349,47 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
                   format(controller.name, controller.system.name, progress_bar_rate_str, search_space_size))
 
         # Evaluate all combinations of control_signals (policies)
-        sample = 0
         controller.EVC_max_state_values = variable.copy()
         controller.EVC_max_policy = controller.control_signal_search_space[0] * 0.0
 
-        # Parallelize using multiprocessing.Pool
-        # NOTE:  currently fails on attempt to pickle lambda functions
-        #        preserved here for possible future restoration
-        if PY_MULTIPROCESSING:
-            EVC_pool = Pool()
-            results = EVC_pool.map(_compute_EVC, [(controller, arg, runtime_params, context)
-                                                 for arg in controller.control_signal_search_space])
+        # Simulate all allocation policies in a single batch if possible (see EVCControlMechanism_Batch_Simulation)
+        batch = controller.paramsCurrent[BATCH_SIMULATIONS] and not MPI_IMPLEMENTATION
+        if batch and not controller._can_batch_simulations():
+            if controller.verbosePref:
+                warnings.warn("{} cannot be simulated in a batch by {};  the simulations will be run serially".
+                              format(controller.system.name, controller.name))
+            batch = False
+
+        num_processes = controller.paramsCurrent[NUM_SIMULATION_PROCESSES]
+        if num_processes is not None and num_processes > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            warnings.warn("{} of {} is not supported on this platform;  the simulations will be run serially".
+                          format(NUM_SIMULATION_PROCESSES, controller.name))
+            num_processes = None
+
+        # Parallelize using a pool of forked processes
+        if not batch and num_processes is not None and num_processes > 1:
+            # (see EVCControlMechanism_Parallel_Simulation)
+            if controller.paramsCurrent[RESTORE_SYSTEM_STATE] is False:
+                raise EVCAuxiliaryError("{} of {} cannot be False if {} is greater than 1".
+                                        format(RESTORE_SYSTEM_STATE, controller.name, NUM_SIMULATION_PROCESSES))
+            chunk_results = _search_in_pool(controller, num_processes, runtime_params, context)
+
+            # chunks are reduced in order, so that (as in a serial search) the last allocation_policy with the max EVC
+            #    is the one selected
+            EVC_max = float('-Infinity')
+            for chunk_EVC_max, chunk_state_values, chunk_policy, _, _, chunk_results_values in chunk_results:
+                if chunk_EVC_max >= EVC_max:
+                    EVC_max = chunk_EVC_max
+                    controller.EVC_max_state_values = chunk_state_values
+                    controller.EVC_max_policy = chunk_policy
+                # results of the simulations are added to those of the System, as they are in a serial search
+                controller.system.results.extend(chunk_results_values)
+            controller.EVC_max = EVC_max
+
+            if _saves_EVC_values(controller):
+                _assign_EVC_values(controller,
+                                   np.concatenate([chunk[3] for chunk in chunk_results], axis=0),
+                                   np.concatenate([chunk[4] for chunk in chunk_results], axis=0))
 
         else:
 
@@ -357,70 +414,19 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
             if MPI_IMPLEMENTATION:
                 print("START: {0}\nEND: {1}".format(start,end))
 
-            #region EVALUATE EVC
-
             # Compute EVC for each allocation policy in control_signal_search_space
             # Notes on MPI:
             # * breaks up search into chunks of size chunk_size for each process (rank)
             # * each process computes max for its chunk and returns
             # * result for each chunk contains EVC max and associated allocation policy for that chunk
-
-            result = None
-            EVC_max = float('-Infinity')
-            EVC_max_policy = np.empty_like(controller.control_signal_search_space[0])
-            EVC_max_state_values = np.empty_like(controller.input_values)
+            if batch:
+                EVC_max, EVC_max_state_values, EVC_max_policy, EVC_values, EVC_policies = \
+                    _search_batch(controller, runtime_params, context)
+            else:
+                EVC_max, EVC_max_state_values, EVC_max_policy, EVC_values, EVC_policies = \
+                    _search_chunk(controller, controller.control_signal_search_space[start:end,:], runtime_params,
+                                  context, report_progress=True)
             max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
-            # FIX:  INITIALIZE TO FULL LENGTH AND ASSIGN DEFAULT VALUES (MORE EFFICIENT):
-            EVC_values = np.array([])
-            EVC_policies = np.array([[]])
-
-            # # TEST PRINT:
-            # print("\nEVC SIMULATION\n")
-
-            for allocation_vector in controller.control_signal_search_space[start:end,:]:
-            # for iter in range(rank, len(controller.control_signal_search_space), size):
-            #     allocation_vector = controller.control_signal_search_space[iter,:]:
-
-                if controller.prefs.reportOutputPref:
-                    increment_progress_bar = (progress_bar_rate < 1) or not (sample % progress_bar_rate)
-                    if increment_progress_bar:
-                        print(kwProgressBarChar, end='', flush=True)
-                sample +=1
-
-                # Calculate EVC for specified allocation policy
-                result_tuple = _compute_EVC(args=(controller, allocation_vector,
-                                                  runtime_params,
-                                                  context))
-                EVC, outcome, cost = result_tuple
-
-                EVC_max = max(EVC, EVC_max)
-                # max_result([t1, t2], key=lambda x: x1)
-
-                # Add to list of EVC values and allocation policies if save option is set
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    # FIX:  ASSIGN BY INDEX (MORE EFFICIENT)
-                    EVC_values = np.append(EVC_values, np.atleast_1d(EVC), axis=0)
-                    # Save policy associated with EVC for each process, as order of chunks
-                    #     might not correspond to order of policies in control_signal_search_space
-                    if len(EVC_policies[0])==0:
-                        EVC_policies = np.atleast_2d(allocation_vector)
-                    else:
-                        EVC_policies = np.append(EVC_policies, np.atleast_2d(allocation_vector), axis=0)
-
-                # If EVC is greater than the previous value:
-                # - store the current set of monitored state value in EVC_max_state_values
-                # - store the current set of control_signals in EVC_max_policy
-                # if EVC_max > EVC:
-                # FIX: PUT ERROR HERE IF EVC AND/OR EVC_MAX ARE EMPTY (E.G., WHEN EXECUTION_ID IS WRONG)
-                if EVC == EVC_max:
-                    # Keep track of state values and allocation policy associated with EVC max
-                    # EVC_max_state_values = controller.input_value.copy()
-                    # EVC_max_policy = allocation_vector.copy()
-                    EVC_max_state_values = controller.input_values
-                    EVC_max_policy = allocation_vector
-                    max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
-
-            #endregion
 
             # Aggregate, reduce and assign global results
 
@@ -434,16 +440,16 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
                 controller.EVC_max_state_values = max_of_max_tuples[1]
                 controller.EVC_max_policy = max_of_max_tuples[2]
 
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    controller.EVC_values = np.concatenate(Comm.allgather(EVC_values), axis=0)
-                    controller.EVC_policies = np.concatenate(Comm.allgather(EVC_policies), axis=0)
+                if _saves_EVC_values(controller):
+                    _assign_EVC_values(controller,
+                                       np.concatenate(Comm.allgather(EVC_values), axis=0),
+                                       np.concatenate(Comm.allgather(EVC_policies), axis=0))
             else:
                 controller.EVC_max = EVC_max
                 controller.EVC_max_state_values = EVC_max_state_values
                 controller.EVC_max_policy = EVC_max_policy
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    controller.EVC_values = EVC_values
-                    controller.EVC_policies = EVC_policies
+                if _saves_EVC_values(controller):
+                    _assign_EVC_values(controller, EVC_values, EVC_policies)
             # # TEST PRINT:
             # import re
             # print("\nFINAL:\n\tmax tuple:\n\t\tEVC_max: {}\n\t\tEVC_max_state_values: {}\n\t\tEVC_max_policy: {}".
@@ -461,46 +467,887 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
             print("\nEVC simulation completed")
     #endregion
 
-        # -----------------------------------------------------------------
+        # Assign and return the allocation_policy with the maximum EVC
+        self.num_simulations = len(controller.control_signal_search_space)
+        return _implement_EVC_max_policy(controller)
+
+
+class ControlSignalSearch(EVCAuxiliaryFunction):
+    """Base class for functions that search some of the allocation policies available to an `EVCControlMechanism`.
+
+    Like `ControlSignalGridSearch`, these return the `allocation_policy` with the maximum `EVC
+    <EVCControlMechanism_EVC>` among those they evaluate, each of which is a combination of values drawn from the
+    `allocation_samples` of the EVCControlMechanism's ControlSignals;  but rather than evaluating every combination (in
+    `control_signal_search_space`, which is not assigned when one of these is the EVCControlMechanism's `function
+    <EVCControlMechanism.function>`), they use a strategy to choose which to evaluate.  Each allocation policy is
+    evaluated using the EVCControlMechanism's `run_simulation` method and `value_function
+    <EVCControlMechanism.value_function>`, one at a time (they do not use `parallel
+    <EVCControlMechanism_Parallel_Simulation>` or `batch <EVCControlMechanism_Batch_Simulation>` simulation), and if
+    the EVCControlMechanism's `save_all_values_and_policies` attribute is `True`, the policies evaluated and their EVC
+    values are saved in its `EVC_policies` and `EVC_values` attributes.
+
+    Attributes
+    ----------
 
-        #region ASSIGN CONTROL SIGNAL VALUES
+    num_simulations : int
+        the number of simulations run the last time the function was executed.
 
-        # Assign allocations to control_signals for optimal allocation policy:
-        EVC_maxStateValue = iter(controller.EVC_max_state_values)
+    """
+
+    componentName = CONTROL_SIGNAL_SEARCH_FUNCTION
 
-        # Assign max values for optimal allocation policy to controller.input_states (for reference only)
-        for i in range(len(controller.input_states)):
-            controller.input_states[controller.input_states.names[i]].value = np.atleast_1d(next(EVC_maxStateValue))
+    paramClassDefaults = EVCAuxiliaryFunction.paramClassDefaults.copy()
 
+    # control_signal_search_space is not constructed for the EVCControlMechanism that uses it
+    uses_control_signal_search_space = False
+
+    def __init__(self,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None,
+                 context=None):
+        function = function or self.function
+        self.num_simulations = 0
+        super().__init__(function=function,
+                         params=params,
+                         owner=owner,
+                         context=self.componentName+INITIALIZING)
+
+    def function(
+        self,
+        controller=None,
+        variable=None,
+        runtime_params=None,
+        params=None,
+        context=None,
+    ):
+        """Search the allocation policies chosen by `_search`, and return the one with the maximum EVC"""
+
+        if INITIALIZING in context:
+            return defaultControlAllocation
+
+        if controller is None:
+            raise EVCAuxiliaryError("Call to {}() missing controller argument".format(self.__class__.__name__))
+
+        controller.EVC_max = None
+        controller.EVC_values = []
+        controller.EVC_policies = []
+
+        # Reset context so that System knows this is a simulation (to avoid infinitely recursive loop)
+        context = context.replace(EXECUTING, '{0} {1} of '.format(controller.name, EVC_SIMULATION))
+
+        allocation_samples = [np.asarray(control_signal.allocation_samples, dtype=float)
+                              for control_signal in controller.control_signals]
+
+        self.num_simulations = 0
+
+        def evaluate(allocation_vector):
+            self.num_simulations += 1
+            EVC, outcome, cost = _compute_EVC(args=(controller, allocation_vector, runtime_params, context))
+            return EVC, controller.input_values
+
+        evaluations, selected = self._search(controller, allocation_samples, evaluate)
+
+        EVC_max, EVC_max_state_values, EVC_max_policy, EVC_values, EVC_policies = \
+            _reduce_EVC(controller, evaluations, num_evaluations=len(evaluations))
+        if selected is not None:
+            EVC_max_policy, EVC_max, EVC_max_state_values = evaluations[selected]
+        controller.EVC_max = EVC_max
+        controller.EVC_max_state_values = EVC_max_state_values
+        controller.EVC_max_policy = EVC_max_policy
+        if _saves_EVC_values(controller):
+            _assign_EVC_values(controller, EVC_values, EVC_policies)
 
-        # Report EVC max info
         if controller.prefs.reportOutputPref:
-            print ("\nMaximum EVC for {0}: {1}".format(controller.system.name, float(controller.EVC_max)))
-            print ("ControlProjection allocation(s) for maximum EVC:")
-            for i in range(len(controller.control_signals)):
-                print("\t{0}: {1}".format(controller.control_signals[i].name,
-                                        controller.EVC_max_policy[i]))
-            print()
+            print("\n{0} evaluated EVC for {1} in {2} simulations".
+                  format(controller.name, controller.system.name, self.num_simulations))
 
-        #endregionj
+        return _implement_EVC_max_policy(controller)
+
+    def _search(self, controller, allocation_samples, evaluate):
+        """Choose and evaluate allocation policies for **controller**
+
+        **allocation_samples** is a list with a 1d np.array of the `allocation_samples` for each of the controller's
+        ControlSignals, and **evaluate** is a function that simulates an allocation policy and returns its EVC and
+        the resulting values of the controller's input_states.
+
+        Returns a list of (allocation_vector, EVC, state_values) tuples, one for each allocation policy evaluated, and
+        the index in that list of the one to select, or None to select the (last) one with the maximum EVC.
+        """
+        raise EVCAuxiliaryError("{} must implement _search".format(self.__class__.__name__))
+
+
+class ControlSignalCoordinateAscent(ControlSignalSearch):
+    """
+    ControlSignalCoordinateAscent(  \
+        max_iterations=10)
 
-        # # TEST PRINT:
-        # print ("\nEND OF TRIAL 1 EVC outputState: {0}\n".format(controller.outputState.value))
+    Search for the `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>` by adjusting the allocation of
+    one ControlSignal at a time (see `ControlSignalSearch`).
 
-        #region ASSIGN AND RETURN allocation_policy
-        # Convert EVC_max_policy into 2d array with one control_signal allocation per item,
-        #     assign to controller.allocation_policy, and return (where it will be assigned to controller.value).
-        #     (note:  the conversion is to be consistent with use of controller.value for assignments to control_signals.value)
-        allocation_policy = np.array(controller.EVC_max_policy).reshape(len(controller.EVC_max_policy), -1)
-        controller.value = allocation_policy
-        return allocation_policy
-        #endregion
+    The search begins with the `allocation_samples` closest to the current `allocation_policy` (i.e., the one selected
+    on the previous `TRIAL`).  It then evaluates every one of the `allocation_samples` for the first ControlSignal,
+    holding the others fixed, and keeps the one with the greatest EVC;  then does the same for the next ControlSignal,
+    and so on.  This is repeated until a pass over all of the ControlSignals does not change the `allocation_policy`,
+    or **max_iterations** passes have been made.  Each pass runs at most as many simulations as the sum of the numbers
+    of `allocation_samples` of the ControlSignals (rather than their product), and an `allocation_policy` is not
+    simulated more than once in a `TRIAL`;  however, the result is a local maximum of the EVC, which may not be the
+    maximum over all of the allocation policies.
+
+    Arguments
+    ---------
+
+    max_iterations : int : default 10
+        specifies the maximum number of passes over the ControlSignals.
+
+    Attributes
+    ----------
+
+    max_iterations : int
+        the maximum number of passes over the ControlSignals.
+
+    num_simulations : int
+        the number of simulations run the last time the function was executed.
+
+    """
+
+    componentName = CONTROL_SIGNAL_COORDINATE_ASCENT_FUNCTION
+
+    paramClassDefaults = ControlSignalSearch.paramClassDefaults.copy()
+
+    @tc.typecheck
+    def __init__(self,
+                 max_iterations:int=10,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None,
+                 context=None):
+
+        # Assign args to params and functionParams dicts (kwConstants must == arg names)
+        params = self._assign_args_to_param_dicts(max_iterations=max_iterations, params=params)
+
+        super().__init__(default_variable=default_variable,
+                         params=params,
+                         function=function,
+                         owner=owner,
+                         context=context)
+
+    def _validate_params(self, request_set, target_set=None, context=None):
+        super()._validate_params(request_set=request_set, target_set=target_set, context=context)
+        _validate_minimum_param_values(self, target_set, {MAX_ITERATIONS: 1})
+
+    def _search(self, controller, allocation_samples, evaluate):
+
+        # Evaluations of allocation policies, keyed by the index of each allocation in allocation_samples
+        evaluations = OrderedDict()
+
+        def evaluate_indices(indices):
+            indices = tuple(indices)
+            if indices not in evaluations:
+                allocation_vector = _get_allocation_vector(allocation_samples, indices)
+                evaluations[indices] = (allocation_vector,) + evaluate(allocation_vector)
+            return evaluations[indices][1]
+
+        current_indices = _get_nearest_sample_indices(controller, allocation_samples)
+        current_EVC = evaluate_indices(current_indices)
+
+        for iteration in range(self.max_iterations):
+            changed = False
+            for i, samples in enumerate(allocation_samples):
+                best_index = current_indices[i]
+                for j in range(len(samples)):
+                    if j == current_indices[i]:
+                        continue
+                    EVC = evaluate_indices(current_indices[:i] + [j] + current_indices[i+1:])
+                    if EVC > current_EVC:
+                        current_EVC = EVC
+                        best_index = j
+                if best_index != current_indices[i]:
+                    current_indices[i] = best_index
+                    changed = True
+            if not changed:
+                break
+
+        return list(evaluations.values()), list(evaluations).index(tuple(current_indices))
+
+
+class ControlSignalSuccessiveHalving(ControlSignalSearch):
+    """
+    ControlSignalSuccessiveHalving(  \
+        num_candidates=None,         \
+        num_initial_simulations=1,   \
+        reduction_factor=2,          \
+        seed=None)
+
+    Search for the `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>` by simulating a set of
+    candidate allocation policies repeatedly, and discarding the worst of them after each round (see
+    `ControlSignalSearch`).
+
+    This is useful when the outcome of a simulation is noisy (e.g., when the `system <EVCControlMechanism.system>`
+    includes Mechanisms with random `noise <TransferMechanism.noise>`), so that the EVC of an `allocation_policy` must
+    be estimated from several simulations.  In the first round, each candidate is simulated **num_initial_simulations**
+    times;  the candidates are then ranked by their mean EVC over all of the simulations run for them so far, and only
+    the best of every **reduction_factor** of them are retained for the next round, in which each is simulated
+    **reduction_factor** times as often as in the previous one.  This continues until a single candidate remains, which
+    is the `allocation_policy` returned.  The simulations are concentrated on the most promising candidates:  the
+    total number of simulations is approximately **num_initial_simulations** times the number of candidates, times the
+    number of rounds.
+
+    The EVC values saved in `EVC_values` (if `save_all_values_and_policies` is `True`) are the mean EVC of each
+    candidate over the simulations run for it.
+
+    Arguments
+    ---------
+
+    num_candidates : int : default None
+        specifies the number of candidate allocation policies;  if it is `None`, every combination of the
+        `allocation_samples` of the ControlSignals is a candidate;  otherwise, that many are drawn at random (without
+        duplicates, so there may be fewer).
+
+    num_initial_simulations : int : default 1
+        specifies the number of times each candidate is simulated in the first round.
+
+    reduction_factor : int : default 2
+        specifies the factor by which the number of candidates is reduced, and the number of simulations of each is
+        increased, in each round;  must be at least 2.
+
+    seed : int : default None
+        specifies the seed for the random number generator used to draw candidates.
+
+    Attributes
+    ----------
+
+    num_candidates : int or None
+        the number of candidates drawn at random, or `None` if every combination of `allocation_samples` is a
+        candidate.
+
+    num_initial_simulations : int
+        the number of times each candidate is simulated in the first round.
+
+    reduction_factor : int
+        the factor by which the number of candidates is reduced, and the number of simulations of each is increased, in
+        each round.
+
+    num_simulations : int
+        the number of simulations run the last time the function was executed.
+
+    """
+
+    componentName = CONTROL_SIGNAL_SUCCESSIVE_HALVING_FUNCTION
+
+    paramClassDefaults = ControlSignalSearch.paramClassDefaults.copy()
+
+    @tc.typecheck
+    def __init__(self,
+                 num_candidates:tc.optional(int)=None,
+                 num_initial_simulations:int=1,
+                 reduction_factor:int=2,
+                 seed:tc.optional(int)=None,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None,
+                 context=None):
+
+        # Assign args to params and functionParams dicts (kwConstants must == arg names)
+        params = self._assign_args_to_param_dicts(num_candidates=num_candidates,
+                                                  num_initial_simulations=num_initial_simulations,
+                                                  reduction_factor=reduction_factor,
+                                                  seed=seed,
+                                                  params=params)
+
+        super().__init__(default_variable=default_variable,
+                         params=params,
+                         function=function,
+                         owner=owner,
+                         context=context)
+
+        self._random_state = np.random.RandomState(self.seed)
+
+    def _validate_params(self, request_set, target_set=None, context=None):
+        super()._validate_params(request_set=request_set, target_set=target_set, context=context)
+        _validate_minimum_param_values(self, target_set, {NUM_CANDIDATES: 1,
+                                                          NUM_INITIAL_SIMULATIONS: 1,
+                                                          REDUCTION_FACTOR: 2})
+
+    def _search(self, controller, allocation_samples, evaluate):
+
+        if self.num_candidates is None:
+            candidates = _get_control_signal_search_space(allocation_samples)
+        else:
+            indices = np.unique(_draw_random_sample_indices(self._random_state, allocation_samples,
+                                                            self.num_candidates),
+                                axis=0)
+            candidates = [_get_allocation_vector(allocation_samples, sample_indices) for sample_indices in indices]
+
+        EVCs = [[] for candidate in candidates]
+        state_values = [None] * len(candidates)
+
+        def mean_EVC(i):
+            return np.mean(EVCs[i], axis=0)
+
+        remaining = list(range(len(candidates)))
+        num_simulations = self.num_initial_simulations
+        while True:
+            for i in remaining:
+                for simulation in range(num_simulations):
+                    EVC, state_values[i] = evaluate(candidates[i])
+                    EVCs[i].append(EVC)
+            if len(remaining) == 1:
+                break
+            # sorted is stable, so that candidates with the same mean EVC are retained in their original order
+            num_remaining = max(len(remaining) // self.reduction_factor, 1)
+            ranked = sorted(remaining, key=lambda i: float(np.sum(mean_EVC(i))), reverse=True)
+            remaining = sorted(ranked[:num_remaining])
+            if len(remaining) == 1:
+                break
+            num_simulations *= self.reduction_factor
+
+        evaluations = [(candidates[i], mean_EVC(i), state_values[i]) for i in range(len(candidates))]
+        return evaluations, remaining[0]
+
+
+class ControlSignalRandomSearch(ControlSignalSearch):
+    """
+    ControlSignalRandomSearch(    \
+        num_samples=100,          \
+        sampling=RANDOM_SAMPLING, \
+        seed=None)
+
+    Search for the `allocation_policy` with the maximum `EVC <EVCControlMechanism_EVC>` among a fixed number of
+    allocation policies drawn at random (see `ControlSignalSearch`).
+
+    On each execution, **num_samples** allocation policies are drawn from the combinations of the `allocation_samples`
+    of the ControlSignals, and each is simulated once (an `allocation_policy` that is drawn more than once is simulated
+    only once, so at most **num_samples** simulations are run).  The allocation policies are drawn using one of the
+    following methods, specified by **sampling**:
+
+    * *RANDOM_SAMPLING* -- the allocation for each ControlSignal is drawn independently and uniformly from its
+      `allocation_samples`;
+    * *LATIN_HYPERCUBE_SAMPLING* -- the `allocation_samples` of each ControlSignal are divided into **num_samples**
+      equal strata, and each allocation policy is drawn from a different stratum for each ControlSignal (chosen by an
+      independent random permutation for each), so that the allocations for each ControlSignal are spread evenly
+      over its `allocation_samples`.
+
+    Arguments
+    ---------
+
+    num_samples : int : default 100
+        specifies the number of allocation policies drawn on each execution.
+
+    sampling : RANDOM_SAMPLING or LATIN_HYPERCUBE_SAMPLING : default RANDOM_SAMPLING
+        specifies how the allocation policies are drawn.
+
+    seed : int : default None
+        specifies the seed for the random number generator used to draw allocation policies.
+
+    Attributes
+    ----------
+
+    num_samples : int
+        the number of allocation policies drawn on each execution.
+
+    sampling : RANDOM_SAMPLING or LATIN_HYPERCUBE_SAMPLING
+        determines how the allocation policies are drawn.
+
+    num_simulations : int
+        the number of simulations run the last time the function was executed.
+
+    """
+
+    componentName = CONTROL_SIGNAL_RANDOM_SEARCH_FUNCTION
+
+    paramClassDefaults = ControlSignalSearch.paramClassDefaults.copy()
+
+    @tc.typecheck
+    def __init__(self,
+                 num_samples:int=100,
+                 sampling:tc.enum(RANDOM_SAMPLING, LATIN_HYPERCUBE_SAMPLING)=RANDOM_SAMPLING,
+                 seed:tc.optional(int)=None,
+                 default_variable=None,
+                 params=None,
+                 function=None,
+                 owner=None,
+                 context=None):
+
+        # Assign args to params and functionParams dicts (kwConstants must == arg names)
+        params = self._assign_args_to_param_dicts(num_samples=num_samples,
+                                                  sampling=sampling,
+                                                  seed=seed,
+                                                  params=params)
+
+        super().__init__(default_variable=default_variable,
+                         params=params,
+                         function=function,
+                         owner=owner,
+                         context=context)
+
+        self._random_state = np.random.RandomState(self.seed)
+
+    def _validate_params(self, request_set, target_set=None, context=None):
+        super()._validate_params(request_set=request_set, target_set=target_set, context=context)
+        _validate_minimum_param_values(self, target_set, {NUM_SAMPLES: 1})
+
+    def _search(self, controller, allocation_samples, evaluate):
+
+        if self.sampling == LATIN_HYPERCUBE_SAMPLING:
+            indices = _draw_latin_hypercube_sample_indices(self._random_state, allocation_samples, self.num_samples)
+        else:
+            indices = _draw_random_sample_indices(self._random_state, allocation_samples, self.num_samples)
+
+        # Evaluations of allocation policies, keyed by the index of each allocation in allocation_samples
+        evaluations = OrderedDict()
+        for sample_indices in map(tuple, indices):
+            if sample_indices not in evaluations:
+                allocation_vector = _get_allocation_vector(allocation_samples, sample_indices)
+                evaluations[sample_indices] = (allocation_vector,) + evaluate(allocation_vector)
+
+        return list(evaluations.values()), None
+
+
+class EVCHistory:
+    """
+    EVCHistory(filename=None)
+
+    Stores the `EVC_values <EVCControlMechanism.EVC_values>` and `EVC_policies <EVCControlMechanism.EVC_policies>` of
+    an `EVCControlMechanism` for every `TRIAL` on which it is executed (see `EVCControlMechanism_EVC_History`).
+
+    The values and policies of all of the `TRIAL`\\s are stored contiguously, in the order in which they were added,
+    in arrays that are enlarged as needed;  the values and policies for a given `TRIAL` are returned by indexing the
+    EVCHistory with its number (in the order in which they were added).  If **filename** is specified, the arrays are
+    memory-mapped to files (rather than held in memory), so that a history that is too large to be held in memory can
+    be stored;  the EVC values are stored in *filename*\\ ``_values.dat``, and the allocation policies in
+    *filename*\\ ``_policies.dat``, as float64 in C order (one row per allocation policy), and can be read using
+    `np.memmap <https://docs.scipy.org/doc/numpy/reference/generated/numpy.memmap.html>`_ or `np.fromfile
+    <https://docs.scipy.org/doc/numpy/reference/generated/numpy.fromfile.html>`_.  Any existing files with those
+    names are overwritten.
+
+    Arguments
+    ---------
+
+    filename : str : default None
+        specifies the path (without an extension) of the files to which the values and policies are memory-mapped;
+        if it is `None`, they are stored in memory.
+
+    Attributes
+    ----------
+
+    filename : str or None
+        the path of the files to which the values and policies are memory-mapped, or `None` if they are stored in
+        memory.
+
+    values : 1d np.array
+        the EVC values of every `TRIAL`.
+
+    policies : 2d np.array
+        the allocation policies of every `TRIAL`, each of which corresponds to an item of `values`.
+
+    trial_offsets : 1d np.array
+        the index in `values` and `policies` of the first item for each `TRIAL`, followed by the number of items;
+        the items for `TRIAL` *i* are those from ``trial_offsets[i]`` to ``trial_offsets[i+1]``.
+
+    """
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.clear()
+
+    def __len__(self):
+        return len(self._trial_offsets) - 1
+
+    def __getitem__(self, trial):
+        """Return the EVC values and allocation policies for **trial**"""
+        trial = range(len(self))[trial]
+        start, end = self._trial_offsets[trial], self._trial_offsets[trial + 1]
+        return self.values[start:end], self.policies[start:end]
+
+    @property
+    def values(self):
+        if self._values is None:
+            return np.empty(0)
+        return self._values[:self._trial_offsets[-1]]
+
+    @property
+    def policies(self):
+        if self._policies is None:
+            return np.empty((0, 0))
+        return self._policies[:self._trial_offsets[-1]]
+
+    @property
+    def trial_offsets(self):
+        return np.array(self._trial_offsets)
+
+    def append(self, EVC_values, EVC_policies):
+        """Add **EVC_values** and **EVC_policies** as those of the next `TRIAL`"""
+        start = self._trial_offsets[-1]
+        EVC_values = np.asarray(EVC_values, dtype=float).reshape(-1)
+        if len(EVC_values):
+            EVC_policies = np.asarray(EVC_policies, dtype=float).reshape(len(EVC_values), -1)
+            end = start + len(EVC_values)
+            self._reserve(end, EVC_policies.shape[1])
+            self._values[start:end] = EVC_values
+            self._policies[start:end] = EVC_policies
+            start = end
+        self._trial_offsets.append(start)
+
+    def get_landscape(self):
+        """Return the EVC values and allocation policies as arrays with one item for each `TRIAL`
+
+        Returns (2d np.array, 3d np.array): the EVC value of each allocation policy evaluated on each `TRIAL`, and
+        those allocation policies;  this requires that the same number was saved on every `TRIAL`.
+        """
+        num_policies = np.unique(np.diff(self._trial_offsets))
+        if len(num_policies) > 1:
+            raise EVCAuxiliaryError("The number of allocation policies saved in {} differs among trials ({})".
+                                    format(self.__class__.__name__, ', '.join(str(n) for n in num_policies)))
+        return (self.values.reshape(len(self), -1),
+                self.policies.reshape(len(self), -1, self.policies.shape[-1]))
+
+    def clear(self):
+        """Discard the values and policies of all `TRIAL`\\s"""
+        self._values = None
+        self._policies = None
+        self._trial_offsets = [0]
+        if self.filename is not None:
+            for filename in self._get_filenames():
+                open(filename, 'wb').close()
+
+    def flush(self):
+        """Write any changes to the memory-mapped files to disk"""
+        for array in (self._values, self._policies):
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def _get_filenames(self):
+        return self.filename + '_values.dat', self.filename + '_policies.dat'
+
+    def _reserve(self, size, num_control_signals):
+        """Enlarge the arrays, if necessary, to hold **size** values and allocation policies"""
+        if self._policies is not None:
+            if self._policies.shape[1] != num_control_signals:
+                raise EVCAuxiliaryError("The allocation policies added to {} must each have {} items".
+                                        format(self.__class__.__name__, self._policies.shape[1]))
+            if len(self._values) >= size:
+                return
+
+        if self.filename is None:
+            # doubling the size of the arrays when they are enlarged keeps the cost of copying linear
+            if self._values is not None:
+                size = max(size, 2 * len(self._values))
+            values = np.empty(size)
+            policies = np.empty((size, num_control_signals))
+            num_values = self._trial_offsets[-1]
+            if num_values:
+                values[:num_values] = self._values[:num_values]
+                policies[:num_values] = self._policies[:num_values]
+            self._values, self._policies = values, policies
+
+        else:
+            # the files are extended, and mapped again, without copying the items already stored in them
+            self.flush()
+            self._values = self._policies = None
+            values_filename, policies_filename = self._get_filenames()
+            self._values = _map_file(values_filename, (size,))
+            self._policies = _map_file(policies_filename, (size, num_control_signals))
+
+
+def _validate_minimum_param_values(function, params, minimum_values):
+    """Raise an EVCAuxiliaryError if any of the **params** in **minimum_values** is less than its minimum value"""
+    for param_name, minimum_value in minimum_values.items():
+        if param_name in params and params[param_name] is not None and params[param_name] < minimum_value:
+            raise EVCAuxiliaryError("{} for {} must be at least {}".
+                                    format(param_name, function.__class__.__name__, minimum_value))
+
+
+def _get_control_signal_search_space(allocation_samples):
+    """Return a 2d np.array with every combination of values from the arrays in **allocation_samples**"""
+    # Reference for implementation below:
+    # http://stackoverflow.com/questions/1208118/using-numpy-to-build-an-array-of-all-combinations-of-two-arrays
+    return np.array(np.meshgrid(*allocation_samples)).T.reshape(-1, len(allocation_samples))
+
+
+def _get_allocation_vector(allocation_samples, indices):
+    """Return the allocation policy with the value at each of **indices** in the corresponding **allocation_samples**
+    """
+    return np.array([samples[index] for samples, index in zip(allocation_samples, indices)])
+
+
+def _get_nearest_sample_indices(controller, allocation_samples):
+    """Return the index in each of **allocation_samples** of the value closest to the controller's current allocation
+    for the corresponding ControlSignal (or 0 if it does not have one)
+    """
+    indices = []
+    for i, samples in enumerate(allocation_samples):
+        try:
+            allocation = float(np.atleast_1d(controller.value[i])[0])
+        except (TypeError, IndexError, ValueError):
+            indices.append(0)
+        else:
+            indices.append(int(np.argmin(np.abs(samples - allocation))))
+    return indices
+
+
+def _draw_random_sample_indices(random_state, allocation_samples, num_samples):
+    """Return a 2d np.array of **num_samples** rows, each with a random index into each of **allocation_samples**"""
+    return np.stack([random_state.randint(len(samples), size=num_samples) for samples in allocation_samples], axis=1)
+
+
+def _draw_latin_hypercube_sample_indices(random_state, allocation_samples, num_samples):
+    """Return a 2d np.array of **num_samples** rows, each with an index into each of **allocation_samples** drawn
+    from a different one of **num_samples** equal strata of it
+    """
+    indices = []
+    for samples in allocation_samples:
+        strata = (random_state.permutation(num_samples) + random_state.uniform(size=num_samples)) / num_samples
+        indices.append(np.minimum((strata * len(samples)).astype(int), len(samples) - 1))
+    return np.stack(indices, axis=1)
+
+
+def _map_file(filename, shape):
+    """Return a float64 np.memmap of **shape** for **filename**, the size of which is set to fit it"""
+    with open(filename, 'r+b') as file:
+        file.truncate(int(np.prod(shape)) * np.dtype(float).itemsize)
+    return np.memmap(filename, dtype=float, mode='r+', shape=shape)
+
+
+def _search_chunk(controller, search_space, runtime_params, context, report_progress=False):
+    """Compute the EVC for each `allocation_policy <EVCControlMechanism.allocation_policy>` in **search_space**.
+
+    Returns (float, 2d np.array, 1d np.array, 1d np.array, 2d np.array):
+        (EVC_max, EVC_max_state_values, EVC_max_policy, EVC_values, EVC_policies) for the allocation policies in
+        **search_space**;  EVC_values and EVC_policies are empty unless the controller's
+        `save_all_values_and_policies <EVCControlMechanism.save_all_values_and_policies>` attribute is `True`.
+
+    """
+
+    if report_progress and controller.prefs.reportOutputPref:
+        progress_bar_rate = int(10 ** (np.log10(len(controller.control_signal_search_space))-2))
+    else:
+        report_progress = False
+
+    def evaluate_policies():
+        for sample, allocation_vector in enumerate(search_space):
+
+            if report_progress:
+                increment_progress_bar = (progress_bar_rate < 1) or not (sample % progress_bar_rate)
+                if increment_progress_bar:
+                    print(kwProgressBarChar, end='', flush=True)
+
+            # Calculate EVC for specified allocation policy
+            result_tuple = _compute_EVC(args=(controller, allocation_vector,
+                                              runtime_params,
+                                              context))
+            EVC, outcome, cost = result_tuple
+
+            yield allocation_vector, EVC, controller.input_values
+
+    return _reduce_EVC(controller, evaluate_policies(), num_evaluations=len(search_space))
+
+
+def _search_batch(controller, runtime_params, context):
+    """Compute the EVC for each `allocation_policy <EVCControlMechanism.allocation_policy>` in the controller's
+    `control_signal_search_space`, using a single batched simulation (see `EVCControlMechanism_Batch_Simulation`).
+
+    Returns the same values as `_search_chunk`.
+    """
+    search_space = controller.control_signal_search_space
+    outcomes, costs = controller.run_batch_simulation(inputs=controller.predicted_input,
+                                                      allocation_policies=search_space,
+                                                      runtime_params=runtime_params,
+                                                      context=context)
+
+    def evaluate_policies():
+        for allocation_vector, outcome, cost in zip(search_space, outcomes, costs):
+            EVC, outcome, cost = controller.paramsCurrent[VALUE_FUNCTION].function(controller=controller,
+                                                                                   outcome=outcome,
+                                                                                   costs=cost,
+                                                                                   context=context)
+            yield allocation_vector, EVC, outcome
+
+    return _reduce_EVC(controller, evaluate_policies(), num_evaluations=len(search_space))
+
+
+def _reduce_EVC(controller, evaluations, num_evaluations=None):
+    """Identify the maximum EVC in **evaluations**, and save all EVC values and allocation policies if specified
+
+    **evaluations** is an iterable of (allocation_vector, EVC, state_values) tuples, and **num_evaluations** the number
+    of them, if it is known (used to allocate the arrays in which they are saved);  returns the same values as
+    `_search_chunk`.  If the controller's `num_saved_policies <EVCControlMechanism.num_saved_policies>` is specified,
+    only that many of the allocation policies with the greatest EVC are saved, in order of decreasing EVC.
+    """
+
+    EVC_max = float('-Infinity')
+    EVC_max_policy = np.empty(len(controller.control_signals))
+    EVC_max_state_values = np.empty_like(controller.input_values)
+
+    save_values = _saves_EVC_values(controller)
+    if save_values:
+        num_saved_policies = controller.paramsCurrent[NUM_SAVED_POLICIES]
+        # if only the greatest are saved, a buffer twice that size is reduced to them each time it is filled;
+        #    otherwise, one the size of evaluations is allocated (or, if that is not known, one that is doubled in
+        #    size each time it is filled)
+        if num_saved_policies:
+            buffer_size = 2 * num_saved_policies
+            if num_evaluations is not None:
+                buffer_size = min(buffer_size, num_evaluations)
+        elif num_evaluations is not None:
+            buffer_size = num_evaluations
+        else:
+            buffer_size = 16
+        EVC_values = np.empty(max(buffer_size, 1))
+        EVC_policies = np.empty((len(EVC_values), len(controller.control_signals)))
+        num_saved = 0
+    else:
+        EVC_values = np.array([])
+        EVC_policies = np.array([[]])
+
+    for allocation_vector, EVC, state_values in evaluations:
+
+        EVC_max = max(EVC, EVC_max)
+
+        # Add to list of EVC values and allocation policies if save option is set
+        if save_values:
+            if num_saved == len(EVC_values):
+                if num_saved_policies:
+                    EVC_values[:num_saved_policies], EVC_policies[:num_saved_policies] = \
+                        _select_max_EVC_values(EVC_values, EVC_policies, num_saved_policies)
+                    num_saved = num_saved_policies
+                else:
+                    EVC_values = np.concatenate([EVC_values, np.empty_like(EVC_values)])
+                    EVC_policies = np.concatenate([EVC_policies, np.empty_like(EVC_policies)])
+            # Save policy associated with EVC for each process, as order of chunks
+            #     might not correspond to order of policies in control_signal_search_space
+            EVC_values[num_saved] = np.squeeze(EVC)
+            EVC_policies[num_saved] = allocation_vector
+            num_saved += 1
+
+        # If EVC is greater than the previous value:
+        # - store the current set of monitored state value in EVC_max_state_values
+        # - store the current set of control_signals in EVC_max_policy
+        # FIX: PUT ERROR HERE IF EVC AND/OR EVC_MAX ARE EMPTY (E.G., WHEN EXECUTION_ID IS WRONG)
+        if EVC == EVC_max:
+            # Keep track of state values and allocation policy associated with EVC max
+            EVC_max_state_values = state_values
+            EVC_max_policy = allocation_vector
+
+    if save_values:
+        EVC_values = EVC_values[:num_saved]
+        EVC_policies = EVC_policies[:num_saved]
+        if num_saved_policies:
+            EVC_values, EVC_policies = _select_max_EVC_values(EVC_values, EVC_policies, num_saved_policies)
+
+    return EVC_max, EVC_max_state_values, EVC_max_policy, EVC_values, EVC_policies
+
+
+def _saves_EVC_values(controller):
+    """Return `True` if the EVC of each allocation policy evaluated by **controller** is to be saved"""
+    return bool(controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES] or controller.paramsCurrent[SAVE_EVC_HISTORY])
+
+
+def _select_max_EVC_values(EVC_values, EVC_policies, num_saved_policies):
+    """Return the **num_saved_policies** greatest of **EVC_values**, and the corresponding **EVC_policies**, in order of
+    decreasing EVC (and, for equal values, in the order in which they were evaluated)
+    """
+    order = np.argsort(-EVC_values, kind='mergesort')[:num_saved_policies]
+    return EVC_values[order], EVC_policies[order]
+
+
+def _assign_EVC_values(controller, EVC_values, EVC_policies):
+    """Assign **EVC_values** and **EVC_policies** to **controller**, retaining only the greatest if its
+    `num_saved_policies <EVCControlMechanism.num_saved_policies>` is specified
+    """
+    num_saved_policies = controller.paramsCurrent[NUM_SAVED_POLICIES]
+    if num_saved_policies:
+        EVC_values, EVC_policies = _select_max_EVC_values(EVC_values, EVC_policies, num_saved_policies)
+    controller.EVC_values = EVC_values
+    controller.EVC_policies = EVC_policies
+
+
+def _implement_EVC_max_policy(controller):
+    """Assign the values for the controller's `EVC_max_policy <EVCControlMechanism.EVC_max_policy>` to its
+    input_states, report it if specified, and return it as an allocation_policy (assigned to controller.value)
+    """
+
+    #region ASSIGN CONTROL SIGNAL VALUES
+
+    # Assign allocations to control_signals for optimal allocation policy:
+    EVC_maxStateValue = iter(controller.EVC_max_state_values)
+
+    # Assign max values for optimal allocation policy to controller.input_states (for reference only)
+    for i in range(len(controller.input_states)):
+        controller.input_states[controller.input_states.names[i]].value = np.atleast_1d(next(EVC_maxStateValue))
+
+
+    # Report EVC max info
+    if controller.prefs.reportOutputPref:
+        print ("\nMaximum EVC for {0}: {1}".format(controller.system.name, float(controller.EVC_max)))
+        print ("ControlProjection allocation(s) for maximum EVC:")
+        for i in range(len(controller.control_signals)):
+            print("\t{0}: {1}".format(controller.control_signals[i].name,
+                                    controller.EVC_max_policy[i]))
+        print()
+
+    #endregionj
+
+    # # TEST PRINT:
+    # print ("\nEND OF TRIAL 1 EVC outputState: {0}\n".format(controller.outputState.value))
+
+    #region ASSIGN AND RETURN allocation_policy
+    # Convert EVC_max_policy into 2d array with one control_signal allocation per item,
+    #     assign to controller.allocation_policy, and return (where it will be assigned to controller.value).
+    #     (note:  the conversion is to be consistent with use of controller.value for assignments to control_signals.value)
+    allocation_policy = np.array(controller.EVC_max_policy).reshape(len(controller.EVC_max_policy), -1)
+    controller.value = allocation_policy
+    return allocation_policy
+    #endregion
+
+
+# Arguments of the search being carried out by _search_in_pool;  these are inherited by each process when it is forked,
+#    rather than pickled (which the controller, and the Components of its System, cannot be)
+_pool_search_args = None
+
+
+def _search_pool_chunk(bounds):
+    """Search a chunk of the controller's `control_signal_search_space` in a process forked by `_search_in_pool`
+
+    Returns the result of `_search_chunk` for the chunk, followed by the results that its simulations added to the
+    System's `results <System.results>`.
+    """
+    controller, runtime_params, context = _pool_search_args
+    start, end = bounds
+    num_results = len(controller.system.results)
+    chunk_result = _search_chunk(controller, controller.control_signal_search_space[start:end], runtime_params, context)
+    return chunk_result + (controller.system.results[num_results:],)
+
+
+def _search_in_pool(controller, num_processes, runtime_params, context):
+    """Divide the controller's `control_signal_search_space` into contiguous chunks, and search them in parallel.
+
+    Each chunk is searched in a process forked from the current one, and so simulates a copy of the `system
+    <EVCControlMechanism.system>` in its current state;  only the results of the search are returned to this process.
+
+    Returns a list of the results of `_search_pool_chunk` for the chunks, in the order of `control_signal_search_space`.
+    """
+    global _pool_search_args
+
+    search_space_size = len(controller.control_signal_search_space)
+    num_chunks = min(num_processes, search_space_size)
+    boundaries = np.linspace(0, search_space_size, num_chunks + 1).astype(int)
+
+    _pool_search_args = (controller, runtime_params, context)
+    try:
+        with multiprocessing.get_context('fork').Pool(num_chunks) as pool:
+            return pool.map(_search_pool_chunk, list(zip(boundaries[:-1], boundaries[1:])), chunksize=1)
+    finally:
+        _pool_search_args = None
 
 
 def _compute_EVC(args):
     """Compute EVC for a specified `allocation_policy <EVCControlMechanism.allocation_policy>`.
 
-    IMPLEMENTATION NOTE:  implemented as a function so it can be used with multiprocessing Pool
+    IMPLEMENTATION NOTE:  implemented as a function so it can be used in the processes forked by _search_in_pool
 
     Args:
         ctlr (EVCControlMechanism)
@@ -534,9 +1381,4 @@ def _compute_EVC(args):
                                                               costs=ctlr.control_signal_costs,
                                                               context=context)
 
-
-    if PY_MULTIPROCESSING:
-        return
-
-    else:
-        return (EVC_current)
+    return (EVC_current)
@@ -172,6 +172,24 @@ functions, that can be used by its `function <EVCControlMechanism.function>` to
 set of functions and their operation are described in the section that follows;  however, the EVCControlMechanism's
 `function <EVCControlMechanism.function>` can call any other function to customize how the EVC is calcualted.
 
+.. _EVCControlMechanism_Search_Functions:
+
+Since `ControlSignalGridSearch` evaluates every combination of the `allocation_samples <ControlSignal.allocation_samples>`
+of the EVCControlMechanism's ControlSignals, the number of simulations it runs grows exponentially with the number of
+ControlSignals.  The following functions evaluate only some of those combinations, and can be specified in the
+**function** argument of the EVCControlMechanism's constructor instead (each uses the same auxiliary functions, and
+records the number of simulations it ran in its `num_simulations <ControlSignalSearch.num_simulations>` attribute,
+as does `ControlSignalGridSearch`):
+
+  * `ControlSignalCoordinateAscent` -- adjusts the allocation of one ControlSignal at a time, until no single change
+    increases the EVC;
+  ..
+  * `ControlSignalSuccessiveHalving` -- simulates a set of candidate allocation policies repeatedly, discarding the
+    worst half of them in each round, which is useful when the outcome of the simulations is noisy;
+  ..
+  * `ControlSignalRandomSearch` -- evaluates a fixed number of allocation policies, drawn at random or by Latin
+    hypercube sampling.
+
 .. _EVCControlMechanism_Default_Configuration:
 
 Default Configuration of EVC Function and its Auxiliary Functions
@@ -286,6 +304,150 @@ detailed `above <EVC_Default_Configuration>`):
 This procedure can be modified by specifying a custom function for any or all of the `functions
 <EVCControlMechanism_Functions>` referred to above.
 
+.. _EVCControlMechanism_Parallel_Simulation:
+
+*Parallel Simulation*
+~~~~~~~~~~~~~~~~~~~~~
+
+The simulations carried out by the default `function <EVCControlMechanism.function>` can be divided among several
+processes, by specifying the **num_simulation_processes** argument of the EVCControlMechanism's constructor.  Each time
+the EVCControlMechanism is executed, `control_signal_search_space` is divided into that many contiguous chunks, and
+each is searched in a process forked from the current one (this requires a platform that supports forking, such as
+Linux or macOS;  on others, the simulations are run serially).  Each process simulates its own copy of the `system
+<EVCControlMechanism.system>`, in the state it was in when the EVCControlMechanism was executed, and returns only the
+EVC values and allocation policies it evaluated, its maximum, and the `results <System.results>` of its simulations;
+these are then combined in the order of `control_signal_search_space`.  As a consequence:
+
+  * the selected `allocation_policy`, `EVC_values` and `EVC_policies` are the same as for a serial search, since each
+    simulation is run from the state the System was in when the EVCControlMechanism was executed (`restore_system_state
+    <EVCControlMechanism.restore_system_state>` is then `True` by default, and cannot be `False`;  see
+    `EVCControlMechanism_Simulation_State`);
+    stochastic Functions draw the same values as in a serial search only if the System's Components have been assigned
+    their own random number generators using its `seed_random_states <System.seed_random_states>` method (see
+    `System_Random_States`), since the global generator is not restored with the state of the System;
+  * the simulations do not change the state of the `system <EVCControlMechanism.system>` in the current process
+    (e.g., the values of its Mechanisms, or the entries in their `Logs <Log>`), other than by adding to its `results
+    <System.results>`.
+
+Since the processes are forked each time the EVCControlMechanism is executed, parallel simulation is worthwhile only
+when the simulations are costly (e.g., for Systems with Mechanisms that integrate over many time steps, or large
+search spaces).
+
+.. _EVCControlMechanism_Batch_Simulation:
+
+*Batch Simulation*
+~~~~~~~~~~~~~~~~~~
+
+If the EVCControlMechanism's `batch_simulations <EVCControlMechanism.batch_simulations>` attribute is `True`, the
+default `function <EVCControlMechanism.function>` evaluates every `allocation_policy` in `control_signal_search_space`
+using `run_batch_simulation`, rather than running a simulation of its `system <EVCControlMechanism.system>` for each.
+This runs a single simulation, using the first `allocation_policy`, and then computes the values of the Mechanisms
+that depend on the `allocation_policy` (those with a parameter controlled by the EVCControlMechanism, and those that
+receive Projections from them) for all of the others at once, as a batch of values.  Mechanisms that do not depend on
+the `allocation_policy` are executed only in the first simulation.
+
+This is possible if the `system <EVCControlMechanism.system>` does not use learning, and each of the Mechanisms that
+depends on the `allocation_policy`:
+
+  * has a `value <Mechanism_Base.value>` that depends only on its current input and parameters, and not on any of
+    its previous executions; this is the case for a `TransferMechanism` that is not in `integrator_mode
+    <TransferMechanism.integrator_mode>` and uses a non-random `noise <TransferMechanism.noise>`, a `DDM` that uses an
+    analytic solution (`BogaczEtAl` or `NavarroAndFuss`), and an `ObjectiveMechanism` that uses a
+    `CombinationFunction`;
+  ..
+  * receives Projections only from Mechanisms that execute before it in the System's `execution_list
+    <System.execution_list>`, through `MappingProjections <MappingProjection>` that are not subject to learning, to
+    InputStates that sum their inputs and are not subject to gating;
+  ..
+  * has OutputStates that are not subject to gating.
+
+A `TransferMechanism` using a `Linear`, `Exponential` or `Logistic` function is executed for the entire batch in
+a single vectorized call;  other Mechanisms are executed once for each `allocation_policy` in the batch, but without
+the overhead of executing the rest of the System.  If any of the conditions above is not met, the simulations are run
+one at a time.  The `EVC_values`, `EVC_policies` and selected `allocation_policy` are the same as for simulations run
+one at a time (up to floating point rounding in the computation of the Projections), except that Mechanisms that do
+not depend on the `allocation_policy`, and so are executed only once, do not accumulate any changes to their state
+(for example, a `prediction Mechanism <EVCControlMechanism_Prediction_Mechanisms>` integrates its input only once);
+and only the result of the first simulation is added to the System's `results <System.results>`.
+
+.. _EVCControlMechanism_Simulation_State:
+
+*Simulation State*
+~~~~~~~~~~~~~~~~~~
+
+If its `restore_system_state <EVCControlMechanism.restore_system_state>` attribute is `True` (as it is by default if
+its simulations are `divided among processes <EVCControlMechanism_Parallel_Simulation>`), the EVCControlMechanism
+saves the state of the `system <EVCControlMechanism.system>` when it is executed (using the System's `save_state
+<System.save_state>` method;  see `System_Execution_State`), restores that state before running each simulation, and
+restores it again after the last one.  Each `allocation_policy` is then evaluated from the same state, so that the
+result does not depend on the order in which they are evaluated (and is the same whether or not they are `divided among
+processes <EVCControlMechanism_Parallel_Simulation>`), and the simulations do not affect the subsequent execution of the
+System, other than by the `results <System.results>` they add to it, and the entries they make in the `Logs <Log>` of
+its Components.  Otherwise (as it is by default for simulations run serially), each simulation starts from the state
+left by the one before it, and the last one leaves its state in the `system <EVCControlMechanism.system>`:  for
+example, a Mechanism that integrates its input (such as a `TransferMechanism` in `integrator_mode
+<TransferMechanism.integrator_mode>`) continues to do so over the simulations, and the `Clock` of the System's
+`scheduler_processing <System.scheduler_processing>` counts the `TRIAL`\\s run in them;  this cannot be
+combined with `parallel simulation <EVCControlMechanism_Parallel_Simulation>`.
+
+.. _EVCControlMechanism_Outcome_Cache:
+
+*Outcome Cache*
+~~~~~~~~~~~~~~~
+
+If the **outcome_cache_size** argument of the EVCControlMechanism's constructor is specified, the outcome of each
+simulation run by `run_simulation` (i.e., the values of its `input_states <EVCControlMechanism.input_states>`) is stored
+in a cache, so that a simulation with the same inputs under the same conditions, on the same or a later `TRIAL`, is not
+run again.  The outcome is looked up using:
+
+  * the inputs for the simulation (by default, the `predicted_input`);
+  ..
+  * the `allocation_policy` being simulated;
+  ..
+  * the value of every parameter of the Mechanisms in the `system <EVCControlMechanism.system>` (other than the
+    `prediction_mechanisms`) and of the Projections they receive, using the value specified for the parameter
+    (rather than its value under the last `allocation_policy`) for those controlled by the EVCControlMechanism;
+  ..
+  * the `previous_value <Integrator.previous_value>` of any Mechanism (or its `function <Mechanism_Base.function>`)
+    that has one, such as a `TransferMechanism` in `integrator_mode <TransferMechanism.integrator_mode>`.
+
+When the cache holds **outcome_cache_size** outcomes, the least recently used one is discarded to make room for a new
+one.  If **outcome_cache_tolerance** is specified, the inputs and values above are rounded to the nearest multiple of
+it before they are looked up, so that simulations that differ by less than that are treated as the same.  The
+number of simulations found in the cache, and the number that were run, are recorded in `outcome_cache_hits` and
+`outcome_cache_misses`;  the cache can be emptied by calling `clear_outcome_cache`.
+
+The `cost <ControlSignal.cost>` of each `allocation_policy` is always computed, but a simulation found in the cache
+does not execute the `system <EVCControlMechanism.system>`, and so does not change the state of its Mechanisms or add to
+its `results <System.results>`.  The cache should therefore be used only when the outcome of a simulation is determined
+by the items listed above (for example, not if the System includes Mechanisms with random `noise
+<TransferMechanism.noise>`, or that use a stochastic `Function`).  Simulations run in the processes forked for
+`parallel simulation <EVCControlMechanism_Parallel_Simulation>` use the outcomes in the cache at the time they are
+forked, but do not add to it.  If `restore_system_state <EVCControlMechanism.restore_system_state>` is `True` (see
+`EVCControlMechanism_Simulation_State`), the state of the System is restored before the outcome is looked up, so it
+is the state in which the EVCControlMechanism was executed that is used for the outcome cache.
+
+.. _EVCControlMechanism_Saving_EVC_Values:
+
+*Saving EVC Values*
+~~~~~~~~~~~~~~~~~~~
+
+If the EVCControlMechanism's `save_all_values_and_policies` attribute is `True`, every `allocation_policy` evaluated
+by its `function <EVCControlMechanism.function>` is saved in `EVC_policies`, and its `EVC <EVCControlMechanism_EVC>`
+in `EVC_values`, each time the EVCControlMechanism is executed.  These are saved in arrays allocated for the number of
+allocation policies to be evaluated (e.g., the size of `control_signal_search_space`), and so do not add to the time
+taken by a search.  If the **num_saved_policies** argument of its constructor is specified, only that many of them,
+with the greatest EVC, are saved (in order of decreasing EVC);  these are identified as the search proceeds, so that
+the memory used is proportional to **num_saved_policies** rather than to the number of allocation policies evaluated.
+
+`EVC_values` and `EVC_policies` are replaced each time the EVCControlMechanism is executed.  If the
+**save_EVC_history** argument of its constructor is `True`, those of every `TRIAL` are also added to an `EVCHistory`,
+assigned to the EVCControlMechanism's `EVC_history` attribute, that can be used to examine the EVC of the allocation
+policies over the course of a `run <Run>`.  If **save_EVC_history** is a str, it is used as the path of files to which
+the EVCHistory is memory-mapped, so that histories too large to be held in memory can be saved.  Specifying
+**save_EVC_history** also causes `EVC_values` and `EVC_policies` to be saved, whether or not
+**save_all_values_and_policies** is `True`.
+
 
 .. _EVCControlMechanism_Examples:
 
@@ -324,24 +486,32 @@ Class Reference
 
 """
 
+import numbers
+
+from collections import Hashable, OrderedDict
+
 import numpy as np
 import typecheck as tc
 
 from psyneulink.components.component import function_type
-from psyneulink.components.functions.function import ModulationParam, _is_modulation_param
+from psyneulink.components.functions.function import LinearCombination, LinearMatrix, ModulationParam, \
+    _dot, _is_modulation_param
 from psyneulink.components.mechanisms.adaptive.control.controlmechanism import ControlMechanism
 from psyneulink.components.mechanisms.mechanism import MechanismList
 from psyneulink.components.mechanisms.processing import integratormechanism
 from psyneulink.components.mechanisms.processing.objectivemechanism import ObjectiveMechanism
 from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
 from psyneulink.components.shellclasses import Function, System_Base
-from psyneulink.globals.keywords import COMMAND_LINE, CONTROL, CONTROLLER, COST_FUNCTION, EVC_MECHANISM, FUNCTION, \
-    INITIALIZING, INIT_FUNCTION_METHOD_ONLY, PARAMETER_STATES, PREDICTION_MECHANISM, PREDICTION_MECHANISMS, \
-    PREDICTION_MECHANISM_PARAMS, PREDICTION_MECHANISM_TYPE, SUM
+from psyneulink.globals.keywords import COMMAND_LINE, CONTROL, CONTROLLER, COST_FUNCTION, EVC_MECHANISM, EXPONENTS, \
+    FUNCTION, INITIALIZING, INIT_FUNCTION_METHOD_ONLY, MATRIX, OFFSET, OPERATION, OUTCOME_CACHE_SIZE, \
+    OUTCOME_CACHE_TOLERANCE, PARAMETER_STATES, \
+    PREDICTION_MECHANISM, PREDICTION_MECHANISMS, PREDICTION_MECHANISM_PARAMS, PREDICTION_MECHANISM_TYPE, \
+    NUM_SIMULATION_PROCESSES, RESTORE_SYSTEM_STATE, SAVE_EVC_HISTORY, SCALE, SUM, WEIGHTS
 from psyneulink.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.globals.preferences.preferenceset import PreferenceLevel
 from psyneulink.globals.utilities import ContentAddressableList
-from psyneulink.library.subsystems.evc.evcauxiliary import ControlSignalGridSearch, ValueFunction
+from psyneulink.library.subsystems.evc.evcauxiliary import ControlSignalGridSearch, EVCHistory, ValueFunction, \
+    _get_control_signal_search_space
 from psyneulink.scheduling.time import TimeScale
 
 __all__ = [
@@ -368,6 +538,13 @@ class EVCControlMechanism(ControlMechanism):
     cost_function=LinearCombination(operation=SUM),                    \
     combine_outcome_and_cost_function=LinearCombination(operation=SUM) \
     save_all_values_and_policies:bool=:keyword:`False`,                \
+    num_saved_policies=None,                                           \
+    save_EVC_history=False,                                            \
+    num_simulation_processes=None,                                     \
+    batch_simulations:bool=:keyword:`False`,                           \
+    restore_system_state=None,                                         \
+    outcome_cache_size=None,                                           \
+    outcome_cache_tolerance=None,                                      \
     control_signals=None,                                              \
     params=None,                                                       \
     name=None,                                                         \
@@ -465,6 +642,39 @@ class EVCControlMechanism(ControlMechanism):
     save_all_values_and_policies : bool : default False
         specifes whether to save every `allocation_policy` tested in `EVC_policies` and their values in `EVC_values`.
 
+    num_saved_policies : int : default None
+        specifies the number of allocation policies saved in `EVC_policies` and `EVC_values`, if they are saved;  only
+        those with the greatest EVC are saved (see `EVCControlMechanism_Saving_EVC_Values`).  If it is `None` or 0,
+        every `allocation_policy` tested is saved.
+
+    save_EVC_history : bool or str : default False
+        specifies whether to save the `EVC_values` and `EVC_policies` of every `TRIAL` in `EVC_history`;  if it is a
+        str, they are memory-mapped to files with that path (see `EVCControlMechanism_Saving_EVC_Values`).
+
+    num_simulation_processes : int : default None
+        specifies the number of processes among which the simulations carried out by the default `function
+        <EVCControlMechanism.function>` are divided (see `num_simulation_processes
+        <EVCControlMechanism.num_simulation_processes>` for details).
+
+    batch_simulations : bool : default False
+        specifies whether the simulations carried out by the default `function <EVCControlMechanism.function>` are
+        carried out in a single batch when that is possible (see `batch_simulations
+        <EVCControlMechanism.batch_simulations>` for details).
+
+    restore_system_state : bool : default None
+        specifies whether each simulation is run from, and the `system <EVCControlMechanism.system>` is returned to,
+        the state it was in when the EVCControlMechanism was executed (see `EVCControlMechanism_Simulation_State`);
+        if it is `None`, it is `True` if **num_simulation_processes** is greater than 1, and `False` otherwise.  It
+        cannot be `False` if **num_simulation_processes** is greater than 1.
+
+    outcome_cache_size : int : default None
+        specifies the maximum number of simulation outcomes stored for reuse (see
+        `EVCControlMechanism_Outcome_Cache`);  if it is `None` or 0, outcomes are not stored.
+
+    outcome_cache_tolerance : float : default None
+        specifies the precision to which the values used to look up an outcome in the cache are rounded (see
+        `EVCControlMechanism_Outcome_Cache`);  if it is `None`, they must match exactly.
+
     control_signals : ControlSignal specification or List[ControlSignal specification, ...]
         specifies the parameters to be controlled by the EVCControlMechanism
         (see `ControlSignal_Specification` for details of specification).
@@ -544,6 +754,9 @@ class EVCControlMechanism(ControlMechanism):
         `control_signal_search_space` attribute), by executing the System (using `run_simulation`) for each
         combination, evaluating the result using `value_function`, and returning the `allocation_policy` that yielded
         the greatest `EVC <EVCControlMechanism_EVC>` value (see `EVCControlMechanism_Default_Configuration` for additional details).
+        `ControlSignalCoordinateAscent`, `ControlSignalSuccessiveHalving` and `ControlSignalRandomSearch` evaluate only
+        some of those combinations (see `EVCControlMechanism_Search_Functions`), and do not assign
+        `control_signal_search_space`.
         If a custom function is specified, it must accommodate a **controller** argument that specifies an EVCControlMechanism
         (and provides access to its attributes, including `control_signal_search_space`), and must return an array with
         the same format (number and type of elements) as the EVCControlMechanism's `allocation_policy` attribute.
@@ -621,7 +834,9 @@ class EVCControlMechanism(ControlMechanism):
     control_signal_search_space : 2d np.array
         an array each item of which is an `allocation_policy`.  By default, it is assigned the set of all possible
         allocation policies, using np.meshgrid to construct all permutations of `ControlSignal` values from the set
-        specified for each by its `allocation_samples <EVCControlMechanism.allocation_samples>` attribute.
+        specified for each by its `allocation_samples <EVCControlMechanism.allocation_samples>` attribute.  It is
+        `None` if the EVCControlMechanism's `function <EVCControlMechanism.function>` is a `ControlSignalSearch`
+        (see `EVCControlMechanism_Search_Functions`).
 
     EVC_max : 1d np.array with single value
         the maximum `EVC <EVCControlMechanism_EVC>` value over all allocation policies in `control_signal_search_space`.
@@ -639,9 +854,58 @@ class EVCControlMechanism(ControlMechanism):
         If it is specified, each `allocation_policy` tested in the `control_signal_search_space` is saved in
         `EVC_policies`, and their values are saved in `EVC_values`.
 
+    num_saved_policies : int or None : default None
+        the number of allocation policies with the greatest EVC that are saved in `EVC_policies` and `EVC_values`;
+        if it is `None` or 0, every `allocation_policy` tested is saved (see `EVCControlMechanism_Saving_EVC_Values`).
+
+    save_EVC_history : bool or str : default False
+        determines whether the `EVC_values` and `EVC_policies` of every `TRIAL` are saved in `EVC_history` (in memory
+        or, if it is a str, in memory-mapped files with that path).
+
+    EVC_history : EVCHistory or None
+        the `EVC_values` and `EVC_policies` of every `TRIAL` on which the EVCControlMechanism has been executed since
+        `save_EVC_history` was specified (see `EVCControlMechanism_Saving_EVC_Values`);  it is `None` if
+        `save_EVC_history` is `False`.
+
+    num_simulation_processes : int or None : default None
+        the number of processes among which the simulations carried out by the default `function
+        <EVCControlMechanism.function>` (`ControlSignalGridSearch`) are divided.  If it is `None` or 1, the
+        simulations are run serially in the current process.  Otherwise, `control_signal_search_space` is divided into
+        that many contiguous chunks, each of which is searched in a process forked from the current one (and so
+        simulates a copy of the `system <EVCControlMechanism.system>` in its state at the time the EVCControlMechanism
+        is executed); see `EVCControlMechanism_Parallel_Simulation` for details.
+
+    batch_simulations : bool : default False
+        determines whether the default `function <EVCControlMechanism.function>` (`ControlSignalGridSearch`)
+        simulates every `allocation_policy` in `control_signal_search_space` in a single batch, using
+        `run_batch_simulation`.  If the `system <EVCControlMechanism.system>` cannot be simulated in a batch, the
+        simulations are run one at a time (see `EVCControlMechanism_Batch_Simulation` for details).
+
+    restore_system_state : bool or None : default None
+        determines whether the state of the `system <EVCControlMechanism.system>` is saved when the EVCControlMechanism
+        is executed, restored before each simulation it runs, and restored again after them (see
+        `EVCControlMechanism_Simulation_State`);  if it is `None`, the state is restored only if
+        `num_simulation_processes` is greater than 1.
+
+    outcome_cache_size : int or None : default None
+        the maximum number of simulation outcomes stored for reuse by `run_simulation`;  when it is reached, the least
+        recently used outcome is discarded (see `EVCControlMechanism_Outcome_Cache` for details).
+
+    outcome_cache_tolerance : float or None : default None
+        the precision to which the inputs, `allocation_policy` and parameter values used to look up an outcome in the
+        cache are rounded;  if it is `None`, they must match exactly (see `EVCControlMechanism_Outcome_Cache`).
+
+    outcome_cache_hits : int
+        the number of simulations for which an outcome was found in the cache since it was last cleared.
+
+    outcome_cache_misses : int
+        the number of simulations run while the cache was in use because an outcome was not found in it, since it was
+        last cleared.
+
     EVC_policies : 2d np.array
-        array with every `allocation_policy` tested in `control_signal_search_space`.  The `EVC <EVCControlMechanism_EVC>`
-        value of each is stored in `EVC_values`.
+        array with every `allocation_policy` tested in `control_signal_search_space` (or, if `num_saved_policies` is
+        specified, those with the greatest EVC).  The `EVC <EVCControlMechanism_EVC>` value of each is stored in
+        `EVC_values`.
 
     EVC_values :  1d np.array
         array of `EVC <EVCControlMechanism_EVC>` values, each of which corresponds to an `allocation_policy` in `EVC_policies`;
@@ -701,11 +965,25 @@ class EVCControlMechanism(ControlMechanism):
                  combine_outcome_and_cost_function=LinearCombination(operation=SUM,
                                                                      context=componentType+FUNCTION),
                  save_all_values_and_policies:bool=False,
+                 num_saved_policies:tc.optional(int)=None,
+                 save_EVC_history:tc.any(bool, str)=False,
+                 num_simulation_processes:tc.optional(int)=None,
+                 batch_simulations:bool=False,
+                 restore_system_state:tc.optional(bool)=None,
+                 outcome_cache_size:tc.optional(int)=None,
+                 outcome_cache_tolerance:tc.optional(numbers.Real)=None,
                  params=None,
                  name=None,
                  prefs:is_pref_set=None,
                  context=componentType+INITIALIZING):
 
+        # Simulations run in forked processes start from the state in which they were forked, so they are the same as
+        #    those run serially only if each of those also starts from that state
+        #    (see EVCControlMechanism_Simulation_State)
+        if num_simulation_processes is not None and num_simulation_processes > 1 and restore_system_state is False:
+            raise EVCError("restore_system_state cannot be False for {} if num_simulation_processes is greater than 1".
+                           format(name or self.__class__.__name__))
+
         # Assign args to params and functionParams dicts (kwConstants must == arg names)
         params = self._assign_args_to_param_dicts(system=system,
                                                   prediction_mechanism_type=prediction_mechanism_type,
@@ -718,8 +996,19 @@ class EVCControlMechanism(ControlMechanism):
                                                   cost_function=cost_function,
                                                   combine_outcome_and_cost_function=combine_outcome_and_cost_function,
                                                   save_all_values_and_policies=save_all_values_and_policies,
+                                                  num_saved_policies=num_saved_policies,
+                                                  save_EVC_history=save_EVC_history,
+                                                  num_simulation_processes=num_simulation_processes,
+                                                  batch_simulations=batch_simulations,
+                                                  restore_system_state=restore_system_state,
+                                                  outcome_cache_size=outcome_cache_size,
+                                                  outcome_cache_tolerance=outcome_cache_tolerance,
                                                   params=params)
 
+        self.clear_outcome_cache()
+        self.EVC_history = None
+        self._simulation_start_state = None
+
         super(EVCControlMechanism, self).__init__(# default_variable=default_variable,
                                            # size=size,
                                            system=system,
@@ -887,37 +1176,45 @@ class EVCControlMechanism(ControlMechanism):
 
         if not 'System.controller setter' in context:
             self._update_predicted_input()
-        # self.system._cache_state()
-
-        # CONSTRUCT SEARCH SPACE
-
-        control_signal_sample_lists = []
-        control_signals = self.control_signals
 
-        # Get allocation_samples for all ControlSignals
-        num_control_signals = len(control_signals)
+        # Save the state of the System, from which each simulation is run (see EVCControlMechanism_Simulation_State)
+        if self._restores_system_state() and not INITIALIZING in context:
+            self._simulation_start_state = self.system.save_state()
 
-        for control_signal in self.control_signals:
-            control_signal_sample_lists.append(control_signal.allocation_samples)
+        # CONSTRUCT SEARCH SPACE
 
         # Construct control_signal_search_space:  set of all permutations of ControlProjection allocations
-        #                                     (one sample from the allocationSample of each ControlProjection)
-        # Reference for implementation below:
-        # http://stackoverflow.com/questions/1208118/using-numpy-to-build-an-array-of-all-combinations-of-two-arrays
-        self.control_signal_search_space = \
-            np.array(np.meshgrid(*control_signal_sample_lists)).T.reshape(-1,num_control_signals)
+        #                                     (one sample from the allocationSample of each ControlProjection);
+        #    this is not needed by a function that searches only some of them (e.g., a ControlSignalSearch)
+        if getattr(self.function_object, 'uses_control_signal_search_space', True):
+            self.control_signal_search_space = \
+                _get_control_signal_search_space([control_signal.allocation_samples
+                                                  for control_signal in self.control_signals])
+        else:
+            self.control_signal_search_space = None
 
         # EXECUTE SEARCH
 
-        # IMPLEMENTATION NOTE:
-        # self.system._store_system_state()
-
-        allocation_policy = self.function(controller=self,
-                                          variable=variable,
-                                          runtime_params=runtime_params,
-                                          context=context)
-        # IMPLEMENTATION NOTE:
-        # self.system._restore_system_state()
+        try:
+            allocation_policy = self.function(controller=self,
+                                              variable=variable,
+                                              runtime_params=runtime_params,
+                                              context=context)
+        finally:
+            # Restore the state of the System to undo the simulations, other than the outcome of the selected
+            #    allocation_policy assigned to the EVCControlMechanism's input_states
+            if self._simulation_start_state is not None:
+                input_values = [input_state.value for input_state in self.input_states]
+                self.system.restore_state(self._simulation_start_state)
+                self._simulation_start_state = None
+                for input_state, value in zip(self.input_states, input_values):
+                    input_state.value = value
+
+        if self.paramsCurrent[SAVE_EVC_HISTORY] and not INITIALIZING in context:
+            if self.EVC_history is None:
+                filename = self.paramsCurrent[SAVE_EVC_HISTORY]
+                self.EVC_history = EVCHistory(filename=filename if isinstance(filename, str) else None)
+            self.EVC_history.append(self.EVC_values, self.EVC_policies)
 
         return allocation_policy
 
@@ -944,6 +1241,14 @@ class EVCControlMechanism(ControlMechanism):
             self.predicted_input[origin_mech] = self.origin_prediction_mechanisms[origin_mech].value
             # self.predicted_input[origin_mech] = self.origin_prediction_mechanisms[origin_mech].output_state.value
 
+    def _restores_system_state(self):
+        """Return whether the state of the System is restored for the simulations (see restore_system_state)"""
+        restore_system_state = self.paramsCurrent[RESTORE_SYSTEM_STATE]
+        if restore_system_state is None:
+            num_simulation_processes = self.paramsCurrent[NUM_SIMULATION_PROCESSES]
+            return num_simulation_processes is not None and num_simulation_processes > 1
+        return restore_system_state
+
     def run_simulation(self,
                        inputs,
                        allocation_vector,
@@ -971,6 +1276,10 @@ class EVCControlMechanism(ControlMechanism):
 
         """
 
+        # Run the simulation from the state saved when the EVCControlMechanism was executed, if it was
+        if self._simulation_start_state is not None:
+            self.system.restore_state(self._simulation_start_state)
+
         if self.value is None:
             # Initialize value if it is None
             self.value = np.empty(len(self.control_signals))
@@ -982,18 +1291,237 @@ class EVCControlMechanism(ControlMechanism):
             self.value[i] = np.atleast_1d(allocation_vector[i])
         self._update_output_states(runtime_params=runtime_params, context=context)
 
-        self.system.run(inputs=inputs, context=context)
+        # Use the outcome of an identical simulation if it is in the cache (see EVCControlMechanism_Outcome_Cache)
+        monitored_states = None
+        if self.paramsCurrent[OUTCOME_CACHE_SIZE]:
+            outcome_cache_key = self._get_outcome_cache_key(inputs, allocation_vector)
+            monitored_states = self._get_cached_outcome(outcome_cache_key)
+
+        if monitored_states is None:
+            self.system.run(inputs=inputs, context=context)
 
-        # Get outcomes for current allocation_policy
-        #    = the values of the monitored output states (self.input_states)
-        # self.objective_mechanism.execute(context=EVC_SIMULATION)
-        monitored_states = self._update_input_states(runtime_params=runtime_params, context=context)
+            # Get outcomes for current allocation_policy
+            #    = the values of the monitored output states (self.input_states)
+            # self.objective_mechanism.execute(context=EVC_SIMULATION)
+            monitored_states = self._update_input_states(runtime_params=runtime_params, context=context)
+
+            if self.paramsCurrent[OUTCOME_CACHE_SIZE]:
+                self._cache_outcome(outcome_cache_key, monitored_states)
 
         for i in range(len(self.control_signals)):
             self.control_signal_costs[i] = self.control_signals[i].cost
 
         return monitored_states
 
+    def clear_outcome_cache(self):
+        """Discard the outcomes stored in the cache, and reset `outcome_cache_hits` and `outcome_cache_misses`
+        (see `EVCControlMechanism_Outcome_Cache`).
+        """
+        self._outcome_cache = OrderedDict()
+        self.outcome_cache_hits = 0
+        self.outcome_cache_misses = 0
+
+    def _get_outcome_cache_key(self, inputs, allocation_vector):
+        """Return the key used to look up the outcome of a simulation in the cache
+
+        The key identifies **inputs**, **allocation_vector**, and the parameters and state of the Mechanisms in system
+        that determine the outcome (see `EVCControlMechanism_Outcome_Cache`).
+        """
+        tolerance = self.paramsCurrent[OUTCOME_CACHE_TOLERANCE]
+
+        controlled_parameter_states = {projection.receiver
+                                       for control_signal in self.control_signals
+                                       for projection in control_signal.efferents}
+        parameter_values = []
+        state_values = []
+        prediction_mechanisms = set(self.origin_prediction_mechanisms.values())
+        for mechanism in self.system.execution_list:
+            if mechanism is self or mechanism in prediction_mechanisms:
+                continue
+            parameter_states = list(mechanism._parameter_states)
+            for input_state in mechanism.input_states:
+                for projection in input_state.path_afferents:
+                    parameter_states.extend(projection._parameter_states)
+            for parameter_state in parameter_states:
+                if parameter_state in controlled_parameter_states:
+                    parameter_values.append(_get_parameter_base_value(parameter_state))
+                else:
+                    parameter_values.append(parameter_state.value)
+            for owner in (mechanism, mechanism.function_object):
+                state_values.append(getattr(owner, 'previous_value', None))
+
+        if isinstance(inputs, dict):
+            inputs = list(inputs.items())
+
+        return _get_outcome_cache_key_item((inputs, allocation_vector, parameter_values, state_values), tolerance)
+
+    def _get_cached_outcome(self, key):
+        """Return the outcome stored in the cache for **key**, or None if there is none"""
+        try:
+            outcome = self._outcome_cache[key]
+        except KeyError:
+            self.outcome_cache_misses += 1
+            return None
+        self._outcome_cache.move_to_end(key)
+        self.outcome_cache_hits += 1
+
+        for input_state, value in zip(self.input_states, outcome):
+            input_state.value = value.copy()
+        return np.array(self.input_values)
+
+    def _cache_outcome(self, key, outcome):
+        """Store **outcome** in the cache for **key**, discarding the least recently used outcomes if it is full"""
+        self._outcome_cache[key] = [np.array(value) for value in outcome]
+        while len(self._outcome_cache) > self.paramsCurrent[OUTCOME_CACHE_SIZE]:
+            self._outcome_cache.popitem(last=False)
+
+    def _can_batch_simulations(self):
+        """Return `True` if `system <EVCControlMechanism.system>` can be simulated by `run_batch_simulation`
+        """
+        return self._get_batch_simulation_mechanisms() is not None
+
+    def _get_batch_simulation_mechanisms(self):
+        """Return the Mechanisms of system that depend on the allocation_policy, in order of execution
+
+        Returns None if the System cannot be simulated in a batch (see `EVCControlMechanism_Batch_Simulation`).
+        """
+        system = self.system
+        if system is None or system.learning:
+            return None
+
+        execution_list = [mechanism for mechanism in system.execution_list if mechanism is not self]
+        execution_order = {mechanism: i for i, mechanism in enumerate(execution_list)}
+
+        # Mechanisms with a parameter controlled by the EVCControlMechanism
+        batch_mechanisms = set()
+        for control_signal in self.control_signals:
+            for projection in control_signal.efferents:
+                if projection.receiver.owner not in execution_order:
+                    return None
+                batch_mechanisms.add(projection.receiver.owner)
+
+        # Mechanisms that receive Projections from those, directly or indirectly
+        added = True
+        while added:
+            added = False
+            for mechanism in execution_list:
+                if (mechanism not in batch_mechanisms
+                        and any(projection.sender.owner in batch_mechanisms
+                                for input_state in mechanism.input_states
+                                for projection in input_state.path_afferents)):
+                    batch_mechanisms.add(mechanism)
+                    added = True
+
+        for mechanism in batch_mechanisms:
+            if not mechanism._can_execute_batch():
+                return None
+            if any(output_state.mod_afferents for output_state in mechanism.output_states):
+                return None
+
+        # the EVCControlMechanism's InputStates are updated last, from the batch of values of the Mechanisms it monitors
+        execution_order[self] = len(execution_list)
+        for mechanism in execution_list + [self]:
+            for input_state in mechanism.input_states:
+                senders = [projection.sender.owner for projection in input_state.path_afferents]
+                if not any(sender in batch_mechanisms for sender in senders):
+                    continue
+                if not _can_batch_input_state(input_state):
+                    return None
+                if any(sender not in execution_order or execution_order[sender] >= execution_order[mechanism]
+                       for sender in senders):
+                    return None
+
+        return [mechanism for mechanism in execution_list if mechanism in batch_mechanisms]
+
+    def run_batch_simulation(self,
+                             inputs,
+                             allocation_policies,
+                             runtime_params=None,
+                             context=None):
+        """
+        Simulate the `System` for which the EVCControlMechanism is the `controller <System.controller>` under each
+        of a set of allocation policies, in a single batch (see `EVCControlMechanism_Batch_Simulation`).
+
+        Arguments
+        ----------
+
+        inputs : List[input] or ndarray(input) : default default_variable
+            the inputs used for the simulation (see `run_simulation <EVCControlMechanism.run_simulation>`).
+
+        allocation_policies : 2d np.array
+            the allocation policies to simulate, each of which has one allocation value for each of the
+            EVCControlMechanism's ControlSignals (listed in `control_signals`).
+
+        runtime_params : Optional[Dict[str, Dict[str, Dict[str, value]]]]
+            a dictionary that can include any of the parameters used as arguments to instantiate the mechanisms,
+            their functions, or Projection(s) to any of their states.  See `Mechanism_Runtime_Parameters` for a full
+            description.
+
+        Returns
+        -------
+
+        (outcomes, costs) : Tuple(List[2d np.array], List[2d np.array])
+            the values of the EVCControlMechanism's `input_states <EVCControlMechanism.input_states>`, and of the
+            `cost <ControlSignal.cost>` of each of its `control_signals <EVCControlMechanism.control_signals>`, for
+            each allocation policy.
+
+        """
+
+        batch_mechanisms = self._get_batch_simulation_mechanisms()
+        if batch_mechanisms is None:
+            raise EVCError("{} cannot be simulated in a batch by {}".format(self.system.name, self.name))
+
+        # Run the simulation for the first allocation_policy, which assigns the values of the Mechanisms that do not
+        #    depend on the allocation_policy;  its result is the only one added to the System's results
+        outcomes = [self.run_simulation(inputs=inputs,
+                                        allocation_vector=allocation_policies[0],
+                                        runtime_params=runtime_params,
+                                        context=context)]
+        costs = [self.control_signal_costs.copy()]
+
+        batch_size = len(allocation_policies) - 1
+        if batch_size == 0:
+            return outcomes, costs
+
+        # Get the values of the controlled parameters (and costs) for each of the other allocation policies
+        controlled_parameter_states = []
+        for control_signal in self.control_signals:
+            for projection in control_signal.efferents:
+                if projection.receiver not in controlled_parameter_states:
+                    controlled_parameter_states.append(projection.receiver)
+        parameter_state_values = {parameter_state: [] for parameter_state in controlled_parameter_states}
+
+        for allocation_vector in allocation_policies[1:]:
+            for i in range(len(self.control_signals)):
+                self.value[i] = np.atleast_1d(allocation_vector[i])
+            self._update_output_states(runtime_params=runtime_params, context=context)
+            for parameter_state in controlled_parameter_states:
+                parameter_state.update(context=context)
+                parameter_state_values[parameter_state].append(parameter_state.value)
+            for i in range(len(self.control_signals)):
+                self.control_signal_costs[i] = self.control_signals[i].cost
+            costs.append(self.control_signal_costs.copy())
+
+        # Execute each Mechanism that depends on the allocation_policy for the entire batch
+        output_state_values = {}
+        for mechanism in batch_mechanisms:
+            variable = np.stack([_get_input_state_batch_value(input_state, output_state_values, batch_size)
+                                 for input_state in mechanism.input_states],
+                                axis=1)
+            param_values = {parameter_state.name: np.array(values)
+                            for parameter_state, values in parameter_state_values.items()
+                            if parameter_state.owner is mechanism}
+            values = mechanism._execute_batch(variable, param_values, context=context)
+            output_state_values.update(zip(mechanism.output_states,
+                                           mechanism._get_output_values_batch(values, context=context)))
+
+        monitored_states = np.stack([_get_input_state_batch_value(input_state, output_state_values, batch_size)
+                                     for input_state in self.input_states],
+                                    axis=1)
+        outcomes.extend(monitored_states)
+
+        return outcomes, costs
+
     # The following implementation of function attributes as properties insures that even if user sets the value of a
     #    function directly (i.e., without using assign_params), it will still be wrapped as a UserDefinedFunction.
     # This is done to insure they can be called by value_function in the same way as the defaults
@@ -1045,3 +1573,80 @@ class EVCControlMechanism(ControlMechanism):
             self._combine_outcome_and_cost_function = udf
         else:
             self._combine_outcome_and_cost_function = value
+
+
+def _can_batch_input_state(input_state):
+    """Return `True` if the value of **input_state** can be computed by `_get_input_state_batch_value`"""
+    function = input_state.function_object
+    if (input_state.mod_afferents
+            or not isinstance(function, LinearCombination)
+            or function.get_current_function_param(OPERATION) != SUM
+            or function.get_current_function_param(WEIGHTS) is not None
+            or function.get_current_function_param(EXPONENTS) is not None
+            or not isinstance(function.get_current_function_param(SCALE), (numbers.Number, type(None)))
+            or not isinstance(function.get_current_function_param(OFFSET), (numbers.Number, type(None)))):
+        return False
+    return all(isinstance(projection, MappingProjection)
+               and isinstance(projection.function_object, LinearMatrix)
+               and not projection._parameter_states[MATRIX].mod_afferents
+               for projection in input_state.path_afferents)
+
+
+def _get_input_state_batch_value(input_state, output_state_values, batch_size):
+    """Return the value of **input_state** for each item of a batch
+
+    **output_state_values** is a dict with a batch of values for each OutputState that depends on the allocation
+    policy;  the Projections from other OutputStates have the same value for every item of the batch.
+    """
+    if not any(projection.sender in output_state_values for projection in input_state.path_afferents):
+        return np.array([input_state.value] * batch_size)
+
+    projection_values = []
+    for projection in input_state.path_afferents:
+        # the matrix can be a sparse matrix (see Mapping_Sparse_Matrix), so _dot is used
+        matrix = projection.function_object.get_current_function_param(MATRIX)
+        if projection.sender in output_state_values:
+            sender_values = output_state_values[projection.sender]
+            if sender_values.ndim == 2:
+                projection_values.append(_dot(sender_values, matrix))
+            else:
+                projection_values.append(np.array([_dot(value, matrix) for value in sender_values]))
+        else:
+            # computed from the value of the sender, since that of a Projection is assigned only if it is read or logged
+            projection_values.append(np.array([_dot(projection.sender.value, matrix)] * batch_size))
+
+    scale = input_state.function_object.get_current_function_param(SCALE)
+    offset = input_state.function_object.get_current_function_param(OFFSET)
+    if scale is None:
+        scale = 1.0
+    if offset is None:
+        offset = 0.0
+    return np.sum(projection_values, axis=0) * scale + offset
+
+
+def _get_parameter_base_value(parameter_state):
+    """Return the value specified for the parameter of **parameter_state**, before it is modulated"""
+    # as in ParameterState._execute, the parameter is usually one of its owner's function
+    try:
+        return getattr(parameter_state.owner.function_object, '_' + parameter_state.name)
+    except AttributeError:
+        return getattr(parameter_state.owner, '_' + parameter_state.name)
+
+
+def _get_outcome_cache_key_item(value, tolerance=None):
+    """Return a hashable representation of **value**, for use in a key of the outcome cache
+
+    Numeric values (including nested lists and arrays of them) are rounded to the nearest multiple of **tolerance**,
+    if it is specified;  other values are used as they are if they are hashable, and by their repr if not.
+    """
+    if isinstance(value, (list, tuple)) or (isinstance(value, np.ndarray) and value.dtype == object):
+        return tuple(_get_outcome_cache_key_item(item, tolerance) for item in value)
+    try:
+        array = np.asarray(value, dtype=float)
+    except (TypeError, ValueError):
+        return value if isinstance(value, Hashable) else repr(value)
+    if tolerance:
+        array = np.round(array / tolerance)
+    # adding 0.0 converts -0.0 (which has a different representation in bytes) to 0.0
+    array = array + 0.0
+    return array.shape, array.tobytes()
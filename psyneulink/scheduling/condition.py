@@ -291,6 +291,8 @@ Class Reference
 
 import logging
 
+import numpy as np
+
 from psyneulink.scheduling.time import TimeScale
 
 __all__ = [
@@ -376,6 +378,7 @@ class ConditionSet(object):
         condition.owner = owner
         condition.scheduler = self.scheduler
         self.conditions[owner] = condition
+        self._invalidate_schedule_cache()
 
     def add_condition_set(self, conditions):
         """Add a collection of `Conditions <Condition>` to the ConditionSet.
@@ -392,6 +395,13 @@ class ConditionSet(object):
             conditions[owner].owner = owner
             conditions[owner].scheduler = self.scheduler
             self.conditions[owner] = conditions[owner]
+        self._invalidate_schedule_cache()
+
+    def _invalidate_schedule_cache(self):
+        # the schedule recorded by the Scheduler may not be produced by the Conditions added
+        #    (see Scheduler_Schedule_Caching)
+        if self.scheduler is not None:
+            self.scheduler._invalidate_schedule_cache()
 
 
 class Condition(object):
@@ -422,6 +432,12 @@ class Condition(object):
         the `Component` with which the Condition is associated, and the execution of which it determines.
 
     """
+    # True if the Condition depends only on Scheduler state that is reset at the start of every TRIAL, so that
+    # it is satisfied at the same points in every TRIAL (see Scheduler_Schedule_Caching)
+    _time_invariant = False
+    # True if the Condition cannot change within a TRIAL (e.g., it depends only on the number of TRIALs)
+    _fixed_within_trial = False
+
     def __init__(self, func, *args, **kwargs):
         self.func = func
         self.args = args
@@ -457,7 +473,8 @@ class Condition(object):
             True - if the Condition is satisfied
             False - if the Condition is not satisfied
         '''
-        logger.debug('Condition ({0}) using scheduler {1}'.format(type(self).__name__, self.scheduler))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Condition ({0}) using scheduler {1}'.format(type(self).__name__, self.scheduler))
         has_args = len(self.args) > 0
         has_kwargs = len(self.kwargs) > 0
 
@@ -523,6 +540,9 @@ class Always(Condition):
         - always satisfied.
 
     """
+    _time_invariant = True
+    _fixed_within_trial = True
+
     def __init__(self):
         super().__init__(lambda: True)
 
@@ -538,6 +558,9 @@ class Never(Condition):
 
         - never satisfied.
     """
+    _time_invariant = True
+    _fixed_within_trial = True
+
     def __init__(self):
         super().__init__(lambda: False)
 
@@ -596,6 +619,14 @@ class All(Condition):
                 return False
         return True
 
+    @property
+    def _time_invariant(self):
+        return all(cond._time_invariant for cond in self.args)
+
+    @property
+    def _fixed_within_trial(self):
+        return all(cond._fixed_within_trial for cond in self.args)
+
 
 class Any(Condition):
     """Any
@@ -643,6 +674,14 @@ class Any(Condition):
                 return True
         return False
 
+    @property
+    def _time_invariant(self):
+        return all(cond._time_invariant for cond in self.args)
+
+    @property
+    def _fixed_within_trial(self):
+        return all(cond._fixed_within_trial for cond in self.args)
+
 
 class Not(Condition):
     """Not
@@ -667,6 +706,14 @@ class Not(Condition):
     def owner(self, value):
         self.args[0].owner = value
 
+    @property
+    def _time_invariant(self):
+        return all(cond._time_invariant for cond in self.args)
+
+    @property
+    def _fixed_within_trial(self):
+        return all(cond._fixed_within_trial for cond in self.args)
+
 
 class NWhen(Condition):
     """NWhen
@@ -735,6 +782,7 @@ class BeforePass(Condition):
                                      format(type(self).__name__))
             return self.scheduler.clock.get_total_times_relative(TimeScale.PASS, time_scale) < n
         super().__init__(func, n, time_scale)
+        self._time_invariant = time_scale == TimeScale.TRIAL
 
 
 class AtPass(Condition):
@@ -764,6 +812,7 @@ class AtPass(Condition):
                                      format(type(self).__name__))
             return self.scheduler.clock.get_total_times_relative(TimeScale.PASS, time_scale) == n
         super().__init__(func, n)
+        self._time_invariant = time_scale == TimeScale.TRIAL
 
 
 class AfterPass(Condition):
@@ -792,6 +841,7 @@ class AfterPass(Condition):
                                      format(type(self).__name__))
             return self.scheduler.clock.get_total_times_relative(TimeScale.PASS, time_scale) > n
         super().__init__(func, n, time_scale)
+        self._time_invariant = time_scale == TimeScale.TRIAL
 
 
 class AfterNPasses(Condition):
@@ -816,6 +866,7 @@ class AfterNPasses(Condition):
                                      format(type(self).__name__))
             return self.scheduler.clock.get_total_times_relative(TimeScale.PASS, time_scale) >= n
         super().__init__(func, n, time_scale)
+        self._time_invariant = time_scale == TimeScale.TRIAL
 
 
 class EveryNPasses(Condition):
@@ -842,6 +893,7 @@ class EveryNPasses(Condition):
                                      format(type(self).__name__))
             return self.scheduler.clock.get_total_times_relative(TimeScale.PASS, time_scale) % n == 0
         super().__init__(func, n, time_scale)
+        self._time_invariant = time_scale == TimeScale.TRIAL
 
 
 class BeforeTrial(Condition):
@@ -863,6 +915,8 @@ class BeforeTrial(Condition):
           so, `BeforeTrial(2)` is satisfied at `TRIAL` 0 and `TRIAL` 1.
 
     """
+    _fixed_within_trial = True
+
     def __init__(self, n, time_scale=TimeScale.RUN):
         def func(n):
             if self.scheduler is None:
@@ -891,6 +945,8 @@ class AtTrial(Condition):
           so, `AtTrial(1)` is satisfied when one `TRIAL` (`TRIAL` 0) has already occurred.
 
     """
+    _fixed_within_trial = True
+
     def __init__(self, n, time_scale=TimeScale.RUN):
         def func(n):
             if self.scheduler is None:
@@ -920,6 +976,8 @@ class AfterTrial(Condition):
           etc.).
 
     """
+    _fixed_within_trial = True
+
     def __init__(self, n, time_scale=TimeScale.RUN):
         def func(n):
             if self.scheduler is None:
@@ -943,6 +1001,8 @@ class AfterNTrials(Condition):
         - at least n `TRIAL`s have occured  within one unit of time at the `TimeScale` specified by **time_scale**.
 
     """
+    _fixed_within_trial = True
+
     def __init__(self, n, time_scale=TimeScale.RUN):
         def func(n, time_scale):
             if self.scheduler is None:
@@ -980,10 +1040,12 @@ class BeforeNCalls(Condition):
             if self.scheduler is None:
                 raise ConditionError('{0}: self.scheduler is None - scheduler must be assigned'.
                                      format(type(self).__name__))
-            num_calls = self.scheduler.counts_total[time_scale][dependency]
-            logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
+            num_calls = self.scheduler.counts_total[time_scale.value, self.scheduler.node_indices[dependency]]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
             return num_calls < n
         super().__init__(func, dependency, n)
+        self._time_invariant = time_scale <= TimeScale.TRIAL
 
 # NOTE:
 # The behavior of AtNCalls is not desired (i.e. depending on the order mechanisms are checked, B running AtNCalls(A, x))
@@ -1015,10 +1077,12 @@ class AtNCalls(Condition):
             if self.scheduler is None:
                 raise ConditionError('{0}: self.scheduler is None - scheduler must be assigned'.
                                      format(type(self).__name__))
-            num_calls = self.scheduler.counts_total[time_scale][dependency]
-            logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
+            num_calls = self.scheduler.counts_total[time_scale.value, self.scheduler.node_indices[dependency]]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
             return num_calls == n
         super().__init__(func, dependency, n)
+        self._time_invariant = time_scale <= TimeScale.TRIAL
 
 
 class AfterCall(Condition):
@@ -1044,10 +1108,12 @@ class AfterCall(Condition):
             if self.scheduler is None:
                 raise ConditionError('{0}: self.scheduler is None - scheduler must be assigned'.
                                      format(type(self).__name__))
-            num_calls = self.scheduler.counts_total[time_scale][dependency]
-            logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
+            num_calls = self.scheduler.counts_total[time_scale.value, self.scheduler.node_indices[dependency]]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
             return num_calls > n
         super().__init__(func, dependency, n)
+        self._time_invariant = time_scale <= TimeScale.TRIAL
 
 
 class AfterNCalls(Condition):
@@ -1073,10 +1139,12 @@ class AfterNCalls(Condition):
             if self.scheduler is None:
                 raise ConditionError('{0}: self.scheduler is None - scheduler must be assigned'.
                                      format(type(self).__name__))
-            num_calls = self.scheduler.counts_total[time_scale][dependency]
-            logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
+            num_calls = self.scheduler.counts_total[time_scale.value, self.scheduler.node_indices[dependency]]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('{0} has reached {1} num_calls in {2}'.format(dependency, num_calls, time_scale.name))
             return num_calls >= n
         super().__init__(func, dependency, n)
+        self._time_invariant = time_scale <= TimeScale.TRIAL
 
 
 class AfterNCallsCombined(Condition):
@@ -1108,13 +1176,13 @@ class AfterNCallsCombined(Condition):
                                      format(type(self).__name__))
             if n is None:
                 raise ConditionError('{0}: required keyword argument n is None'.format(type(self).__name__))
-            count_sum = 0
-            for d in dependencies:
-                count_sum += self.scheduler.counts_total[time_scale][d]
-                logger.debug('{0} has reached {1} num_calls in {2}'.
-                             format(d, self.scheduler.counts_total[time_scale][d], time_scale.name))
-            return count_sum >= n
+            counts = self.scheduler.counts_total[time_scale.value,
+                                                 [self.scheduler.node_indices[d] for d in dependencies]]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('{0} have reached {1} num_calls in {2}'.format(dependencies, counts, time_scale.name))
+            return counts.sum() >= n
         super().__init__(func, *dependencies, n=n)
+        self._time_invariant = time_scale <= TimeScale.TRIAL
 
 
 class EveryNCalls(Condition):
@@ -1152,13 +1220,17 @@ class EveryNCalls(Condition):
         - Scheduler's count of each other Component that is "useable" by the Component is reset to 0.
 
     """
+    _time_invariant = True
+
     def __init__(self, dependency, n):
         def func(dependency, n):
             if self.scheduler is None:
                 raise ConditionError('{0}: self.scheduler is None - scheduler must be assigned'.
                                      format(type(self).__name__))
-            num_calls = self.scheduler.counts_useable[dependency][self.owner]
-            logger.debug('{0} has reached {1} num_calls'.format(dependency, num_calls))
+            num_calls = self.scheduler.counts_useable[self.scheduler.node_indices[dependency],
+                                                      self.scheduler.node_indices[self.owner]]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('{0} has reached {1} num_calls'.format(dependency, num_calls))
             return num_calls >= n
         super().__init__(func, dependency, n)
 
@@ -1186,11 +1258,13 @@ class JustRan(Condition):
             if self.scheduler is None:
                 raise ConditionError('{0}: self.scheduler is None - scheduler must be assigned'.
                                      format(type(self).__name__))
-            logger.debug('checking if {0} in previous execution step set'.format(dependency))
-            try:
-                return dependency in self.scheduler.execution_list[-1]
-            except TypeError:
-                return dependency == self.scheduler.execution_list[-1]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('checking if {0} in previous execution step set'.format(dependency))
+            previous_time_step = self.scheduler.clock.history.total_times[TimeScale.TIME_STEP] - 1
+            return (
+                previous_time_step >= 0
+                and self.scheduler.last_time_step_run[self.scheduler.node_indices[dependency]] == previous_time_step
+            )
         super().__init__(func, dependency)
 
 
@@ -1215,13 +1289,12 @@ class AllHaveRun(Condition):
             if self.scheduler is None:
                 raise ConditionError('{0}: self.scheduler is None - scheduler must be assigned'.
                                      format(type(self).__name__))
-            if len(dependencies) == 0:
-                dependencies = self.scheduler.nodes
-            for d in dependencies:
-                if self.scheduler.counts_total[time_scale][d] < 1:
-                    return False
-            return True
+            counts = self.scheduler.counts_total[time_scale.value]
+            if len(dependencies) > 0:
+                counts = counts[[self.scheduler.node_indices[d] for d in dependencies]]
+            return bool(np.all(counts >= 1))
         super().__init__(func, *dependencies)
+        self._time_invariant = time_scale <= TimeScale.TRIAL
 
 
 class WhenFinished(Condition):
@@ -182,6 +182,52 @@ or its **termination_learning** argument to terminate the execution of learning:
         ...,
         termination_processing={TimeScale.TRIAL: WhenFinished(ddm)}
         )
+
+.. _Scheduler_Execution_History:
+
+Execution History
+~~~~~~~~~~~~~~~~~
+
+By default, a Scheduler does not keep the `TIME_STEP`\ s it has produced, so that its memory use does not grow with
+the length of a run.  Its **execution_list_maxlen** argument specifies how many of the most recent `TIME_STEP`\ s are
+kept in its `execution_list <Scheduler.execution_list>`; None keeps the full history::
+
+    scheduler = pnl.Scheduler(system=s, execution_list_maxlen=None)
+
+`Conditions <Condition>` do not rely on `execution_list <Scheduler.execution_list>`, and are evaluated in the same way
+whatever history is kept.
+
+.. _Scheduler_Schedule_Caching:
+
+Schedule Caching
+~~~~~~~~~~~~~~~~
+
+If every `Condition` assigned to the Scheduler depends only on counts that are reset at the start of each `TRIAL`
+(e.g., `Always`, `EveryNCalls`, `AllHaveRun`, or `AfterNCalls` and `AtPass` with their default **time_scale**), then
+the sequence of `TIME_STEP`\ s it produces is the same in every `TRIAL`.  If **cache_schedule** is specified as True
+in the Scheduler's constructor, it then records the sequence the first time it is produced and replays it in later
+`TRIAL`\ s without evaluating any Conditions.  The termination Condition for a `RUN` may also depend on the number of
+`TRIAL`\ s (e.g., `AfterNTrials`).  The recorded sequence is discarded when a Condition is added (using the
+`add_condition <Scheduler.add_condition>` or `add_condition_set <Scheduler.add_condition_set>` method of either the
+Scheduler or its `condition_set <Scheduler.condition_set>`), or a different termination Condition is assigned.
+However, a Condition that is modified in place (e.g., by assigning different values to its `args`) is not
+detected, and the recorded sequence continues to be replayed;  caching is therefore off by default, and should be
+used only if the Scheduler's Conditions are not modified once they have been added.
+
+.. _Scheduler_Tracing:
+
+Tracing
+~~~~~~~
+
+The Scheduler does not format any debugging output during a run unless the ``DEBUG`` level is enabled for its
+logger.  To inspect the counts it uses to evaluate `Conditions <Condition>`, assign a `SchedulerTrace` to its
+`trace <Scheduler.trace>` attribute (or **trace** argument); this records a `SchedulerTraceEntry` for each
+`TIME_STEP` that the Scheduler produces::
+
+    scheduler.trace = pnl.SchedulerTrace()
+    list(scheduler.run())
+    scheduler.trace.entries[-1].counts_useable
+
 Examples
 --------
 
@@ -299,16 +345,19 @@ Class Reference
 
 """
 
+import collections
 import datetime
 import logging
 
+import numpy as np
+
 from toposort import toposort
 
 from psyneulink.scheduling.condition import AllHaveRun, Always, Condition, ConditionSet, Never
-from psyneulink.scheduling.time import Clock, TimeScale
+from psyneulink.scheduling.time import Clock, Time, TimeScale
 
 __all__ = [
-    'Scheduler', 'SchedulerError',
+    'Scheduler', 'SchedulerError', 'SchedulerTrace', 'SchedulerTraceEntry',
 ]
 
 logger = logging.getLogger(__name__)
@@ -323,6 +372,47 @@ class SchedulerError(Exception):
         return repr(self.error_value)
 
 
+SchedulerTraceEntry = collections.namedtuple(
+    'SchedulerTraceEntry', 'time, execution_set, counts_total, counts_useable'
+)
+
+
+class SchedulerTrace(object):
+    """Records the state of a `Scheduler` at each `TIME_STEP` it produces (see `Scheduler_Tracing`).
+
+    Arguments
+    ---------
+
+    maxlen : int or None
+        the maximum number of entries kept; once reached, the oldest entries are discarded.
+        If None, all entries are kept.
+
+    Attributes
+    ----------
+
+    entries : collections.deque
+        a `SchedulerTraceEntry` for each `TIME_STEP` recorded, containing the `Time` at which it occurred, its
+        execution set, and copies of the Scheduler's `counts_total <Scheduler.counts_total>` and
+        `counts_useable <Scheduler.counts_useable>` at that point.
+
+    """
+    def __init__(self, maxlen=None):
+        self.entries = collections.deque(maxlen=maxlen)
+
+    def record(self, scheduler, execution_set):
+        self.entries.append(
+            SchedulerTraceEntry(
+                time=Time(**vars(scheduler.clock.time)),
+                execution_set=frozenset(execution_set),
+                counts_total=scheduler.counts_total.copy(),
+                counts_useable=scheduler.counts_useable.copy(),
+            )
+        )
+
+    def clear(self):
+        self.entries.clear()
+
+
 class Scheduler(object):
     """Generates an order of execution for `Components <Component>` in a `Composition <Composition>` or graph
     specification dictionary, possibly determined by a set of `Conditions <Condition>`.
@@ -358,8 +448,30 @@ class Scheduler(object):
     condition_set : ConditionSet
         the set of Conditions the Scheduler uses when running
 
-    execution_list : list
-        the full history of time steps the Scheduler has produced
+    execution_list : list or collections.deque
+        the history of time steps the Scheduler has produced, limited by `execution_list_maxlen
+        <Scheduler.execution_list_maxlen>` (see `Scheduler_Execution_History`)
+
+    execution_list_maxlen : int or None
+        the maximum number of time steps kept in `execution_list <Scheduler.execution_list>`; 0 keeps none,
+        and None keeps the full history
+
+    node_indices : Dict[Component: int]
+        maps each of the Scheduler's nodes to its index in `counts_total <Scheduler.counts_total>` and
+        `counts_useable <Scheduler.counts_useable>`
+
+    counts_total : 2d np.array
+        the number of times each node has executed within the current unit of each `TimeScale`;
+        ``counts_total[time_scale.value, node_indices[node]]`` is the count of **node** at **time_scale**
+
+    counts_useable : 2d np.array
+        the number of executions of each node that are available to be "used" by another node (e.g., by an
+        `EveryNCalls` Condition); ``counts_useable[node_indices[a], node_indices[b]]`` is the number of executions
+        of **a** useable by **b**
+
+    last_time_step_run : 1d np.array
+        the `TIME_STEP` (counted over the lifetime of the Scheduler) in which each node last executed, or -1 if it
+        has not yet executed; ``last_time_step_run[node_indices[node]]`` is the entry for **node**
 
     consideration_queue: list
         a list form of the Scheduler's toposort ordering of its nodes
@@ -376,6 +488,14 @@ class Scheduler(object):
     clock : `Clock`
         a `Clock` object that stores the current time in this Scheduler
 
+    cache_schedule : bool : default False
+        if True, the `TIME_STEP`\ s produced in a `TRIAL` are recorded and replayed in later `TRIAL`\ s whenever
+        all of the Scheduler's Conditions permit it (see `Scheduler_Schedule_Caching`)
+
+    trace : `SchedulerTrace` or None
+        if assigned, records the execution set and counts of the Scheduler at each `TIME_STEP` it produces;
+        None (the default) records nothing
+
     """
     def __init__(
         self,
@@ -384,21 +504,35 @@ class Scheduler(object):
         graph=None,
         condition_set=None,
         termination_conds=None,
+        execution_list_maxlen=0,
+        cache_schedule=False,
+        trace=None,
     ):
         '''
         :param self:
         :param composition: (Composition) - the Composition this scheduler is scheduling for
         :param condition_set: (ConditionSet) - a :keyword:`ConditionSet` to be scheduled
+        :param execution_list_maxlen: (int) - the number of time steps kept in execution_list;
+               None keeps the full history (default: 0)
+        :param cache_schedule: (bool) - replay the schedule of a time-invariant set of Conditions (default: False)
+        :param trace: (SchedulerTrace) - records the Scheduler's counts at each `TIME_STEP` (default: None)
         '''
         self.condition_set = condition_set if condition_set is not None else ConditionSet(scheduler=self)
-        # stores the in order list of self.run's yielded outputs
-        self.execution_list = []
+        self.cache_schedule = cache_schedule
+        self._invalidate_schedule_cache()
+        # stores the in order list of self.run's yielded outputs, if requested
+        self.execution_list_maxlen = execution_list_maxlen
+        if execution_list_maxlen is None:
+            self.execution_list = []
+        else:
+            self.execution_list = collections.deque(maxlen=execution_list_maxlen)
         self.consideration_queue = []
         self.termination_conds = {
             TimeScale.RUN: Never(),
             TimeScale.TRIAL: AllHaveRun(),
         }
         self.update_termination_conditions(termination_conds)
+        self.trace = trace
 
         if system is not None:
             self.nodes = [m for m in system.execution_list]
@@ -447,31 +581,32 @@ class Scheduler(object):
         self.consideration_queue = list(toposort(dependencies))
 
     def _init_counts(self):
+        # maps each node to its row/column in the count arrays below
+        self.node_indices = {node: i for i, node in enumerate(self.nodes)}
         # stores total the number of occurrences of a node through the time scale
         # i.e. the number of times node has ran/been queued to run in a trial
-        self.counts_total = {ts: None for ts in TimeScale}
-        # counts_useable is a dictionary intended to store the number of available "instances" of a certain node that
+        # counts_total[ts.value, node_indices[n]] is the count of n within the current unit of ts
+        self.counts_total = np.zeros((len(TimeScale), len(self.nodes)), dtype=np.int64)
+        # counts_useable is a matrix intended to store the number of available "instances" of a certain node that
         # are available to expend in order to satisfy conditions such as "run B every two times A runs"
-        # specifically, counts_useable[a][b] = n indicates that there are n uses of a that are available for b to expend
-        # so, in the previous example B would check to see if counts_useable[A][B] >= 2, in which case B can run
-        # then, counts_useable[a][b] would be reset to 0, even if it was greater than 2
-        self.counts_useable = {node: {n: 0 for n in self.nodes} for node in self.nodes}
-
-        for ts in TimeScale:
-            self.counts_total[ts] = {n: 0 for n in self.nodes}
+        # specifically, counts_useable[a, b] = n indicates that there are n uses of a that are available for b to expend
+        # so, in the previous example B would check to see if counts_useable[A, B] >= 2, in which case B can run
+        # then, counts_useable[a, b] would be reset to 0, even if it was greater than 2
+        self.counts_useable = np.zeros((len(self.nodes), len(self.nodes)), dtype=np.int64)
+        # stores the lifetime index of the time step in which each node last ran, so that Conditions such as JustRan
+        # do not depend on execution_list, which may not be kept
+        self.last_time_step_run = np.full(len(self.nodes), -1, dtype=np.int64)
 
     def _reset_counts_total(self, time_scale):
-        for ts in TimeScale:
-            # only reset the values underneath the current scope
-            # this works because the enum is set so that higher granularities of time have lower values
-            if ts.value <= time_scale.value:
-                for c in self.counts_total[ts]:
-                    logger.debug('resetting counts_total[{0}][{1}] to 0'.format(ts, c))
-                    self.counts_total[ts][c] = 0
+        # only reset the values underneath the current scope
+        # this works because the enum is set so that higher granularities of time have lower values
+        self.counts_total[:time_scale.value + 1] = 0
 
     def update_termination_conditions(self, termination_conds):
         if termination_conds is not None:
             logger.info('Specified termination_conds {0} overriding {1}'.format(termination_conds, self.termination_conds))
+            if any(self.termination_conds.get(ts) is not termination_conds[ts] for ts in termination_conds):
+                self._invalidate_schedule_cache()
             self.termination_conds.update(termination_conds)
 
         for ts in self.termination_conds:
@@ -507,6 +642,27 @@ class Scheduler(object):
         '''
         self.condition_set.add_condition_set(conditions)
 
+    ################################################################################
+    # Schedule caching methods
+    #   see Scheduler_Schedule_Caching
+    ################################################################################
+
+    def _invalidate_schedule_cache(self):
+        # the passes of the last recorded TRIAL, each a list of (execution set, node indices in order of addition)
+        self._schedule_cache = None
+        # whether the current Conditions allow caching; None until checked
+        self._schedule_cacheable = None
+
+    def _is_schedule_cacheable(self):
+        if self._schedule_cacheable is None:
+            termination_run = self.termination_conds[TimeScale.RUN]
+            self._schedule_cacheable = (
+                self.termination_conds[TimeScale.TRIAL]._time_invariant
+                and (termination_run._time_invariant or termination_run._fixed_within_trial)
+                and all(self.condition_set.conditions[node]._time_invariant for node in self.nodes)
+            )
+        return self._schedule_cacheable
+
     ################################################################################
     # Validation methods
     #   to provide the user with info if they do something odd
@@ -538,11 +694,35 @@ class Scheduler(object):
         self._validate_run_state()
         self.update_termination_conditions(self._parse_termination_conditions(termination_conds))
 
-        self.counts_useable = {node: {n: 0 for n in self.nodes} for node in self.nodes}
+        # checked once per run, so that no debug messages are formatted in the loops below unless DEBUG is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        self.counts_useable.fill(0)
         self._reset_counts_total(TimeScale.TRIAL)
 
+        # the lifetime index of the time step being built; incremented along with the clock below
+        cur_time_step = self.clock.history.total_times[TimeScale.TIME_STEP]
+
+        # a RUN termination Condition that is fixed within a TRIAL is checked only here when caching, so a TRIAL in
+        # which it is already satisfied is left to the loop below, and is neither recorded nor replayed
+        use_schedule_cache = (
+            self.cache_schedule
+            and self._is_schedule_cacheable()
+            and (
+                self.termination_conds[TimeScale.RUN]._time_invariant
+                or not self.termination_conds[TimeScale.RUN].is_satisfied()
+            )
+        )
+        if use_schedule_cache and self._schedule_cache is not None:
+            yield from self._replay_schedule(cur_time_step)
+            return self.execution_list
+
+        schedule = [] if use_schedule_cache else None
+
         while not self.termination_conds[TimeScale.TRIAL].is_satisfied() and not self.termination_conds[TimeScale.RUN].is_satisfied():
             self._reset_counts_total(TimeScale.PASS)
+            if schedule is not None:
+                schedule.append([])
 
             execution_list_has_changed = False
             cur_index_consideration_queue = 0
@@ -554,6 +734,7 @@ class Scheduler(object):
             ):
                 # all nodes to be added during this time step
                 cur_time_step_exec = set()
+                cur_time_step_indices = []
                 # the current "layer/group" of nodes that MIGHT be added during this time step
                 cur_consideration_set = self.consideration_queue[cur_index_consideration_queue]
                 try:
@@ -567,58 +748,92 @@ class Scheduler(object):
                 while True:
                     cur_consideration_set_has_changed = False
                     for current_node in cur_consideration_set:
-                        logger.debug('cur time_step exec: {0}'.format(cur_time_step_exec))
-                        for n in self.counts_useable:
-                            logger.debug('Counts of {0} useable by'.format(n))
-                            for n2 in self.counts_useable[n]:
-                                logger.debug('\t{0}: {1}'.format(n2, self.counts_useable[n][n2]))
-
                         # only add each node once during a single time step, this also serves
                         # to prevent infinitely cascading adds
                         if current_node not in cur_time_step_exec:
                             if self.condition_set.conditions[current_node].is_satisfied():
-                                logger.debug('adding {0} to execution list'.format(current_node))
-                                logger.debug('cur time_step exec pre add: {0}'.format(cur_time_step_exec))
+                                if debug:
+                                    logger.debug('adding {0} to time step {1}'.format(current_node, cur_time_step_exec))
                                 cur_time_step_exec.add(current_node)
-                                logger.debug('cur time_step exec post add: {0}'.format(cur_time_step_exec))
                                 execution_list_has_changed = True
                                 cur_consideration_set_has_changed = True
 
-                                for ts in TimeScale:
-                                    self.counts_total[ts][current_node] += 1
-                                # current_node's node is added to the execution queue, so we now need to
-                                # reset all of the counts useable by current_node's node to 0
-                                for n in self.counts_useable:
-                                    self.counts_useable[n][current_node] = 0
-                                # and increment all of the counts of current_node's node useable by other
-                                # nodes by 1
-                                for n in self.counts_useable:
-                                    self.counts_useable[current_node][n] += 1
+                                current_index = self.node_indices[current_node]
+                                cur_time_step_indices.append(current_index)
+                                self._count_execution(current_index, cur_time_step)
                     # do-while condition
                     if not cur_consideration_set_has_changed:
                         break
 
                 # add a new time step at each step in a pass, if the time step would not be empty
                 if len(cur_time_step_exec) >= 1:
+                    if schedule is not None:
+                        schedule[-1].append((frozenset(cur_time_step_exec), tuple(cur_time_step_indices)))
+                    if self.trace is not None:
+                        self.trace.record(self, cur_time_step_exec)
                     self.execution_list.append(cur_time_step_exec)
-                    yield self.execution_list[-1]
+                    yield cur_time_step_exec
 
                     self.clock._increment_time(TimeScale.TIME_STEP)
+                    cur_time_step += 1
 
                 cur_index_consideration_queue += 1
 
             # if an entire pass occurs with nothing running, add an empty time step
             if not execution_list_has_changed:
-                self.execution_list.append(set())
-                yield self.execution_list[-1]
+                if schedule is not None:
+                    schedule[-1].append((frozenset(), ()))
+                if self.trace is not None:
+                    self.trace.record(self, set())
+                empty_time_step = set()
+                self.execution_list.append(empty_time_step)
+                yield empty_time_step
 
                 self.clock._increment_time(TimeScale.TIME_STEP)
+                cur_time_step += 1
 
             self.clock._increment_time(TimeScale.PASS)
 
+        if schedule is not None:
+            self._schedule_cache = schedule
+
         self.clock._increment_time(TimeScale.TRIAL)
 
         if self.termination_conds[TimeScale.RUN].is_satisfied():
             self.date_last_run_end = datetime.datetime.now()
 
         return self.execution_list
+
+    def _replay_schedule(self, cur_time_step):
+        # yields the time steps of the cached schedule, updating all state as run would but evaluating no Conditions
+        for pass_ in self._schedule_cache:
+            self._reset_counts_total(TimeScale.PASS)
+
+            for execution_set, indices in pass_:
+                for index in indices:
+                    self._count_execution(index, cur_time_step)
+
+                cur_time_step_exec = set(execution_set)
+                if self.trace is not None:
+                    self.trace.record(self, cur_time_step_exec)
+                self.execution_list.append(cur_time_step_exec)
+                yield cur_time_step_exec
+
+                self.clock._increment_time(TimeScale.TIME_STEP)
+                cur_time_step += 1
+
+            self.clock._increment_time(TimeScale.PASS)
+
+        self.clock._increment_time(TimeScale.TRIAL)
+
+        if self.termination_conds[TimeScale.RUN].is_satisfied():
+            self.date_last_run_end = datetime.datetime.now()
+
+    def _count_execution(self, index, time_step):
+        self.counts_total[:, index] += 1
+        # the node is added to the execution queue, so we now need to
+        # reset all of the counts useable by the node to 0
+        self.counts_useable[:, index] = 0
+        # and increment all of the counts of the node useable by other nodes by 1
+        self.counts_useable[index] += 1
+        self.last_time_step_run[index] = time_step
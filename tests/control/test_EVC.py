@@ -1,7 +1,10 @@
+import functools
+
 import numpy as np
 import pytest
 
-from psyneulink.components.functions.function import BogaczEtAl, DRIFT_RATE, Exponential, Linear, THRESHOLD
+from psyneulink.components.functions.function import BogaczEtAl, DRIFT_RATE, Exponential, Linear, Logistic, NormalDist, \
+    THRESHOLD
 from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
 from psyneulink.components.process import Process
 from psyneulink.components.projections.modulatory.controlprojection import ControlProjection
@@ -10,7 +13,9 @@ from psyneulink.globals.keywords import ALLOCATION_SAMPLES, IDENTITY_MATRIX, MEA
 from psyneulink.globals.preferences.componentpreferenceset import ComponentPreferenceSet, kpReportOutputPref, kpVerbosePref
 from psyneulink.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
 from psyneulink.library.mechanisms.processing.integrator.ddm import DDM, DECISION_VARIABLE, PROBABILITY_UPPER_THRESHOLD, RESPONSE_TIME
-from psyneulink.library.subsystems.evc.evccontrolmechanism import EVCControlMechanism
+from psyneulink.library.subsystems.evc.evcauxiliary import ControlSignalCoordinateAscent, ControlSignalRandomSearch, \
+    ControlSignalSuccessiveHalving, EVCAuxiliaryError, LATIN_HYPERCUBE_SAMPLING, RANDOM_SAMPLING
+from psyneulink.library.subsystems.evc.evccontrolmechanism import EVCControlMechanism, EVCError
 
 
 def test_EVC():
@@ -689,3 +694,354 @@ def test_laming_validation_specify_control_signals():
         Decision._parameter_states[THRESHOLD].value,
         Decision._parameter_states[THRESHOLD].mod_afferents[0].value * Decision._parameter_states[THRESHOLD].function_object.value
     )
+
+
+def _make_EVC_system(num_simulation_processes=None):
+    Input = TransferMechanism(name='Input')
+    Reward = TransferMechanism(output_states=[RESULT, MEAN, VARIANCE], name='Reward')
+    Decision = DDM(
+        function=BogaczEtAl(
+            drift_rate=(
+                1.0,
+                ControlProjection(function=Linear, control_signal_params={ALLOCATION_SAMPLES: np.arange(0.1, 1.01, 0.3)})
+            ),
+            threshold=(
+                1.0,
+                ControlProjection(function=Linear, control_signal_params={ALLOCATION_SAMPLES: np.arange(0.1, 1.01, 0.3)})
+            ),
+            noise=(0.5),
+            starting_point=(0),
+            t0=0.45
+        ),
+        output_states=[DECISION_VARIABLE, RESPONSE_TIME, PROBABILITY_UPPER_THRESHOLD],
+        name='Decision',
+    )
+    TaskExecutionProcess = Process(size=1, pathway=[(Input), IDENTITY_MATRIX, (Decision)])
+    RewardProcess = Process(size=1, pathway=[(Reward)])
+
+    S = System(
+        processes=[TaskExecutionProcess, RewardProcess],
+        controller=EVCControlMechanism,
+        enable_controller=True,
+        monitor_for_control=[Reward, Decision.PROBABILITY_UPPER_THRESHOLD, (Decision.RESPONSE_TIME, -1, 1)],
+    )
+    S.controller.save_all_values_and_policies = True
+    S.controller.num_simulation_processes = num_simulation_processes
+
+    return S, Input, Reward
+
+
+@pytest.mark.parametrize('num_simulation_processes', [3, 16, 20])
+def test_EVC_num_simulation_processes_matches_serial(num_simulation_processes):
+    runs = []
+    for num_processes in [None, num_simulation_processes]:
+        np.random.seed(0)
+        S, Input, Reward = _make_EVC_system(num_processes)
+        S.run(inputs={Input: [0.5, 0.123], Reward: [20, 20]})
+        runs.append(S)
+
+    def results_by_mechanism_type(S, result):
+        # the order of the TERMINAL Mechanisms, and so of the values in each result, can differ between Systems
+        values = iter(result)
+        return {type(mech): [next(values) for output_state in mech.output_states]
+                for mech in S.terminal_mechanisms.mechanisms}
+
+    serial, parallel = runs
+    num_simulations = len(serial.controller.control_signal_search_space)
+    assert len(parallel.results) == len(serial.results)
+    for i, (parallel_result, serial_result) in enumerate(zip(parallel.results, serial.results)):
+        # the result recorded for each trial follows those of its simulations;  in a serial search, it is left over
+        #    from the last simulation, whereas the System in this process is not changed by those run in parallel
+        if i % (num_simulations + 1) == num_simulations:
+            continue
+        parallel_result = results_by_mechanism_type(parallel, parallel_result)
+        serial_result = results_by_mechanism_type(serial, serial_result)
+        # the DDM's decision variable is drawn at random, and so differs in the forked processes;  the remaining
+        #    results (and so the EVC of each allocation_policy) do not depend on it
+        np.testing.assert_array_equal(np.array(parallel_result[DDM][1:], dtype=float),
+                                      np.array(serial_result[DDM][1:], dtype=float))
+        np.testing.assert_array_equal(np.array(parallel_result[TransferMechanism], dtype=float),
+                                      np.array(serial_result[TransferMechanism], dtype=float))
+    np.testing.assert_array_equal(parallel.controller.EVC_values, serial.controller.EVC_values)
+    np.testing.assert_array_equal(parallel.controller.EVC_policies, serial.controller.EVC_policies)
+    np.testing.assert_array_equal(parallel.controller.EVC_max_policy, serial.controller.EVC_max_policy)
+    assert parallel.controller.EVC_max == serial.controller.EVC_max
+
+
+def _make_transfer_EVC_system(integrator_mode=False, noise=0.0, bias=False, **controller_args):
+    Input = TransferMechanism(name='Input', size=2)
+    Hidden = TransferMechanism(
+        name='Hidden',
+        size=3,
+        function=Logistic(
+            gain=(1.0, ControlProjection(control_signal_params={ALLOCATION_SAMPLES: np.arange(0.5, 2.01, 0.5)}))
+        ),
+        integrator_mode=integrator_mode,
+        noise=noise,
+    )
+    Output = TransferMechanism(
+        name='Output',
+        function=Linear(
+            slope=(1.0, ControlProjection(control_signal_params={ALLOCATION_SAMPLES: np.arange(0.1, 1.01, 0.3)}))
+        ),
+        output_states=[RESULT, MEAN],
+    )
+    processes = [Process(pathway=[Input, np.array([[1, 2, 3], [-1, 0.5, 2]]), Hidden, Output])]
+    if bias:
+        # a second MappingProjection to Output, the value of which does not depend on the allocation_policy
+        processes.append(Process(pathway=[TransferMechanism(name='Bias'), np.array([[0.5]]), Output]))
+    S = System(
+        processes=processes,
+        controller=EVCControlMechanism(save_all_values_and_policies=True, **controller_args),
+        enable_controller=True,
+        monitor_for_control=[Output.output_states[MEAN]],
+    )
+
+    return S, Input
+
+
+@pytest.mark.parametrize('make_system', [_make_EVC_system,
+                                         _make_transfer_EVC_system,
+                                         functools.partial(_make_transfer_EVC_system, bias=True)])
+def test_EVC_batch_simulations_matches_serial(make_system):
+    runs = []
+    for batch_simulations in [False, True]:
+        S = make_system()[0]
+        S.controller.batch_simulations = batch_simulations
+        S.run(inputs={mech: [[1.0] * len(mech.instance_defaults.variable[0])] for mech in S.origin_mechanisms})
+        runs.append(S)
+
+    serial, batch = runs
+    assert batch.controller._can_batch_simulations()
+    # only the result of the first simulation, and of the trial, are added to the System's results
+    assert len(batch.results) == 2
+    np.testing.assert_allclose(np.array(batch.controller.EVC_values, dtype=float),
+                               np.array(serial.controller.EVC_values, dtype=float))
+    np.testing.assert_array_equal(batch.controller.EVC_policies, serial.controller.EVC_policies)
+    np.testing.assert_array_equal(batch.controller.EVC_max_policy, serial.controller.EVC_max_policy)
+
+
+def test_EVC_batch_simulations_falls_back_to_serial():
+    S, Input = _make_transfer_EVC_system(integrator_mode=True)
+    S.controller.batch_simulations = True
+    assert not S.controller._can_batch_simulations()
+
+    S.run(inputs={Input: [[1.0, 1.0]]})
+    assert len(S.results) == len(S.controller.control_signal_search_space) + 1
+
+
+def test_EVC_outcome_cache():
+    runs = []
+    for outcome_cache_size in [None, 100]:
+        S, Input = _make_transfer_EVC_system()
+        # the predicted input is the input for the trial, so that the first and last trials have the same one
+        S.controller.prediction_mechanisms[0].function_object.rate = 1.0
+        S.controller.outcome_cache_size = outcome_cache_size
+        EVC_values = []
+        S.run(inputs={Input: [[1.0, 1.0], [2.0, 2.0], [1.0, 1.0]]},
+              call_after_trial=lambda: EVC_values.append(S.controller.EVC_values.copy()))
+        runs.append((S, EVC_values))
+
+    (uncached, uncached_EVC_values), (cached, cached_EVC_values) = runs
+    search_space_size = len(cached.controller.control_signal_search_space)
+    assert cached.controller.outcome_cache_hits == search_space_size
+    assert cached.controller.outcome_cache_misses == 2 * search_space_size
+    for uncached_values, cached_values in zip(uncached_EVC_values, cached_EVC_values):
+        np.testing.assert_allclose(uncached_values.astype(float), cached_values.astype(float))
+
+    # a change to a parameter of the System is a different simulation
+    cached.mechanisms[1].function_object.bias = 0.5
+    cached.run(inputs={cached.origin_mechanisms[0]: [[1.0, 1.0]]})
+    assert cached.controller.outcome_cache_hits == search_space_size
+    assert cached.controller.outcome_cache_misses == 3 * search_space_size
+
+    cached.controller.clear_outcome_cache()
+    assert cached.controller.outcome_cache_hits == cached.controller.outcome_cache_misses == 0
+
+
+def test_EVC_outcome_cache_evicts_least_recently_used():
+    S, Input = _make_transfer_EVC_system()
+    S.controller.prediction_mechanisms[0].function_object.rate = 1.0
+    S.controller.outcome_cache_size = 8
+    S.run(inputs={Input: [[1.0, 1.0], [1.0, 1.0]]})
+
+    # each outcome is discarded before the search returns to it on the next trial
+    assert len(S.controller._outcome_cache) == 8
+    assert S.controller.outcome_cache_hits == 0
+
+
+def test_EVC_outcome_cache_tolerance():
+    S, Input = _make_transfer_EVC_system()
+    S.controller.outcome_cache_size = 100
+    S.controller.outcome_cache_tolerance = 0.25
+    # the predicted inputs of the last two trials (0.875 and 0.9375) are the same to within the tolerance
+    S.run(inputs={Input: [[1.0, 1.0]] * 4})
+
+    assert S.controller.outcome_cache_hits == len(S.controller.control_signal_search_space)
+
+
+@pytest.mark.parametrize(
+    'function, num_simulations, finds_grid_max',
+    [
+        (ControlSignalCoordinateAscent(), 10, True),
+        # 16 candidates simulated once, 8 twice, 4 four times, and 2 eight times
+        (ControlSignalSuccessiveHalving(), 64, True),
+        # 6 candidates simulated once, and 3 twice;  the policy with the maximum EVC is not among them
+        (ControlSignalSuccessiveHalving(num_candidates=6, seed=1), 12, False),
+        (ControlSignalRandomSearch(num_samples=8, sampling=LATIN_HYPERCUBE_SAMPLING, seed=0), 8, True),
+    ]
+)
+def test_EVC_search_functions(function, num_simulations, finds_grid_max):
+    grid_search = _make_transfer_EVC_system()[0]
+    grid_search.run(inputs={grid_search.origin_mechanisms[0]: [[1.0, 1.0]]})
+    assert grid_search.controller.function_object.num_simulations == 16
+
+    S, Input = _make_transfer_EVC_system(function=function)
+    S.run(inputs={Input: [[1.0, 1.0]]})
+    controller = S.controller
+
+    assert controller.control_signal_search_space is None
+    assert controller.function_object.num_simulations == num_simulations
+    assert len(S.results) == num_simulations + 1
+    np.testing.assert_allclose(float(controller.EVC_max), max(controller.EVC_values))
+    # the outcome is deterministic, so each EVC value is the same as in the grid search
+    for policy, EVC in zip(controller.EVC_policies, controller.EVC_values):
+        grid_index = np.flatnonzero(np.all(np.isclose(grid_search.controller.EVC_policies, policy), axis=1))[0]
+        np.testing.assert_allclose(EVC, grid_search.controller.EVC_values[grid_index])
+    if finds_grid_max:
+        np.testing.assert_allclose(controller.EVC_max_policy, grid_search.controller.EVC_max_policy)
+
+
+def test_EVC_random_search_is_seeded():
+    runs = []
+    for i in range(2):
+        S, Input = _make_transfer_EVC_system(function=ControlSignalRandomSearch(num_samples=6,
+                                                                                sampling=RANDOM_SAMPLING,
+                                                                                seed=7))
+        S.run(inputs={Input: [[1.0, 1.0], [1.0, 1.0]]})
+        runs.append(S.controller)
+
+    for controller in runs:
+        # policies drawn more than once are simulated only once
+        assert controller.function_object.num_simulations == len(controller.EVC_policies) <= 6
+        assert controller.EVC_max == max(controller.EVC_values)
+    np.testing.assert_array_equal(runs[0].EVC_policies, runs[1].EVC_policies)
+
+
+@pytest.mark.parametrize('controller_args', [{}, {'num_simulation_processes': 2}])
+def test_EVC_num_saved_policies(controller_args):
+    runs = []
+    for num_saved_policies in [None, 3]:
+        S, Input = _make_transfer_EVC_system(num_saved_policies=num_saved_policies, **controller_args)
+        S.run(inputs={Input: [[1.0, 1.0]]})
+        runs.append(S.controller)
+
+    all_policies, max_policies = runs
+    assert len(all_policies.EVC_values) == 16
+    order = np.argsort(-all_policies.EVC_values, kind='mergesort')[:3]
+    np.testing.assert_array_equal(max_policies.EVC_values, all_policies.EVC_values[order])
+    np.testing.assert_array_equal(max_policies.EVC_policies, all_policies.EVC_policies[order])
+    np.testing.assert_array_equal(max_policies.EVC_max_policy, all_policies.EVC_max_policy)
+
+
+@pytest.mark.parametrize('memory_mapped', [False, True])
+def test_EVC_history(memory_mapped, tmpdir):
+    filename = str(tmpdir.join('EVC_history')) if memory_mapped else None
+    S, Input = _make_transfer_EVC_system(save_EVC_history=filename or True)
+    trials = []
+    S.run(inputs={Input: [[1.0, 1.0], [2.0, 0.5], [0.5, 1.0]]},
+          call_after_trial=lambda: trials.append((S.controller.EVC_values.copy(), S.controller.EVC_policies.copy())))
+
+    history = S.controller.EVC_history
+    assert len(history) == 3
+    np.testing.assert_array_equal(history.trial_offsets, [0, 16, 32, 48])
+    for trial, (EVC_values, EVC_policies) in enumerate(trials):
+        np.testing.assert_array_equal(history[trial][0], EVC_values)
+        np.testing.assert_array_equal(history[trial][1], EVC_policies)
+
+    EVC_values, EVC_policies = history.get_landscape()
+    assert EVC_values.shape == (3, 16)
+    assert EVC_policies.shape == (3, 16, 2)
+    np.testing.assert_array_equal(EVC_values[-1], trials[-1][0])
+
+    if memory_mapped:
+        history.flush()
+        np.testing.assert_array_equal(np.fromfile(filename + '_values.dat'), history.values)
+        np.testing.assert_array_equal(np.fromfile(filename + '_policies.dat').reshape(-1, 2), history.policies)
+
+    history.clear()
+    assert len(history) == 0
+    assert len(history.values) == 0
+
+
+def test_EVC_restore_system_state():
+    runs = []
+    for controller_args in [{}, {'restore_system_state': True}, {'num_simulation_processes': 2}]:
+        S, Input = _make_transfer_EVC_system(integrator_mode=True, **controller_args)
+        # the predicted input is then the same as the input, and differs from that on the previous trial
+        S.controller.prediction_mechanisms[0].function_object.rate = 1.0
+        Hidden = S.controller.control_signals[0].efferents[0].receiver.owner
+        S.run(inputs={Input: [[1.0, 1.0], [2.0, 0.5]]})
+        runs.append((S, Hidden))
+
+    (unrestored, unrestored_hidden), (restored, restored_hidden), (parallel, parallel_hidden) = runs
+
+    # the simulations are not counted by the Clock, and do not change the state of the integrator
+    assert restored.scheduler_processing.clock.time.run == 1
+    assert unrestored.scheduler_processing.clock.time.run > 1
+    # each trial integrates the input (multiplied by the weight matrix) with a smoothing_factor of 0.5
+    np.testing.assert_allclose(restored_hidden.integrator_function.previous_value, [[0.75, 2.75, 4.75]])
+    assert not np.allclose(unrestored_hidden.integrator_function.previous_value, [[0.75, 2.75, 4.75]])
+
+    # each simulation starts from the same state, as does each of those run in forked processes
+    np.testing.assert_array_equal(restored.controller.EVC_values, parallel.controller.EVC_values)
+    np.testing.assert_array_equal(restored.controller.EVC_policies, parallel.controller.EVC_policies)
+
+
+def test_EVC_restore_system_state_does_not_restore_search_random_state():
+    runs = []
+    for restore_system_state in [False, True]:
+        S, Input = _make_transfer_EVC_system(restore_system_state=restore_system_state,
+                                             function=ControlSignalRandomSearch(num_samples=3, seed=1))
+        policies = []
+        S.run(inputs={Input: [[1.0, 1.0]] * 3},
+              call_after_trial=lambda: policies.append(S.controller.EVC_policies.copy()))
+        runs.append(policies)
+
+    unrestored, restored = runs
+    # the random search draws different policies on each trial, whether or not the System's state is restored
+    for policies in runs:
+        assert not np.array_equal(policies[0], policies[1])
+        assert not np.array_equal(policies[1], policies[2])
+    for unrestored_policies, restored_policies in zip(unrestored, restored):
+        np.testing.assert_array_equal(restored_policies, unrestored_policies)
+
+
+def test_EVC_seeded_random_states_parallel_matches_serial():
+    runs = []
+    # the state of the System is restored by default when the simulations are run in parallel
+    for controller_args in [{'restore_system_state': True}, {'num_simulation_processes': 2}]:
+        S, Input = _make_transfer_EVC_system(integrator_mode=True, noise=NormalDist(standard_dev=0.5).function,
+                                             **controller_args)
+        S.seed_random_states(7)
+        S.run(inputs={Input: [[1.0, 1.0], [2.0, 0.5]]})
+        runs.append(S)
+
+    serial, parallel = runs
+    assert parallel.controller.restore_system_state is None
+    # each simulation draws the same noise, whether it is run in this process or in a forked one
+    assert len(set(serial.controller.EVC_values)) > 1
+    np.testing.assert_array_equal(serial.controller.EVC_values, parallel.controller.EVC_values)
+    np.testing.assert_array_equal(serial.controller.EVC_policies, parallel.controller.EVC_policies)
+    np.testing.assert_array_equal(serial.results[-1], parallel.results[-1])
+    np.testing.assert_array_equal(serial.results, parallel.results)
+
+
+def test_EVC_parallel_simulation_requires_restore_system_state():
+    with pytest.raises(EVCError):
+        _make_transfer_EVC_system(restore_system_state=False, num_simulation_processes=2)
+
+    S, Input = _make_transfer_EVC_system(restore_system_state=False)
+    S.controller.num_simulation_processes = 2
+    with pytest.raises(EVCAuxiliaryError):
+        S.run(inputs={Input: [[1.0, 1.0]]})
@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+
+import psyneulink.components.functions.function as Function
+
+# drift rates are multiplied by the variable;  the last three are treated as 0, close to 0, and deterministic
+drift_rates = np.array([0.5, -0.5, 2.0, -3.0, 0.0, 1e-7, 400.0])
+thresholds = np.array([[0.5], [1.0], [2.5]])
+starting_points = np.array([[0.0], [0.2], [-2.0]])
+
+BOGACZ_PARAMS = dict(threshold=thresholds.tolist(), starting_point=starting_points.tolist(), noise=0.5, t0=0.2)
+
+
+def bogacz_loop(f, drift_rates, thresholds, starting_points):
+    results = np.empty((2,) + np.broadcast(drift_rates, thresholds).shape)
+    for index in np.ndindex(*results.shape[1:]):
+        f.threshold = thresholds[index[0], 0]
+        f.starting_point = starting_points[index[0], 0]
+        results[(slice(None),) + index] = f.function(drift_rates[index[1]])
+    return results
+
+
+@pytest.mark.function
+def test_bogacz_array_matches_scalars():
+    rt, er = Function.BogaczEtAl(**BOGACZ_PARAMS).function(drift_rates)
+    expected_rt, expected_er = bogacz_loop(Function.BogaczEtAl(noise=0.5, t0=0.2),
+                                           drift_rates, thresholds, starting_points)
+
+    assert rt.shape == er.shape == (3, 7)
+    np.testing.assert_allclose(rt, expected_rt)
+    np.testing.assert_allclose(er, expected_er)
+    # the error rate is the probability of the lower boundary, whatever the sign of the drift
+    assert np.all(er[:, 0] < 0.5) and np.all(er[:, 1] > 0.5)
+    # deterministic:  no errors, and the time taken to drift from the starting point to the threshold
+    assert np.all(er[:, 6] == 0)
+
+
+@pytest.mark.function
+def test_bogacz_near_zero_drift():
+    f = Function.BogaczEtAl(threshold=1.0, starting_point=0.2, noise=0.5, t0=0.2)
+    rt, er = f.function(np.array([1e-5, 1e-6, 1e-7, 2e-8]))
+    # the solution approaches its limit smoothly, rather than being lost to cancellation
+    np.testing.assert_allclose(rt, rt[-1], rtol=1e-5)
+    np.testing.assert_allclose(er, er[-1], rtol=1e-4)
+    assert np.all(np.diff(rt) > 0)
+
+
+@pytest.mark.function
+@pytest.mark.parametrize('mode', ['scalar loop', 'array'])
+@pytest.mark.benchmark
+def test_bogacz_benchmark(mode, benchmark):
+    benchmark.group = 'BogaczEtAl ' + str(drift_rates.size * thresholds.size) + ' solutions'
+    if mode == 'array':
+        f = Function.BogaczEtAl(**BOGACZ_PARAMS)
+        rt, er = benchmark(f.function, drift_rates)
+    else:
+        f = Function.BogaczEtAl(noise=0.5, t0=0.2)
+        rt, er = benchmark(bogacz_loop, f, drift_rates, thresholds, starting_points)
+    assert rt.shape == (3, 7)
+
+
+# (drift_rate, starting_point, threshold, noise, t0), and the expected mean ER, mean RT, mean DT, then conditional RT
+#    mean, variance and skew, each for the upper then the lower threshold.  These were not computed with MATLAB, but by
+#    a line-by-line scalar Python transcription of the MATLAB functions used previously (ddmSimFRG with sepCDFs=1, and
+#    ddm_metrics_cond_Mat), so they check that the vectorized implementation reproduces those functions, including
+#    their clamping (e.g., of the drift rate to at least 0.01 for the conditional moments);  the conditional moments are
+#    checked independently against the density of Navarro and Fuss (2009) by test_navarro_and_fuss_fixture_density
+navarro_and_fuss_fixture = [
+    ((0.08928, 0.5, 0.2645, 0.5, 0.15), [0.45291084554832856, 0.4290116790427215, 0.27901167904272156, 0.42901167904272264, 0.42901167904272264, 0.05183668254191546, 0.05183668254191546, 1.959341773952471, 1.959341773952471]),
+    ((1.0, 0.1, 1.0, 0.5, 0.2), [0.0030190514556973696, 1.4686149692556325, 1.2686149692556326, 1.8988123097320082, 0.39999844353430164, 0.37399058207332714, 0.0499941876595375, 1.0928585805927484, 3.352614813774806]),
+    ((0.6, 0.7, 1.0, 0.8, 0.2), [0.07037573585756132, 1.1801886882682868, 0.9801886882682869, 0.996107912289683, 1.7324561111424612, 0.6778823358693882, 0.9733130379391786, 2.47602479266062, 1.7511831479630047]),
+    ((-0.6, 0.7, 1.0, 0.8, 0.2), [0.7629765210111906, 1.5284805955771439, 1.328480595577144, 0.996107912289683, 1.7324561111424612, 0.6778823358693882, 0.9733130379391786, 2.47602479266062, 1.7511831479630047]),
+    ((2.5, 0.3, 0.5, 1.0, 0.35), [0.6805093355437373, 0.4472558378599458, 0.09725583785994582, 0.5664948638957149, 0.45798983474067534, 0.01771484555971157, 0.011580542179361369, 1.6967640212873385, 2.4981323331322662]),
+    ((-1.5, 0.5, 2.0, 0.5, 0.1), [0.9999999999622486, 1.433333333232663, 1.333333333232663, 1.4333333332326628, 1.4333333332326628, 0.14814814786850852, 0.14814814786850852, 0.8660253920474275, 0.8660253920474275]),
+    ((0.005, 0.6, 1.0, 0.5, 0.2), [0.46469218396457335, 4.186498711466564, 3.986498711466564, 3.611354011199075, 4.6777840791043745, 9.890007926505184, 11.07270672096039, 2.1215005630001063, 1.8708909907550255]),
+    ((10.0, 0.9, 1.5, 1.0, 0.3), [2.857971620372149e-22, 0.3401387711334609, 0.040138771133460927, 0.32999999999999996, 0.5698509053005893, 0.00030000000000000003, 0.0026895411418118606, 1.732050807568877, 0.5745949115908464]),
+]
+
+
+@pytest.mark.function
+@pytest.mark.parametrize('params, expected', navarro_and_fuss_fixture)
+def test_navarro_and_fuss_fixture(params, expected):
+    drift_rate, starting_point, threshold, noise, t0 = params
+    f = Function.NavarroAndFuss(drift_rate=drift_rate, starting_point=starting_point, threshold=threshold,
+                                noise=noise, t0=t0)
+    er, rt, dt, cond_rts, cond_var_rts, cond_skew_rts = f.function()
+
+    np.testing.assert_allclose([er, rt, dt], expected[:3], rtol=1e-7, atol=1e-15)
+    np.testing.assert_allclose(cond_rts, expected[3:5], rtol=1e-7)
+    np.testing.assert_allclose(cond_var_rts, expected[5:7], rtol=1e-7)
+    np.testing.assert_allclose(cond_skew_rts, expected[7:9], rtol=1e-6)
+
+
+@pytest.mark.function
+def test_navarro_and_fuss_array_matches_scalars():
+    params = np.array([p for p, _ in navarro_and_fuss_fixture])
+    expected = np.array([e for _, e in navarro_and_fuss_fixture])
+    drift_rate, starting_point, threshold, noise, t0 = params.T.tolist()
+
+    results = Function.NavarroAndFuss(drift_rate=drift_rate, starting_point=starting_point, threshold=threshold,
+                                      noise=noise, t0=t0).function()
+
+    assert results[Function.NF_Results.MEAN_ER].shape == (len(params),)
+    assert results[Function.NF_Results.COND_RTS].shape == (2, len(params))
+    np.testing.assert_allclose(np.vstack(results), expected.T, rtol=1e-6, atol=1e-15)
+
+
+@pytest.mark.function
+def test_navarro_and_fuss_density():
+    f = Function.NavarroAndFuss(drift_rate=0.6, starting_point=0.7, threshold=1.0, noise=0.8, t0=0.2)
+    _, _, _, cond_rts, cond_var_rts, _ = f.function()
+
+    time = np.linspace(0, 40, 40001)
+    density = f.density(time, upper=np.array([[True], [False]]))
+    assert density.shape == (2, 40001)
+    assert np.all(density[:, time <= 0.2] == 0)
+
+    # the probability of each threshold, and the moments of the response times conditional on it
+    probability = np.trapz(density, time)
+    mean = np.trapz(time * density, time) / probability
+    variance = np.trapz((time - mean[:, np.newaxis]) ** 2 * density, time) / probability
+    np.testing.assert_allclose(np.sum(probability), 1, rtol=1e-5)
+    np.testing.assert_allclose(mean, cond_rts, rtol=1e-5)
+    np.testing.assert_allclose(variance, cond_var_rts, rtol=1e-4)
+
+
+@pytest.mark.function
+@pytest.mark.parametrize('params, expected', navarro_and_fuss_fixture)
+def test_navarro_and_fuss_fixture_density(params, expected):
+    drift_rate, starting_point, threshold, noise, t0 = params
+    # the conditional moments are computed with the magnitude of the drift rate clamped to at least 0.01
+    f = Function.NavarroAndFuss(drift_rate=np.sign(drift_rate) * max(abs(drift_rate), 0.01),
+                                starting_point=starting_point, threshold=threshold, noise=noise, t0=t0)
+
+    time = np.linspace(0, t0 + max(expected[3:5]) + 20 * np.sqrt(max(expected[5:7])), 100001)
+    density = f.density(time, upper=np.array([[True], [False]]))
+    probability = np.trapz(density, time)
+    mean = np.trapz(time * density, time) / probability
+    variance = np.trapz((time - mean[:, np.newaxis]) ** 2 * density, time) / probability
+    skew = np.trapz((time - mean[:, np.newaxis]) ** 3 * density, time) / probability / variance ** 1.5
+    np.testing.assert_allclose(mean, expected[3:5], rtol=1e-7)
+    np.testing.assert_allclose(variance, expected[5:7], rtol=1e-6)
+    np.testing.assert_allclose(skew, expected[7:9], rtol=1e-5)
@@ -55,3 +55,56 @@ def test_basic(func, variable, params, fail, expected, benchmark):
     # This is rather hacky. it might break with pytest benchmark update
     iterations = 3 if benchmark.disabled else benchmark.stats.stats.rounds + 2
     assert np.allclose(res, expected(f.initializer, variable, iterations, **params))
+
+
+def _per_element_normal():
+    # a noise function without a size argument, which is called for each element
+    return np.random.normal()
+
+
+@pytest.mark.function
+@pytest.mark.integrator_function
+def test_noise_function_sampled_in_one_call():
+    calls = []
+
+    def noise(size=None):
+        calls.append(size)
+        return np.random.normal(size=size)
+
+    results = []
+    for noise_function in [noise, Function.NormalDist().function, _per_element_normal]:
+        f = Function.AdaptiveIntegrator(default_variable=np.zeros(1000), rate=1.0, noise=noise_function)
+        del calls[:]
+        np.random.seed(0)
+        results.append(f.function(np.zeros(1000)))
+        if noise_function is noise:
+            assert calls == [(1, 1000)]
+    # the values are the same as those drawn separately for each element
+    np.testing.assert_array_equal(results[0], results[2])
+    np.testing.assert_array_equal(results[1], results[2])
+
+
+@pytest.mark.function
+@pytest.mark.integrator_function
+def test_noise_array_of_functions():
+    f = Function.AdaptiveIntegrator(default_variable=[0.0, 0.0, 0.0], rate=1.0,
+                                    noise=[Function.NormalDist().function, 0.5, Function.UniformDist().function])
+    first = f.function([0.0, 0.0, 0.0])
+    second = f.function([0.0, 0.0, 0.0])
+
+    # the functions are executed again on each call
+    assert first[0][0] != second[0][0]
+    assert first[0][2] != second[0][2]
+    assert first[0][1] == second[0][1] == 0.5
+    assert callable(f.noise[0])
+
+
+@pytest.mark.function
+@pytest.mark.integrator_function
+@pytest.mark.parametrize("noise", [_per_element_normal, Function.NormalDist().function],
+                         ids=["per element", "DistributionFunction"])
+@pytest.mark.benchmark
+def test_noise_function_benchmark(noise, benchmark):
+    f = Function.AdaptiveIntegrator(default_variable=np.zeros(1000), rate=0.5, noise=noise)
+    benchmark.group = GROUP_PREFIX + "noise function"
+    benchmark(f.function, np.zeros(1000))
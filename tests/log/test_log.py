@@ -3,6 +3,9 @@ import pytest
 import psyneulink as pnl
 import numpy as np
 
+from psyneulink.globals.log import _flush_log_entry_files
+
+
 class TestLog:
 
     def test_log(self):
@@ -484,4 +487,183 @@ class TestLog:
         assert np.allclose(log_dict_T1["Pass"][30], 30)
         assert np.allclose(log_dict_T1["Time_step"][30], 0)
         assert abs(log_dict_T1["value"][58]) >= 0.95
-        assert abs(log_dict_T1["value"][57]) < 0.95
\ No newline at end of file
+        assert abs(log_dict_T1["value"][57]) < 0.95
+
+    @pytest.mark.parametrize("in_execution", [False, True], ids=["stack_search", "execution_context"])
+    @pytest.mark.benchmark
+    def test_log_value_assignment(self, in_execution, benchmark):
+        # Cost of logging a single assignment to the value of a Mechanism, with the context obtained either
+        # by searching the call stack (outside of any execution) or from the execution in progress
+        from psyneulink.globals.log import _tracks_execution_context
+
+        T = pnl.TransferMechanism(name='log_test_T', size=2)
+        PS = pnl.Process(name='log_test_PS', pathway=[T])
+        SYS = pnl.System(name='log_test_SYS', processes=[PS])
+        SYS.execute()
+        T.set_log_conditions(pnl.VALUE, pnl.LogCondition.EXECUTION)
+        value = np.array([[1.0, 2.0]])
+        context = pnl.EXECUTING + " " + pnl.SYSTEM + " " + SYS.name
+
+        def assign_value(context):
+            T.value = value
+
+        if in_execution:
+            assign = _tracks_execution_context(lambda system, context=None: assign_value(None))
+            benchmark.group = "Log value assignment"
+            benchmark(assign, SYS, context=context)
+        else:
+            benchmark.group = "Log value assignment"
+            benchmark(assign_value, context)
+
+        entries = T.log.logged_entries[T.name]
+        assert entries
+        assert all(entry.context == context for entry in entries)
+        assert all(entry.time == entries[0].time and None not in entry.time for entry in entries)
+        assert np.allclose(entries[-1].value, value)
+
+    def test_log_capacity(self):
+        T1 = pnl.TransferMechanism(name='log_test_T1', size=2)
+        PS = pnl.Process(name='log_test_PS', pathway=[T1])
+        SYS = pnl.System(name='log_test_SYS', processes=[PS])
+
+        T1.set_log_conditions(pnl.VALUE, capacity=2)
+        T1.set_log_conditions(pnl.RESULTS)
+
+        SYS.run(inputs={T1: [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]})
+
+        # Only the two most recent entries are retained for value
+        log_dict_T1 = T1.log.nparray_dictionary(entries=['value'])
+        assert np.allclose(log_dict_T1['Trial'], [[1], [2]])
+        assert np.allclose(log_dict_T1['value'], [[[3.0, 4.0]], [[5.0, 6.0]]])
+
+        # Alignment with an entry that retains all of its entries
+        log_dict_T1 = T1.log.nparray_dictionary(entries=['RESULTS', 'value'])
+        assert np.allclose(log_dict_T1['Trial'], [[0], [1], [2]])
+        assert np.allclose(log_dict_T1['RESULTS'], [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+        assert log_dict_T1['value'][0] is None
+        assert np.allclose(log_dict_T1['value'][1], [[3.0, 4.0]])
+        assert np.allclose(log_dict_T1['value'][2], [[5.0, 6.0]])
+
+        # Reducing the capacity discards the oldest entries
+        T1.set_log_conditions(pnl.RESULTS, capacity=1)
+        assert len(T1.log.logged_entries['RESULTS']) == 1
+        assert np.allclose(T1.log.logged_entries['RESULTS'][0].value, [5.0, 6.0])
+
+
+class TestLogEntryBuffer:
+
+    def test_ring_buffer(self):
+        buffer = pnl.LogEntryBuffer(capacity=3)
+        for i in range(5):
+            buffer.append(pnl.LogEntry((0, i, 0, 0), 'context {}'.format(i % 2), np.array([i, i + 1])))
+
+        assert len(buffer) == 3
+        assert [entry.time for entry in buffer] == [(0, 2, 0, 0), (0, 3, 0, 0), (0, 4, 0, 0)]
+        assert buffer.contexts == ['context 0', 'context 1', 'context 0']
+        assert np.array_equal(buffer.values, [[2, 3], [3, 4], [4, 5]])
+        assert np.array_equal(buffer.times[:, 1], [2, 3, 4])
+
+        del buffer[0:]
+        assert len(buffer) == 0
+
+    def test_growth_and_heterogeneous_values(self):
+        buffer = pnl.LogEntryBuffer()
+        for i in range(40):
+            buffer.append(pnl.LogEntry(None, 'context', np.array([i])))
+        assert len(buffer) == 40
+        assert buffer[39].time == (None, None, None)
+        assert np.array_equal(buffer.values[:, 0], np.arange(40))
+
+        # Value with a different shape reverts to object storage, preserving earlier values
+        buffer.append(pnl.LogEntry(None, 'context', np.array([1.0, 2.0])))
+        assert buffer.values.dtype == object
+        assert np.array_equal(buffer[0].value, [0])
+        assert np.array_equal(buffer[-1].value, [1.0, 2.0])
+
+
+class TestLogSink:
+
+    def test_log_sink(self, tmpdir):
+        T1 = pnl.TransferMechanism(name='log_test_T1', size=2)
+        PS = pnl.Process(name='log_test_PS', pathway=[T1])
+        SYS = pnl.System(name='log_test_SYS', processes=[PS])
+
+        T1.set_log_conditions([pnl.VALUE, pnl.RESULTS], sink=str(tmpdir))
+        inputs = [[float(i), float(i + 1)] for i in range(50)]
+        SYS.run(inputs={T1: inputs})
+
+        log_dict_T1 = T1.log.nparray_dictionary(entries=['value', 'RESULTS'])
+        assert isinstance(log_dict_T1['value'], np.memmap)
+        assert np.allclose(log_dict_T1['Trial'][:, 0], np.arange(50))
+        assert np.allclose(log_dict_T1['RESULTS'], inputs)
+        assert np.allclose(log_dict_T1['value'][:, 0], inputs)
+
+        # Reopen read-only
+        entries = pnl.read_log_entries(str(tmpdir))
+        assert set(entries) == {T1.name, '{}[{}]'.format(T1.name, pnl.RESULTS)}
+        results = entries['{}[{}]'.format(T1.name, pnl.RESULTS)]
+        assert len(results) == 50
+        assert np.allclose(results.values, inputs)
+        assert results[3].time == (0, 3, 0, 0)
+        assert results.contexts == T1.log.logged_entries[pnl.RESULTS].contexts
+        with pytest.raises(pnl.LogError):
+            results.append(results[0])
+
+
+class TestLogEntryFile:
+
+    def test_chunked_writes(self, tmpdir):
+        entries = pnl.LogEntryFile(str(tmpdir), 'item', chunk_size=4)
+        for i in range(10):
+            entries.append(pnl.LogEntry((0, i, 0, 0), 'context', np.array([i, -i])))
+        # Two chunks written to disk, and two entries still in memory
+        assert entries._len_on_disk == 8
+        assert len(entries) == 10
+        assert np.array_equal(entries.values[:, 1], -np.arange(10))
+        assert entries._len_on_disk == 10
+
+        # Values with a different shape or type can't be logged to disk, and aren't added to those in memory
+        with pytest.raises(pnl.LogError):
+            entries.append(pnl.LogEntry((0, 10, 0, 0), 'context', np.array([1, 2, 3])))
+        with pytest.raises(pnl.LogError):
+            entries.append(pnl.LogEntry((0, 10, 0, 0), 'context', np.array([0.5, 1.5])))
+        assert len(entries) == 10
+        entries.append(pnl.LogEntry((0, 10, 0, 0), 'context', np.array([10, -10])))
+        entries.flush()
+        assert np.array_equal(entries.values[-1], [10, -10])
+
+    def test_values_in_memory_promoted_to_common_type(self, tmpdir):
+        entries = pnl.LogEntryFile(str(tmpdir), 'item', chunk_size=4)
+        entries.append(pnl.LogEntry((0, 0, 0, 0), 'context', np.array([1])))
+        entries.append(pnl.LogEntry((0, 1, 0, 0), 'context', np.array([1.5])))
+        assert np.array_equal(entries.values[:, 0], [1.0, 1.5])
+        assert entries.values.dtype == np.float64
+
+    def test_flush_at_exit_continues_after_error(self, tmpdir, monkeypatch):
+        unwritable = pnl.LogEntryFile(str(tmpdir), 'unwritable', chunk_size=4)
+        entries = pnl.LogEntryFile(str(tmpdir), 'item', chunk_size=4)
+        for log_entry_file in (unwritable, entries):
+            log_entry_file.append(pnl.LogEntry((0, 0, 0, 0), 'context', np.array([1])))
+
+        def flush():
+            raise pnl.LogError('unwritable')
+        monkeypatch.setattr(unwritable, 'flush', flush)
+
+        with pytest.warns(UserWarning, match='unwritable'):
+            _flush_log_entry_files()
+        assert entries._len_on_disk == 1
+
+    def test_columns_kept_open_until_written(self, tmpdir):
+        entries = pnl.LogEntryFile(str(tmpdir), 'item', chunk_size=4)
+        for i in range(8):
+            entries.append(pnl.LogEntry((0, i, 0, 0), 'context', np.array([i])))
+        values = entries._load('value')
+        assert [entry.value[0] for entry in entries] == list(range(8))
+        assert entries[2:5][0].time == (0, 2, 0, 0)
+        assert entries._load('value') is values
+
+        # Writing more entries to disk reopens the columns
+        entries.append(pnl.LogEntry((0, 8, 0, 0), 'context', np.array([8])))
+        assert [entry.value[0] for entry in entries] == list(range(9))
+        assert entries._load('value') is not values
+        assert len(entries._load('value')) == 9
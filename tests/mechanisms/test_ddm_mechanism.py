@@ -6,6 +6,7 @@ from psyneulink.components.component import ComponentError
 from psyneulink.components.functions.function import BogaczEtAl, DriftDiffusionIntegrator, FunctionError, NormalDist
 from psyneulink.components.process import Process
 from psyneulink.components.system import System
+from psyneulink.globals.keywords import NOISE
 from psyneulink.library.mechanisms.processing.integrator.ddm import DDM, DDMError
 from psyneulink.scheduling.condition import WhenFinished
 from psyneulink.scheduling.time import TimeScale
@@ -157,6 +158,98 @@ class TestThreshold:
     #
     #     sched = Scheduler(system=S)
 
+
+class TestRunToThreshold:
+
+    def test_run_to_threshold_matches_time_steps(self):
+        def make_ddm(run_to_threshold):
+            return DDM(function=DriftDiffusionIntegrator(noise=0.5, rate=0.1, threshold=3.0),
+                       run_to_threshold=run_to_threshold)
+
+        D = make_ddm(False)
+        np.random.seed(42)
+        num_executions = 0
+        while not D.is_finished:
+            D.execute(1.0)
+            num_executions += 1
+
+        D_fast = make_ddm(True)
+        np.random.seed(42)
+        D_fast.execute(1.0)
+
+        assert num_executions > 1
+        assert D_fast.is_finished
+        assert np.allclose(D_fast.value, D.value)
+        assert abs(D.value[0][0][0]) == 3.0
+        assert D.value[1][0] == num_executions
+
+    def test_run_to_threshold_in_system(self):
+        results = []
+        for run_to_threshold in [False, True]:
+            D = DDM(function=DriftDiffusionIntegrator(noise=0.2, threshold=10.0),
+                    run_to_threshold=run_to_threshold)
+            S = System(processes=[Process(pathway=[D])])
+            np.random.seed(0)
+            S.run(inputs={D: -1.0},
+                  termination_processing={TimeScale.TRIAL: WhenFinished(D)})
+            scheduler = S.scheduler_processing
+            results.append((D.value[0][0][0], D.value[1][0],
+                            scheduler.counts_total[TimeScale.RUN.value, scheduler.node_indices[D]]))
+
+        # the same decision (at the lower threshold), in a single pass
+        assert results[0][:2] == results[1][:2]
+        assert results[0][0] == -10.0
+        assert results[1][2] == 1 < results[0][2]
+
+    def test_run_to_threshold_paths(self):
+        f = DriftDiffusionIntegrator(rate=1.0, noise=1.0, threshold=1.0, time_step_size=0.001)
+        np.random.seed(0)
+        decision_variables, times = f.run_to_threshold(1.0, num_paths=5000)
+
+        assert np.all(np.abs(decision_variables) == 1.0)
+        assert f.previous_value == 0 and f.previous_time == 0
+        # error rate and mean decision time of the analytic solution (Bogacz et al., 2006)
+        assert np.isclose(np.mean(decision_variables < 0), 1 / (1 + np.exp(2)), atol=0.015)
+        assert np.isclose(np.mean(times), np.tanh(1), rtol=0.05)
+
+        decision_variables, times = f.run_to_threshold(1.0, num_paths=10, max_time_steps=5)
+        assert np.all(times <= 0.005)
+
+    def test_run_to_threshold_noise_array_or_function(self, monkeypatch):
+        f = DriftDiffusionIntegrator(rate=1.0, noise=1.0, threshold=1.0, time_step_size=0.01)
+        np.random.seed(0)
+        expected = f.run_to_threshold(1.0, num_paths=10)
+
+        # the noise of a Function assigned to a Mechanism is the value of its ParameterState, which is an array, and
+        #    a noise function is executed on each time step for each path
+        num_calls = []
+
+        def noise_function():
+            num_calls.append(None)
+            return 1.0
+
+        get_current_function_param = f.get_current_function_param
+        for noise in [np.array([1.0]), noise_function]:
+            monkeypatch.setattr(f, 'get_current_function_param',
+                                lambda param_name: noise if param_name == NOISE
+                                else get_current_function_param(param_name))
+            np.random.seed(0)
+            decision_variables, times = f.run_to_threshold(1.0, num_paths=10)
+            np.testing.assert_array_equal(decision_variables, expected[0])
+            np.testing.assert_array_equal(times, expected[1])
+        assert len(num_calls) == np.sum(np.round(times / 0.01))
+
+    def test_run_to_threshold_stops_at_max_time_steps(self):
+        # with no drift or noise, the path never reaches threshold
+        D = DDM(function=DriftDiffusionIntegrator(rate=0.0, noise=0.0, threshold=1.0),
+                run_to_threshold=True,
+                max_time_steps=100)
+        with pytest.warns(UserWarning, match='did not reach threshold within 100 time steps'):
+            D.execute([0.0])
+        assert D.value[0][0][0] == 0.0
+        assert D.value[1][0] == 100
+        assert not D.is_finished
+
 # ------------------------------------------------------------------------------------------------
 # TEST 2
 # function = Bogacz
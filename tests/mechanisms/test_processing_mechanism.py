@@ -91,11 +91,10 @@ class TestProcessingMechanismFunctions:
         PM1.execute(1.0)
         # assert np.allclose(PM1.value, 1.0)
 
-    # COMMENTED OUT BECAUSE OF MATLAB ENGINE:
-    # def test_processing_mechanism_NavarroAndFuss_function(self):
-    #     PM1 = ProcessingMechanism(function=NavarroAndFuss)
-    #     PM1.execute(1.0)
-    #     # assert np.allclose(PM1.value, 1.0)
+    def test_processing_mechanism_NavarroAndFuss_function(self):
+        PM1 = ProcessingMechanism(function=NavarroAndFuss)
+        PM1.execute(1.0)
+        # assert np.allclose(PM1.value, 1.0)
 
     def test_processing_mechanism_NormalDist_function(self):
         PM1 = ProcessingMechanism(function=NormalDist)
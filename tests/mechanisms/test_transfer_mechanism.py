@@ -960,4 +960,47 @@ class TestIntegratorMode:
         # linear fn: 0.595*1.0 = 0.595
         assert np.allclose(T.previous_value, 0.595)
         assert np.allclose(T.initial_value, 0.5)
-        assert np.allclose(T.integrator_function.initializer, 0.5)
\ No newline at end of file
+        assert np.allclose(T.integrator_function.initializer, 0.5)
+
+
+class TestMemoizedExecution:
+
+    def test_memoized_execution_reuses_value_until_input_or_parameter_changes(self):
+        T = TransferMechanism(function=Logistic(gain=2.0), size=2)
+        calls = []
+        execute = T._execute
+        T._execute = lambda *args, **kwargs: calls.append(1) or execute(*args, **kwargs)
+        T.memoize_execution = True
+
+        expected = T.execute([1.0, 2.0])
+        for i in range(3):
+            np.testing.assert_array_equal(T.execute([1.0, 2.0]), expected)
+            np.testing.assert_array_equal(T.output_state.value, expected[0])
+        assert len(calls) == 1
+        assert T.execution_cache_hits == 3
+        assert T.execution_cache_misses == 1
+
+        # a change to the input or to the value of a ParameterState calls the function again
+        T.execute([1.0, 3.0])
+        T.function_object.gain = 3.0
+        T.execute([1.0, 3.0])
+        assert len(calls) == 3
+        assert T.execution_cache_hits == 3
+        assert np.allclose(T.value, Logistic(gain=3.0).function([1.0, 3.0]))
+
+    def test_memoize_execution_not_allowed_for_stateful_mechanism(self):
+        T = TransferMechanism(integrator_mode=True)
+        with pytest.raises(MechanismError):
+            T.memoize_execution = True
+        assert not T.memoize_execution
+
+    def test_memoize_execution_argument(self):
+        T = TransferMechanism(function=Logistic(gain=2.0), size=2, memoize_execution=True)
+        assert T.memoize_execution
+        T.execute([1.0, 2.0])
+        T.execute([1.0, 2.0])
+        assert T.execution_cache_hits == 1
+        assert T.execution_cache_misses == 1
+
+        with pytest.raises(MechanismError):
+            TransferMechanism(integrator_mode=True, memoize_execution=True)
@@ -0,0 +1,95 @@
+import pytest
+
+from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
+from psyneulink.components.process import Process
+from psyneulink.components.system import System
+from psyneulink.globals.context import ContextFlags, ExecutionContext
+from psyneulink.globals.keywords import COMPONENT_INIT, CONTROL, EVC_SIMULATION, EXECUTING, FUNCTION_CHECK_ARGS, \
+    INITIALIZING, LEARNING, SEPARATOR_BAR, SYSTEM, VALIDATE
+
+
+@pytest.mark.parametrize(
+    'string',
+    [
+        EXECUTING + SYSTEM + ' S',
+        INITIALIZING + COMPONENT_INIT,
+        'S ' + EVC_SIMULATION + ' of ' + EXECUTING,
+        LEARNING + ' ' + SYSTEM,
+        'RUN: ' + VALIDATE,
+        '',
+    ]
+)
+@pytest.mark.parametrize(
+    'keyword',
+    [INITIALIZING, EXECUTING, LEARNING, CONTROL, EVC_SIMULATION, VALIDATE, FUNCTION_CHECK_ARGS, SYSTEM, 'S', 'INIT']
+)
+def test_contains_matches_string(string, keyword):
+    context = ExecutionContext(string) + SEPARATOR_BAR + FUNCTION_CHECK_ARGS
+    assert (keyword in context) == (keyword in string + SEPARATOR_BAR + FUNCTION_CHECK_ARGS)
+
+
+def test_string_is_lazy():
+    calls = []
+
+    def fragment():
+        calls.append(None)
+        return '| Mechanism: A'
+
+    context = ExecutionContext(EXECUTING + SYSTEM) + fragment + SEPARATOR_BAR + FUNCTION_CHECK_ARGS
+
+    assert EXECUTING in context
+    assert context.flags & ContextFlags.CHECKING_ARGS
+    assert not context.flags & ContextFlags.LEARNING
+    assert calls == []
+
+    assert str(context) == EXECUTING + SYSTEM + '| Mechanism: A' + SEPARATOR_BAR + FUNCTION_CHECK_ARGS
+    assert context == str(context)
+    assert 'Mechanism: A' in context
+    assert context.startswith(EXECUTING)
+    assert 'error in ' + context == 'error in ' + str(context)
+    assert len(calls) == 1
+
+
+def test_replace():
+    context = ExecutionContext(EXECUTING + SYSTEM).replace(EXECUTING, LEARNING + ' ')
+
+    assert LEARNING in context
+    assert EXECUTING not in context
+    assert str(context) == LEARNING + ' ' + SYSTEM
+
+
+def test_replace_in_fragments():
+    calls = []
+
+    def fragment():
+        calls.append(None)
+        return '| Mechanism: A'
+
+    nested = ExecutionContext(SEPARATOR_BAR) + EXECUTING
+    context = ExecutionContext(EXECUTING + SYSTEM) + fragment + nested + SEPARATOR_BAR + FUNCTION_CHECK_ARGS
+    replaced = context.replace(EXECUTING, LEARNING + ' ')
+
+    # the string form is not assembled, and the flags are those of the replaced fragments
+    assert calls == []
+    assert replaced.flags == ContextFlags.LEARNING | ContextFlags.CHECKING_ARGS
+    assert str(replaced) == str(context).replace(EXECUTING, LEARNING + ' ')
+    assert EXECUTING in context
+    assert str(context.replace('Mechanism', 'Projection')) == str(context).replace('Mechanism', 'Projection')
+
+
+def test_system_execution_does_not_format_mechanism_context():
+    A = TransferMechanism(name='A')
+    B = TransferMechanism(name='B')
+    S = System(processes=[Process(pathway=[A, B])])
+
+    num_formatted = []
+    get_mechanism_context_string = S._get_mechanism_context_string
+
+    def counted(mechanism):
+        num_formatted.append(mechanism)
+        return get_mechanism_context_string(mechanism)
+
+    S._get_mechanism_context_string = counted
+    S.run(inputs={A: [[1.0], [2.0]]})
+
+    assert num_formatted == []
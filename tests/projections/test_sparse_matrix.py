@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+import psyneulink as pnl
+
+sparse = pytest.importorskip('scipy.sparse')
+
+
+class TestSparseMatrix:
+
+    def test_sparse_matrix_is_preserved_and_gives_same_value_as_dense(self):
+        W = sparse.random(40, 30, density=0.05, format='coo', random_state=0)
+        A = pnl.TransferMechanism(name='A', size=40)
+        B = pnl.TransferMechanism(name='B', size=30)
+        P = pnl.MappingProjection(sender=A, receiver=B, matrix=W)
+        assert sparse.isspmatrix_csr(P.matrix)
+        assert sparse.isspmatrix_csr(P.parameter_states[pnl.MATRIX].value)
+
+        S = pnl.System(processes=[pnl.Process(pathway=[A, P, B])])
+        x = np.random.RandomState(0).rand(40)
+        S.run(inputs={A: [x]})
+        np.testing.assert_allclose(B.value[0], np.dot(x, W.toarray()))
+
+    def test_dense_sparse_matrix_is_converted_to_array(self):
+        W = sparse.random(4, 3, density=0.5, format='csr', random_state=0)
+        P = pnl.MappingProjection(sender=pnl.TransferMechanism(size=4), receiver=pnl.TransferMechanism(size=3),
+                                  matrix=W)
+        assert isinstance(P.matrix, np.ndarray)
+        np.testing.assert_allclose(P.matrix, W.toarray())
+
+    def test_learning_preserves_sparse_matrix(self):
+        W = sparse.random(6, 4, density=0.08, format='csr', random_state=1)
+        mask = W.toarray() != 0
+
+        def run(matrix):
+            A = pnl.TransferMechanism(name='A', size=6)
+            H = pnl.TransferMechanism(name='H', size=4, function=pnl.Logistic())
+            P = pnl.MappingProjection(sender=A, receiver=H, matrix=matrix)
+            S = pnl.System(processes=[pnl.Process(pathway=[A, P, H], learning=pnl.LEARNING, target=[0, 1, 0, 1])],
+                           targets=[0, 1, 0, 1])
+            S.run(inputs={A: [np.arange(6.0) / 6]}, targets={H: [[0, 1, 0, 1]]})
+            return P.parameter_states[pnl.MATRIX].value
+
+        sparse_matrix = run(W)
+        dense_matrix = run(W.toarray())
+        assert sparse.isspmatrix_csr(sparse_matrix)
+        # only the stored entries of the sparse matrix are learned, by the same amount as in the dense matrix
+        np.testing.assert_allclose(sparse_matrix.toarray()[mask], dense_matrix[mask])
+        assert not np.allclose(sparse_matrix.toarray()[mask], W.toarray()[mask])
+        assert np.all(sparse_matrix.toarray()[~mask] == 0)
+
+    def test_EVC_batch_value_with_sparse_matrix(self):
+        from psyneulink.library.subsystems.evc.evccontrolmechanism import _get_input_state_batch_value
+
+        W = sparse.random(40, 30, density=0.05, format='csr', random_state=0)
+        A = pnl.TransferMechanism(name='A', size=40)
+        B = pnl.TransferMechanism(name='B', size=30)
+        pnl.MappingProjection(sender=A, receiver=B, matrix=W)
+        sender_values = np.random.RandomState(0).rand(3, 40)
+
+        batch_value = _get_input_state_batch_value(B.input_state, {A.output_state: sender_values}, 3)
+        np.testing.assert_allclose(batch_value, np.dot(sender_values, W.toarray()))
+
+    def test_stability_with_sparse_matrix(self):
+        W = sparse.random(40, 40, density=0.05, format='csr', random_state=0)
+        variable = np.random.RandomState(0).rand(40)
+        sparse_stability = pnl.Stability(default_variable=variable, matrix=W)
+        dense_stability = pnl.Stability(default_variable=variable, matrix=W.toarray())
+
+        np.testing.assert_allclose(sparse_stability.function(variable), dense_stability.function(variable))
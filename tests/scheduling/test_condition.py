@@ -306,7 +306,7 @@ class TestCondition:
             A = TransferMechanism(function=Linear(slope=5.0, intercept=2.0), name='A')
             comp.add_mechanism(A)
 
-            sched = Scheduler(composition=comp)
+            sched = Scheduler(composition=comp, execution_list_maxlen=None)
             sched.add_condition(A, BeforeTrial(4))
 
             termination_conds = {}
@@ -327,7 +327,7 @@ class TestCondition:
             A = TransferMechanism(function=Linear(slope=5.0, intercept=2.0), name='A')
             comp.add_mechanism(A)
 
-            sched = Scheduler(composition=comp)
+            sched = Scheduler(composition=comp, execution_list_maxlen=None)
             sched.add_condition(A, Always())
 
             termination_conds = {}
@@ -348,7 +348,7 @@ class TestCondition:
             A = TransferMechanism(function=Linear(slope=5.0, intercept=2.0), name='A')
             comp.add_mechanism(A)
 
-            sched = Scheduler(composition=comp)
+            sched = Scheduler(composition=comp, execution_list_maxlen=None)
             sched.add_condition(A, Always())
 
             termination_conds = {}
@@ -8,7 +8,7 @@ from psyneulink.components.projections.pathway.mappingprojection import MappingP
 from psyneulink.composition import Composition
 from psyneulink.scheduling.condition import AfterNCalls, AfterNTrials, AfterPass, All, Always, Any, AtPass, \
     BeforePass, EveryNCalls, EveryNPasses, JustRan, WhenFinished
-from psyneulink.scheduling.scheduler import Scheduler
+from psyneulink.scheduling.scheduler import Scheduler, SchedulerTrace
 from psyneulink.scheduling.time import TimeScale
 
 
@@ -23,6 +23,125 @@ class TestScheduler:
     def test_deepcopy(self):
         pass
 
+    def test_no_formatting_without_debug(self):
+        class Node:
+            num_formatted = 0
+
+            def __repr__(self):
+                Node.num_formatted += 1
+                return 'Node'
+
+        A = Node()
+        B = Node()
+        sched = Scheduler(graph={A: set(), B: {A}})
+        sched.add_condition(B, EveryNCalls(A, 2))
+
+        assert not logging.getLogger('psyneulink.scheduling.scheduler').isEnabledFor(logging.DEBUG)
+        output = list(sched.run())
+        assert output == [{A}, {A}, {B}]
+
+        # the first run may report its defaults (e.g. nodes assigned Always) at INFO level
+        Node.num_formatted = 0
+        list(sched.run())
+        assert Node.num_formatted == 0
+
+    def test_trace(self):
+        sched = Scheduler(graph={'A': set(), 'B': {'A'}}, trace=SchedulerTrace())
+        sched.add_condition('B', EveryNCalls('A', 2))
+        A, B = sched.node_indices['A'], sched.node_indices['B']
+
+        list(sched.run())
+        entries = list(sched.trace.entries)
+
+        assert [e.execution_set for e in entries] == [{'A'}, {'A'}, {'B'}]
+        assert [(e.time.pass_, e.time.time_step) for e in entries] == [(0, 0), (1, 0), (1, 1)]
+        assert [e.counts_useable[A, B] for e in entries] == [1, 2, 0]
+        assert entries[-1].counts_total[TimeScale.TRIAL.value, B] == 1
+
+        sched.trace = SchedulerTrace(maxlen=2)
+        list(sched.run())
+        assert len(sched.trace.entries) == 2
+
+    @pytest.mark.parametrize('maxlen, expected_history', [
+        (0, []),
+        (2, [{'B'}, {'C'}]),
+        (None, [{'A'}, {'B'}, {'C'}, {'A'}, {'B'}, {'C'}]),
+    ])
+    def test_execution_list_maxlen(self, maxlen, expected_history):
+        sched = Scheduler(graph={'A': set(), 'B': {'A'}, 'C': {'B'}}, execution_list_maxlen=maxlen)
+        sched.add_condition('B', JustRan('A'))
+        sched.add_condition('C', JustRan('B'))
+
+        # Conditions are evaluated the same way whatever history is kept
+        for i in range(2):
+            assert list(sched.run()) == [{'A'}, {'B'}, {'C'}]
+
+        assert list(sched.execution_list) == expected_history
+
+    def test_schedule_cache_replay(self):
+        class CountedEveryNCalls(EveryNCalls):
+            num_evaluations = 0
+
+            def is_satisfied(self):
+                CountedEveryNCalls.num_evaluations += 1
+                return super().is_satisfied()
+
+        graph = {'A': set(), 'B': {'A'}, 'C': {'B'}}
+        conditions = {'B': EveryNCalls('A', 2), 'C': CountedEveryNCalls('B', 2)}
+        termination_conds = {TimeScale.RUN: AfterNTrials(3), TimeScale.TRIAL: AfterNCalls('C', 1)}
+
+        sched = Scheduler(graph=graph, cache_schedule=True)
+        sched.add_condition_set(dict(conditions))
+        uncached = Scheduler(graph=graph, cache_schedule=False)
+        uncached.add_condition_set({'B': EveryNCalls('A', 2), 'C': EveryNCalls('B', 2)})
+
+        expected_output = [{'A'}, {'A'}, {'B'}, {'A'}, {'A'}, {'B'}, {'C'}]
+        assert list(sched.run(termination_conds)) == expected_output
+        num_evaluations = CountedEveryNCalls.num_evaluations
+        list(uncached.run(termination_conds))
+
+        for i in range(3):
+            assert list(sched.run(termination_conds)) == list(uncached.run(termination_conds))
+            assert (sched.counts_total == uncached.counts_total).all()
+            assert (sched.counts_useable == uncached.counts_useable).all()
+            assert sched.clock.time == uncached.clock.time
+
+        # AfterNTrials(3) terminated the last TRIAL before anything ran, and the replayed TRIALs evaluated nothing
+        assert CountedEveryNCalls.num_evaluations == num_evaluations
+
+        # adding a Condition discards the recorded schedule
+        sched.add_condition('C', Always())
+        assert sched._schedule_cache is None
+
+    def test_schedule_cache_discarded_by_condition_set(self):
+        sched = Scheduler(graph={'A': set(), 'B': {'A'}}, cache_schedule=True)
+        sched.add_condition('B', EveryNCalls('A', 2))
+        assert list(sched.run()) == [{'A'}, {'A'}, {'B'}]
+        assert sched._schedule_cache is not None
+
+        sched.condition_set.add_condition('B', EveryNCalls('A', 1))
+        assert sched._schedule_cache is None
+        assert list(sched.run()) == [{'A'}, {'B'}]
+
+    def test_schedule_not_cached_by_default(self):
+        sched = Scheduler(graph={'A': set(), 'B': {'A'}})
+        condition = EveryNCalls('A', 2)
+        sched.add_condition('B', condition)
+        assert list(sched.run()) == [{'A'}, {'A'}, {'B'}]
+
+        # a Condition modified in place is used in the next TRIAL
+        condition.args = ('A', 1)
+        assert list(sched.run()) == [{'A'}, {'B'}]
+        assert sched._schedule_cache is None
+
+    def test_schedule_cache_time_variant_conditions(self):
+        sched = Scheduler(graph={'A': set(), 'B': {'A'}}, cache_schedule=True)
+        sched.add_condition('B', Any(EveryNCalls('A', 2), AfterNTrials(1)))
+
+        assert list(sched.run()) == [{'A'}, {'A'}, {'B'}]
+        assert sched._schedule_cache is None
+        assert list(sched.run()) == [{'A'}, {'B'}]
+
 
 class TestLinear:
 
@@ -199,7 +318,7 @@ class TestLinear:
         comp.add_projection(A, MappingProjection(), B)
         comp.add_projection(B, MappingProjection(), C)
 
-        sched = Scheduler(composition=comp)
+        sched = Scheduler(composition=comp, execution_list_maxlen=None)
 
         sched.add_condition(A, BeforePass(5))
         sched.add_condition(B, AfterNCalls(A, 5))
@@ -901,3 +1020,45 @@ class TestBranching:
             set([A1, A2]), set([A1, A2]), set([B1, B3]), set([A1, A2]), set([A1, A2]), set([B1, B2, B3]), set([C1, C2])
         ]
         assert output == pytest.helpers.setify_expected_output(expected_output)
+
+
+class TestScaling:
+
+    @staticmethod
+    def _layered_scheduler(num_nodes, cache_schedule):
+        # ten layers, each node depending on the node at the same position in the previous layer
+        width = max(num_nodes // 10, 1)
+        nodes = ['N{0}'.format(i) for i in range(num_nodes)]
+        graph = {n: set() if i < width else {nodes[i - width]} for i, n in enumerate(nodes)}
+
+        sched = Scheduler(graph=graph, cache_schedule=cache_schedule)
+        for i in range(width, num_nodes):
+            sched.add_condition(nodes[i], EveryNCalls(nodes[i - width], 1))
+        return sched, nodes, width
+
+    @pytest.mark.parametrize('num_nodes', [10, 100, 1000])
+    @pytest.mark.benchmark
+    def test_layered_trial(self, num_nodes, benchmark):
+        # the Conditions are evaluated in each TRIAL
+        sched, nodes, width = self._layered_scheduler(num_nodes, cache_schedule=False)
+
+        benchmark.group = "Scheduler trial, {0} nodes".format(num_nodes)
+        output = benchmark(lambda: list(sched.run()))
+
+        assert len(output) == num_nodes // width
+        assert set().union(*output) == set(nodes)
+        assert all(sched.counts_total[TimeScale.TRIAL.value] == 1)
+
+    @pytest.mark.parametrize('num_nodes', [10, 100, 1000])
+    @pytest.mark.benchmark
+    def test_layered_trial_cached(self, num_nodes, benchmark):
+        # the schedule recorded in the first TRIAL is replayed in the others
+        sched, nodes, width = self._layered_scheduler(num_nodes, cache_schedule=True)
+
+        benchmark.group = "Scheduler cached trial, {0} nodes".format(num_nodes)
+        output = benchmark(lambda: list(sched.run()))
+
+        assert sched._schedule_cache is not None
+        assert len(output) == num_nodes // width
+        assert set().union(*output) == set(nodes)
+        assert all(sched.counts_total[TimeScale.TRIAL.value] == 1)
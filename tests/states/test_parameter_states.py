@@ -170,3 +170,36 @@ class TestModParams:
         with pytest.raises(ComponentError) as error_text:
             T.mod_slope = 20.0
         assert "directly because it is computed by the ParameterState" in str(error_text.value)
+
+
+class TestStaticParameterStates:
+    def test_update_skipped_unless_param_reassigned(self):
+        from psyneulink.components.process import Process
+        from psyneulink.components.system import System
+
+        A = TransferMechanism(name='A')
+        B = TransferMechanism(name='B', function=Linear(slope=2.0))
+        S = System(processes=[Process(pathway=[A, B])])
+        slope_state = B._parameter_states['slope']
+
+        skipped_per_trial = []
+        S.run(inputs={A: [[1.0], [2.0], [3.0]]},
+              call_after_trial=lambda: skipped_per_trial.append(slope_state.num_updates_skipped))
+        # the ParameterState is updated on the first execution, and then skipped on each trial
+        assert np.diff(skipped_per_trial).tolist() == [1, 1]
+        np.testing.assert_allclose(B.value, [[6.0]])
+
+        skipped = slope_state.num_updates_skipped
+        B.function_object.slope = 3.0
+        S.run(inputs={A: [[1.0]]})
+        assert slope_state.num_updates_skipped == skipped
+        assert B.mod_slope == 3.0
+        np.testing.assert_allclose(B.value, [[3.0]])
+
+    def test_logged_parameter_state_not_skipped(self):
+        A = TransferMechanism(name='A')
+        A.set_log_conditions('slope')
+        for i in range(3):
+            A.execute([1.0])
+        assert A._parameter_states['slope'].num_updates_skipped == 0
+        assert len(A.log.nparray_dictionary()['slope']) == 3
@@ -0,0 +1,113 @@
+import numpy as np
+
+from psyneulink.components.functions.function import Logistic
+from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
+from psyneulink.components.process import Process
+from psyneulink.components.projections.pathway.mappingprojection import MappingProjection
+from psyneulink.components.system import System
+from psyneulink.globals.keywords import LEARNING
+
+
+class TestAfferentRouting:
+
+    def test_routing_cached_and_updated_when_projection_added(self):
+        A = TransferMechanism(name='A')
+        B = TransferMechanism(name='B')
+        C = TransferMechanism(name='C')
+        S = System(processes=[Process(pathway=[A, C]), Process(pathway=[B, C])])
+
+        S.run(inputs={A: [[1.0]], B: [[2.0]]})
+        routing = C.input_state._afferent_routing
+        assert [route[0] for route in routing] == C.input_state.path_afferents
+        assert len(routing) == 2
+        np.testing.assert_allclose(C.value, [[3.0]])
+
+        # the routing is reused until a Projection is added
+        S.run(inputs={A: [[1.0]], B: [[2.0]]})
+        assert C.input_state._afferent_routing is routing
+        np.testing.assert_allclose(C.value, [[3.0]])
+
+        MappingProjection(sender=A, receiver=C)
+        assert C.input_state._afferent_routing is None
+        assert [route[0] for route in C.input_state._get_afferent_routing()] == C.input_state.path_afferents
+        assert len(C.input_state._afferent_routing) == 3
+
+    def test_sender_reassigned_after_routing_cached(self):
+        A = TransferMechanism(name='A')
+        B = TransferMechanism(name='B')
+        X = TransferMechanism(name='X')
+        C = TransferMechanism(name='C')
+        S = System(processes=[Process(pathway=[A, C]), Process(pathway=[B])])
+        # X is not in the System, so the Projection from it is ignored
+        projection = MappingProjection(sender=X, receiver=C)
+
+        S.run(inputs={A: [[1.0]], B: [[2.0]]})
+        assert C.input_state._afferent_routing is not None
+        np.testing.assert_allclose(C.value, [[1.0]])
+
+        # the cached routing uses the sender assigned to the Projection when the State is updated
+        projection.sender = B.output_state
+        S.run(inputs={A: [[1.0]], B: [[2.0]]})
+        np.testing.assert_allclose(C.value, [[3.0]])
+
+
+class TestFusedProjections:
+
+    def _run_learning_system(self, fuse):
+        A = TransferMechanism(name='A', size=2)
+        B = TransferMechanism(name='B', size=2)
+        H = TransferMechanism(name='H', size=3, function=Logistic())
+        O = TransferMechanism(name='O', size=2, function=Logistic())
+        AH = MappingProjection(sender=A, receiver=H, matrix=np.arange(6.0).reshape(2, 3) / 10)
+        BH = MappingProjection(sender=B, receiver=H, matrix=-np.arange(6.0).reshape(2, 3) / 10)
+        if not fuse:
+            H.input_state._get_fused_projections = lambda: None
+        S = System(processes=[Process(pathway=[A, AH, H, O], learning=LEARNING, target=[0, 1]),
+                              Process(pathway=[B, BH, H])],
+                   targets=[0, 1])
+        results = S.run(inputs={A: [[1.0, 2.0]], B: [[0.5, -1.0]]}, targets={O: [[0, 1]]}, num_trials=5)
+        return results, H, AH, BH
+
+    def test_fused_projections_match_unfused_with_learning(self):
+        results, H, AH, BH = self._run_learning_system(fuse=True)
+        unfused_results, _, unfused_AH, _ = self._run_learning_system(fuse=False)
+
+        fused_projections = H.input_state._fused_projections
+        assert fused_projections is not None
+        # the value of the MATRIX ParameterState of each Projection is a view into the stacked matrix
+        assert np.shares_memory(BH.parameter_states['matrix'].value, fused_projections.matrix)
+        np.testing.assert_allclose(BH.parameter_states['matrix'].value, -np.arange(6.0).reshape(2, 3) / 10)
+
+        assert not np.allclose(AH.parameter_states['matrix'].value, np.arange(6.0).reshape(2, 3) / 10)
+        np.testing.assert_allclose(AH.parameter_states['matrix'].value,
+                                   unfused_AH.parameter_states['matrix'].value)
+        np.testing.assert_allclose(results, unfused_results)
+
+    def test_fused_projection_values_computed_when_read_or_logged(self):
+        A = TransferMechanism(name='A')
+        B = TransferMechanism(name='B')
+        C = TransferMechanism(name='C')
+        AC = MappingProjection(sender=A, receiver=C, matrix=[[2.0]])
+        BC = MappingProjection(sender=B, receiver=C, matrix=[[3.0]])
+        S = System(processes=[Process(pathway=[A, AC, C]), Process(pathway=[B, BC, C])])
+        AC.set_log_conditions('value')
+
+        S.run(inputs={A: [[1.0]], B: [[1.0]]})
+        assert C.input_state._fused_projections is not None
+        np.testing.assert_allclose(C.value, [[5.0]])
+        # the value of a Projection that is not logged is computed only when it is read
+        assert BC._fused_value is not None
+        np.testing.assert_allclose(BC.value, [3.0])
+        assert BC._fused_value is None
+        np.testing.assert_allclose(AC.value, [2.0])
+
+        state = S.save_state()
+        S.run(inputs={A: [[5.0]], B: [[5.0]]})
+        np.testing.assert_allclose(C.value, [[25.0]])
+        np.testing.assert_allclose(AC.value, [10.0])
+        np.testing.assert_allclose(BC.value, [15.0])
+        np.testing.assert_allclose(AC.log.nparray_dictionary()['value'], [[2.0], [10.0]])
+
+        S.run(inputs={A: [[7.0]], B: [[7.0]]})
+        S.restore_state(state)
+        np.testing.assert_allclose(BC.value, [3.0])
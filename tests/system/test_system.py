@@ -1,6 +1,7 @@
+
 import numpy as np
 
-from psyneulink.components.functions.function import BogaczEtAl, Linear, Logistic
+from psyneulink.components.functions.function import BogaczEtAl, Linear, Logistic, NormalDist
 from psyneulink.components.mechanisms.processing.transfermechanism import TransferMechanism
 from psyneulink.library.mechanisms.processing.transfer.recurrenttransfermechanism import RecurrentTransferMechanism
 from psyneulink.components.process import Process
@@ -672,3 +673,87 @@ class TestInitialize:
         # Run 1 --> Execution 1: 1 + 2 = 3    |    Execution 2: 3 + 2 = 5    |    Execution 3: 5 + 3 = 8
         # Run 2 --> Execution 1: 8 + 1 = 9    |    Execution 2: 9 + 2 = 11    |    Execution 3: 11 + 3 = 14
         assert np.allclose(C.log.nparray_dictionary('value')['value'], [[[3]], [[5]], [[8]], [[9]], [[11]], [[14]]])
+
+
+class TestState:
+
+    def test_save_and_restore_state(self):
+        A = TransferMechanism(name='A', integrator_mode=True, smoothing_factor=0.5)
+        B = TransferMechanism(name='B', function=Logistic)
+        C = RecurrentTransferMechanism(name='C', auto=0.5)
+        abc_system = System(processes=[Process(pathway=[A, B, C])])
+
+        abc_system.run(inputs={A: [1.0, 2.0, 3.0]})
+        state = abc_system.save_state()
+        time = vars(abc_system.scheduler_processing.clock.time).copy()
+        num_time_steps = len(abc_system.scheduler_processing.execution_list)
+
+        runs = []
+        for i in range(2):
+            abc_system.restore_state(state)
+            assert vars(abc_system.scheduler_processing.clock.time) == time
+            assert len(abc_system.scheduler_processing.execution_list) == num_time_steps
+            results = abc_system.run(inputs={A: [2.0, 0.5]})
+            runs.append((np.array(results[-2:]), A.value.copy(), C.value.copy(),
+                         vars(abc_system.scheduler_processing.clock.time).copy()))
+
+        # the state in which the second run started was saved, so it is the same as the first
+        for first, second in zip(*runs):
+            if isinstance(first, dict):
+                assert first == second
+            else:
+                np.testing.assert_array_equal(first, second)
+
+        # without restoring the state, the integrators continue from where they left off
+        abc_system.run(inputs={A: [2.0, 0.5]})
+        assert not np.allclose(A.value, runs[0][1])
+
+    def test_interleaved_runs_with_saved_states(self):
+        A = TransferMechanism(name='A', integrator_mode=True, smoothing_factor=0.5)
+        B = RecurrentTransferMechanism(name='B', auto=0.5)
+        ab_system = System(processes=[Process(pathway=[A, B])])
+        inputs = {'a': [1.0, 2.0, 3.0], 'b': [-1.0, 0.5, 4.0]}
+        initial_state = ab_system.save_state()
+
+        # each sequence of inputs run on its own
+        expected = {}
+        for key, sequence in inputs.items():
+            ab_system.restore_state(initial_state)
+            expected[key] = [np.array(ab_system.run(inputs={A: [x]})[-1]) for x in sequence]
+
+        # run in alternation, each continues from the state in which it was left
+        states = {key: initial_state for key in inputs}
+        results = {key: [] for key in inputs}
+        for x, y in zip(inputs['a'], inputs['b']):
+            for key, value in [('a', x), ('b', y)]:
+                ab_system.restore_state(states[key])
+                results[key].append(np.array(ab_system.run(inputs={A: [value]})[-1]))
+                states[key] = ab_system.save_state()
+
+        np.testing.assert_allclose(results['a'], expected['a'])
+        np.testing.assert_allclose(results['b'], expected['b'])
+
+    def test_seed_random_states(self):
+        def make_system():
+            A = TransferMechanism(name='A', noise=NormalDist().function, integrator_mode=True)
+            B = DDM(name='B')
+            return System(processes=[Process(pathway=[A, B])]), A, B
+
+        inputs = [[1.0], [0.5], [-1.0], [2.0]]
+        results = []
+        for draw_between_trials in [False, True]:
+            S, A, B = make_system()
+            S.seed_random_states(42)
+            # values drawn from the global generator do not change those drawn by the Components
+            S.run(inputs={A: inputs}, call_after_trial=np.random.normal if draw_between_trials else None)
+            results.append(np.array([np.concatenate(r) for r in S.results]))
+
+        np.testing.assert_array_equal(results[0], results[1])
+        assert A.integrator_function.noise.__self__.random_state is not B.random_state
+        assert isinstance(B.random_state, np.random.RandomState)
+        assert A.random_state is np.random
+
+        S, A, B = make_system()
+        S.seed_random_states(43)
+        S.run(inputs={A: inputs})
+        assert not np.array_equal(np.array([np.concatenate(r) for r in S.results]), results[0])